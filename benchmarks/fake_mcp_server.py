@@ -0,0 +1,43 @@
+"""
+Fake MCP server for load tests: one lookup tool answering after a fixed latency.
+
+    python benchmarks/fake_mcp_server.py --transport stdio --latency 0.05
+    python benchmarks/fake_mcp_server.py --transport streamable-http --port 9100 --latency 0.05
+"""
+
+import argparse
+import asyncio
+
+from mcp.server.fastmcp import FastMCP
+
+
+def create_server(name: str, tool_name: str, latency: float, payload_bytes: int, host: str, port: int) -> FastMCP:
+    server = FastMCP(name, host=host, port=port, log_level="WARNING")
+
+    @server.tool(name=tool_name)
+    async def lookup(query: str) -> str:
+        """Look up reference material for a query."""
+        await asyncio.sleep(latency)
+        line = f"result for {query}\n"
+        return (line * (payload_bytes // len(line) + 1))[:payload_bytes]
+
+    return server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--transport", choices=["stdio", "streamable-http"], default="stdio")
+    parser.add_argument("--name", default="fake")
+    parser.add_argument("--tool-name", default="lookup", help="distinct per server when several are used")
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds per tool call")
+    parser.add_argument("--payload-bytes", type=int, default=512, help="size of each tool result")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9100)
+    args = parser.parse_args()
+
+    server = create_server(args.name, args.tool_name, args.latency, args.payload_bytes, args.host, args.port)
+    server.run(transport=args.transport)
+
+
+if __name__ == "__main__":
+    main()
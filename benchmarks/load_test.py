@@ -0,0 +1,424 @@
+"""
+Load test and latency benchmark for /v1/invocations, without Bedrock or real MCP servers.
+
+Starts the app with the fake model (MODEL_PROVIDER=fake) and local fake MCP servers, then drives
+/v1/invocations at each concurrency level, streaming and not. Reports requests per second, latency
+and time to first token percentiles, and the server's memory growth, and saves them as JSON so runs
+can be compared across commits:
+
+    python benchmarks/load_test.py --concurrency 1,8,32 --requests 200
+    python benchmarks/load_test.py --compare benchmarks/results/<previous commit>.json
+
+Each worker has its own session and sends its requests one after the other, so histories grow as
+they would in a conversation. `--url` targets an already running server instead; its memory is not
+measured then.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from contextlib import ExitStack
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+import httpx
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FAKE_MCP_SERVER = os.path.join(ROOT, "benchmarks", "fake_mcp_server.py")
+MODES = ("invoke", "stream")
+
+
+@dataclass
+class Sample:
+    latency: float
+    # time to the first streamed chunk; None for non-streaming requests
+    ttft: Optional[float] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class LevelResult:
+    mode: str
+    concurrency: int
+    requests: int
+    errors: int
+    duration: float
+    rps: float
+    latency: Dict[str, float]
+    ttft: Optional[Dict[str, float]]
+    rss_start: Optional[int]
+    rss_end: Optional[int]
+    rss_growth: Optional[int]
+    error_samples: List[str] = field(default_factory=list)
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Linear interpolation between closest ranks, q in [0, 100]"""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    rank = (len(ordered) - 1) * q / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize(values: List[float]) -> Dict[str, float]:
+    return {
+        "p50": percentile(values, 50),
+        "p95": percentile(values, 95),
+        "p99": percentile(values, 99),
+        "mean": sum(values) / len(values) if values else 0.0,
+        "max": max(values, default=0.0),
+    }
+
+
+def rss_bytes(pid: Optional[int]) -> Optional[int]:
+    """Resident memory of a process, from /proc; None where that is not available"""
+    if pid is None:
+        return None
+    try:
+        with open(f"/proc/{pid}/status", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        return None
+    return None
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def git_commit() -> str:
+    try:
+        commit = subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, text=True).strip()
+        dirty = subprocess.run(["git", "diff", "--quiet", "HEAD"], cwd=ROOT).returncode != 0
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return f"{commit}-dirty" if dirty else commit
+
+
+def wait_until_ready(url: str, process: Optional[subprocess.Popen], timeout: float) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process is not None and process.poll() is not None:
+            raise RuntimeError(f"server exited with {process.returncode} before it was ready")
+        try:
+            if httpx.get(url, timeout=1.0).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.1)
+    raise TimeoutError(f"{url} not ready after {timeout} seconds")
+
+
+def mcp_config(args: argparse.Namespace, stack: ExitStack, workdir: str) -> Dict[str, Any]:
+    """Config for the fake MCP servers; streamable-http ones are started here, stdio ones by the app"""
+    servers: Dict[str, Any] = {}
+    for transport in args.mcp:
+        name = f"fake-{transport}"
+        server_args = [
+            "--name", name,
+            "--tool-name", f"{transport.replace('-', '_')}_lookup",
+            "--latency", str(args.mcp_latency),
+            "--payload-bytes", str(args.mcp_payload_bytes),
+        ]
+        if transport == "stdio":
+            servers[name] = {
+                "transportType": "stdio",
+                "command": sys.executable,
+                "args": [FAKE_MCP_SERVER, *server_args],
+            }
+            continue
+        port = free_port()
+        log = stack.enter_context(open(os.path.join(workdir, f"{name}.log"), "w"))
+        process = subprocess.Popen(
+            [sys.executable, FAKE_MCP_SERVER, "--transport", transport, "--port", str(port), *server_args],
+            stdout=log,
+            stderr=subprocess.STDOUT,
+        )
+        stack.callback(stop, process)
+        url = f"http://127.0.0.1:{port}/mcp"
+        wait_until_ready_tcp(port, process, timeout=30)
+        servers[name] = {"transportType": "streamable-http", "url": url}
+    return {"mcpServers": servers}
+
+
+def wait_until_ready_tcp(port: int, process: subprocess.Popen, timeout: float) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"fake MCP server exited with {process.returncode}")
+        with socket.socket() as s:
+            if s.connect_ex(("127.0.0.1", port)) == 0:
+                return
+        time.sleep(0.1)
+    raise TimeoutError(f"fake MCP server on port {port} not ready after {timeout} seconds")
+
+
+def stop(process: subprocess.Popen) -> None:
+    process.terminate()
+    try:
+        process.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        process.kill()
+
+
+def start_app(args: argparse.Namespace, stack: ExitStack) -> tuple[str, subprocess.Popen]:
+    """Run the app in its own process, in a scratch directory holding its sessions, caches and logs"""
+    workdir = stack.enter_context(tempfile.TemporaryDirectory(prefix="chatbot-bench-"))
+    with open(os.path.join(workdir, "mcp_config.json"), "w", encoding="utf-8") as f:
+        json.dump(mcp_config(args, stack, workdir), f)
+
+    fake_model = {
+        "text": " ".join(["token"] * args.output_tokens),
+        "latency": args.ttft,
+        "tokens_per_second": args.tokens_per_second,
+        "tool_calls_per_turn": args.tool_calls if args.mcp else 0,
+        "parallel_tool_calls": args.parallel_tools,
+    }
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.path.join(ROOT, "src"),
+        "MODEL_ID": "fake",
+        "MODEL_PROVIDER": "fake",
+        "FAKE_MODEL": json.dumps(fake_model),
+        "ENVIRONMENT": "benchmark",
+        "SESSION_STORE": args.session_store,
+        # every prompt is new; cached answers would measure the cache instead of the request path
+        "RESPONSE_CACHE_MAX_ENTRIES": "0",
+        "TOOL_RESULT_OFFLOAD_BYTES": "0",
+        "MODEL_MAX_CONCURRENCY": str(max(args.concurrency) * 2),
+        "MODEL_USER_MAX_CONCURRENCY": str(max(args.concurrency) * 2),
+        "AGENT_POOL_MAX_SIZE": str(max(args.concurrency) * 2),
+    }
+    port = free_port()
+    log = stack.enter_context(open(os.path.join(workdir, "app.log"), "w"))
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=workdir,
+        env=env,
+        stdout=log,
+        stderr=subprocess.STDOUT,
+    )
+    stack.callback(stop, process)
+    url = f"http://127.0.0.1:{port}"
+    try:
+        wait_until_ready(f"{url}/health/ready", process, timeout=args.startup_timeout)
+    except Exception:
+        log.flush()
+        with open(log.name, encoding="utf-8") as f:
+            sys.stderr.write(f.read()[-4000:])
+        raise
+    return url, process
+
+
+async def invoke(client: httpx.AsyncClient, session_id: str, message: str, stream: bool) -> Sample:
+    started = time.perf_counter()
+    payload = {"session_id": session_id, "message": message, "stream": stream}
+    try:
+        if not stream:
+            response = await client.post("/v1/invocations", json=payload)
+            error = None if response.status_code == 200 else f"HTTP {response.status_code}: {response.text[:200]}"
+            return Sample(latency=time.perf_counter() - started, error=error)
+
+        ttft = None
+        error = None
+        async with client.stream("POST", "/v1/invocations", json=payload) as response:
+            if response.status_code != 200:
+                body = (await response.aread()).decode("utf-8", errors="replace")
+                return Sample(latency=time.perf_counter() - started, error=f"HTTP {response.status_code}: {body[:200]}")
+            event = None
+            async for line in response.aiter_lines():
+                if line.startswith("event: "):
+                    event = line[len("event: "):]
+                    if event == "chunk" and ttft is None:
+                        ttft = time.perf_counter() - started
+                elif line.startswith("data: ") and event == "error":
+                    error = line[len("data: "):][:200]
+        return Sample(latency=time.perf_counter() - started, ttft=ttft, error=error)
+    except httpx.HTTPError as e:
+        return Sample(latency=time.perf_counter() - started, error=f"{type(e).__name__}: {e}")
+
+
+async def run_level(
+    url: str, pid: Optional[int], mode: str, concurrency: int, requests: int, warmup: int
+) -> LevelResult:
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=httpx.Timeout(300.0)) as client:
+        sessions = []
+        for _ in range(concurrency):
+            response = await client.post("/v1/sessions", json={"user_id": f"bench-{uuid.uuid4().hex[:8]}"})
+            response.raise_for_status()
+            sessions.append(response.json()["session_id"])
+
+        stream = mode == "stream"
+        for i, session_id in enumerate(sessions[:warmup]):
+            await invoke(client, session_id, f"warm up {i}", stream)
+
+        rss_start = rss_bytes(pid)
+        counter = iter(range(requests))
+        samples: List[Sample] = []
+
+        async def worker(session_id: str) -> None:
+            for n in counter:
+                samples.append(await invoke(client, session_id, f"benchmark question {n}: what changed?", stream))
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(session_id) for session_id in sessions))
+        duration = time.perf_counter() - started
+        rss_end = rss_bytes(pid)
+
+        for session_id in sessions:
+            await client.request("DELETE", "/v1/sessions", json={"session_id": session_id})
+
+    ok = [sample for sample in samples if sample.error is None]
+    ttfts = [sample.ttft for sample in ok if sample.ttft is not None]
+    return LevelResult(
+        mode=mode,
+        concurrency=concurrency,
+        requests=len(samples),
+        errors=len(samples) - len(ok),
+        duration=duration,
+        rps=len(ok) / duration if duration else 0.0,
+        latency=summarize([sample.latency for sample in ok]),
+        ttft=summarize(ttfts) if stream else None,
+        rss_start=rss_start,
+        rss_end=rss_end,
+        rss_growth=rss_end - rss_start if rss_start is not None and rss_end is not None else None,
+        error_samples=sorted({sample.error for sample in samples if sample.error is not None})[:5],
+    )
+
+
+def print_results(results: List[LevelResult]) -> None:
+    """One row per level; latencies in milliseconds"""
+    print(
+        f"{'mode':<7}{'conc':>5}{'reqs':>6}{'err':>5}{'rps':>8}{'p50':>8}{'p95':>8}{'p99':>8}"
+        f"{'ttft50':>8}{'ttft99':>8}{'rss+MB':>8}"
+    )
+    for r in results:
+        ttft = r.ttft or {}
+        growth = f"{r.rss_growth / 2**20:.1f}" if r.rss_growth is not None else "-"
+        print(
+            f"{r.mode:<7}{r.concurrency:>5}{r.requests:>6}{r.errors:>5}{r.rps:>8.1f}"
+            f"{r.latency['p50'] * 1000:>8.0f}{r.latency['p95'] * 1000:>8.0f}{r.latency['p99'] * 1000:>8.0f}"
+            f"{ttft.get('p50', 0) * 1000:>8.0f}{ttft.get('p99', 0) * 1000:>8.0f}{growth:>8}"
+        )
+
+
+def compare(results: List[LevelResult], baseline_path: str) -> None:
+    """Change against a previous run, per mode and concurrency level present in both"""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)
+    previous = {(r["mode"], r["concurrency"]): r for r in baseline["results"]}
+
+    def change(new: float, old: float) -> str:
+        return f"{(new - old) / old * 100:+.1f}%" if old else "-"
+
+    print(f"\ncompared with {baseline.get('commit', baseline_path)}:")
+    print(f"{'mode':<7}{'conc':>5}{'rps':>10}{'p50':>10}{'p99':>10}{'ttft50':>10}")
+    for r in results:
+        old = previous.get((r.mode, r.concurrency))
+        if old is None:
+            continue
+        ttft = change(r.ttft["p50"], old["ttft"]["p50"]) if r.ttft and old.get("ttft") else "-"
+        print(
+            f"{r.mode:<7}{r.concurrency:>5}{change(r.rps, old['rps']):>10}"
+            f"{change(r.latency['p50'], old['latency']['p50']):>10}"
+            f"{change(r.latency['p99'], old['latency']['p99']):>10}{ttft:>10}"
+        )
+
+
+def csv(kind: Any) -> Any:
+    return lambda value: [kind(item) for item in value.split(",") if item]
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=csv(int), default=[1, 8, 32], help="levels, e.g. 1,8,32")
+    parser.add_argument("--requests", type=int, default=200, help="requests per level and mode")
+    parser.add_argument("--warmup", type=int, default=4, help="unmeasured requests per level and mode")
+    parser.add_argument("--modes", type=csv(str), default=list(MODES), help="invoke,stream")
+    parser.add_argument("--url", help="benchmark a running server instead of starting one")
+    # fake model
+    parser.add_argument("--ttft", type=float, default=0.3, help="fake model seconds to first token")
+    parser.add_argument("--tokens-per-second", type=float, default=80.0, help="fake model output rate")
+    parser.add_argument("--output-tokens", type=int, default=40, help="tokens per fake answer")
+    parser.add_argument("--tool-calls", type=int, default=1, help="tool calls per turn, spread over the MCP servers")
+    parser.add_argument("--parallel-tools", type=int, default=1, help="tools the model asks for at once per tool call")
+    # fake MCP servers
+    parser.add_argument("--mcp", type=csv(str), default=["stdio", "streamable-http"], help="stdio,streamable-http")
+    parser.add_argument("--mcp-latency", type=float, default=0.05, help="seconds per fake tool call")
+    parser.add_argument("--mcp-payload-bytes", type=int, default=512)
+    parser.add_argument("--session-store", default="memory", help="SESSION_STORE of the app: memory | sqlite | file")
+    parser.add_argument("--startup-timeout", type=float, default=60.0)
+    parser.add_argument("--output", help="JSON results file (default: benchmarks/results/<commit>.json)")
+    parser.add_argument("--compare", help="previous results file to compare with")
+    args = parser.parse_args(argv)
+    for mode in args.modes:
+        if mode not in MODES:
+            parser.error(f"unknown mode: {mode}")
+    for transport in args.mcp:
+        if transport not in ("stdio", "streamable-http"):
+            parser.error(f"unknown MCP transport: {transport}")
+    return args
+
+
+def levels(args: argparse.Namespace) -> Iterator[tuple[str, int]]:
+    for mode in args.modes:
+        for concurrency in args.concurrency:
+            yield mode, concurrency
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    commit = git_commit()
+    results: List[LevelResult] = []
+    with ExitStack() as stack:
+        if args.url:
+            url, pid = args.url.rstrip("/"), None
+            wait_until_ready(f"{url}/health/ready", None, timeout=args.startup_timeout)
+        else:
+            url, process = start_app(args, stack)
+            pid = process.pid
+        for mode, concurrency in levels(args):
+            result = asyncio.run(run_level(url, pid, mode, concurrency, args.requests, args.warmup))
+            results.append(result)
+            print_results([result])
+
+    print()
+    print_results(results)
+    output = args.output or os.path.join(ROOT, "benchmarks", "results", f"{commit}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "commit": commit,
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "config": {key: value for key, value in vars(args).items() if key not in ("output", "compare")},
+                "results": [asdict(result) for result in results],
+            },
+            f,
+            indent=2,
+        )
+    print(f"\nresults saved to {output}")
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
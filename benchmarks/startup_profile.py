@@ -0,0 +1,179 @@
+"""
+Startup profile: what importing the app costs, and how long until it listens and until it is ready.
+
+Runs `python -X importtime -c "import main"` and lists the slowest imports, then starts the app with
+uvicorn and times the first answered `/ping` (time to listening) and the first `200` from
+`/health/ready` (time to ready, once the DI container is built and the MCP servers are connected):
+
+    python benchmarks/startup_profile.py
+    python benchmarks/startup_profile.py --runs 5 --budget 1.0 --mcp-config mcp_config.json
+
+Exits with status 1 when the median time to listening is over `--budget` seconds, so CI can keep it
+there. The app runs with the fake model, so no AWS credentials are needed.
+"""
+
+import argparse
+import json
+import os
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import httpx
+
+from load_test import ROOT, free_port, stop
+
+SRC = os.path.join(ROOT, "src")
+# import time:       self [us] |   cumulative | imported package
+_IMPORT_TIME = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+@dataclass
+class ImportTime:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def app_env() -> Dict[str, str]:
+    return {
+        **os.environ,
+        "PYTHONPATH": SRC,
+        "MODEL_ID": os.environ.get("MODEL_ID", "fake"),
+        "MODEL_PROVIDER": os.environ.get("MODEL_PROVIDER", "fake"),
+        "ENVIRONMENT": "benchmark",
+        "SESSION_STORE": os.environ.get("SESSION_STORE", "memory"),
+    }
+
+
+def import_times(module: str = "main") -> List[ImportTime]:
+    """Per-module import times of a fresh interpreter importing `module`"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=SRC,
+        env=app_env(),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = []
+    for line in result.stderr.splitlines():
+        match = _IMPORT_TIME.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            times.append(ImportTime(name, int(self_us), int(cumulative_us), len(indent) // 2))
+    return times
+
+
+def time_startup(workdir: str, timeout: float) -> tuple[float, Optional[float]]:
+    """Seconds from launching uvicorn to the first /ping answer, and to the first ready /health/ready"""
+    port = free_port()
+    url = f"http://127.0.0.1:{port}"
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=workdir,
+        env=app_env(),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    listening: Optional[float] = None
+    try:
+        deadline = started + timeout
+        while time.perf_counter() < deadline:
+            if process.poll() is not None:
+                raise RuntimeError(f"server exited with {process.returncode} during startup")
+            try:
+                if listening is None:
+                    httpx.get(f"{url}/ping", timeout=1.0).raise_for_status()
+                    listening = time.perf_counter() - started
+                if httpx.get(f"{url}/health/ready", timeout=1.0).status_code == 200:
+                    return listening, time.perf_counter() - started
+            except httpx.HTTPError:
+                pass
+            time.sleep(0.005)
+        if listening is None:
+            raise TimeoutError(f"server not listening after {timeout} seconds")
+        return listening, None
+    finally:
+        stop(process)
+
+
+def print_imports(times: List[ImportTime], top: int) -> None:
+    total = sum(t.self_us for t in times)
+    print(f"import main: {total / 1e6:.3f}s over {len(times)} modules\n")
+    print(f"{'cumulative':>11}{'self':>9}  top-level imports of main")
+    for t in sorted((t for t in times if t.depth == 1), key=lambda t: -t.cumulative_us)[:top]:
+        print(f"{t.cumulative_us / 1e3:>9.1f}ms{t.self_us / 1e3:>7.1f}ms  {t.module}")
+    print(f"\n{'self':>11}  slowest modules")
+    for t in sorted(times, key=lambda t: -t.self_us)[:top]:
+        print(f"{t.self_us / 1e3:>9.1f}ms  {t.module}")
+    heavy = sorted({t.module.split(".")[0] for t in times} & {"boto3", "botocore", "strands", "mcp"})
+    if heavy:
+        print(f"\nwarning: importing main loads {', '.join(heavy)}")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=3, help="app starts to take the median of")
+    parser.add_argument("--top", type=int, default=15, help="modules to list")
+    parser.add_argument("--budget", type=float, default=1.0, help="allowed seconds to listening; 0 to not check")
+    parser.add_argument("--mcp-config", help="mcp_config.json for the app (default: no MCP servers)")
+    parser.add_argument("--startup-timeout", type=float, default=60.0)
+    parser.add_argument("--output", help="also write the results to this JSON file")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    times = import_times()
+    print_imports(times, args.top)
+
+    listening: List[float] = []
+    ready: List[float] = []
+    with tempfile.TemporaryDirectory(prefix="chatbot-startup-") as workdir:
+        config_path = os.path.join(workdir, "mcp_config.json")
+        if args.mcp_config:
+            shutil.copy(args.mcp_config, config_path)
+        else:
+            with open(config_path, "w", encoding="utf-8") as f:
+                json.dump({"mcpServers": {}}, f)
+        for _ in range(args.runs):
+            to_listening, to_ready = time_startup(workdir, args.startup_timeout)
+            listening.append(to_listening)
+            if to_ready is not None:
+                ready.append(to_ready)
+
+    print(f"\ntime to listening: median {statistics.median(listening):.3f}s, max {max(listening):.3f}s")
+    if ready:
+        print(f"time to ready:     median {statistics.median(ready):.3f}s, max {max(ready):.3f}s")
+    else:
+        print("time to ready:     never ready within the startup timeout")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "import_seconds": sum(t.self_us for t in times) / 1e6,
+                    "imports": [vars(t) for t in sorted(times, key=lambda t: -t.cumulative_us)[: args.top]],
+                    "time_to_listening": listening,
+                    "time_to_ready": ready,
+                },
+                f,
+                indent=2,
+            )
+
+    if args.budget and statistics.median(listening) > args.budget:
+        print(f"\ntime to listening is over the {args.budget}s budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,41 @@
-from .ping.ping_controller import PingController
-from .session.session_controller import SessionController
-from .chat.chat_controller import ChatController
-from .router import create_api_router
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .ping.ping_controller import PingController
+    from .session.session_controller import SessionController
+    from .batch.batch_controller import BatchController
+    from .chat.chat_controller import ChatController
+    from .metrics.metrics_controller import MetricsController
+    from .metrics.prometheus_controller import PrometheusController
+    from .router import create_api_router
+
+# Controllers import the services, and through them strands; they are loaded on first use so that
+# the app can bind its port (serving only the health checks) before paying for those imports.
+_EXPORTS = {
+    "PingController": ".ping.ping_controller",
+    "SessionController": ".session.session_controller",
+    "ChatController": ".chat.chat_controller",
+    "BatchController": ".batch.batch_controller",
+    "MetricsController": ".metrics.metrics_controller",
+    "PrometheusController": ".metrics.prometheus_controller",
+    "create_api_router": ".router",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module, __name__), name)
+
 
 __all__ = [
     "PingController",
     "SessionController",
     "ChatController",
+    "BatchController",
+    "MetricsController",
+    "PrometheusController",
     "create_api_router",
 ]
@@ -0,0 +1,59 @@
+import json
+from typing import Any, AsyncGenerator, AsyncIterator, Dict, List, Optional
+
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+
+from services.chat.batch_service import BatchService
+from ports.chat.dto import BatchItem, BatchResult
+
+
+def parse_batch_items(data: bytes) -> List[BatchItem]:
+    """
+    One JSON object per line with a `message`, or a `title` and `body` as in a request backlog.
+
+    `id` (or `request_id`) defaults to the line number; blank lines are skipped.
+    """
+    items: List[BatchItem] = []
+    ids = set()
+    for number, line in enumerate(data.decode("utf-8").splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            fields: Dict[str, Any] = json.loads(line)
+            if not isinstance(fields, dict):
+                raise ValueError("expected a JSON object")
+            if "message" not in fields and "body" in fields:
+                fields["message"] = "\n\n".join(str(fields[key]) for key in ("title", "body") if fields.get(key))
+            fields["id"] = str(fields.get("id") or fields.get("request_id") or number)
+            item = BatchItem.model_validate(fields)
+        except (ValueError, ValidationError) as e:
+            raise ValueError(f"line {number}: {e}")
+        if item.id in ids:
+            raise ValueError(f"line {number}: duplicate id {item.id!r}")
+        ids.add(item.id)
+        items.append(item)
+    return items
+
+
+class BatchController:
+    def __init__(self, batch_service: BatchService):
+        self.batch_service = batch_service
+
+        self.router = APIRouter(prefix="/v1")
+        self.router.add_api_route("/batch/invocations", self.invoke, methods=["POST"])
+
+    async def invoke(self, http_request: Request, batch_id: Optional[str] = None) -> StreamingResponse:
+        try:
+            items = parse_batch_items(await http_request.body())
+            results = self.batch_service.run(items, batch_id)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        return StreamingResponse(self._encode(results), media_type="application/x-ndjson")
+
+    @staticmethod
+    async def _encode(results: AsyncIterator[BatchResult]) -> AsyncGenerator[str, None]:
+        async for result in results:
+            yield json.dumps(result.model_dump(exclude_none=True), ensure_ascii=False) + "\n"
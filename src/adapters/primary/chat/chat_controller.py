@@ -1,32 +1,124 @@
-from typing import AsyncIterator, Any, cast
+import math
+import time
+from contextlib import aclosing
+from typing import AsyncIterator, Any, Optional, cast
 
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import StreamingResponse
 
+from adapters.primary.chat.sse import with_heartbeats
+from adapters.primary.chat.stream_replay import (
+    ReplayLog,
+    ReplayUnavailableError,
+    StreamReplayStore,
+    parse_last_event_id,
+)
+from services.chat.admission import OverloadedError
 from services.chat.chat_service import ChatService
+from services.chat.turn_coordinator import SessionBusyError, TurnCancelledError
+from ports.chat import UnknownModelError
 from ports.chat.dto import ChatRequest, ChatResponse
+from utils.telemetry import telemetry
 
 
 class ChatController:
-    def __init__(self, chat_service: ChatService):
+    def __init__(
+        self,
+        chat_service: ChatService,
+        stream_heartbeat_interval: float = 15.0,
+        replays: Optional[StreamReplayStore] = None,
+    ):
         self.chat_service = chat_service
+        self.stream_heartbeat_interval = stream_heartbeat_interval
+        # streamed turns are encoded once into a replay log that reconnecting clients resume from
+        self.replays = replays or StreamReplayStore()
 
         self.router = APIRouter(prefix="/v1")
         self.router.add_api_route(
             "/invocations", self.invoke, methods=["POST"])
 
-    async def invoke(self, request: ChatRequest):
+    async def invoke(self, request: ChatRequest, http_request: Request):
+        last_event_id = http_request.headers.get("last-event-id")
+        if request.stream and last_event_id:
+            return self._resume(request.session_id, last_event_id, http_request)
+
+        stream = bool(request.stream)
+        started = time.monotonic()
+        status = 200
+        with telemetry.span(
+            "chat.invoke", **{"session.id": request.session_id, "chat.stream": stream, "chat.model": request.model}
+        ) as span:
+            try:
+                response = await self.chat_service.generate_response(
+                    request.session_id,
+                    request.message,
+                    stream=stream,
+                    request_id=request.request_id,
+                    model=request.model,
+                    user_id=request.user_id,
+                )
+            except (SessionBusyError, TurnCancelledError) as e:
+                status = 409
+                raise HTTPException(status_code=409, detail=str(e))
+            except UnknownModelError as e:
+                status = 400
+                raise HTTPException(status_code=400, detail=str(e))
+            except OverloadedError as e:
+                status = 503
+                raise HTTPException(
+                    status_code=503, detail=str(e), headers={"Retry-After": str(max(1, math.ceil(e.retry_after)))}
+                )
+            except Exception:
+                status = 500
+                raise
+            finally:
+                span.set_attribute("http.response.status_code", status)
+                telemetry.invoke_duration.record(
+                    time.monotonic() - started, {"chat.stream": stream, "http.response.status_code": status}
+                )
+
         if request.stream:
-            return StreamingResponse(
-                self._generate_stream_response(request),
-                media_type="text/event-stream",
-            )
+            log = self.replays.start(request.session_id, cast(AsyncIterator[Any], response))
+            return self._stream_response(log, 0, http_request)
         else:
-            response = await self.chat_service.generate_response(request.session_id, request.message, stream=False)
             return ChatResponse(data=str(response))
 
-    async def _generate_stream_response(self, request: ChatRequest) -> AsyncIterator[Any]:
-        response_stream = await self.chat_service.generate_response(request.session_id, request.message, stream=True)
-        async for event in cast(AsyncIterator[Any], response_stream):
-            if "data" in event:
-                yield event["data"]
+    def _resume(self, session_id: str, last_event_id: str, http_request: Request) -> StreamingResponse:
+        """Reattach to a live turn, or replay the tail of a finished one, after `Last-Event-ID`"""
+        try:
+            turn_id, after = parse_last_event_id(last_event_id)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        try:
+            log = self.replays.get(session_id, turn_id)
+        except ReplayUnavailableError as e:
+            raise HTTPException(status_code=410, detail=str(e))
+        if not log.can_resume(after):
+            raise HTTPException(status_code=410, detail=f"events after {last_event_id} are no longer available")
+
+        return self._stream_response(log, after, http_request)
+
+    def _stream_response(self, log: ReplayLog, after: int, http_request: Request) -> StreamingResponse:
+        return StreamingResponse(
+            self._generate_stream_response(log, after, http_request),
+            media_type="text/event-stream",
+            # disable proxy buffering so batched chunks reach the client as they are flushed
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    async def _generate_stream_response(
+        self, log: ReplayLog, after: int, http_request: Request
+    ) -> AsyncIterator[bytes]:
+        stream = with_heartbeats(
+            self.replays.follow(log, after),
+            http_request.is_disconnected,
+            heartbeat_interval=self.stream_heartbeat_interval,
+        )
+        async with aclosing(stream):
+            try:
+                async for chunk in stream:
+                    yield chunk
+            except ReplayUnavailableError:
+                # this client fell further behind than the log retains; it can reconnect to find out
+                pass
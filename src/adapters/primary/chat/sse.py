@@ -0,0 +1,223 @@
+import asyncio
+from typing import Any, AsyncGenerator, AsyncIterator, Awaitable, Callable, List, Optional, Set, Tuple
+
+from pydantic import BaseModel
+
+from ports.chat.dto import ChatStreamChunk, ChatStreamEnd, ChatStreamError, ChatStreamToolUse, ChatStreamUsage
+from utils.logger import logger
+
+
+# SSE comment line: keeps proxies from timing out idle connections, ignored by clients
+HEARTBEAT = b": ping\n\n"
+
+# (sequence number, encoded frame)
+SSEFrame = Tuple[int, bytes]
+
+_DONE = object()
+
+
+def encode_event(event: str, data: BaseModel, event_id: Optional[str] = None) -> bytes:
+    """Encode a single SSE frame; JSON payloads never contain raw newlines so one data line suffices"""
+    frame = f"event: {event}\ndata: {data.model_dump_json()}\n\n"
+    if event_id is not None:
+        frame = f"id: {event_id}\n{frame}"
+    return frame.encode("utf-8")
+
+
+class SSEEncoder:
+    """
+    Turns strands agent stream events into SSE frames.
+
+    Text deltas are buffered and emitted as one `chunk` event on `flush`; any other event flushes
+    pending text first so the client sees events in the order the agent produced them.
+    Frames are numbered 1, 2, 3, ... and the id sent to the client is `id_prefix` + number.
+    """
+
+    def __init__(self, id_prefix: str = ""):
+        self.id_prefix = id_prefix
+        self.last_event_id = 0
+        self._text: List[str] = []
+        self._text_bytes = 0
+        self._usage = ChatStreamUsage()
+        self._has_usage = False
+        self._stop_reason: Optional[str] = None
+        self._tool_use_ids: Set[str] = set()
+
+    @property
+    def buffered_bytes(self) -> int:
+        return self._text_bytes
+
+    def feed(self, event: Any) -> List[SSEFrame]:
+        if not isinstance(event, dict):
+            return []
+
+        if "data" in event:
+            text = str(event["data"])
+            self._text.append(text)
+            self._text_bytes += len(text.encode("utf-8"))
+            return []
+
+        if "message" in event:
+            return self._tool_uses(event["message"])
+
+        if "event" in event:
+            usage = (event["event"].get("metadata") or {}).get("usage")
+            if usage:
+                self._usage.input_tokens += usage.get("inputTokens", 0)
+                self._usage.output_tokens += usage.get("outputTokens", 0)
+                self._usage.total_tokens += usage.get("totalTokens", 0)
+                self._usage.cache_read_input_tokens += usage.get("cacheReadInputTokens", 0)
+                self._usage.cache_write_input_tokens += usage.get("cacheWriteInputTokens", 0)
+                self._has_usage = True
+            return []
+
+        if "result" in event:
+            stop_reason = getattr(event["result"], "stop_reason", None)
+            self._stop_reason = str(stop_reason) if stop_reason is not None else None
+        return []
+
+    def flush(self) -> List[SSEFrame]:
+        if not self._text:
+            return []
+        chunk = ChatStreamChunk(chunk="".join(self._text))
+        self._text.clear()
+        self._text_bytes = 0
+        return [self._frame("chunk", chunk)]
+
+    def finish(self, error: Optional[BaseException] = None) -> List[SSEFrame]:
+        """Pending text, usage, an error if the turn failed, then the terminal `end` event"""
+        frames = self.flush()
+        if self._has_usage:
+            frames.append(self._frame("usage", self._usage))
+        if error is not None:
+            frames.append(self._frame("error", ChatStreamError(error=str(error))))
+        stop_reason = "error" if error is not None else self._stop_reason
+        frames.append(self._frame("end", ChatStreamEnd(stop_reason=stop_reason)))
+        return frames
+
+    def _tool_uses(self, message: Any) -> List[SSEFrame]:
+        if not isinstance(message, dict) or message.get("role") != "assistant":
+            return []
+
+        frames: List[SSEFrame] = []
+        for block in message.get("content", []):
+            tool_use = block.get("toolUse") if isinstance(block, dict) else None
+            if not tool_use or tool_use["toolUseId"] in self._tool_use_ids:
+                continue
+            self._tool_use_ids.add(tool_use["toolUseId"])
+            frames.extend(self.flush())
+            frames.append(
+                self._frame(
+                    "tool_use",
+                    ChatStreamToolUse(
+                        tool_use_id=tool_use["toolUseId"],
+                        name=tool_use["name"],
+                        input=tool_use.get("input") or {},
+                    ),
+                )
+            )
+        return frames
+
+    def _frame(self, event: str, data: BaseModel) -> SSEFrame:
+        self.last_event_id += 1
+        return self.last_event_id, encode_event(event, data, f"{self.id_prefix}{self.last_event_id}")
+
+
+async def _next(iterator: AsyncIterator[Any]) -> Any:
+    return await anext(iterator, _DONE)
+
+
+async def _close(iterator: AsyncIterator[Any], pending: Optional[asyncio.Task]) -> None:
+    """Cancel an outstanding read, then close the source so its own cleanup runs"""
+    if pending is not None:
+        pending.cancel()
+        # wait without re-raising the read's cancellation, but still honour our own
+        await asyncio.wait([pending])
+    aclose = getattr(iterator, "aclose", None)
+    if aclose is not None:
+        await aclose()
+
+
+async def batch_frames(
+    events: AsyncIterator[Any],
+    encoder: SSEEncoder,
+    flush_interval: float = 0.02,
+    flush_bytes: int = 512,
+) -> AsyncGenerator[List[SSEFrame], None]:
+    """
+    Encode agent events, batching text by time (`flush_interval`) or size (`flush_bytes`).
+
+    Only one event is read ahead, so a slow consumer pushes back on the agent instead of growing
+    a buffer. The last batch always ends with the terminal `end` frame, also when the agent fails.
+    """
+    loop = asyncio.get_running_loop()
+    pending: Optional[asyncio.Task] = None
+    flush_deadline: Optional[float] = None
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.create_task(_next(events))
+            timeout = None if flush_deadline is None else max(flush_deadline - loop.time(), 0)
+            done, _ = await asyncio.wait([pending], timeout=timeout)
+
+            frames: List[SSEFrame] = []
+            if done:
+                task, pending = pending, None
+                try:
+                    event = task.result()
+                except Exception as e:
+                    logger.error("🚨 agent stream failed", exc_info=True, stack_info=True)
+                    yield encoder.finish(e)
+                    return
+                if event is _DONE:
+                    yield encoder.finish()
+                    return
+                frames = encoder.feed(event)
+
+            now = loop.time()
+            if not encoder.buffered_bytes:
+                flush_deadline = None
+            elif flush_deadline is None:
+                flush_deadline = now + flush_interval
+            if flush_deadline is not None and (encoder.buffered_bytes >= flush_bytes or now >= flush_deadline):
+                frames.extend(encoder.flush())
+                flush_deadline = None
+
+            if frames:
+                yield frames
+    finally:
+        await _close(events, pending)
+
+
+async def with_heartbeats(
+    chunks: AsyncIterator[bytes],
+    is_disconnected: Callable[[], Awaitable[bool]],
+    heartbeat_interval: float = 15.0,
+) -> AsyncGenerator[bytes, None]:
+    """
+    Relay `chunks`, writing a heartbeat whenever nothing was sent for `heartbeat_interval` seconds.
+
+    Each heartbeat first checks the client is still there; when it is gone (or this generator is
+    closed) the source is closed too.
+    """
+    pending: Optional[asyncio.Task] = None
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.create_task(_next(chunks))
+            done, _ = await asyncio.wait([pending], timeout=heartbeat_interval)
+            if not done:
+                if await is_disconnected():
+                    logger.info("🔌 client disconnected, closing stream")
+                    return
+                yield HEARTBEAT
+                continue
+
+            task, pending = pending, None
+            chunk = task.result()
+            if chunk is _DONE:
+                return
+            yield chunk
+    finally:
+        await _close(chunks, pending)
+
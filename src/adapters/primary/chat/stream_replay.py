@@ -0,0 +1,276 @@
+import asyncio
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict, deque
+from contextlib import aclosing
+from typing import Any, AsyncIterator, Callable, Deque, Dict, List, Optional, Tuple
+
+import ulid
+
+from adapters.primary.chat.sse import SSEEncoder, SSEFrame, batch_frames
+from utils.logger import logger
+
+
+class ReplayUnavailableError(Exception):
+    """The requested events are no longer retained (unknown turn, expired, or overwritten)"""
+
+
+def parse_last_event_id(last_event_id: str) -> Tuple[str, int]:
+    """`<turn_id>:<seq>` -> (turn_id, seq)"""
+    turn_id, _, seq = last_event_id.rpartition(":")
+    if not turn_id or not seq.isdigit():
+        raise ValueError(f"invalid Last-Event-ID: {last_event_id}")
+    return turn_id, int(seq)
+
+
+class ReplayLog:
+    """
+    Ring buffer of the encoded SSE frames of one streamed turn.
+
+    Frames are numbered contiguously, so a reader resuming after `seq` starts at a computed index.
+    When the log exceeds `max_bytes` the oldest frames are dropped; readers that need them get
+    ReplayUnavailableError.
+    """
+
+    def __init__(self, session_id: str, turn_id: str, max_bytes: int = 1024 * 1024):
+        self.session_id = session_id
+        self.turn_id = turn_id
+        self.max_bytes = max_bytes
+        self.frames: Deque[SSEFrame] = deque()
+        self.bytes = 0
+        self.finished = False
+        self.finished_at: Optional[float] = None
+        self.listeners = 0
+        self.task: Optional[asyncio.Task] = None
+        self._changed = asyncio.Event()
+
+    def extend(self, frames: List[SSEFrame]) -> None:
+        for frame in frames:
+            self.frames.append(frame)
+            self.bytes += len(frame[1])
+        # keep at least the newest frame so followers always have somewhere to resume from
+        while self.bytes > self.max_bytes and len(self.frames) > 1:
+            _, dropped = self.frames.popleft()
+            self.bytes -= len(dropped)
+        self._notify()
+
+    def finish(self, now: float) -> None:
+        self.finished = True
+        self.finished_at = now
+        self._notify()
+
+    def can_resume(self, after: int) -> bool:
+        return not self.frames or self.frames[0][0] <= after + 1
+
+    async def follow(self, after: int = 0) -> AsyncIterator[bytes]:
+        """Replay frames after sequence number `after`, then follow the live turn until it ends"""
+        while True:
+            changed = self._changed
+            if not self.can_resume(after):
+                raise ReplayUnavailableError(f"events after {self.turn_id}:{after} were overwritten")
+            if self.frames:
+                start = max(after + 1 - self.frames[0][0], 0)
+                batch = [self.frames[i] for i in range(start, len(self.frames))]
+                if batch:
+                    after = batch[-1][0]
+                    yield b"".join(frame for _, frame in batch)
+            if self.finished:
+                return
+            await changed.wait()
+
+    def _notify(self) -> None:
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+
+class StreamReplayStore:
+    """
+    Replay logs of streamed turns, keyed by session and turn, so a client that drops can resume.
+
+    Every streamed turn is encoded once by a producer task into its log; client connections only
+    read from the log. A turn nobody listens to is cancelled after `resume_grace` seconds. Finished
+    logs are kept for `ttl` seconds; when the logs held in memory exceed `max_memory_bytes`, the
+    oldest finished ones are moved to `spill_path` (or dropped when it is not set).
+    """
+
+    def __init__(
+        self,
+        log_max_bytes: int = 1024 * 1024,
+        max_memory_bytes: int = 64 * 1024 * 1024,
+        ttl: float = 300.0,
+        resume_grace: float = 30.0,
+        spill_path: Optional[str] = None,
+        flush_interval: float = 0.02,
+        flush_bytes: int = 512,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.log_max_bytes = log_max_bytes
+        self.max_memory_bytes = max_memory_bytes
+        self.ttl = ttl
+        self.resume_grace = resume_grace
+        self.spill_path = spill_path
+        self.flush_interval = flush_interval
+        self.flush_bytes = flush_bytes
+        self._clock = clock
+
+        # (session_id, turn_id) -> log, in order of creation
+        self.logs: "OrderedDict[Tuple[str, str], ReplayLog]" = OrderedDict()
+        # (session_id, turn_id) -> finished_at of logs moved to disk
+        self._spilled: "OrderedDict[Tuple[str, str], float]" = OrderedDict()
+        self._idle_timers: Dict[Tuple[str, str], asyncio.TimerHandle] = {}
+
+        if spill_path:
+            os.makedirs(spill_path, exist_ok=True)
+
+    def start(self, session_id: str, events: AsyncIterator[Any]) -> ReplayLog:
+        """Start encoding a turn's agent events into a new replay log"""
+        self._prune()
+        turn_id = ulid.ulid()
+        log = ReplayLog(session_id, turn_id, max_bytes=self.log_max_bytes)
+        self.logs[(session_id, turn_id)] = log
+        log.task = asyncio.create_task(self._produce(log, events))
+        log.task.add_done_callback(lambda task: self._produced(log, events, task))
+        if self.resume_grace > 0:
+            # also covers a client that is gone before it starts reading
+            self._schedule_cancel(log)
+        return log
+
+    def get(self, session_id: str, turn_id: str) -> ReplayLog:
+        self._prune()
+        log = self.logs.get((session_id, turn_id))
+        if log is not None:
+            return log
+        if (session_id, turn_id) in self._spilled:
+            return self._load(session_id, turn_id)
+        raise ReplayUnavailableError(f"no replay log for turn {turn_id}")
+
+    async def follow(self, log: ReplayLog, after: int = 0) -> AsyncIterator[bytes]:
+        """Read a log on behalf of one client connection"""
+        key = (log.session_id, log.turn_id)
+        log.listeners += 1
+        timer = self._idle_timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        try:
+            async for chunk in log.follow(after):
+                yield chunk
+        finally:
+            log.listeners -= 1
+            if log.listeners == 0:
+                if log.finished:
+                    # the log was skipped by the cap while this client was still reading it
+                    self._enforce_memory_cap()
+                else:
+                    self._schedule_cancel(log)
+
+    def cleanup(self) -> None:
+        for log in self.logs.values():
+            if log.task is not None:
+                log.task.cancel()
+        for timer in self._idle_timers.values():
+            timer.cancel()
+        self.logs.clear()
+        self._idle_timers.clear()
+        for key in list(self._spilled):
+            self._remove_spilled(key)
+
+    async def _produce(self, log: ReplayLog, events: AsyncIterator[Any]) -> None:
+        encoder = SSEEncoder(id_prefix=f"{log.turn_id}:")
+        async with aclosing(batch_frames(events, encoder, self.flush_interval, self.flush_bytes)) as batches:
+            async for frames in batches:
+                log.extend(frames)
+
+    def _produced(self, log: ReplayLog, events: AsyncIterator[Any], task: asyncio.Task) -> None:
+        """
+        Done callback of the producer rather than its `finally`: a task cancelled before its first
+        step never runs its body, and followers would wait for the end of the log forever.
+        """
+        if task.cancelled() and not log.frames:
+            # batch_frames may never have run, so the agent stream is still open
+            aclose = getattr(events, "aclose", None)
+            if aclose is not None:
+                asyncio.ensure_future(aclose())
+        log.finish(self._clock())
+        timer = self._idle_timers.pop((log.session_id, log.turn_id), None)
+        if timer is not None:
+            timer.cancel()
+        self._enforce_memory_cap()
+
+    def _schedule_cancel(self, log: ReplayLog) -> None:
+        key = (log.session_id, log.turn_id)
+        if self.resume_grace <= 0:
+            self._cancel_if_idle(log)
+            return
+        loop = asyncio.get_running_loop()
+        self._idle_timers[key] = loop.call_later(self.resume_grace, self._cancel_if_idle, log)
+
+    def _cancel_if_idle(self, log: ReplayLog) -> None:
+        self._idle_timers.pop((log.session_id, log.turn_id), None)
+        if log.listeners == 0 and not log.finished and log.task is not None:
+            # nobody came back for it; stop paying for tokens
+            logger.info("✂️ cancelling abandoned stream", session_id=log.session_id, turn_id=log.turn_id)
+            log.task.cancel()
+
+    def _memory_bytes(self) -> int:
+        return sum(log.bytes for log in self.logs.values())
+
+    def _enforce_memory_cap(self) -> None:
+        total = self._memory_bytes()
+        for key, log in list(self.logs.items()):
+            if total <= self.max_memory_bytes:
+                break
+            if not log.finished or log.listeners:
+                continue
+            del self.logs[key]
+            total -= log.bytes
+            self._spill(log)
+
+    def _prune(self) -> None:
+        """Forget finished logs older than the ttl, in memory and on disk"""
+        expired_before = self._clock() - self.ttl
+        for key, log in list(self.logs.items()):
+            if log.finished and log.finished_at is not None and log.finished_at < expired_before:
+                del self.logs[key]
+        for key, finished_at in list(self._spilled.items()):
+            if finished_at < expired_before:
+                self._remove_spilled(key)
+
+    def _spill_file(self, key: Tuple[str, str]) -> str:
+        assert self.spill_path is not None
+        return os.path.join(self.spill_path, hashlib.sha256("/".join(key).encode("utf-8")).hexdigest())
+
+    def _spill(self, log: ReplayLog) -> None:
+        if not self.spill_path or log.finished_at is None:
+            return
+        key = (log.session_id, log.turn_id)
+        data = {"frames": [[seq, frame.decode("utf-8")] for seq, frame in log.frames]}
+        try:
+            with open(self._spill_file(key), "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+        except OSError:
+            logger.warning("⚠️ failed to spill replay log", session_id=log.session_id, exc_info=True)
+            return
+        self._spilled[key] = log.finished_at
+
+    def _load(self, session_id: str, turn_id: str) -> ReplayLog:
+        key = (session_id, turn_id)
+        try:
+            with open(self._spill_file(key), "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            self._spilled.pop(key, None)
+            raise ReplayUnavailableError(f"replay log for turn {turn_id} could not be read")
+
+        log = ReplayLog(session_id, turn_id, max_bytes=self.log_max_bytes)
+        log.extend([(seq, frame.encode("utf-8")) for seq, frame in data["frames"]])
+        log.finish(self._spilled[key])
+        return log
+
+    def _remove_spilled(self, key: Tuple[str, str]) -> None:
+        self._spilled.pop(key, None)
+        try:
+            os.remove(self._spill_file(key))
+        except OSError:
+            pass
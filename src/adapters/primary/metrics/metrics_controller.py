@@ -0,0 +1,25 @@
+from typing import Dict
+
+from fastapi import APIRouter
+
+from services.chat.chat_service import ChatService
+from ports.chat.dto import ModelRouteStats, ModelSchedulerStats, ModelUsageStats
+
+
+class MetricsController:
+    def __init__(self, chat_service: ChatService):
+        self.chat_service = chat_service
+
+        self.router = APIRouter(prefix="/v1/metrics")
+        self.router.add_api_route("/usage", self.usage, methods=["GET"])
+        self.router.add_api_route("/models", self.models, methods=["GET"])
+        self.router.add_api_route("/scheduler", self.scheduler, methods=["GET"])
+
+    async def usage(self) -> ModelUsageStats:
+        return self.chat_service.usage_stats()
+
+    async def models(self) -> Dict[str, ModelRouteStats]:
+        return self.chat_service.model_stats()
+
+    async def scheduler(self) -> ModelSchedulerStats:
+        return self.chat_service.scheduler_stats()
@@ -0,0 +1,17 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from utils.telemetry import Telemetry, telemetry as default_telemetry
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class PrometheusController:
+    def __init__(self, telemetry: Telemetry = default_telemetry):
+        self.telemetry = telemetry
+
+        self.router = APIRouter()
+        self.router.add_api_route("/metrics", self.metrics, methods=["GET"])
+
+    async def metrics(self) -> PlainTextResponse:
+        return PlainTextResponse(self.telemetry.render_prometheus(), media_type=PROMETHEUS_CONTENT_TYPE)
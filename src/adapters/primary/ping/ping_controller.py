@@ -1,12 +1,41 @@
+from typing import Optional
+
 from fastapi import APIRouter
+from fastapi.responses import JSONResponse
 
-from ports.ping.dto import HealthResponse
+from ports.ping.dto import HealthResponse, ReadinessResponse, SubsystemResponse
+from utils.readiness import Readiness, all_ready
 
 
 class PingController:
-    def __init__(self):
+    def __init__(self, readiness: Optional[Readiness] = None):
+        if readiness is None:
+            # without a readiness tracker there is nothing to wait for: always ready
+            readiness = Readiness([])
+            readiness.mark_started()
+        self.readiness = readiness
+
         self.router = APIRouter()
         self.router.add_api_route("/ping", self.ping, methods=["GET"])
+        self.router.add_api_route("/health/live", self.live, methods=["GET"], response_model=HealthResponse)
+        self.router.add_api_route(
+            "/health/ready", self.ready, methods=["GET"], response_model=ReadinessResponse)
 
     async def ping(self):
         return HealthResponse(status="ok")
+
+    async def live(self) -> JSONResponse:
+        """503 once a startup step failed, so the process gets restarted; answering at all shows the loop runs"""
+        live = self.readiness.live
+        response = HealthResponse(status="ok" if live else "failed")
+        return JSONResponse(response.model_dump(), status_code=200 if live else 503)
+
+    async def ready(self) -> JSONResponse:
+        """Subsystem health and load; 503 while starting, overloaded or failed"""
+        states = self.readiness.status()
+        ready = self.readiness.started and all_ready(states)
+        subsystems = {
+            name: SubsystemResponse(state=status.state, detail=status.detail) for name, status in states.items()
+        }
+        response = ReadinessResponse(status="ready" if ready else "not_ready", subsystems=subsystems)
+        return JSONResponse(response.model_dump(), status_code=200 if ready else 503)
@@ -0,0 +1,45 @@
+from typing import Sequence
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from utils.readiness import Readiness
+
+
+class StartupGate:
+    """
+    ASGI middleware answering 503 with `Retry-After` until the application is ready.
+
+    The app binds its port before the DI container is built and the MCP servers connect; health
+    checks (the `exempt` path prefixes) are served meanwhile, every other request is turned away.
+    Once the application has started the gate stays open: later trouble is for `/health/ready`
+    to report, not a reason to refuse requests that could still be served.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        readiness: Readiness,
+        exempt: Sequence[str] = ("/ping", "/health/"),
+        retry_after: int = 1,
+    ):
+        self.app = app
+        self.readiness = readiness
+        self.exempt = tuple(exempt)
+        self.retry_after = retry_after
+        self._open = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if self._open or scope["type"] != "http" or scope["path"].startswith(self.exempt):
+            await self.app(scope, receive, send)
+            return
+        if self.readiness.started:
+            self._open = True
+            await self.app(scope, receive, send)
+            return
+        response = JSONResponse(
+            {"detail": "service is starting"},
+            status_code=503,
+            headers={"Retry-After": str(self.retry_after)},
+        )
+        await response(scope, receive, send)
@@ -1,24 +1,35 @@
+from typing import TYPE_CHECKING
+
 from fastapi import APIRouter
 
 from adapters.primary import (
-    PingController,
     SessionController,
     ChatController,
+    BatchController,
+    MetricsController,
+    PrometheusController,
 )
-from di.container import DIContainer
+from config import app_config
+
+if TYPE_CHECKING:
+    # the container imports primary adapters itself (the stream replay store)
+    from di.container import DIContainer
 
 
 # TODO: use dependency injection using Depends instead of DIContainer for e2e testing
-def create_api_router(container: DIContainer) -> APIRouter:
-    ping_controller = PingController()
+# the health checks are not here: they are served before the container exists (see main.py)
+def create_api_router(container: "DIContainer") -> APIRouter:
     session_controller = SessionController(container.session_service)
-    chat_controller = ChatController(container.chat_service)
+    chat_controller = ChatController(
+        container.chat_service,
+        stream_heartbeat_interval=app_config.stream_heartbeat_interval,
+        replays=container.stream_replays,
+    )
+    batch_controller = BatchController(container.batch_service)
+    metrics_controller = MetricsController(container.chat_service)
+    prometheus_controller = PrometheusController()
 
     router = APIRouter()
-    router.include_router(
-        ping_controller.router,
-        tags=["health"]
-    )
     router.include_router(
         session_controller.router,
         tags=["sessions"]
@@ -27,5 +38,17 @@ def create_api_router(container: DIContainer) -> APIRouter:
         chat_controller.router,
         tags=["chat"]
     )
+    router.include_router(
+        batch_controller.router,
+        tags=["batch"]
+    )
+    router.include_router(
+        metrics_controller.router,
+        tags=["metrics"]
+    )
+    router.include_router(
+        prometheus_controller.router,
+        tags=["metrics"]
+    )
 
     return router
@@ -1,4 +1,18 @@
+from .batch_checkpoint_store import FileBatchCheckpointStore
+from .conversation_manager import ConversationManagerFactory, ConversationStrategy
+from .fake_model import FakeModel
+from .model_router import ModelSpec, RoutingStrategy
+from .response_cache import InMemoryResponseCache
 from .strands_mcp_agent_adapter import StrandsMCPAgentAdapter
 
 
-__all__ = ["StrandsMCPAgentAdapter"]
+__all__ = [
+    "FileBatchCheckpointStore",
+    "ConversationManagerFactory",
+    "ConversationStrategy",
+    "FakeModel",
+    "InMemoryResponseCache",
+    "ModelSpec",
+    "RoutingStrategy",
+    "StrandsMCPAgentAdapter",
+]
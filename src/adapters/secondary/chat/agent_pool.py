@@ -0,0 +1,199 @@
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from strands import Agent
+
+from utils.logger import logger
+
+
+# (session_id, agent, reason) -> None
+EvictionCallback = Callable[[str, Agent, str], None]
+
+
+@dataclass
+class AgentPoolStats:
+    size: int
+    bytes: int
+    hits: int
+    misses: int
+    evictions: Dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class _PoolEntry:
+    agent: Agent
+    last_used: float
+    bytes: int = 0
+    measured_messages: int = 0
+
+
+def estimate_message_bytes(message: Any) -> int:
+    """Approximate in-memory size of a single message by its serialized length"""
+    try:
+        return len(json.dumps(message, default=str, ensure_ascii=False))
+    except (TypeError, ValueError):
+        return len(str(message))
+
+
+class AgentPool:
+    """
+    Bounded LRU pool of agents keyed by session id.
+
+    Entries are evicted when the pool exceeds `max_size` entries or `max_bytes` estimated bytes
+    (least recently used first), or when they have been idle longer than `idle_ttl` seconds.
+    An evicted session is simply rebuilt by the caller on its next request.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 256,
+        idle_ttl: Optional[float] = 60 * 30,
+        max_bytes: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        assert max_size > 0, "max_size must be positive"
+        self.max_size = max_size
+        self.idle_ttl = idle_ttl
+        self.max_bytes = max_bytes
+        self._clock = clock
+
+        self._entries: "OrderedDict[str, _PoolEntry]" = OrderedDict()
+        self._callbacks: List[EvictionCallback] = []
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, session_id: object) -> bool:
+        return session_id in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._entries))
+
+    def add_eviction_callback(self, callback: EvictionCallback) -> None:
+        self._callbacks.append(callback)
+
+    def get(self, session_id: str) -> Optional[Agent]:
+        """Return the pooled agent for the session (marking it most recently used), or None"""
+        self.evict_idle()
+
+        entry = self._entries.get(session_id)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        entry.last_used = self._clock()
+        self._entries.move_to_end(session_id)
+        return entry.agent
+
+    def put(self, session_id: str, agent: Agent) -> None:
+        """Add an agent to the pool, evicting others if capacity is exceeded"""
+        if session_id in self._entries:
+            self._discard(session_id)
+
+        self._entries[session_id] = _PoolEntry(agent=agent, last_used=self._clock())
+        self.touch(session_id)
+
+    def touch(self, session_id: str) -> None:
+        """
+        Refresh the byte estimate of a pooled agent after its history changed.
+
+        Only messages appended since the last measurement are sized, so a turn costs O(new messages).
+        If the history shrank (e.g. the conversation manager trimmed it), the estimate is recomputed.
+        """
+        entry = self._entries.get(session_id)
+        if entry is None:
+            return
+
+        messages = getattr(entry.agent, "messages", None) or []
+        if len(messages) < entry.measured_messages:
+            new_bytes = sum(estimate_message_bytes(m) for m in messages)
+        else:
+            new_bytes = entry.bytes + sum(estimate_message_bytes(m) for m in messages[entry.measured_messages:])
+
+        self._bytes += new_bytes - entry.bytes
+        entry.bytes = new_bytes
+        entry.measured_messages = len(messages)
+        entry.last_used = self._clock()
+        self._entries.move_to_end(session_id)
+
+        self._evict_over_capacity(keep=session_id)
+
+    def remove(self, session_id: str) -> Optional[Agent]:
+        """Remove an agent from the pool without counting it as an eviction"""
+        entry = self._discard(session_id)
+        return entry.agent if entry else None
+
+    def evict_idle(self) -> None:
+        """Evict agents idle longer than `idle_ttl`; entries are in LRU order so only the head is scanned"""
+        if self.idle_ttl is None:
+            return
+
+        deadline = self._clock() - self.idle_ttl
+        while self._entries:
+            session_id, entry = next(iter(self._entries.items()))
+            if entry.last_used > deadline:
+                break
+            self._evict(session_id, "idle")
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> AgentPoolStats:
+        return AgentPoolStats(
+            size=len(self._entries),
+            bytes=self._bytes,
+            hits=self._hits,
+            misses=self._misses,
+            evictions=dict(self._evictions),
+        )
+
+    def _evict_over_capacity(self, keep: Optional[str] = None) -> None:
+        while len(self._entries) > self.max_size:
+            if not self._evict_lru("capacity", keep):
+                break
+
+        if self.max_bytes is None:
+            return
+        while self._bytes > self.max_bytes:
+            if not self._evict_lru("memory", keep):
+                break
+
+    def _evict_lru(self, reason: str, keep: Optional[str]) -> bool:
+        for session_id in self._entries:
+            if session_id != keep:
+                self._evict(session_id, reason)
+                return True
+        return False
+
+    def _evict(self, session_id: str, reason: str) -> None:
+        entry = self._discard(session_id)
+        if entry is None:
+            return
+
+        self._evictions[reason] = self._evictions.get(reason, 0) + 1
+        for callback in self._callbacks:
+            try:
+                callback(session_id, entry.agent, reason)
+            except Exception:
+                logger.error(
+                    "🚨 agent pool eviction callback failed",
+                    session_id=session_id,
+                    reason=reason,
+                    exc_info=True,
+                    stack_info=True,
+                )
+
+    def _discard(self, session_id: str) -> Optional[_PoolEntry]:
+        entry = self._entries.pop(session_id, None)
+        if entry is not None:
+            self._bytes -= entry.bytes
+        return entry
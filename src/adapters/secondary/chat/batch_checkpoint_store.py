@@ -0,0 +1,76 @@
+import json
+import os
+import re
+import time
+from typing import Dict, Optional, override
+
+from ports.chat import BatchCheckpointStore
+from ports.chat.dto import BatchResult
+from utils.logger import logger
+
+
+# batch ids become file names
+_BATCH_ID = re.compile(r"^[A-Za-z0-9_.-]{1,128}$")
+
+
+class FileBatchCheckpointStore(BatchCheckpointStore):
+    """
+    One append-only JSONL file of completed results per batch.
+
+    A line is written as each item completes, so an interrupted batch loses at most the items in flight.
+    A torn last line (the worker died mid-write) is ignored; that item simply runs again.
+    Checkpoints not written to for `ttl` seconds are removed by `prune`.
+    """
+
+    def __init__(self, path: str, ttl: Optional[float] = 7 * 24 * 60 * 60):
+        self.path = path
+        self.ttl = ttl
+        os.makedirs(path, exist_ok=True)
+
+    @staticmethod
+    def validate(batch_id: str) -> None:
+        if not _BATCH_ID.match(batch_id):
+            raise ValueError(f"invalid batch id: {batch_id!r}")
+
+    @override
+    def load(self, batch_id: str) -> Dict[str, BatchResult]:
+        self.validate(batch_id)
+        results: Dict[str, BatchResult] = {}
+        try:
+            with open(self._file(batch_id), encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        result = BatchResult.model_validate_json(line)
+                    except ValueError:
+                        logger.warning("⚠️ skipping unreadable batch checkpoint line", batch_id=batch_id)
+                        continue
+                    results[result.id] = result
+        except FileNotFoundError:
+            pass
+        return results
+
+    @override
+    def append(self, batch_id: str, result: BatchResult) -> None:
+        self.validate(batch_id)
+        line = json.dumps(result.model_dump(exclude_none=True), ensure_ascii=False)
+        with open(self._file(batch_id), "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+    def prune(self) -> int:
+        """Remove expired checkpoints; returns how many were removed"""
+        if self.ttl is None:
+            return 0
+        cutoff = time.time() - self.ttl
+        removed = 0
+        for name in os.listdir(self.path):
+            file = os.path.join(self.path, name)
+            try:
+                if name.endswith(".jsonl") and os.stat(file).st_mtime < cutoff:
+                    os.remove(file)
+                    removed += 1
+            except FileNotFoundError:
+                pass
+        return removed
+
+    def _file(self, batch_id: str) -> str:
+        return os.path.join(self.path, f"{batch_id}.jsonl")
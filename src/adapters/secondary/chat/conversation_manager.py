@@ -0,0 +1,340 @@
+import asyncio
+import json
+from collections import deque
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Any, Callable, Coroutine, Deque, Dict, Iterator, List, Optional, Tuple, override
+
+from strands import Agent
+from strands.agent.conversation_manager import (
+    ConversationManager,
+    SlidingWindowConversationManager,
+    SummarizingConversationManager,
+)
+from strands.types.content import Message
+from strands.types.exceptions import ContextWindowOverflowException
+
+from utils.logger import logger
+from utils.tokens import estimate_message_tokens
+
+
+# messages -> summary text; runs the model, so it is awaited off the request path
+Summarizer = Callable[[List[Message]], Coroutine[Any, Any, str]]
+
+SUMMARY_PREFIX = "Summary of the earlier conversation:\n"
+
+
+class ConversationStrategy(StrEnum):
+    SLIDING = "sliding"
+    SUMMARIZING = "summarizing"
+    TOKEN_BUDGET = "token_budget"
+    COMPACTING = "compacting"
+
+
+class MessageTokenTracker:
+    """
+    Token counts of an agent's message list, cached per message.
+
+    Messages are only ever appended at the tail or trimmed from the head, so after the first sync
+    each turn only counts the new messages and each trim only subtracts the dropped ones.
+    Any other mutation (restore, summarization) is detected in O(1) and triggers a full recount.
+    """
+
+    def __init__(self, counter: Callable[[Message], int] = estimate_message_tokens):
+        self._counter = counter
+        self._entries: Deque[Tuple[Message, int]] = deque()
+        self.total = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def sync(self, messages: List[Message]) -> int:
+        """Bring the cache in line with `messages` and return their total token count"""
+        tracked = len(self._entries)
+        if tracked and (
+            len(messages) < tracked
+            or messages[0] is not self._entries[0][0]
+            or messages[tracked - 1] is not self._entries[-1][0]
+        ):
+            self.reset()
+            tracked = 0
+
+        for message in messages[tracked:]:
+            tokens = self._counter(message)
+            self._entries.append((message, tokens))
+            self.total += tokens
+        return self.total
+
+    def counts(self) -> Iterator[int]:
+        """Per-message token counts, oldest first"""
+        return (tokens for _, tokens in self._entries)
+
+    def drop_front(self, count: int) -> None:
+        for _ in range(min(count, len(self._entries))):
+            _, tokens = self._entries.popleft()
+            self.total -= tokens
+
+    def reset(self) -> None:
+        self._entries.clear()
+        self.total = 0
+
+
+class TokenBudgetConversationManager(SlidingWindowConversationManager):
+    """
+    Sliding window bounded by both a message count and an estimated input-token budget.
+
+    Oldest messages are trimmed until the history fits both limits, never splitting a
+    toolUse/toolResult pair.
+    """
+
+    def __init__(
+        self,
+        token_budget: int,
+        window_size: int = 40,
+        should_truncate_results: bool = True,
+        token_counter: Callable[[Message], int] = estimate_message_tokens,
+    ):
+        super().__init__(window_size=window_size, should_truncate_results=should_truncate_results)
+        self.token_budget = token_budget
+        self.tracker = MessageTokenTracker(token_counter)
+
+    @override
+    def apply_management(self, agent: Agent, **kwargs: Any) -> None:
+        total = self.tracker.sync(agent.messages)
+        if len(agent.messages) <= self.window_size and total <= self.token_budget:
+            return
+        self._trim(agent.messages, strict=False)
+
+    @override
+    def reduce_context(self, agent: Agent, e: Optional[Exception] = None, **kwargs: Any) -> None:
+        if e is None:
+            self.tracker.sync(agent.messages)
+            self._trim(agent.messages, strict=True)
+            return
+
+        # the model rejected the context: fall back to the base strategy, which may rewrite tool results in place
+        super().reduce_context(agent, e, **kwargs)
+        self.tracker.reset()
+
+    def _trim(self, messages: List[Message], strict: bool) -> None:
+        min_trim = max(len(messages) - self.window_size, 0)
+        remaining = self.tracker.total
+        trim_index = 0
+        # only the dropped prefix is walked, so trimming is proportional to what is removed
+        for tokens in self.tracker.counts():
+            if trim_index >= len(messages) - 1 or (trim_index >= min_trim and remaining <= self.token_budget):
+                break
+            remaining -= tokens
+            trim_index += 1
+
+        trim_index = self._next_valid_trim_index(messages, trim_index)
+        if trim_index == 0:
+            return
+        if trim_index >= len(messages):
+            if strict:
+                raise ContextWindowOverflowException("Unable to trim conversation context!")
+            # no valid cut point yet (e.g. pending tool result); retry after the next cycle
+            return
+
+        self.removed_message_count += trim_index
+        messages[:] = messages[trim_index:]
+        self.tracker.drop_front(trim_index)
+
+    @staticmethod
+    def _next_valid_trim_index(messages: List[Message], trim_index: int) -> int:
+        while 0 < trim_index < len(messages):
+            content = messages[trim_index]["content"]
+            # the oldest message cannot be a toolResult, nor a toolUse whose result does not follow it
+            if any("toolResult" in block for block in content) or (
+                any("toolUse" in block for block in content)
+                and trim_index + 1 < len(messages)
+                and not any("toolResult" in block for block in messages[trim_index + 1]["content"])
+            ):
+                trim_index += 1
+            else:
+                break
+        return trim_index
+
+
+def render_transcript(messages: List[Message], max_tool_result_chars: int = 2000) -> str:
+    """Plain-text transcript of messages for the summarizer; tool calls and results are inlined"""
+    lines: List[str] = []
+    for message in messages:
+        for block in message["content"]:
+            if "text" in block:
+                lines.append(f"{message['role']}: {block['text']}")
+            elif "toolUse" in block:
+                tool_use = block["toolUse"]
+                lines.append(f"tool call {tool_use['name']}: {json.dumps(tool_use.get('input', {}), default=str)}")
+            elif "toolResult" in block:
+                result = " ".join(item["text"] for item in block["toolResult"].get("content", []) if "text" in item)
+                lines.append(f"tool result: {result[:max_tool_result_chars]}")
+    return "\n".join(lines)
+
+
+class CompactingConversationManager(TokenBudgetConversationManager):
+    """
+    Token budget that folds the oldest messages into a running summary instead of dropping them.
+
+    Once the history crosses `compaction_threshold` tokens, the oldest span (together with the current
+    summary, so earlier turns are never summarized twice) is summarized in a background task while the
+    conversation goes on. The summary replaces the span at the next turn boundary and is kept in the
+    conversation manager state, so it is persisted with the session and restored as the first message.
+    The token budget still trims hard if a summary is not ready in time.
+    """
+
+    def __init__(
+        self,
+        token_budget: int,
+        summarizer: Summarizer,
+        compaction_threshold: Optional[int] = None,
+        window_size: int = 200,
+        preserve_recent_messages: int = 4,
+        should_truncate_results: bool = True,
+        token_counter: Callable[[Message], int] = estimate_message_tokens,
+    ):
+        super().__init__(
+            token_budget=token_budget,
+            window_size=window_size,
+            should_truncate_results=should_truncate_results,
+            token_counter=token_counter,
+        )
+        self.summarizer = summarizer
+        self.compaction_threshold = compaction_threshold or token_budget * 3 // 4
+        self.preserve_recent_messages = preserve_recent_messages
+        self.summaries = 0
+        self._summary_message: Optional[Message] = None
+        self._pending: Optional[asyncio.Task] = None
+        # last message of the span being summarized, located by identity when the summary lands
+        self._pending_end: Optional[Message] = None
+
+    @override
+    def restore_from_session(self, state: Dict[str, Any]) -> Optional[List[Message]]:
+        super().restore_from_session(state)
+        self._summary_message = state.get("summary_message")
+        return [self._summary_message] if self._summary_message else None
+
+    @override
+    def get_state(self) -> Dict[str, Any]:
+        return {"summary_message": self._summary_message, **super().get_state()}
+
+    @override
+    def apply_management(self, agent: Agent, **kwargs: Any) -> None:
+        self.apply_summary(agent)
+        if self.tracker.sync(agent.messages) > self.compaction_threshold:
+            self._schedule_summary(agent.messages)
+        super().apply_management(agent, **kwargs)
+
+    def apply_summary(self, agent: Agent) -> bool:
+        """Swap a finished background summary in for the span it covers; call between turns"""
+        task, end = self._pending, self._pending_end
+        if task is None or not task.done():
+            return False
+        self._pending = self._pending_end = None
+        if task.cancelled() or task.exception() is not None:
+            logger.warning("⚠️ conversation summary failed, keeping the full history", exc_info=task.exception())
+            return False
+
+        messages = agent.messages
+        split = next((i + 1 for i, message in enumerate(messages) if message is end), None)
+        if split is None:
+            # the span was trimmed by the hard budget meanwhile; the summary no longer lines up
+            return False
+
+        replaced = split - (1 if messages[0] is self._summary_message else 0)
+        self._summary_message = {"role": "user", "content": [{"text": SUMMARY_PREFIX + task.result()}]}
+        messages[:] = [self._summary_message] + messages[split:]
+        self.removed_message_count += replaced
+        self.tracker.reset()
+        self.summaries += 1
+        logger.info("🗜️ conversation compacted", summarized_messages=replaced, remaining_messages=len(messages))
+        return True
+
+    def _schedule_summary(self, messages: List[Message]) -> None:
+        if self._pending is not None:
+            return
+        split = self._split_index(messages)
+        if split <= 1:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._pending_end = messages[split - 1]
+        self._pending = loop.create_task(self.summarizer(list(messages[:split])))
+
+    def _split_index(self, messages: List[Message]) -> int:
+        """Number of leading messages to summarize: everything but the newest half of the threshold"""
+        keep_tokens = self.compaction_threshold // 2
+        counts = list(self.tracker.counts())
+        split, kept = len(messages), 0
+        while split > 0:
+            recent = len(messages) - split < self.preserve_recent_messages
+            if not recent and kept + counts[split - 1] > keep_tokens:
+                break
+            split -= 1
+            kept += counts[split]
+        # the summary is a user message, so the kept history has to resume with the assistant
+        while split < len(messages) and messages[split]["role"] != "assistant":
+            split += 1
+        return split if split < len(messages) else 0
+
+    @override
+    def _trim(self, messages: List[Message], strict: bool) -> None:
+        head = messages[0] if messages else None
+        super()._trim(messages, strict)
+        if head is not None and head is self._summary_message and (not messages or messages[0] is not head):
+            # the summary is not a session message; it must not count as removed
+            self.removed_message_count -= 1
+            self._summary_message = None
+
+
+@dataclass
+class ConversationManagerFactory:
+    """
+    Builds a fresh conversation manager for every agent.
+
+    Conversation managers keep per-conversation state (e.g. removed_message_count), so they must never
+    be shared between sessions.
+    Note that a session restored from storage must use the same strategy it was persisted with.
+    """
+
+    strategy: ConversationStrategy = ConversationStrategy.SLIDING
+    window_size: int = 20
+    token_budget: int = 32_000
+    should_truncate_results: bool = True
+    summary_ratio: float = 0.3
+    preserve_recent_messages: int = 10
+    # tokens at which the compacting strategy starts summarizing; None: 3/4 of the token budget
+    compaction_threshold: Optional[int] = None
+
+    def __post_init__(self):
+        self.strategy = ConversationStrategy(self.strategy)
+
+    def create(self, summarizer: Optional[Summarizer] = None) -> ConversationManager:
+        if self.strategy == ConversationStrategy.COMPACTING:
+            if summarizer is None:
+                raise ValueError("the compacting strategy needs a summarizer")
+            return CompactingConversationManager(
+                token_budget=self.token_budget,
+                summarizer=summarizer,
+                compaction_threshold=self.compaction_threshold,
+                window_size=self.window_size,
+                preserve_recent_messages=self.preserve_recent_messages,
+                should_truncate_results=self.should_truncate_results,
+            )
+        if self.strategy == ConversationStrategy.SUMMARIZING:
+            return SummarizingConversationManager(
+                summary_ratio=self.summary_ratio,
+                preserve_recent_messages=self.preserve_recent_messages,
+            )
+        if self.strategy == ConversationStrategy.TOKEN_BUDGET:
+            return TokenBudgetConversationManager(
+                token_budget=self.token_budget,
+                window_size=self.window_size,
+                should_truncate_results=self.should_truncate_results,
+            )
+        return SlidingWindowConversationManager(
+            window_size=self.window_size,
+            should_truncate_results=self.should_truncate_results,
+        )
@@ -0,0 +1,144 @@
+import asyncio
+import json
+import random
+import re
+from typing import Any, AsyncGenerator, Callable, Dict, List, Optional, Type, TypeVar, Union, override
+
+from pydantic import BaseModel
+from strands.models import Model
+from strands.types.content import Messages
+from strands.types.exceptions import ModelThrottledException
+from strands.types.streaming import StreamEvent
+from strands.types.tools import ToolSpec
+
+T = TypeVar("T", bound=BaseModel)
+
+# a word and the whitespace after it counts as one token
+_TOKEN = re.compile(r"\S+\s*")
+
+
+class FakeModel(Model):
+    """
+    Local stand-in for a Bedrock model, for tests and load tests without AWS.
+
+    Answers every call with `text`: the first token after `latency` seconds, the rest at
+    `tokens_per_second` (all at once when unset). The first `tool_calls_per_turn` calls of a turn
+    ask for `parallel_tool_calls` tools at once instead, with `tool_input`: `tool_name`, or else the
+    offered tools in turn.
+    Like a provisioned quota, it throttles calls beyond `capacity` concurrent ones, and a random
+    `throttle_rate` share of all calls. Nothing else is random, so runs are repeatable.
+    """
+
+    def __init__(
+        self,
+        text: str = "ok",
+        latency: float = 0.05,
+        capacity: Optional[int] = None,
+        throttle_rate: float = 0.0,
+        rng: Callable[[], float] = random.random,
+        tokens_per_second: Optional[float] = None,
+        tool_calls_per_turn: int = 0,
+        parallel_tool_calls: int = 1,
+        tool_name: Optional[str] = None,
+        tool_input: Optional[Dict[str, Any]] = None,
+    ):
+        self.text = text
+        self.latency = latency
+        self.capacity = capacity
+        self.throttle_rate = throttle_rate
+        self._rng = rng
+        self.tokens_per_second = tokens_per_second
+        self.tool_calls_per_turn = tool_calls_per_turn
+        self.parallel_tool_calls = parallel_tool_calls
+        self.tool_name = tool_name
+        self.tool_input = tool_input or {"query": "benchmark"}
+        self.in_flight = 0
+        self.calls = 0
+        self.throttled = 0
+
+    @override
+    def update_config(self, **model_config: Any) -> None:
+        pass
+
+    @override
+    def get_config(self) -> Any:
+        return {"model_id": "fake"}
+
+    @override
+    def structured_output(
+        self, output_model: Type[T], prompt: Messages, system_prompt: Optional[str] = None, **kwargs: Any
+    ) -> AsyncGenerator[dict[str, Union[T, Any]], None]:
+        raise NotImplementedError("the fake model has no structured output")
+
+    @override
+    async def stream(
+        self,
+        messages: Messages,
+        tool_specs: Optional[List[ToolSpec]] = None,
+        system_prompt: Optional[str] = None,
+        **kwargs: Any,
+    ) -> AsyncGenerator[StreamEvent, None]:
+        self.calls += 1
+        if (self.capacity is not None and self.in_flight >= self.capacity) or self._rng() < self.throttle_rate:
+            self.throttled += 1
+            raise ModelThrottledException("ThrottlingException: too many requests")
+
+        self.in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            await asyncio.sleep(self.latency)
+            yield {"messageStart": {"role": "assistant"}}
+
+            tools = self._next_tools(messages, tool_specs)
+            if tools:
+                for i, tool in enumerate(tools):
+                    tool_use_id = f"tooluse_fake_{self.calls}_{i}"
+                    yield {"contentBlockStart": {"start": {"toolUse": {"toolUseId": tool_use_id, "name": tool}}}}
+                    yield {"contentBlockDelta": {"delta": {"toolUse": {"input": json.dumps(self.tool_input)}}}}
+                    yield {"contentBlockStop": {}}
+                yield {"messageStop": {"stopReason": "tool_use"}}
+                output_tokens = len(tools) * len(json.dumps(self.tool_input)) // 4
+            else:
+                tokens = _TOKEN.findall(self.text) or [self.text]
+                first_token_at = loop.time()
+                for i, token in enumerate(tokens):
+                    if i and self.tokens_per_second:
+                        await asyncio.sleep(max(0.0, first_token_at + i / self.tokens_per_second - loop.time()))
+                    yield {"contentBlockDelta": {"delta": {"text": token}}}
+                yield {"contentBlockStop": {}}
+                yield {"messageStop": {"stopReason": "end_turn"}}
+                output_tokens = len(tokens)
+
+            input_tokens = sum(len(str(message["content"])) for message in messages) // 4
+            yield {
+                "metadata": {
+                    "usage": {
+                        "inputTokens": input_tokens,
+                        "outputTokens": output_tokens,
+                        "totalTokens": input_tokens + output_tokens,
+                    },
+                    "metrics": {"latencyMs": int((loop.time() - started) * 1000)},
+                }
+            }
+        finally:
+            self.in_flight -= 1
+
+    def _next_tools(self, messages: Messages, tool_specs: Optional[List[ToolSpec]]) -> List[str]:
+        """The tools to ask for, while the turn has made fewer than `tool_calls_per_turn` tool calls"""
+        if not tool_specs or self.tool_calls_per_turn <= 0:
+            return []
+        tool_calls = 0
+        # tool calls of this turn are the assistant tool uses after the last user prompt
+        for message in reversed(messages):
+            content = message["content"]
+            if message["role"] == "user" and not any("toolResult" in block for block in content):
+                break
+            if message["role"] == "assistant" and any("toolUse" in block for block in content):
+                tool_calls += 1
+        if tool_calls >= self.tool_calls_per_turn:
+            return []
+        first = tool_calls * self.parallel_tool_calls
+        return [
+            self.tool_name or tool_specs[(first + i) % len(tool_specs)]["name"] for i in range(self.parallel_tool_calls)
+        ]
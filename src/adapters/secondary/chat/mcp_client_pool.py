@@ -0,0 +1,374 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Any, Callable, Dict, List, Optional, cast
+
+from strands.tools.mcp import MCPClient
+
+from adapters.secondary.chat.mcp_tool_catalog import build_tools, tool_definitions
+from ports.mcp import MCPCircuitBreakerConfig, MCPPoolConfig
+from utils.logger import logger
+
+
+# strands turns exceptions raised while talking to the server into error results with this prefix
+_TRANSPORT_ERROR_PREFIX = "Tool execution failed:"
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"  # calls flow normally
+    OPEN = "open"  # calls fail fast and the server's tools are hidden from new agents
+    HALF_OPEN = "half_open"  # reset timeout elapsed; the next outcome decides
+
+
+# (server_name, state) -> None
+CircuitChangeCallback = Callable[[str, CircuitState], None]
+# (server_name) -> None
+ConnectedCallback = Callable[[str], None]
+
+
+class CircuitBreaker:
+    """Opens after `failure_threshold` consecutive failures and half-opens `reset_timeout` seconds later"""
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        on_change: Optional[Callable[[CircuitState], None]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._on_change = on_change
+        self._clock = clock
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+
+    @property
+    def state(self) -> CircuitState:
+        if self._state == CircuitState.OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+            self._set_state(CircuitState.HALF_OPEN)
+        return self._state
+
+    def allow(self) -> bool:
+        return self.state != CircuitState.OPEN
+
+    def record_success(self) -> None:
+        self._failures = 0
+        if self._state != CircuitState.CLOSED:
+            self._set_state(CircuitState.CLOSED)
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self.state == CircuitState.HALF_OPEN or self._failures >= self.failure_threshold:
+            self._opened_at = self._clock()
+            if self._state != CircuitState.OPEN:
+                self._set_state(CircuitState.OPEN)
+
+    def _set_state(self, state: CircuitState) -> None:
+        self._state = state
+        if self._on_change is not None:
+            self._on_change(state)
+
+
+@dataclass
+class _Member:
+    client: MCPClient
+    healthy: bool = False
+    # a (re)connect is running in a worker thread; the client must not be replaced meanwhile
+    starting: bool = False
+    in_flight: int = 0
+    backoff: float = 0.0
+    retry_at: float = 0.0
+    probe: Optional[asyncio.Future] = None
+
+
+@dataclass
+class MCPClientPoolStats:
+    size: int
+    healthy: int
+    in_flight: int
+    circuit: CircuitState
+    reconnects: int
+
+
+class MCPClientPool:
+    """
+    N connections to one MCP server behind the MCPClient interface the agent tools use.
+
+    Calls go to the healthy connection with the fewest calls in flight, so one slow call does not
+    hold up every session. A background task probes the connections, reconnects dead ones with
+    exponential backoff, and drives a circuit breaker that fails calls fast while the server is down.
+    The same task keeps retrying a pool that could not connect at all; `on_connected` fires whenever
+    the pool goes from no usable connection to at least one.
+    """
+
+    def __init__(
+        self,
+        server_name: str,
+        client: MCPClient,
+        factory: Optional[Callable[[], Optional[MCPClient]]] = None,
+        pool_config: Optional[MCPPoolConfig] = None,
+        breaker_config: Optional[MCPCircuitBreakerConfig] = None,
+        on_circuit_change: Optional[CircuitChangeCallback] = None,
+        on_connected: Optional[ConnectedCallback] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.server_name = server_name
+        self.config = pool_config or MCPPoolConfig()
+        breaker_config = breaker_config or MCPCircuitBreakerConfig()
+        self._factory = factory
+        self._clock = clock
+        self._on_circuit_change = on_circuit_change
+        self._on_connected = on_connected
+
+        clients = [client]
+        if factory is not None:
+            clients.extend(c for c in (factory() for _ in range(self.config.size - 1)) if c is not None)
+        self.members = [_Member(client=c) for c in clients]
+
+        self.breaker = CircuitBreaker(
+            failure_threshold=breaker_config.failureThreshold,
+            reset_timeout=breaker_config.resetTimeout,
+            on_change=self._circuit_changed,
+            clock=clock,
+        )
+        self.reconnects = 0
+        self._connected = False
+        self._health_task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        # probes run here rather than in the default executor, so probes stuck on a hung server are
+        # bounded by the pool size instead of piling up every health check interval
+        self._probe_executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def available(self) -> bool:
+        return self.breaker.allow()
+
+    def start(self) -> "MCPClientPool":
+        """Blocking: connect every member concurrently; succeeds if at least one connects"""
+        with ThreadPoolExecutor(max_workers=len(self.members)) as executor:
+            connected = list(executor.map(self._start_member, self.members))
+        if not any(connected):
+            raise RuntimeError(f"no connection to MCP server could be established: {self.server_name}")
+        return self
+
+    def stop(self, exc_type: Any = None, exc_val: Any = None, exc_tb: Any = None) -> None:
+        if self._health_task is not None:
+            self._health_task.cancel()
+            self._health_task = None
+        if self._probe_executor is not None:
+            self._probe_executor.shutdown(wait=False, cancel_futures=True)
+            self._probe_executor = None
+        for member in self.members:
+            member.healthy = False
+            self._stop_client(member.client)
+
+    def list_tools_sync(self, pagination_token: Optional[str] = None) -> List[Any]:
+        member = self._pick()
+        if member is None:
+            raise RuntimeError(f"no healthy connection to MCP server: {self.server_name}")
+        # rebind the tools to the pool so their calls are balanced across connections
+        return build_tools(tool_definitions(member.client.list_tools_sync(pagination_token)), self)
+
+    async def call_tool_async(
+        self,
+        tool_use_id: str,
+        name: str,
+        arguments: Optional[Dict[str, Any]] = None,
+        read_timeout_seconds: Any = None,
+    ) -> Dict[str, Any]:
+        if not self.breaker.allow():
+            return self._error_result(tool_use_id, f"MCP server {self.server_name} is temporarily unavailable")
+
+        member = self._pick()
+        if member is None:
+            self.breaker.record_failure()
+            return self._error_result(tool_use_id, f"no healthy connection to MCP server {self.server_name}")
+
+        member.in_flight += 1
+        try:
+            call = member.client.call_tool_async(
+                tool_use_id=tool_use_id,
+                name=name,
+                arguments=arguments,
+                read_timeout_seconds=read_timeout_seconds,
+            )
+            # MCPToolResult is a TypedDict; handled as the plain dict it is at runtime
+            result = cast(Dict[str, Any], await asyncio.wait_for(call, self.config.callTimeout))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("⚠️ MCP tool call failed", server_name=self.server_name, tool_name=name, error=str(e))
+            self._mark_unhealthy(member)
+            self.breaker.record_failure()
+            return self._error_result(tool_use_id, f"{_TRANSPORT_ERROR_PREFIX} {e}")
+        finally:
+            member.in_flight -= 1
+
+        if self._is_transport_error(result):
+            self._mark_unhealthy(member)
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
+        return result
+
+    def start_health_checks(self) -> None:
+        """Start the background probe/reconnect loop on the running event loop"""
+        if self._health_task is None:
+            self._wakeup = asyncio.Event()
+            self._health_task = asyncio.create_task(self._run_health_checks())
+
+    async def check_health(self) -> None:
+        """Probe healthy members, reconnect unhealthy ones that are due, and settle a half-open breaker"""
+        now = self._clock()
+        checks = []
+        for member in self.members:
+            if member.healthy:
+                checks.append(self._probe(member))
+            elif not member.starting and member.retry_at <= now:
+                checks.append(self._reconnect(member))
+        if checks:
+            await asyncio.gather(*checks)
+
+        connected, self._connected = self._connected, any(member.healthy for member in self.members)
+        if self._connected and not connected and self._on_connected is not None:
+            self._on_connected(self.server_name)
+
+        if self.breaker.state == CircuitState.HALF_OPEN:
+            if any(member.healthy for member in self.members):
+                self.breaker.record_success()
+            else:
+                self.breaker.record_failure()
+
+    def stats(self) -> MCPClientPoolStats:
+        return MCPClientPoolStats(
+            size=len(self.members),
+            healthy=sum(1 for member in self.members if member.healthy),
+            in_flight=sum(member.in_flight for member in self.members),
+            circuit=self.breaker.state,
+            reconnects=self.reconnects,
+        )
+
+    async def _run_health_checks(self) -> None:
+        assert self._wakeup is not None
+        while True:
+            delay = self.config.healthCheckInterval
+            unhealthy = [member.retry_at for member in self.members if not member.healthy]
+            if unhealthy:
+                delay = max(min(delay, min(unhealthy) - self._clock()), 0)
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), delay)
+            except TimeoutError:
+                pass
+            self._wakeup.clear()
+
+            try:
+                await self.check_health()
+            except Exception:
+                logger.error(
+                    "🚨 MCP health check failed",
+                    server_name=self.server_name,
+                    exc_info=True,
+                    stack_info=True,
+                )
+
+    async def _probe(self, member: _Member) -> None:
+        if member.probe is not None and not member.probe.done():
+            # the previous probe is still stuck on this connection; don't queue another one behind it
+            logger.warning("⚠️ MCP health probe still pending", server_name=self.server_name)
+            self._mark_unhealthy(member)
+            return
+
+        if self._probe_executor is None:
+            self._probe_executor = ThreadPoolExecutor(
+                max_workers=len(self.members), thread_name_prefix=f"mcp-probe-{self.server_name}"
+            )
+        member.probe = asyncio.get_running_loop().run_in_executor(
+            self._probe_executor, member.client.list_tools_sync
+        )
+        # a probe that outlived its timeout fails unobserved; don't log it as never retrieved
+        member.probe.add_done_callback(lambda f: f.cancelled() or f.exception())
+        try:
+            # shield: on timeout the probe future must keep tracking the thread it is still running on
+            await asyncio.wait_for(asyncio.shield(member.probe), self.config.probeTimeout)
+        except Exception:
+            logger.warning("⚠️ MCP health probe failed", server_name=self.server_name)
+            self._mark_unhealthy(member)
+
+    async def _reconnect(self, member: _Member) -> None:
+        old = member.client
+        new = self._factory() if self._factory is not None else old
+        if new is None or new is old:
+            # reuse the client: it has to be stopped (reset) before it can be started again
+            new = old
+            await asyncio.to_thread(self._stop_client, old)
+        else:
+            # the old connection may be half dead; never let closing it hold up the reconnect
+            asyncio.get_running_loop().run_in_executor(None, self._stop_client, old)
+            member.probe = None
+
+        member.client = new
+        if not await asyncio.to_thread(self._start_member, member):
+            return
+
+        self.reconnects += 1
+        logger.info("🔌 MCP client reconnected", server_name=self.server_name)
+
+    def _start_member(self, member: _Member) -> bool:
+        member.starting = True
+        try:
+            member.client.start()
+        except Exception as e:
+            member.healthy = False
+            member.backoff = min(max(member.backoff * 2, self.config.reconnectBackoff), self.config.maxReconnectBackoff)
+            member.retry_at = self._clock() + member.backoff
+            logger.warning(
+                "⚠️ MCP client failed to connect",
+                server_name=self.server_name,
+                retry_in=member.backoff,
+                error=str(e),
+            )
+            return False
+        finally:
+            member.starting = False
+
+        member.healthy = True
+        member.backoff = 0.0
+        return True
+
+    def _mark_unhealthy(self, member: _Member) -> None:
+        if not member.healthy:
+            return
+        member.healthy = False
+        member.retry_at = self._clock()
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _pick(self) -> Optional[_Member]:
+        healthy = [member for member in self.members if member.healthy]
+        return min(healthy, key=lambda member: member.in_flight) if healthy else None
+
+    def _circuit_changed(self, state: CircuitState) -> None:
+        logger.warning("⚡️ MCP circuit breaker state changed", server_name=self.server_name, state=str(state))
+        if self._on_circuit_change is not None:
+            self._on_circuit_change(self.server_name, state)
+
+    def _stop_client(self, client: MCPClient) -> None:
+        try:
+            client.stop(None, None, None)
+        except Exception:
+            logger.warning("⚠️ error on closing MCP client", server_name=self.server_name, exc_info=True)
+
+    @staticmethod
+    def _is_transport_error(result: Dict[str, Any]) -> bool:
+        if result.get("status") != "error":
+            return False
+        content = result.get("content") or [{}]
+        return str(content[0].get("text", "")).startswith(_TRANSPORT_ERROR_PREFIX)
+
+    @staticmethod
+    def _error_result(tool_use_id: str, message: str) -> Dict[str, Any]:
+        return {"status": "error", "toolUseId": tool_use_id, "content": [{"text": message}]}
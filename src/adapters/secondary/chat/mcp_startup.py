@@ -0,0 +1,98 @@
+import asyncio
+from typing import Any, Callable, Dict, List, Optional
+
+from ports.mcp import MCPToolClient
+from utils.logger import logger
+
+
+# (server_name, client, tools) -> None
+ServerReadyCallback = Callable[[str, MCPToolClient, List[Any]], None]
+# (server_name) -> True if the caller keeps retrying the client itself, so it must not be closed
+ServerFailedCallback = Callable[[str], Optional[bool]]
+
+
+class MCPStartup:
+    """
+    Starts MCP clients concurrently, off the event loop, each bounded by its own timeout.
+
+    `wait_for_quorum` returns as soon as `quorum` servers are ready (or every server has finished
+    trying), so the app can serve traffic while slow servers keep starting in the background;
+    their tools are handed to `on_ready` whenever they arrive.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[str, MCPToolClient], List[Any]],
+        on_ready: ServerReadyCallback,
+        on_failed: Optional[ServerFailedCallback] = None,
+    ):
+        self._connect = connect
+        self._on_ready = on_ready
+        self._on_failed = on_failed
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._ready = 0
+        self._finished = 0
+        self._quorum_reached = asyncio.Event()
+        self._quorum = 0
+
+    def start(
+        self, clients: Dict[str, MCPToolClient], timeouts: Dict[str, float], quorum: Optional[int] = None
+    ) -> None:
+        self._quorum = len(clients) if quorum is None else min(max(quorum, 0), len(clients))
+        if self._quorum == 0:
+            self._quorum_reached.set()
+
+        for server_name, client in clients.items():
+            self._tasks[server_name] = asyncio.create_task(
+                self._start_server(server_name, client, timeouts[server_name], len(clients))
+            )
+
+    async def wait_for_quorum(self) -> None:
+        await self._quorum_reached.wait()
+
+    def pending(self) -> List[str]:
+        return [name for name, task in self._tasks.items() if not task.done()]
+
+    def cancel(self) -> None:
+        for task in self._tasks.values():
+            task.cancel()
+
+    async def _start_server(self, server_name: str, client: MCPToolClient, timeout: float, total: int) -> None:
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(None, self._connect, server_name, client)
+        try:
+            # shield: on timeout the worker thread keeps running, we only stop waiting for it
+            tools = await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.CancelledError:
+            future.add_done_callback(lambda f: self._stop_abandoned(loop, server_name, client, f))
+            raise
+        except Exception:
+            logger.error(
+                "🚨 MCP server failed to start",
+                server_name=server_name,
+                timeout=timeout,
+                exc_info=True,
+                stack_info=True,
+            )
+            adopted = self._on_failed(server_name) if self._on_failed is not None else False
+            if not adopted:
+                future.add_done_callback(lambda f: self._stop_abandoned(loop, server_name, client, f))
+        else:
+            self._ready += 1
+            logger.info("⚡️ MCP client connected", server_name=server_name, tool_count=len(tools))
+            self._on_ready(server_name, client, tools)
+            if self._ready >= self._quorum:
+                self._quorum_reached.set()
+        finally:
+            self._finished += 1
+            if self._finished >= total:
+                self._quorum_reached.set()
+
+    @staticmethod
+    def _stop_abandoned(loop: asyncio.AbstractEventLoop, server_name: str, client: MCPToolClient, future: Any) -> None:
+        """A client that connected after its timeout is not used; close it without blocking the loop"""
+        if future.cancelled() or future.exception() is not None:
+            return
+        logger.warning("⚠️ closing MCP client that connected after its timeout", server_name=server_name)
+        if not loop.is_closed():
+            loop.run_in_executor(None, client.stop, None, None, None)
@@ -0,0 +1,112 @@
+import hashlib
+import json
+import os
+from typing import Any, Dict, List, Optional, cast
+
+from mcp.types import Tool as MCPTool
+from pydantic import BaseModel
+from strands.tools.mcp import MCPAgentTool, MCPClient
+
+from ports.mcp import MCPToolClient
+from utils.logger import logger
+
+
+# {"name": ..., "description": ..., "inputSchema": {...}}
+ToolDefinition = Dict[str, Any]
+
+
+def _dumps(data: Any) -> str:
+    return json.dumps(data, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+
+
+# settings that do not affect which tools a server exposes
+_NON_DISCOVERY_FIELDS = {"disabled", "startupTimeout", "toolCache", "pool", "circuitBreaker"}
+
+
+def config_hash(server_config: BaseModel) -> str:
+    """Hash of a server's config; a changed command, url or env invalidates its cached catalog"""
+    data = server_config.model_dump(exclude=_NON_DISCOVERY_FIELDS)
+    return hashlib.sha256(_dumps(data).encode("utf-8")).hexdigest()
+
+
+def tool_fingerprint(definitions: List[ToolDefinition]) -> str:
+    return hashlib.sha256(_dumps(definitions).encode("utf-8")).hexdigest()
+
+
+def tool_definitions(tools: List[Any]) -> List[ToolDefinition]:
+    """Extract the cacheable schema of MCP tools; objects without a tool spec are skipped"""
+    definitions: List[ToolDefinition] = []
+    for tool in tools:
+        spec = getattr(tool, "tool_spec", None)
+        if not spec:
+            continue
+        input_schema = spec.get("inputSchema", {})
+        definitions.append(
+            {
+                "name": spec["name"],
+                "description": spec.get("description"),
+                "inputSchema": input_schema.get("json", input_schema),
+            }
+        )
+    return definitions
+
+
+def build_tools(definitions: List[ToolDefinition], client: MCPToolClient) -> List[Any]:
+    """Rebuild agent tools from cached definitions, bound to a (possibly still starting) client"""
+    return [
+        MCPAgentTool(
+            MCPTool(name=d["name"], description=d.get("description"), inputSchema=d["inputSchema"]),
+            # MCPAgentTool is annotated with the concrete client but only ever calls call_tool_async
+            cast(MCPClient, client),
+        )
+        for d in definitions
+    ]
+
+
+class MCPToolCatalog:
+    """
+    On-disk cache of MCP tool schemas, one JSON file per server.
+
+    An entry is only valid for the server config it was recorded with, so editing a server in
+    `mcp_config.json` falls back to live discovery. Entries are rewritten only when the live
+    tool list differs from the cached one.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def load(self, server_name: str, server_config: BaseModel) -> Optional[List[ToolDefinition]]:
+        try:
+            with open(self._entry_path(server_name), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            tools = entry["tools"]
+            if not isinstance(tools, list) or not all(isinstance(tool, dict) and "name" in tool for tool in tools):
+                raise ValueError("malformed tool list")
+        except FileNotFoundError:
+            return None
+        except Exception:
+            logger.warning("⚠️ ignoring unreadable MCP tool catalog entry", server_name=server_name, exc_info=True)
+            return None
+
+        if entry.get("configHash") != config_hash(server_config):
+            logger.info("🔄 MCP server config changed, ignoring cached tools", server_name=server_name)
+            return None
+        return tools
+
+    def store(self, server_name: str, server_config: BaseModel, definitions: List[ToolDefinition]) -> None:
+        entry = {
+            "configHash": config_hash(server_config),
+            "fingerprint": tool_fingerprint(definitions),
+            "tools": definitions,
+        }
+        path = self._entry_path(server_name)
+        os.makedirs(self.path, exist_ok=True)
+        # write-then-rename so a crash never leaves a truncated catalog behind
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(_dumps(entry))
+        os.replace(tmp_path, path)
+
+    def _entry_path(self, server_name: str) -> str:
+        safe_name = "".join(c if c.isalnum() or c in "-_" else "_" for c in server_name)
+        return os.path.join(self.path, f"{safe_name}.json")
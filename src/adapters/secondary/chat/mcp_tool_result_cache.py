@@ -0,0 +1,315 @@
+import asyncio
+import hashlib
+import json
+import os
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, override
+
+from strands.tools.mcp import MCPAgentTool
+from strands.types.tools import ToolGenerator, ToolUse
+
+from ports.mcp import MCPToolCacheConfig
+from utils.logger import logger
+
+
+def canonical_arguments(arguments: Optional[Dict[str, Any]]) -> str:
+    """
+    Stable encoding of tool arguments: key order does not matter and omitted optional
+    arguments (None) are equivalent to missing ones.
+    """
+
+    def normalize(value: Any) -> Any:
+        if isinstance(value, dict):
+            return {k: normalize(v) for k, v in value.items() if v is not None}
+        if isinstance(value, (list, tuple)):
+            return [normalize(v) for v in value]
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        return value
+
+    return json.dumps(normalize(arguments or {}), ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+
+
+# spill files are named by the sha256 of their key; nothing else in the spill directory is touched
+_SPILL_FILE_NAME = re.compile(r"^[0-9a-f]{64}$")
+
+
+def cache_key(server_name: str, tool_name: str, arguments: Optional[Dict[str, Any]]) -> str:
+    return f"{server_name}/{tool_name}:{canonical_arguments(arguments)}"
+
+
+@dataclass
+class ToolCacheStats:
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    # results not cached because they were errors or larger than maxBytes
+    uncacheable: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.coalesced + self.misses
+        return (self.hits + self.coalesced) / total if total else 0.0
+
+
+class ToolResultCache:
+    """
+    TTL + LRU cache of serialized tool results, bounded by total bytes.
+
+    Entries evicted from memory are spilled (when `spill_path` is set) and promoted back on their
+    next hit. Each process spills into its own `worker-<pid>` subdirectory of `spill_path`, which
+    has its own byte budget and is emptied on startup and on `clear`.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        spill_path: Optional[str] = None,
+        spill_max_bytes: int = 512 * 1024 * 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_bytes = max_bytes
+        # workers sharing `spill_path` must never see (or delete) each other's files
+        self.spill_path = os.path.join(spill_path, f"worker-{os.getpid()}") if spill_path else None
+        self.spill_max_bytes = spill_max_bytes
+        self._clock = clock
+
+        # key -> (expires_at, payload)
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._bytes = 0
+        # key -> size of its spill file, oldest first
+        self._spilled: "OrderedDict[str, int]" = OrderedDict()
+        self._spilled_bytes = 0
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._stats: Dict[str, ToolCacheStats] = {}
+
+        if self.spill_path:
+            os.makedirs(self.spill_path, exist_ok=True)
+            # left behind by a previous process with the same pid; its expiry times are meaningless here
+            self._remove_spill_files()
+
+    def get(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._unspill(key)
+            if entry is None:
+                return None
+            self._store(key, *entry)
+
+        expires_at, payload = entry
+        if expires_at <= self._clock():
+            self._drop(key)
+            return None
+
+        self._entries.move_to_end(key)
+        return payload
+
+    def put(self, key: str, payload: str, ttl: float) -> None:
+        self._drop(key)
+        self._discard_spill(key)
+        self._store(key, self._clock() + ttl, payload)
+
+    def stats(self) -> Dict[str, ToolCacheStats]:
+        """Per-tool counters, keyed by `server/tool`"""
+        return dict(self._stats)
+
+    def stats_for(self, tool_key: str) -> ToolCacheStats:
+        return self._stats.setdefault(tool_key, ToolCacheStats())
+
+    async def get_or_call(
+        self,
+        tool_key: str,
+        key: str,
+        ttl: float,
+        max_bytes: int,
+        call: Callable[[], Awaitable[Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        """
+        Return the cached result for `key`, or run `call` once no matter how many identical
+        requests arrive while it is in flight.
+        """
+        stats = self.stats_for(tool_key)
+        payload = self.get(key)
+        if payload is not None:
+            stats.hits += 1
+            return json.loads(payload)
+
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            try:
+                # shield: a cancelled follower must not cancel the shared call
+                result = await asyncio.shield(in_flight)
+            except asyncio.CancelledError:
+                if not in_flight.cancelled():
+                    raise
+                # the leading request was cancelled; make the call ourselves
+            else:
+                stats.coalesced += 1
+                return result
+
+        stats.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            result = await call()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # mark retrieved so a call nobody joined does not log "exception was never retrieved"
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+
+        payload = json.dumps(result, ensure_ascii=False, separators=(",", ":"))
+        if result.get("status") != "success" or len(payload.encode("utf-8")) > max_bytes:
+            stats.uncacheable += 1
+        else:
+            self.put(key, payload, ttl)
+        return result
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+        self._spilled.clear()
+        self._spilled_bytes = 0
+        if self.spill_path:
+            self._remove_spill_files()
+            try:
+                os.rmdir(self.spill_path)
+            except OSError:
+                pass
+
+    def _remove_spill_files(self) -> None:
+        assert self.spill_path is not None
+        try:
+            names = os.listdir(self.spill_path)
+        except FileNotFoundError:
+            return
+        for name in names:
+            if _SPILL_FILE_NAME.match(name):
+                try:
+                    os.remove(os.path.join(self.spill_path, name))
+                except FileNotFoundError:
+                    pass
+
+    def _store(self, key: str, expires_at: float, payload: str) -> None:
+        self._entries[key] = (expires_at, payload)
+        self._bytes += len(payload)
+        while self._bytes > self.max_bytes and self._entries:
+            evicted_key, (evicted_expires_at, evicted_payload) = self._entries.popitem(last=False)
+            self._bytes -= len(evicted_payload)
+            self._spill(evicted_key, evicted_expires_at, evicted_payload)
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry[1])
+
+    def _spill_file(self, key: str) -> str:
+        assert self.spill_path is not None
+        return os.path.join(self.spill_path, hashlib.sha256(key.encode("utf-8")).hexdigest())
+
+    def _spill(self, key: str, expires_at: float, payload: str) -> None:
+        if not self.spill_path or expires_at <= self._clock():
+            return
+        data = json.dumps({"key": key, "expiresAt": expires_at, "payload": payload})
+        try:
+            with open(self._spill_file(key), "w", encoding="utf-8") as f:
+                f.write(data)
+        except OSError:
+            logger.warning("⚠️ failed to spill tool result to disk", exc_info=True)
+            return
+
+        self._spilled[key] = len(data)
+        self._spilled_bytes += len(data)
+        while self._spilled_bytes > self.spill_max_bytes and self._spilled:
+            self._discard_spill(next(iter(self._spilled)))
+
+    def _unspill(self, key: str) -> Optional[Tuple[float, str]]:
+        if not self.spill_path:
+            return None
+        try:
+            with open(self._spill_file(key), "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            logger.warning("⚠️ ignoring unreadable spilled tool result", exc_info=True)
+            return None
+        finally:
+            self._discard_spill(key)
+
+        if data.get("key") != key:
+            return None
+        return data["expiresAt"], data["payload"]
+
+    def _discard_spill(self, key: str) -> None:
+        size = self._spilled.pop(key, None)
+        if size is not None:
+            self._spilled_bytes -= size
+        if self.spill_path:
+            try:
+                os.remove(self._spill_file(key))
+            except FileNotFoundError:
+                pass
+
+
+class CachedMCPAgentTool(MCPAgentTool):
+    """MCPAgentTool whose successful results are served from a ToolResultCache"""
+
+    def __init__(
+        self,
+        tool: MCPAgentTool,
+        server_name: str,
+        cache: ToolResultCache,
+        cache_config: MCPToolCacheConfig,
+    ):
+        super().__init__(tool.mcp_tool, tool.mcp_client)
+        self.server_name = server_name
+        self.cache = cache
+        self.cache_config = cache_config
+
+    @override
+    async def stream(self, tool_use: ToolUse, invocation_state: Dict[str, Any], **kwargs: Any) -> ToolGenerator:
+        async def call() -> Dict[str, Any]:
+            result: Dict[str, Any] = {}
+            async for event in super(CachedMCPAgentTool, self).stream(tool_use, invocation_state, **kwargs):
+                result = event
+            return result
+
+        tool_key = f"{self.server_name}/{self.tool_name}"
+        result = await self.cache.get_or_call(
+            tool_key,
+            cache_key(self.server_name, self.tool_name, tool_use.get("input")),
+            ttl=self.cache_config.ttl,
+            max_bytes=self.cache_config.maxBytes,
+            call=call,
+        )
+        # cached and coalesced results belong to another tool use
+        yield {**result, "toolUseId": tool_use["toolUseId"]}
+
+
+def wrap_cached_tools(
+    server_name: str,
+    tools: List[Callable],
+    cache: ToolResultCache,
+    cache_configs: Dict[str, MCPToolCacheConfig],
+) -> List[Callable]:
+    """Wrap the tools that opted into result caching; other tools are returned unchanged"""
+    wrapped = []
+    for tool in tools:
+        cache_config = cache_configs.get(getattr(tool, "tool_name", ""))
+        if cache_config is not None and cache_config.enabled and isinstance(tool, MCPAgentTool):
+            tool = CachedMCPAgentTool(tool, server_name, cache, cache_config)
+        wrapped.append(tool)
+    return wrapped
+
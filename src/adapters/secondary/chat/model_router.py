@@ -0,0 +1,240 @@
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Any, AsyncGenerator, Callable, Dict, List, Optional, Type, TypeVar, Union, override
+
+from opentelemetry.trace import Span, StatusCode
+from pydantic import BaseModel
+from strands.models import Model
+from strands.types.content import Messages
+from strands.types.streaming import StreamEvent
+from strands.types.tools import ToolSpec
+
+from ports.chat import UnknownModelError
+from utils.logger import logger
+from utils.telemetry import telemetry
+
+T = TypeVar("T", bound=BaseModel)
+
+DEFAULT_MODEL = "default"
+
+# token type reported in telemetry -> Bedrock usage field
+_TOKEN_TYPES = {
+    "input": "inputTokens",
+    "output": "outputTokens",
+    "cache_read": "cacheReadInputTokens",
+    "cache_write": "cacheWriteInputTokens",
+}
+
+
+class RoutingStrategy(StrEnum):
+    # every call goes to the default model unless the request names one
+    FIXED = "fixed"
+    # short, plain prompts go to the fast model first and escalate to the default model when needed
+    CASCADE = "cascade"
+
+
+@dataclass
+class ModelSpec:
+    model_id: str
+    max_tokens: Optional[int] = None
+    # USD per 1000 tokens, only used for cost tracking
+    input_cost: float = 0.0
+    output_cost: float = 0.0
+
+
+@dataclass
+class ModelRouteStats:
+    calls: int = 0
+    # calls whose answer was discarded and asked again from the default model
+    escalations: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_input_tokens: int = 0
+    total_latency: float = 0.0
+    cost: float = 0.0
+
+    @property
+    def avg_latency(self) -> float:
+        return self.total_latency / self.calls if self.calls else 0.0
+
+
+class ModelRouter(Model):
+    """
+    Routes each model call of a turn to one of several registered models.
+
+    A turn may name a model (`start_turn`); it is then used for every call of that turn. Otherwise
+    the cascade strategy sends calls answering a short, plain user prompt to the fast model. Its
+    response is buffered and only released if it is a final answer; a tool call, a truncated or an
+    empty answer is discarded and the call goes to the default model instead. Nothing of the fast
+    attempt reaches the agent, so the session history only ever holds the answer that was kept.
+
+    Latency, tokens and estimated cost are tracked per model for tuning the cascade thresholds,
+    and every call is traced as a `model.call` span carrying its time to first token.
+    """
+
+    def __init__(
+        self,
+        models: Dict[str, Model],
+        specs: Dict[str, ModelSpec],
+        strategy: RoutingStrategy = RoutingStrategy.FIXED,
+        fast_model: Optional[str] = None,
+        simple_prompt_chars: int = 400,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if DEFAULT_MODEL not in models:
+            raise ValueError(f"the model registry needs a '{DEFAULT_MODEL}' model")
+        if fast_model is not None and fast_model not in models:
+            raise ValueError(f"unknown cascade model: {fast_model}")
+        self.models = models
+        self.specs = specs
+        self.strategy = strategy
+        self.fast_model = fast_model
+        self.simple_prompt_chars = simple_prompt_chars
+        self._clock = clock
+        self._requested: ContextVar[Optional[str]] = ContextVar("requested_model", default=None)
+        self._stats: Dict[str, ModelRouteStats] = {name: ModelRouteStats() for name in models}
+        self._lock = threading.Lock()
+
+    def resolve(self, name: Optional[str]) -> Optional[str]:
+        if name is not None and name not in self.models:
+            raise UnknownModelError(f"unknown model: {name}")
+        return name
+
+    def start_turn(self, name: Optional[str]) -> None:
+        self._requested.set(self.resolve(name))
+
+    def end_turn(self) -> None:
+        self._requested.set(None)
+
+    def stats(self) -> Dict[str, ModelRouteStats]:
+        with self._lock:
+            return {name: ModelRouteStats(**vars(stats)) for name, stats in self._stats.items()}
+
+    @override
+    def update_config(self, **model_config: Any) -> None:
+        self.models[DEFAULT_MODEL].update_config(**model_config)
+
+    @override
+    def get_config(self) -> Any:
+        return self.models[DEFAULT_MODEL].get_config()
+
+    @override
+    def structured_output(
+        self, output_model: Type[T], prompt: Messages, system_prompt: Optional[str] = None, **kwargs: Any
+    ) -> AsyncGenerator[dict[str, Union[T, Any]], None]:
+        name = self._requested.get() or DEFAULT_MODEL
+        return self.models[name].structured_output(output_model, prompt, system_prompt=system_prompt, **kwargs)
+
+    @override
+    async def stream(
+        self,
+        messages: Messages,
+        tool_specs: Optional[List[ToolSpec]] = None,
+        system_prompt: Optional[str] = None,
+        **kwargs: Any,
+    ) -> AsyncGenerator[StreamEvent, None]:
+        name = self._route(messages)
+        if name == self.fast_model and name != DEFAULT_MODEL:
+            events = [event async for event in self._call(name, messages, tool_specs, system_prompt, **kwargs)]
+            reason = self._escalation_reason(events)
+            if reason is None:
+                for event in events:
+                    yield event
+                return
+            with self._lock:
+                self._stats[name].escalations += 1
+            logger.info("⬆️ escalating to the default model", model=name, reason=reason)
+            name = DEFAULT_MODEL
+
+        async for event in self._call(name, messages, tool_specs, system_prompt, **kwargs):
+            yield event
+
+    def _route(self, messages: Messages) -> str:
+        requested = self._requested.get()
+        if requested is not None:
+            return requested
+        if self.strategy == RoutingStrategy.CASCADE and self.fast_model is not None and self._is_simple(messages):
+            return self.fast_model
+        return DEFAULT_MODEL
+
+    def _is_simple(self, messages: Messages) -> bool:
+        """A new user prompt, not a tool result, and short enough for the fast model"""
+        if not messages or messages[-1]["role"] != "user":
+            return False
+        content = messages[-1]["content"]
+        if any("toolResult" in block for block in content):
+            return False
+        return sum(len(block.get("text", "")) for block in content) <= self.simple_prompt_chars
+
+    @staticmethod
+    def _escalation_reason(events: List[StreamEvent]) -> Optional[str]:
+        stop_reason = None
+        has_text = False
+        for event in events:
+            if "messageStop" in event:
+                stop_reason = event["messageStop"].get("stopReason")
+            elif "contentBlockDelta" in event:
+                has_text = has_text or bool(event["contentBlockDelta"].get("delta", {}).get("text", "").strip())
+        if stop_reason in ("tool_use", "max_tokens"):
+            return str(stop_reason)
+        if not has_text:
+            return "empty"
+        return None
+
+    async def _call(
+        self,
+        name: str,
+        messages: Messages,
+        tool_specs: Optional[List[ToolSpec]],
+        system_prompt: Optional[str],
+        **kwargs: Any,
+    ) -> AsyncGenerator[StreamEvent, None]:
+        spec = self.specs.get(name)
+        span = telemetry.start_span("model.call", **{"model.name": name, "model.id": spec and spec.model_id})
+        started = self._clock()
+        first_token: Optional[float] = None
+        usage: Dict[str, Any] = {}
+        try:
+            async for event in self.models[name].stream(messages, tool_specs, system_prompt, **kwargs):
+                if first_token is None and "contentBlockDelta" in event:
+                    first_token = self._clock() - started
+                    telemetry.model_time_to_first_token.record(first_token, {"model.name": name})
+                    span.set_attribute("model.time_to_first_token", first_token)
+                if "metadata" in event:
+                    usage = dict(event["metadata"].get("usage") or {})
+                yield event
+        except Exception as e:
+            span.record_exception(e)
+            span.set_status(StatusCode.ERROR, str(e))
+            raise
+        finally:
+            latency = self._clock() - started
+            self._record(name, latency, usage)
+            self._record_telemetry(name, latency, usage, span)
+
+    @staticmethod
+    def _record_telemetry(name: str, latency: float, usage: Dict[str, Any], span: Span) -> None:
+        attributes = {"model.name": name}
+        telemetry.model_call_duration.record(latency, attributes)
+        for token_type, key in _TOKEN_TYPES.items():
+            if usage.get(key):
+                telemetry.model_tokens.record(usage[key], {**attributes, "token.type": token_type})
+                span.set_attribute(f"model.tokens.{token_type}", usage[key])
+        span.end()
+
+    def _record(self, name: str, latency: float, usage: Dict[str, Any]) -> None:
+        spec = self.specs.get(name)
+        input_tokens = usage.get("inputTokens", 0) + usage.get("cacheWriteInputTokens", 0)
+        output_tokens = usage.get("outputTokens", 0)
+        with self._lock:
+            stats = self._stats[name]
+            stats.calls += 1
+            stats.total_latency += latency
+            stats.input_tokens += input_tokens
+            stats.output_tokens += output_tokens
+            stats.cache_read_input_tokens += usage.get("cacheReadInputTokens", 0)
+            if spec is not None:
+                stats.cost += (input_tokens * spec.input_cost + output_tokens * spec.output_cost) / 1000
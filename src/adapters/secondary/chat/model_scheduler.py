@@ -0,0 +1,219 @@
+import asyncio
+import heapq
+import itertools
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, AsyncGenerator, Callable, Dict, List, Optional, Tuple, Type, TypeVar, Union, override
+
+from pydantic import BaseModel
+from strands.models import Model
+from strands.types.content import Messages
+from strands.types.exceptions import ModelThrottledException
+from strands.types.streaming import StreamEvent
+from strands.types.tools import ToolSpec
+
+from ports.chat.dto import TurnPriority
+from utils.logger import logger
+from utils.telemetry import telemetry
+
+T = TypeVar("T", bound=BaseModel)
+
+# lower runs first
+_RANKS = {TurnPriority.INTERACTIVE: 0, TurnPriority.BATCH: 1}
+
+
+@dataclass
+class SchedulerStats:
+    # current adaptive limit on concurrent model calls
+    limit: float = 0.0
+    in_flight: int = 0
+    queued: int = 0
+    admitted: int = 0
+    throttled: int = 0
+    total_queue_time: float = 0.0
+    max_queue_time: float = 0.0
+
+    @property
+    def avg_queue_time(self) -> float:
+        return self.total_queue_time / self.admitted if self.admitted else 0.0
+
+
+@dataclass(order=True)
+class _Waiter:
+    rank: int
+    seq: int
+    user: str = field(compare=False)
+    priority: TurnPriority = field(compare=False)
+    future: "asyncio.Future[None]" = field(compare=False)
+    enqueued_at: float = field(compare=False)
+
+
+class ModelCallScheduler:
+    """
+    Admission control for outbound model calls.
+
+    Calls beyond the concurrency limit wait in a priority queue: interactive turns are admitted
+    ahead of batch work, first come first served within a priority. A user never has more than
+    `per_user_concurrency` calls in flight, so one user cannot take every slot.
+
+    The limit adapts AIMD-style: every successful call raises it by 1/limit (about one slot per
+    round of calls) up to `max_concurrency`, and a throttled call multiplies it by `backoff`.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 32,
+        per_user_concurrency: int = 4,
+        min_concurrency: int = 1,
+        backoff: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_concurrency = max_concurrency
+        self.per_user_concurrency = per_user_concurrency
+        self.min_concurrency = min_concurrency
+        self.backoff = backoff
+        self._clock = clock
+        self._limit = float(max_concurrency)
+        self._waiters: List[_Waiter] = []
+        self._in_flight = 0
+        self._per_user: Dict[str, int] = {}
+        self._seq = itertools.count()
+        self._stats = SchedulerStats()
+
+    @property
+    def limit(self) -> int:
+        return max(int(self._limit), self.min_concurrency)
+
+    async def acquire(self, user: str, priority: TurnPriority = TurnPriority.INTERACTIVE) -> None:
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, _Waiter(_RANKS[priority], next(self._seq), user, priority, future, self._clock()))
+        self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # admitted just as the caller was cancelled; hand the slot on
+                self.release(user)
+            raise
+
+    def release(self, user: str, throttled: bool = False) -> None:
+        self._in_flight -= 1
+        remaining = self._per_user.get(user, 0) - 1
+        if remaining > 0:
+            self._per_user[user] = remaining
+        else:
+            self._per_user.pop(user, None)
+
+        if throttled:
+            self._limit = max(self._limit * self.backoff, float(self.min_concurrency))
+            self._stats.throttled += 1
+            logger.warning("🐢 model call throttled, lowering concurrency", limit=self.limit)
+        else:
+            self._limit = min(self._limit + 1 / self._limit, float(self.max_concurrency))
+        self._dispatch()
+
+    def stats(self) -> SchedulerStats:
+        stats = SchedulerStats(**vars(self._stats))
+        stats.limit = self._limit
+        stats.in_flight = self._in_flight
+        stats.queued = sum(1 for waiter in self._waiters if not waiter.future.done())
+        return stats
+
+    def _dispatch(self) -> None:
+        """Admit waiters in priority order while there is room; users at their cap keep their place"""
+        skipped: List[_Waiter] = []
+        while self._waiters and self._in_flight < self.limit:
+            waiter = heapq.heappop(self._waiters)
+            if waiter.future.done():
+                # cancelled while queued
+                continue
+            if self._per_user.get(waiter.user, 0) >= self.per_user_concurrency:
+                skipped.append(waiter)
+                continue
+            self._in_flight += 1
+            self._per_user[waiter.user] = self._per_user.get(waiter.user, 0) + 1
+            queue_time = self._clock() - waiter.enqueued_at
+            self._stats.admitted += 1
+            self._stats.total_queue_time += queue_time
+            self._stats.max_queue_time = max(self._stats.max_queue_time, queue_time)
+            telemetry.model_queue_wait.record(queue_time, {"priority": str(waiter.priority)})
+            waiter.future.set_result(None)
+        for waiter in skipped:
+            heapq.heappush(self._waiters, waiter)
+
+
+class ScheduledModel(Model):
+    """
+    Runs every call of the wrapped model through a `ModelCallScheduler`.
+
+    A call throttled before it produced any output is retried here after a non-blocking delay,
+    queueing again behind the lowered limit; only when the retries are used up does the throttle
+    reach the agent's event loop, whose own retry sleeps block the worker.
+    """
+
+    def __init__(self, model: Model, scheduler: ModelCallScheduler, max_retries: int = 3, retry_delay: float = 0.5):
+        self.model = model
+        self.scheduler = scheduler
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self._caller: ContextVar[Tuple[str, TurnPriority]] = ContextVar(
+            "model_caller", default=("", TurnPriority.INTERACTIVE)
+        )
+
+    def start_turn(self, user: str, priority: TurnPriority) -> None:
+        self._caller.set((user, priority))
+
+    def set_priority(self, priority: TurnPriority) -> None:
+        """Change the priority of the calls made from the current context, keeping their user"""
+        self._caller.set((self._caller.get()[0], priority))
+
+    @override
+    def update_config(self, **model_config: Any) -> None:
+        self.model.update_config(**model_config)
+
+    @override
+    def get_config(self) -> Any:
+        return self.model.get_config()
+
+    @override
+    async def structured_output(
+        self, output_model: Type[T], prompt: Messages, system_prompt: Optional[str] = None, **kwargs: Any
+    ) -> AsyncGenerator[dict[str, Union[T, Any]], None]:
+        user, priority = self._caller.get()
+        await self.scheduler.acquire(user, priority)
+        throttled = False
+        try:
+            async for event in self.model.structured_output(output_model, prompt, system_prompt, **kwargs):
+                yield event
+        except ModelThrottledException:
+            throttled = True
+            raise
+        finally:
+            self.scheduler.release(user, throttled)
+
+    @override
+    async def stream(
+        self,
+        messages: Messages,
+        tool_specs: Optional[List[ToolSpec]] = None,
+        system_prompt: Optional[str] = None,
+        **kwargs: Any,
+    ) -> AsyncGenerator[StreamEvent, None]:
+        user, priority = self._caller.get()
+        for attempt in range(self.max_retries + 1):
+            await self.scheduler.acquire(user, priority)
+            throttled = False
+            started = False
+            try:
+                async for event in self.model.stream(messages, tool_specs, system_prompt, **kwargs):
+                    started = True
+                    yield event
+                return
+            except ModelThrottledException:
+                throttled = True
+                if started or attempt == self.max_retries:
+                    raise
+            finally:
+                self.scheduler.release(user, throttled)
+            await asyncio.sleep(self.retry_delay * 2 ** attempt)
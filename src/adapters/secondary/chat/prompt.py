@@ -1,3 +1,10 @@
 SYSTEM_PROMPT = """
 You are a helpful assistant.
 """.strip()
+
+SUMMARY_PROMPT = """
+You compress conversations between a user and an assistant. Summarize the transcript you are given so the
+assistant can continue the conversation from the summary alone: keep facts, decisions, open questions,
+user preferences and the essential findings of tool results; drop pleasantries and repetition.
+Answer with the summary only.
+""".strip()
@@ -0,0 +1,134 @@
+import hashlib
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, AsyncGenerator, Iterator, List, Mapping, Optional, override
+
+from strands.models.bedrock import BedrockModel
+from strands.types.content import ContentBlock, Message, Messages
+from strands.types.streaming import StreamEvent
+from strands.types.tools import ToolSpec
+
+from adapters.secondary.chat.mcp_tool_catalog import tool_definitions, tool_fingerprint
+
+
+def tool_sort_key(tool: Any) -> str:
+    return getattr(tool, "tool_name", "")
+
+
+def prefix_fingerprint(model_id: str, system_prompt: str, tools: List[Any]) -> str:
+    """
+    Hash of everything in front of the conversation: model, system prompt and tool specs.
+
+    Bedrock caches prompt prefixes byte for byte, so the same fingerprint means the cached
+    system prompt and tool blocks can be reused.
+    """
+    prefix = "\n".join([model_id, system_prompt, tool_fingerprint(tool_definitions(tools))])
+    return hashlib.sha256(prefix.encode("utf-8")).hexdigest()
+
+
+def place_cache_checkpoint(messages: List[Message]) -> None:
+    """
+    Move the conversation cache checkpoint to the end of the history, before the next user message.
+
+    Everything up to the checkpoint was sent on the previous turn, so the next request reads it from
+    the cache instead of processing it again. Only one checkpoint is kept in the history: together
+    with the system prompt and tool checkpoints that stays within Bedrock's limit of four.
+    """
+    for message in messages:
+        if any("cachePoint" in block for block in message["content"]):
+            message["content"] = [block for block in message["content"] if "cachePoint" not in block]
+    if messages:
+        checkpoint: ContentBlock = {"cachePoint": {"type": "default"}}
+        messages[-1]["content"] = [*messages[-1]["content"], checkpoint]
+
+
+@dataclass
+class TokenUsage:
+    model_calls: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    # prompt tokens served from the cache, and tokens written to it
+    cache_read_input_tokens: int = 0
+    cache_write_input_tokens: int = 0
+
+    @property
+    def cache_hit_rate(self) -> float:
+        """Share of prompt tokens read from the cache"""
+        total = self.input_tokens + self.cache_read_input_tokens + self.cache_write_input_tokens
+        return self.cache_read_input_tokens / total if total else 0.0
+
+    def add(self, usage: Mapping[str, Any]) -> None:
+        self.model_calls += 1
+        self.input_tokens += usage.get("inputTokens", 0)
+        self.output_tokens += usage.get("outputTokens", 0)
+        self.cache_read_input_tokens += usage.get("cacheReadInputTokens", 0)
+        self.cache_write_input_tokens += usage.get("cacheWriteInputTokens", 0)
+
+
+class TokenUsageMetrics:
+    """
+    Token usage reported by the model, in total and for the turn in progress.
+
+    The turn is tracked in a context variable, so concurrent turns on other sessions do not mix;
+    a turn spans every model call of its event loop, tool use cycles included.
+    """
+
+    def __init__(self):
+        self._total = TokenUsage()
+        self._turn: ContextVar[Optional[TokenUsage]] = ContextVar("turn_token_usage", default=None)
+        self._untracked: ContextVar[bool] = ContextVar("untracked_token_usage", default=False)
+        self._lock = threading.Lock()
+
+    def start_turn(self) -> TokenUsage:
+        turn = TokenUsage()
+        self._turn.set(turn)
+        return turn
+
+    def end_turn(self) -> None:
+        self._turn.set(None)
+
+    @contextmanager
+    def untracked(self) -> Iterator[None]:
+        """Model calls made in this context (e.g. health probes) are not counted"""
+        token = self._untracked.set(True)
+        try:
+            yield
+        finally:
+            self._untracked.reset(token)
+
+    def record(self, usage: Mapping[str, Any]) -> None:
+        if self._untracked.get():
+            return
+        with self._lock:
+            self._total.add(usage)
+            turn = self._turn.get()
+            if turn is not None:
+                turn.add(usage)
+
+    def stats(self) -> TokenUsage:
+        with self._lock:
+            return TokenUsage(**vars(self._total))
+
+
+class UsageTrackingBedrockModel(BedrockModel):
+    """BedrockModel that records the token usage of every call, cache reads and writes included"""
+
+    def __init__(self, usage: TokenUsageMetrics, **model_config: Any):
+        super().__init__(**model_config)
+        self.usage = usage
+
+    @override
+    async def stream(
+        self,
+        messages: Messages,
+        tool_specs: Optional[List[ToolSpec]] = None,
+        system_prompt: Optional[str] = None,
+        **kwargs: Any,
+    ) -> AsyncGenerator[StreamEvent, None]:
+        async for event in super().stream(messages, tool_specs, system_prompt, **kwargs):
+            usage = event.get("metadata", {}).get("usage")
+            if usage:
+                self.usage.record(usage)
+            yield event
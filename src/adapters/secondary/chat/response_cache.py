@@ -0,0 +1,158 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, override
+
+from ports.chat import ResponseCache
+from utils.logger import logger
+
+if TYPE_CHECKING:
+    from adapters.secondary.chat.similarity_index import SimilarityIndex
+
+
+# text -> vector; vectors are L2-normalized by the similarity index
+Embedder = Callable[[str], Any]
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Case, whitespace and trailing punctuation do not change what is being asked"""
+    return " ".join(prompt.casefold().split()).rstrip(" ?!.")
+
+
+@dataclass
+class ResponseCacheStats:
+    hits: int = 0
+    # hits served by the similarity tier
+    similar_hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+@dataclass
+class _Entry:
+    scope: str
+    response: str
+    expires_at: float
+
+
+class InMemoryResponseCache(ResponseCache):
+    """
+    Per-worker TTL + LRU response cache.
+
+    The exact tier is keyed on the normalized prompt within a scope. When `similarity_threshold` is
+    set, a miss falls back to the most similar cached prompt of the same scope, if its cosine
+    similarity reaches the threshold (requires numpy).
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl: float = 60 * 60,
+        similarity_threshold: Optional[float] = None,
+        embedder: Optional[Embedder] = None,
+        embedding_dimensions: int = 512,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.similarity_threshold = similarity_threshold
+        self._embedder: Optional[Embedder] = None
+        self._index_factory: Optional[Callable[[int], "SimilarityIndex"]] = None
+        if similarity_threshold is not None:
+            try:
+                from adapters.secondary.chat.similarity_index import SimilarityIndex, hashed_ngram_embedder
+            except ImportError as e:
+                raise RuntimeError("the response cache similarity tier requires numpy (semantic-cache extra)") from e
+            self._embedder = embedder or hashed_ngram_embedder(embedding_dimensions)
+            self._index_factory = SimilarityIndex
+        self._clock = clock
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._indexes: Dict[str, "SimilarityIndex"] = {}
+        self._stats = ResponseCacheStats()
+        self._lock = threading.Lock()
+
+    @override
+    def get(self, scope: str, prompt: str) -> Optional[str]:
+        key = self._key(scope, prompt)
+        with self._lock:
+            entry = self._lookup(key)
+        if entry is None and self._embedder is not None:
+            vector = self._embedder(prompt)
+            with self._lock:
+                entry = self._lookup_similar(scope, vector)
+                if entry is not None:
+                    self._stats.similar_hits += 1
+
+        with self._lock:
+            if entry is None:
+                self._stats.misses += 1
+                return None
+            self._stats.hits += 1
+            return entry.response
+
+    @override
+    def put(self, scope: str, prompt: str, response: str) -> None:
+        if not response or self.max_entries <= 0:
+            return
+        key = self._key(scope, prompt)
+        # embedding outside the lock; it is the expensive part
+        vector = self._embedder(prompt) if self._embedder is not None else None
+        with self._lock:
+            self._entries[key] = _Entry(scope, response, self._clock() + self.ttl)
+            self._entries.move_to_end(key)
+            if vector is not None and self._index_factory is not None:
+                index = self._indexes.get(scope)
+                if index is None:
+                    index = self._indexes[scope] = self._index_factory(len(vector))
+                index.add(key, vector)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+    @override
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._indexes.clear()
+
+    def stats(self) -> ResponseCacheStats:
+        return ResponseCacheStats(**vars(self._stats))
+
+    @staticmethod
+    def _key(scope: str, prompt: str) -> str:
+        return f"{scope}:{hashlib.sha256(normalize_prompt(prompt).encode('utf-8')).hexdigest()}"
+
+    def _lookup(self, key: str) -> Optional[_Entry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= self._clock():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _lookup_similar(self, scope: str, vector: Any) -> Optional[_Entry]:
+        index = self._indexes.get(scope)
+        if index is None or self.similarity_threshold is None:
+            return None
+        match = index.nearest(vector)
+        if match is None or match[1] < self.similarity_threshold:
+            return None
+        logger.info("🧭 similar cached prompt found", similarity=round(match[1], 3))
+        return self._lookup(match[0])
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        index = self._indexes.get(entry.scope)
+        if index is not None:
+            index.remove(key)
+            if not len(index):
+                del self._indexes[entry.scope]
@@ -0,0 +1,76 @@
+import zlib
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from adapters.secondary.chat.response_cache import Embedder, normalize_prompt
+
+
+def hashed_ngram_embedder(dimensions: int = 512, n: int = 3) -> Embedder:
+    """
+    Local embedding of a prompt's character n-grams, hashed into a fixed number of buckets.
+
+    Needs no model round trip and catches near-identical prompts (typos, reordered clauses); a real
+    embedding model can be plugged in instead for paraphrases.
+    """
+
+    def embed(text: str) -> Any:
+        text = f" {normalize_prompt(text)} "
+        vector = np.zeros(dimensions, dtype=np.float32)
+        for i in range(max(len(text) - n + 1, 1)):
+            # crc32 rather than hash(): buckets must not depend on the process' hash seed
+            vector[zlib.crc32(text[i:i + n].encode("utf-8")) % dimensions] += 1.0
+        return vector
+
+    return embed
+
+
+class SimilarityIndex:
+    """
+    Brute-force cosine nearest neighbour over a preallocated matrix of unit vectors.
+
+    One matrix-vector product per lookup; rows are swap-removed so the matrix stays dense.
+    """
+
+    def __init__(self, dimensions: int, capacity: int = 64):
+        self._vectors = np.zeros((capacity, dimensions), dtype=np.float32)
+        self._keys: List[str] = []
+        self._rows: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, key: str, vector: Any) -> None:
+        self.remove(key)
+        if len(self._keys) == len(self._vectors):
+            self._vectors = np.concatenate([self._vectors, np.zeros_like(self._vectors)])
+        row = len(self._keys)
+        self._vectors[row] = _unit(vector)
+        self._keys.append(key)
+        self._rows[key] = row
+
+    def remove(self, key: str) -> None:
+        row = self._rows.pop(key, None)
+        if row is None:
+            return
+        last = len(self._keys) - 1
+        if row != last:
+            moved = self._keys[last]
+            self._vectors[row] = self._vectors[last]
+            self._keys[row] = moved
+            self._rows[moved] = row
+        self._keys.pop()
+
+    def nearest(self, vector: Any) -> Optional[Tuple[str, float]]:
+        if not self._keys:
+            return None
+        scores = self._vectors[:len(self._keys)] @ _unit(vector)
+        row = int(np.argmax(scores))
+        return self._keys[row], float(scores[row])
+
+
+def _unit(vector: Any) -> Any:
+    assert np is not None
+    vector = np.asarray(vector, dtype=np.float32)
+    norm = float(np.linalg.norm(vector))
+    return vector / norm if norm else vector
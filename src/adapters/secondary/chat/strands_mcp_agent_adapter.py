@@ -1,20 +1,51 @@
-from typing import AsyncIterator, Any, Optional, List, Callable, Dict, override
+from collections import OrderedDict
+from typing import AsyncIterator, Any, Optional, List, Callable, Dict, Set, Tuple, override
+
+import asyncio
+import functools
 
-import boto3
 from strands import Agent
 from strands.hooks import HookProvider
+from strands.models import Model
 from strands.session.repository_session_manager import RepositorySessionManager
-from strands.models.bedrock import BedrockModel
-from strands.agent.conversation_manager import SlidingWindowConversationManager
 from strands.tools.mcp import MCPClient
+from strands.types.content import Message
+from strands.types.exceptions import ModelThrottledException
 
-from adapters.secondary.chat.prompt import SYSTEM_PROMPT
-from ports.chat import MCPAgentAdapter
-from ports.mcp import MCPConfig
-from utils.mcp import load_mcp_config, initialize_mcp_clients, load_mcp_tools
+from adapters.secondary.chat.agent_pool import AgentPool, AgentPoolStats
+from adapters.secondary.chat.conversation_manager import ConversationManagerFactory, render_transcript
+from adapters.secondary.chat.mcp_client_pool import CircuitState, MCPClientPool, MCPClientPoolStats
+from adapters.secondary.chat.mcp_startup import MCPStartup
+from adapters.secondary.chat.mcp_tool_catalog import MCPToolCatalog, build_tools, tool_definitions, tool_fingerprint
+from adapters.secondary.chat.model_scheduler import ModelCallScheduler, ScheduledModel
+from adapters.secondary.chat.model_router import DEFAULT_MODEL, ModelRouter, ModelSpec, RoutingStrategy
+from adapters.secondary.chat.mcp_tool_result_cache import ToolCacheStats, ToolResultCache, wrap_cached_tools
+from adapters.secondary.chat.prompt import SUMMARY_PROMPT, SYSTEM_PROMPT
+from adapters.secondary.chat.prompt_cache import (
+    TokenUsage,
+    TokenUsageMetrics,
+    UsageTrackingBedrockModel,
+    place_cache_checkpoint,
+    prefix_fingerprint,
+    tool_sort_key,
+)
+from adapters.secondary.chat.tool_executor import ToolExecutor, ToolExecutorStats, bound_tools
+from adapters.secondary.chat.tool_index import ToolIndex, used_tools
+from adapters.secondary.chat.tool_registry import SharedToolRegistry
+from adapters.secondary.chat.tool_result_store import ToolResultBlobStore, ToolResultOffloader, read_tool_result_tool
+from adapters.secondary.chat.tool_telemetry import ToolCallTelemetry
+from ports.chat import MCPAgentAdapter, ModelThrottledError
+from ports.chat.dto import ModelRouteStats, ModelSchedulerStats, ModelUsageStats, TurnPriority
+from ports.session import SessionConflictError
+from ports.mcp import MCPConfig, MCPToolClient
+from utils.mcp import load_mcp_config, initialize_mcp_clients, load_mcp_tools, create_mcp_client
 from utils.logger import logger
 
 
+# tool subsets whose registries are kept for reuse
+_MAX_SUBSET_REGISTRIES = 64
+
+
 class StrandsMCPAgentAdapter(MCPAgentAdapter):
     def __init__(
         self,
@@ -23,8 +54,35 @@ class StrandsMCPAgentAdapter(MCPAgentAdapter):
         temperature: float = 0.3,
         aws_profile_name: Optional[str] = None,
         model_region: Optional[str] = None,
+        agent_pool_max_size: int = 256,
+        agent_pool_idle_ttl: Optional[float] = 60 * 30,
+        agent_pool_max_bytes: Optional[int] = None,
+        conversation_manager_factory: Optional[ConversationManagerFactory] = None,
+        mcp_startup_timeout: float = 30.0,
+        mcp_startup_quorum: Optional[int] = None,
+        mcp_tool_catalog_path: Optional[str] = None,
+        tool_result_cache_max_bytes: int = 64 * 1024 * 1024,
+        tool_result_cache_spill_path: Optional[str] = None,
+        tool_max_concurrency: Optional[int] = None,
+        tool_timeout: Optional[float] = None,
+        tool_selection_top_k: int = 0,
+        tool_selection_always: Optional[List[str]] = None,
+        tool_result_offload_bytes: int = 0,
+        tool_result_blob_path: Optional[str] = None,
+        tool_result_preview_chars: int = 1000,
+        prompt_cache_checkpoints: bool = True,
+        models: Optional[Dict[str, ModelSpec]] = None,
+        routing_strategy: RoutingStrategy = RoutingStrategy.FIXED,
+        cascade_model: Optional[str] = None,
+        cascade_max_prompt_chars: int = 400,
+        model_max_concurrency: int = 32,
+        model_user_max_concurrency: int = 4,
+        model_throttle_retries: int = 3,
+        model_factory: Optional[Callable[[ModelSpec], Model]] = None,
     ):
-        self.model_id = model_id
+        # `model_id` is the default model; `models` registers more, selectable per request or by the cascade
+        specs = {DEFAULT_MODEL: ModelSpec(model_id=model_id), **(models or {})}
+        self.model_id = specs[DEFAULT_MODEL].model_id
         self.max_tokens = max_tokens
         self.temperature = temperature
         # model region and aws_profile_name are mutually exclusive
@@ -32,91 +90,597 @@ class StrandsMCPAgentAdapter(MCPAgentAdapter):
         self.model_region = model_region if not aws_profile_name else None
         self.system_prompt = SYSTEM_PROMPT
 
-        # Initialize model
-        session = boto3.Session(
-            profile_name=aws_profile_name,
-            region_name=model_region,
+        # token usage of every model call, including prompt cache reads and writes
+        self.usage = TokenUsageMetrics()
+
+        @functools.cache
+        def boto_session() -> Any:
+            # imported on first use: without Bedrock (e.g. the fake model) boto3 is never loaded
+            import boto3
+
+            return boto3.Session(profile_name=aws_profile_name, region_name=model_region)
+
+        def create_bedrock_model(spec: ModelSpec) -> Model:
+            return UsageTrackingBedrockModel(
+                self.usage,
+                boto_session=boto_session(),
+                model_id=spec.model_id,
+                max_tokens=spec.max_tokens or max_tokens,
+                temperature=temperature,
+                cache_prompt="default",
+                cache_tools="default",
+                streaming=True,
+            )
+
+        # `model_factory` replaces Bedrock, e.g. with a fake model for load tests
+        create_model = model_factory or create_bedrock_model
+        self.model_router = ModelRouter(
+            {name: create_model(spec) for name, spec in specs.items()},
+            specs,
+            strategy=routing_strategy,
+            fast_model=cascade_model,
+            simple_prompt_chars=cascade_max_prompt_chars,
         )
-        self.model = BedrockModel(
-            boto_session=session,
-            model_id=model_id,
-            max_tokens=max_tokens,
-            temperature=temperature,
-            cache_prompt="default",
-            cache_tools="default",
-            streaming=True,
+        # every model call queues here, so spikes wait for a slot instead of being throttled by Bedrock
+        self.scheduler = ModelCallScheduler(
+            max_concurrency=model_max_concurrency,
+            per_user_concurrency=model_user_max_concurrency,
         )
+        self.model = ScheduledModel(self.model_router, self.scheduler, max_retries=model_throttle_retries)
+        # a cache checkpoint after the history lets the next turn reuse the whole conversation prefix
+        self.prompt_cache_checkpoints = prompt_cache_checkpoints
 
-        self.conversation_manager = SlidingWindowConversationManager(
-            window_size=20,
-            should_truncate_results=True,
-        )
+        # conversation managers hold per-conversation state, so each agent gets its own
+        self.conversation_manager_factory = conversation_manager_factory or ConversationManagerFactory()
 
         # MCP components
-        self.mcp_clients: Dict[str, MCPClient] = {}
+        self.mcp_startup_timeout = mcp_startup_timeout
+        # number of servers that must be ready before serving traffic (None: all of them)
+        self.mcp_startup_quorum = mcp_startup_quorum
+        self.mcp_startup: Optional[MCPStartup] = None
+        self.mcp_clients: Dict[str, MCPToolClient] = {}
+        # pools of servers that failed to start; their health loop keeps reconnecting until one is up
+        self._recovering_clients: Dict[str, MCPClientPool] = {}
+        self._starting_clients: Dict[str, MCPToolClient] = {}
+        self._recovery_tasks: Set[asyncio.Task] = set()
         self.mcp_tools: List[Callable] = []
         self.local_tools: List[Callable] = []
         self.hooks: List[HookProvider] = []
 
-        # Agent instances per session
-        self.agents: Dict[str, Agent] = {}
+        # Tool schemas cached across restarts; None disables the catalog
+        self.tool_catalog = MCPToolCatalog(mcp_tool_catalog_path) if mcp_tool_catalog_path else None
+        self.mcp_config = MCPConfig()
+        self.server_tools: Dict[str, List[Callable]] = {}
+        self._server_fingerprints: Dict[str, str] = {}
+        # tool name -> MCP server, for labelling tool call spans and metrics
+        self._tool_servers: Dict[str, str] = {}
+        self.hooks.append(ToolCallTelemetry(self._tool_servers.get))
+        # Results of tools that opted in via `toolCache` in mcp_config.json
+        self.tool_result_cache = ToolResultCache(
+            max_bytes=tool_result_cache_max_bytes,
+            spill_path=tool_result_cache_spill_path,
+        )
+        # MCP tool calls of a turn run concurrently, capped globally and per server, and are cancelled with the turn
+        self.tool_executor = ToolExecutor(max_concurrency=tool_max_concurrency, default_timeout=tool_timeout)
+        # Oversized tool results are kept out of the conversation and paged in by the model on demand
+        self.tool_result_offloader: Optional[ToolResultOffloader] = None
+        if tool_result_offload_bytes > 0 and tool_result_blob_path:
+            blob_store = ToolResultBlobStore(tool_result_blob_path)
+            blob_store.prune()
+            self.tool_result_offloader = ToolResultOffloader(
+                blob_store,
+                threshold_bytes=tool_result_offload_bytes,
+                preview_chars=tool_result_preview_chars,
+            )
+            self.hooks.append(self.tool_result_offloader)
+            self.local_tools.append(read_tool_result_tool(blob_store))
+
+        # Built lazily and shared by every agent until the tool set changes
+        self._tool_registry: Optional[SharedToolRegistry] = None
+        # With more MCP tools than `tool_selection_top_k`, each turn only gets the tools that match its
+        # prompt, the `tool_selection_always` ones and those the conversation already used; 0 sends all
+        self.tool_selection_top_k = tool_selection_top_k
+        self.tool_selection_always = set(tool_selection_always or [])
+        self._tool_index = ToolIndex([])
+        # registries of the tool subsets picked recently, shared by the turns that pick the same subset
+        self._subset_registries: "OrderedDict[Tuple[str, ...], SharedToolRegistry]" = OrderedDict()
+        # hash of the model, system prompt and tool specs sent in front of every conversation
+        self._prefix_fingerprint: Optional[str] = None
+        self._logged_prefix_fingerprint: Optional[str] = None
+
+        # Agent instances per session, bounded by size, idle time and estimated memory
+        self.agents = AgentPool(
+            max_size=agent_pool_max_size,
+            idle_ttl=agent_pool_idle_ttl,
+            max_bytes=agent_pool_max_bytes,
+        )
+        self.agents.add_eviction_callback(self._on_agent_evicted)
 
     @override
-    def configure_mcp(self, mcp_config: Optional[MCPConfig] = None) -> None:
-        """Configure MCP clients and tools"""
+    async def configure_mcp(self, mcp_config: Optional[MCPConfig] = None) -> None:
+        """
+        Start MCP clients concurrently and load their tools.
+
+        Servers with a cached tool catalog have their tools attached right away and are revalidated
+        once they connect. Returns once the startup quorum is ready; servers still starting keep going
+        in the background and their tools are attached (for agents created afterwards) as they arrive.
+        """
         if mcp_config is None:
             mcp_config = load_mcp_config()
+        self.mcp_config = mcp_config
+        for server_name, server_config in mcp_config.mcpServers.items():
+            self.tool_executor.configure_server(server_name, server_config.toolExecution)
+
+        clients = {
+            server_name: self._create_client_pool(server_name, client)
+            for server_name, client in initialize_mcp_clients(mcp_config).items()
+        }
+        timeouts: Dict[str, float] = {}
+        cached = 0
+        for server_name, client in clients.items():
+            server_config = mcp_config.mcpServers.get(server_name)
+            timeouts[server_name] = (server_config and server_config.startupTimeout) or self.mcp_startup_timeout
+
+            definitions = self._load_cached_tools(server_name)
+            if definitions is not None:
+                self._set_server_tools(server_name, build_tools(definitions, client), tool_fingerprint(definitions))
+                cached += 1
+                logger.info("📦 MCP tools loaded from catalog", server_name=server_name, tool_count=len(definitions))
+
+        # servers served from the catalog already count as ready
+        quorum = len(clients) if self.mcp_startup_quorum is None else self.mcp_startup_quorum
+        self._starting_clients = clients
+        self.mcp_startup = MCPStartup(
+            connect=self._connect_mcp_server,
+            on_ready=self._attach_mcp_server,
+            on_failed=self._detach_mcp_server,
+        )
+        self.mcp_startup.start(clients, timeouts, quorum=max(quorum - cached, 0))
+        await self.mcp_startup.wait_for_quorum()
+
+        pending = self.mcp_startup.pending()
+        if pending:
+            logger.info("⏳ serving before all MCP servers are ready", pending_servers=pending)
+
+    def _create_client_pool(self, server_name: str, client: MCPClient) -> MCPToolClient:
+        server_config = self.mcp_config.mcpServers.get(server_name)
+        if server_config is None:
+            return client
+        return MCPClientPool(
+            server_name,
+            client,
+            factory=lambda: create_mcp_client(server_config),
+            pool_config=server_config.pool,
+            breaker_config=server_config.circuitBreaker,
+            on_circuit_change=self._on_circuit_change,
+            on_connected=self._on_mcp_connected,
+        )
+
+    @staticmethod
+    def _connect_mcp_server(server_name: str, client: MCPToolClient) -> List[Callable]:
+        """Blocking connect + tool discovery; runs in a worker thread"""
+        client.start()
+        return load_mcp_tools({server_name: client})
+
+    def _attach_mcp_server(self, server_name: str, client: MCPToolClient, tools: List[Callable]) -> None:
+        self.mcp_clients[server_name] = client
+        if isinstance(client, MCPClientPool):
+            client.start_health_checks()
+
+        definitions = tool_definitions(tools)
+        fingerprint = tool_fingerprint(definitions)
+        if self._server_fingerprints.get(server_name) == fingerprint:
+            # cached tools are bound to this client, which is now connected; nothing to rebuild
+            logger.info("✅ cached MCP tools are up to date", server_name=server_name)
+            return
+
+        if server_name in self.server_tools:
+            logger.info("🔁 MCP tool list changed, refreshing catalog", server_name=server_name)
+        self._set_server_tools(server_name, tools, fingerprint)
+        self._store_cached_tools(server_name, definitions)
+
+    def _detach_mcp_server(self, server_name: str) -> bool:
+        """
+        Drop tools served from the catalog for a server that never came up.
+
+        A pooled server keeps reconnecting in the background and is attached once it connects;
+        returns True in that case so the startup does not close the client.
+        """
+        if self.server_tools.pop(server_name, None) is not None:
+            self._server_fingerprints.pop(server_name, None)
+            self._rebuild_tools()
+
+        client = self._starting_clients.get(server_name)
+        if not isinstance(client, MCPClientPool):
+            return False
+        logger.info("🔁 retrying MCP server in the background", server_name=server_name)
+        self._recovering_clients[server_name] = client
+        client.start_health_checks()
+        return True
+
+    def _on_mcp_connected(self, server_name: str) -> None:
+        pool = self._recovering_clients.pop(server_name, None)
+        if pool is None:
+            return
+        task = asyncio.create_task(self._recover_mcp_server(server_name, pool))
+        self._recovery_tasks.add(task)
+        task.add_done_callback(self._recovery_tasks.discard)
+
+    async def _recover_mcp_server(self, server_name: str, pool: MCPClientPool) -> None:
+        """Discover and attach the tools of a server that failed at startup and has now connected"""
+        tools = await asyncio.to_thread(load_mcp_tools, {server_name: pool})
+        if not tools:
+            # discovery failed; try again on the pool's next successful reconnect
+            self._recovering_clients[server_name] = pool
+            return
+        logger.info("⚡️ MCP server recovered", server_name=server_name, tool_count=len(tools))
+        self._attach_mcp_server(server_name, pool, tools)
+
+    def _set_server_tools(self, server_name: str, tools: List[Callable], fingerprint: str) -> None:
+        server_config = self.mcp_config.mcpServers.get(server_name)
+        if server_config is not None and server_config.toolCache:
+            tools = wrap_cached_tools(server_name, tools, self.tool_result_cache, server_config.toolCache)
+        tools = bound_tools(server_name, tools, self.tool_executor)
+        self.server_tools[server_name] = tools
+        self._server_fingerprints[server_name] = fingerprint
+        self._rebuild_tools()
+
+    def _rebuild_tools(self) -> None:
+        # sorted, so the tool specs sent to the model (and their cached prefix) do not depend on
+        # the order servers connected in or listed their tools
+        self.mcp_tools = sorted(
+            (
+                tool
+                for server_name, tools in self.server_tools.items()
+                if self._is_server_available(server_name)
+                for tool in tools
+            ),
+            key=tool_sort_key,
+        )
+        self._tool_servers.clear()
+        self._tool_servers.update(
+            (tool_sort_key(tool), server_name) for server_name, tools in self.server_tools.items() for tool in tools
+        )
+        self._tool_registry = None
+        self._prefix_fingerprint = None
+        self._tool_index = ToolIndex(self.mcp_tools)
+        self._subset_registries.clear()
+
+    def _is_server_available(self, server_name: str) -> bool:
+        """False while the server's circuit breaker is open"""
+        client = self.mcp_clients.get(server_name)
+        return not isinstance(client, MCPClientPool) or client.available
+
+    def _on_circuit_change(self, server_name: str, state: CircuitState) -> None:
+        if state == CircuitState.OPEN:
+            logger.warning("🚧 hiding MCP server tools from new agents", server_name=server_name)
+        elif state == CircuitState.CLOSED:
+            logger.info("✅ MCP server tools restored for new agents", server_name=server_name)
+        self._rebuild_tools()
+
+    def _load_cached_tools(self, server_name: str) -> Optional[List[Dict[str, Any]]]:
+        server_config = self.mcp_config.mcpServers.get(server_name)
+        if self.tool_catalog is None or server_config is None:
+            return None
+        return self.tool_catalog.load(server_name, server_config)
+
+    def _store_cached_tools(self, server_name: str, definitions: List[Dict[str, Any]]) -> None:
+        server_config = self.mcp_config.mcpServers.get(server_name)
+        if self.tool_catalog is None or server_config is None:
+            return
+        try:
+            self.tool_catalog.store(server_name, server_config, definitions)
+        except Exception:
+            logger.error(
+                "🚨 failed to write MCP tool catalog",
+                server_name=server_name,
+                exc_info=True,
+                stack_info=True,
+            )
+
+    def _shared_tool_registry(self) -> SharedToolRegistry:
+        if self._tool_registry is None:
+            self._tool_registry = SharedToolRegistry(self.mcp_tools + self.local_tools)
+            fingerprint = self.prefix_fingerprint()
+            if fingerprint != self._logged_prefix_fingerprint:
+                # every change invalidates the prompt cache for all sessions
+                logger.info("🧷 prompt prefix changed", fingerprint=fingerprint[:12], tool_count=len(self.mcp_tools))
+                self._logged_prefix_fingerprint = fingerprint
+        return self._tool_registry
 
-        self.mcp_clients = initialize_mcp_clients(mcp_config)
+    def _select_tools(self, agent: Agent, content: str) -> SharedToolRegistry:
+        """The tool registry for a turn: every tool, or the subset its prompt and conversation need"""
+        if not self.tool_selection_top_k or len(self.mcp_tools) <= self.tool_selection_top_k:
+            return self._shared_tool_registry()
+        selected = self._tool_index.select(
+            content, self.tool_selection_top_k, always=self.tool_selection_always | used_tools(agent.messages)
+        )
+        # in the order of the full tool list, so a subset always yields the same cacheable prompt prefix
+        tools = [tool for tool in self.mcp_tools if tool_sort_key(tool) in selected]
+        key = tuple(tool_sort_key(tool) for tool in tools)
+        registry = self._subset_registries.get(key)
+        if registry is None:
+            registry = SharedToolRegistry(tools + self.local_tools)
+            self._subset_registries[key] = registry
+            if len(self._subset_registries) > _MAX_SUBSET_REGISTRIES:
+                self._subset_registries.popitem(last=False)
+        else:
+            self._subset_registries.move_to_end(key)
+        return registry
 
-        for server_name, client in self.mcp_clients.items():
-            client.start()
-            logger.info("⚡️ MCP client connected", server_name=server_name)
+    def prefix_fingerprint(self) -> str:
+        if self._prefix_fingerprint is None:
+            self._prefix_fingerprint = prefix_fingerprint(
+                self.model_id, self.system_prompt, self.mcp_tools + self.local_tools
+            )
+        return self._prefix_fingerprint
 
-        self.mcp_tools = load_mcp_tools(self.mcp_clients)
+    def _get_or_create_agent(self, session_manager: RepositorySessionManager) -> Agent:
+        """
+        Get existing agent or create new one for session.
 
-    def _get_or_create_agent(self, session_id: str) -> Agent:
-        """Get existing agent or create new one for session"""
-        if session_id in self.agents:
+        The session manager is attached to the agent so every new message is persisted as it is added,
+        and a rebuilt agent (after eviction or restart) restores its history from the session.
+        """
+        session_id = session_manager.session_id
+        agent = self.agents.get(session_id)
+        if agent is not None and self._is_stale(session_manager, agent):
+            # another worker served this session meanwhile; our history would overwrite its turns
+            logger.info("♻️ pooled agent is stale, rebuilding from session", session_id=session_id)
+            self.agents.remove(session_id)
+            agent = None
+        if agent is not None:
             logger.info("🔄 reusing existing agent for session", session_id=session_id)
-            return self.agents[session_id]
+            return agent
 
         agent = Agent(
             model=self.model,
-            conversation_manager=self.conversation_manager,
+            conversation_manager=self.conversation_manager_factory.create(summarizer=self._summarize),
             system_prompt=self.system_prompt,
-            tools=self.mcp_tools + self.local_tools,
             hooks=self.hooks,
+            session_manager=session_manager,
         )
-        self.agents[session_id] = agent
+        # tools are registered once and shared instead of re-processed for every agent
+        agent.tool_registry = self._shared_tool_registry()
+        self.agents.put(session_id, agent)
         logger.info("🤖 StrandsAgent created for session", session_id=session_id)
         return agent
 
+    async def _summarize(self, messages: List[Message]) -> str:
+        """Summarize history for the compacting conversation manager, on a throwaway agent without tools"""
+        # runs in its own task; no one is waiting for it, so it queues behind interactive turns
+        self.model.set_priority(TurnPriority.BATCH)
+        summarizer = Agent(model=self.model, system_prompt=SUMMARY_PROMPT, callback_handler=None)
+        result = await summarizer.invoke_async(prompt=render_transcript(messages))
+        return str(result).strip()
+
+    def _prepare_turn(self, agent: Agent, content: str) -> None:
+        # a summary finished in the background since the last turn replaces the span it covers
+        apply_summary = getattr(agent.conversation_manager, "apply_summary", None)
+        if apply_summary is not None:
+            apply_summary(agent)
+        agent.tool_registry = self._select_tools(agent, content)
+        if self.prompt_cache_checkpoints:
+            place_cache_checkpoint(agent.messages)
+
+    def _start_turn(self, model: Optional[str], user: str, priority: TurnPriority) -> TokenUsage:
+        self.model_router.start_turn(model)
+        self.model.start_turn(user, priority)
+        self.tool_executor.start_turn()
+        return self.usage.start_turn()
+
+    def _end_turn(self, session_id: str, turn: TokenUsage) -> None:
+        self.model_router.end_turn()
+        self.usage.end_turn()
+        cancelled = self.tool_executor.end_turn()
+        if cancelled:
+            logger.info("🛑 cancelled tool calls of an aborted turn", session_id=session_id, tool_calls=cancelled)
+        logger.info(
+            "📊 turn token usage",
+            session_id=session_id,
+            model_calls=turn.model_calls,
+            input_tokens=turn.input_tokens,
+            output_tokens=turn.output_tokens,
+            cache_read_input_tokens=turn.cache_read_input_tokens,
+            cache_write_input_tokens=turn.cache_write_input_tokens,
+        )
+
+    @staticmethod
+    def _is_stale(session_manager: RepositorySessionManager, agent: Agent) -> bool:
+        # only shared session stores can be written by other workers
+        is_stale = getattr(session_manager, "is_stale", None)
+        return is_stale is not None and is_stale(agent)
+
+    def _on_agent_evicted(self, session_id: str, agent: Agent, reason: str) -> None:
+        logger.info("♻️ agent evicted from pool", session_id=session_id, reason=reason)
+
+    def pool_stats(self) -> AgentPoolStats:
+        """Agent pool hit/miss/eviction counters for sizing the pool"""
+        return self.agents.stats()
+
+    def mcp_pool_stats(self) -> Dict[str, MCPClientPoolStats]:
+        """Connection pool health and circuit state per MCP server"""
+        clients = {**self._recovering_clients, **self.mcp_clients}
+        return {
+            server_name: client.stats()
+            for server_name, client in clients.items()
+            if isinstance(client, MCPClientPool)
+        }
+
+    @override
+    async def probe_model(self) -> None:
+        # straight to the default model: a probe neither waits in the scheduler nor counts in routing stats,
+        # and its tokens are left out of the usage stats
+        with self.usage.untracked():
+            stream = self.model_router.models[DEFAULT_MODEL].stream(
+                [{"role": "user", "content": [{"text": "ping"}]}], system_prompt="Reply with one word."
+            )
+            try:
+                # the first event shows the model is reachable; the answer itself is not needed
+                async for _ in stream:
+                    break
+            except ModelThrottledException as e:
+                raise ModelThrottledError(str(e)) from e
+            finally:
+                aclose = getattr(stream, "aclose", None)
+                if aclose is not None:
+                    await aclose()
+
+    @override
+    def mcp_server_status(self) -> Dict[str, str]:
+        pending = set(self.mcp_startup.pending()) if self.mcp_startup is not None else set()
+        status: Dict[str, str] = {}
+        for server_name in self.mcp_config.mcpServers:
+            if server_name in self.mcp_clients:
+                status[server_name] = "ready" if self._is_server_available(server_name) else "circuit_open"
+            elif server_name in pending:
+                status[server_name] = "starting"
+            elif server_name in self._recovering_clients:
+                status[server_name] = "recovering"
+            else:
+                status[server_name] = "failed"
+        return status
+
+    def tool_executor_stats(self) -> ToolExecutorStats:
+        """Tool calls running, waiting for a slot, timed out and cancelled with their turn"""
+        return self.tool_executor.stats()
+
+    def tool_cache_stats(self) -> Dict[str, ToolCacheStats]:
+        """Per-tool result cache counters, keyed by `server/tool`"""
+        return self.tool_result_cache.stats()
+
+    @override
+    def response_cache_scope(self, session_manager: RepositorySessionManager) -> Optional[str]:
+        # restores the session's history if the agent is not pooled; a miss needs the agent anyway
+        agent = self._get_or_create_agent(session_manager)
+        if agent.messages:
+            return None
+        return self.prefix_fingerprint()
+
+    @override
+    def release_session(self, session_id: str) -> None:
+        self.agents.remove(session_id)
+
+    @override
+    def usage_stats(self) -> ModelUsageStats:
+        usage = self.usage.stats()
+        return ModelUsageStats(**vars(usage), cache_hit_rate=usage.cache_hit_rate)
+
+    @override
+    def model_stats(self) -> Dict[str, ModelRouteStats]:
+        return {
+            name: ModelRouteStats(**vars(stats), avg_latency=stats.avg_latency)
+            for name, stats in self.model_router.stats().items()
+        }
+
+    @override
+    def scheduler_stats(self) -> ModelSchedulerStats:
+        stats = self.scheduler.stats()
+        return ModelSchedulerStats(
+            limit=stats.limit,
+            in_flight=stats.in_flight,
+            queued=stats.queued,
+            admitted=stats.admitted,
+            throttled=stats.throttled,
+            avg_queue_time=stats.avg_queue_time,
+            max_queue_time=stats.max_queue_time,
+        )
+
     @override
-    async def generate_response(self, session_manager: RepositorySessionManager, content: str) -> str:
+    async def record_response(self, session_manager: RepositorySessionManager, content: str, response: str) -> None:
+        session_id = session_manager.session_id
+        agent = self._get_or_create_agent(session_manager)
+        messages: List[Message] = [
+            {"role": "user", "content": [{"text": content}]},
+            {"role": "assistant", "content": [{"text": response}]},
+        ]
+        try:
+            for message in messages:
+                agent.messages.append(message)
+                session_manager.append_message(message, agent)
+        except SessionConflictError:
+            self.agents.remove(session_id)
+            raise
+        self.agents.touch(session_id)
+
+    @override
+    async def generate_response(
+        self,
+        session_manager: RepositorySessionManager,
+        content: str,
+        model: Optional[str] = None,
+        user_id: Optional[str] = None,
+        priority: TurnPriority = TurnPriority.INTERACTIVE,
+    ) -> str:
         """Generate response using the agent"""
         session_id = session_manager.session_id
-        agent = self._get_or_create_agent(session_id)
+        self.model_router.resolve(model)
+        agent = self._get_or_create_agent(session_manager)
+        self._prepare_turn(agent, content)
 
-        response = await agent.invoke_async(prompt=content)
+        turn = self._start_turn(model, user_id or session_id, priority)
+        try:
+            response = await agent.invoke_async(prompt=content)
+        except SessionConflictError:
+            # lost a write race with another worker; the next turn rebuilds the agent from storage
+            self.agents.remove(session_id)
+            raise
+        finally:
+            self._end_turn(session_id, turn)
+        self.agents.touch(session_id)
         content_block = response.message["content"][0]
         return content_block.get("text", "")
 
     @override
     async def generate_response_stream(
-        self, session_manager: RepositorySessionManager, content: str
+        self,
+        session_manager: RepositorySessionManager,
+        content: str,
+        model: Optional[str] = None,
+        user_id: Optional[str] = None,
+        priority: TurnPriority = TurnPriority.INTERACTIVE,
     ) -> AsyncIterator[Any]:
         """Generate streaming response using the agent"""
         session_id = session_manager.session_id
-        agent = self._get_or_create_agent(session_id)
+        # before the stream starts, so an unknown model is an error response rather than an error event
+        self.model_router.resolve(model)
+        agent = self._get_or_create_agent(session_manager)
+        self._prepare_turn(agent, content)
 
-        return agent.stream_async(prompt=content)
+        stream = agent.stream_async(prompt=content)
+        return self._stream_and_touch(session_id, stream, model, user_id or session_id, priority)
+
+    async def _stream_and_touch(
+        self,
+        session_id: str,
+        stream: AsyncIterator[Any],
+        model: Optional[str],
+        user: str,
+        priority: TurnPriority,
+    ) -> AsyncIterator[Any]:
+        """Relay stream events and refresh the pool's memory estimate once the turn completes"""
+        turn = self._start_turn(model, user, priority)
+        try:
+            async for event in stream:
+                yield event
+        except SessionConflictError:
+            self.agents.remove(session_id)
+            raise
+        finally:
+            self._end_turn(session_id, turn)
+            self.agents.touch(session_id)
 
     @override
     def cleanup(self) -> None:
         logger.info("🧹 cleaning up agent adapter")
 
-        for client_name, client in self.mcp_clients.items():
+        if self.mcp_startup is not None:
+            self.mcp_startup.cancel()
+        for task in self._recovery_tasks:
+            task.cancel()
+
+        clients = {**self._recovering_clients, **self.mcp_clients}
+        for client_name, client in clients.items():
             try:
                 logger.info("🔌 closing MCP client", client_name=client_name)
                 client.stop(None, None, None)
@@ -129,7 +693,12 @@ class StrandsMCPAgentAdapter(MCPAgentAdapter):
                 )
 
         self.mcp_clients.clear()
-        self.mcp_tools.clear()
+        self._recovering_clients.clear()
+        self._starting_clients = {}
+        self.server_tools.clear()
+        self._server_fingerprints.clear()
+        self._rebuild_tools()
+        self.tool_result_cache.clear()
         self.agents.clear()
 
         logger.info("🧹 agent adapter cleaned up")
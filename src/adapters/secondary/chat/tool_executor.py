@@ -0,0 +1,156 @@
+import asyncio
+from contextlib import AsyncExitStack
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, TypeVar, override
+
+from strands.tools.mcp import MCPAgentTool
+from strands.types.tools import ToolGenerator, ToolUse
+
+from ports.mcp import MCPToolExecutionConfig
+from utils.logger import logger
+
+T = TypeVar("T")
+
+
+@dataclass
+class ToolExecutorStats:
+    in_flight: int = 0
+    queued: int = 0
+    completed: int = 0
+    timed_out: int = 0
+    cancelled: int = 0
+
+
+class ToolExecutor:
+    """
+    Runs the MCP tool calls of every agent under a global and a per-server concurrency cap, each
+    bounded by its tool's timeout.
+
+    strands starts all tool uses of a model response at once, so a turn takes as long as its slowest
+    tool rather than the sum of them; the caps keep a burst of turns from flooding the servers, and
+    calls beyond them wait for a slot. Calls are tracked per turn, so `end_turn` cancels the ones an
+    aborted turn (client gone, turn cancelled) left running.
+    """
+
+    def __init__(self, max_concurrency: Optional[int] = None, default_timeout: Optional[float] = None):
+        self.max_concurrency = max_concurrency
+        self.default_timeout = default_timeout
+        self._global = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        self._servers: Dict[str, asyncio.Semaphore] = {}
+        self._configs: Dict[str, MCPToolExecutionConfig] = {}
+        # tasks running a tool call of the current turn
+        self._turn: ContextVar[Optional[Set[asyncio.Task]]] = ContextVar("turn_tool_calls", default=None)
+        self._stats = ToolExecutorStats()
+
+    def configure_server(self, server_name: str, config: MCPToolExecutionConfig) -> None:
+        self._configs[server_name] = config
+        if config.maxConcurrency:
+            self._servers[server_name] = asyncio.Semaphore(config.maxConcurrency)
+        else:
+            self._servers.pop(server_name, None)
+
+    def timeout(self, server_name: str, tool_name: str) -> Optional[float]:
+        """Seconds a call of the tool may take: per tool, else per server, else the default; None: no limit"""
+        config = self._configs.get(server_name)
+        if config is not None:
+            if tool_name in config.toolTimeouts:
+                return config.toolTimeouts[tool_name]
+            if config.timeout is not None:
+                return config.timeout
+        return self.default_timeout
+
+    def start_turn(self) -> None:
+        self._turn.set(set())
+
+    def end_turn(self) -> int:
+        """Cancel the tool calls the turn left running; returns how many were cancelled"""
+        calls = self._turn.get()
+        self._turn.set(None)
+        if not calls:
+            return 0
+        for task in calls:
+            task.cancel()
+        self._stats.cancelled += len(calls)
+        return len(calls)
+
+    async def call(self, server_name: str, tool_name: str, call: Callable[[], Awaitable[T]]) -> T:
+        """Run `call` once a slot is free; raises TimeoutError when it outlasts the tool's timeout"""
+        calls = self._turn.get()
+        task = asyncio.current_task()
+        if calls is not None and task is not None:
+            calls.add(task)
+        server_slot = self._servers.get(server_name)
+        self._stats.queued += 1
+        queued = True
+        try:
+            async with AsyncExitStack() as slots:
+                # the server slot first, so a call waiting for a busy server holds no global slot
+                if server_slot is not None:
+                    await slots.enter_async_context(server_slot)
+                if self._global is not None:
+                    await slots.enter_async_context(self._global)
+                self._stats.queued -= 1
+                queued = False
+
+                self._stats.in_flight += 1
+                try:
+                    result = await asyncio.wait_for(call(), self.timeout(server_name, tool_name))
+                except TimeoutError:
+                    self._stats.timed_out += 1
+                    raise
+                finally:
+                    self._stats.in_flight -= 1
+                self._stats.completed += 1
+                return result
+        finally:
+            if queued:
+                self._stats.queued -= 1
+            if calls is not None and task is not None:
+                calls.discard(task)
+
+    def stats(self) -> ToolExecutorStats:
+        return ToolExecutorStats(**vars(self._stats))
+
+
+class BoundedMCPAgentTool(MCPAgentTool):
+    """MCPAgentTool whose calls run through a ToolExecutor; a call that times out returns an error result"""
+
+    def __init__(self, tool: MCPAgentTool, server_name: str, executor: ToolExecutor):
+        super().__init__(tool.mcp_tool, tool.mcp_client)
+        # possibly a CachedMCPAgentTool: cache hits take a slot only briefly
+        self.tool = tool
+        self.server_name = server_name
+        self.executor = executor
+
+    @override
+    async def stream(self, tool_use: ToolUse, invocation_state: Dict[str, Any], **kwargs: Any) -> ToolGenerator:
+        async def call() -> Dict[str, Any]:
+            result: Dict[str, Any] = {}
+            async for event in self.tool.stream(tool_use, invocation_state, **kwargs):
+                result = event
+            return result
+
+        try:
+            result = await self.executor.call(self.server_name, self.tool_name, call)
+        except TimeoutError:
+            timeout = self.executor.timeout(self.server_name, self.tool_name)
+            logger.warning(
+                "⏱️ MCP tool call timed out", server_name=self.server_name, tool_name=self.tool_name, timeout=timeout
+            )
+            result = {
+                "toolUseId": tool_use["toolUseId"],
+                "status": "error",
+                "content": [{"text": f"Tool {self.tool_name} timed out after {timeout} seconds"}],
+            }
+        yield result
+
+
+def bound_tools(server_name: str, tools: List[Callable], executor: ToolExecutor) -> List[Callable]:
+    """Run a server's MCP tools through the executor; other tools are returned unchanged"""
+    bound = []
+    for tool in tools:
+        if isinstance(tool, MCPAgentTool):
+            tool = BoundedMCPAgentTool(tool, server_name, executor)
+        bound.append(tool)
+    return bound
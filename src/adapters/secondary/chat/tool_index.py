@@ -0,0 +1,83 @@
+import math
+import re
+from collections import Counter
+from typing import AbstractSet, Any, Dict, Iterable, List, Set
+
+from strands.types.content import Messages
+
+from adapters.secondary.chat.prompt_cache import tool_sort_key
+
+_CAMEL_BOUNDARY = re.compile(r"([a-z0-9])([A-Z])")
+_WORD = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase words of a text; tool names are split on camelCase and `_` boundaries"""
+    return _WORD.findall(_CAMEL_BOUNDARY.sub(r"\1 \2", text).lower())
+
+
+def used_tools(messages: Messages) -> Set[str]:
+    """Names of the tools called in a conversation"""
+    return {
+        block["toolUse"]["name"]
+        for message in messages
+        if message["role"] == "assistant"
+        for block in message["content"]
+        if "toolUse" in block
+    }
+
+
+class ToolIndex:
+    """
+    BM25 index over the names and descriptions of a tool set, for picking the tools a prompt needs.
+
+    Built once per tool set, so a lookup only scores the query's terms against precomputed term
+    frequencies. Tool names count twice: they are short and say the most about what a tool does.
+    """
+
+    def __init__(self, tools: Iterable[Any], k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.names: List[str] = []
+        self._term_freqs: List[Counter] = []
+        for tool in tools:
+            name = tool_sort_key(tool)
+            description = (getattr(tool, "tool_spec", None) or {}).get("description") or ""
+            self.names.append(name)
+            self._term_freqs.append(Counter(tokenize(name) * 2 + tokenize(description)))
+
+        self._lengths = [sum(freqs.values()) for freqs in self._term_freqs]
+        self._avg_length = sum(self._lengths) / len(self._lengths) if self._lengths else 0.0
+        doc_freqs: Counter = Counter(term for freqs in self._term_freqs for term in freqs)
+        count = len(self.names)
+        self._idf: Dict[str, float] = {
+            term: math.log(1 + (count - df + 0.5) / (df + 0.5)) for term, df in doc_freqs.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def scores(self, query: str) -> List[float]:
+        terms = [term for term in set(tokenize(query)) if term in self._idf]
+        scores = []
+        for freqs, length in zip(self._term_freqs, self._lengths):
+            norm = self.k1 * (1 - self.b + self.b * length / self._avg_length) if self._avg_length else self.k1
+            scores.append(
+                sum(
+                    self._idf[term] * freqs[term] * (self.k1 + 1) / (freqs[term] + norm)
+                    for term in terms
+                    if term in freqs
+                )
+            )
+        return scores
+
+    def select(self, query: str, top_k: int, always: AbstractSet[str] = frozenset()) -> Set[str]:
+        """
+        The `top_k` tools scoring best for the query, plus the `always` ones that are in the index.
+
+        Tools matching none of the query's terms are not picked, however few match.
+        """
+        scores = self.scores(query)
+        ranked = sorted(range(len(self.names)), key=lambda i: (-scores[i], self.names[i]))
+        selected = {self.names[i] for i in ranked[:top_k] if scores[i] > 0}
+        return selected | (always & set(self.names))
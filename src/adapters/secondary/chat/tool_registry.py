@@ -0,0 +1,30 @@
+from typing import Any, Dict, List, Optional, override
+
+from strands.tools.registry import ToolRegistry
+
+
+class SharedToolRegistry(ToolRegistry):
+    """
+    ToolRegistry built once and shared by every agent created while the tool set is unchanged.
+
+    strands normalizes and validates every tool spec each time the model is called; the result
+    only depends on the registered tools, so it is computed once and reused until a tool is added.
+    """
+
+    def __init__(self, tools: Optional[List[Any]] = None):
+        super().__init__()
+        self._tools_config: Optional[Dict[str, Any]] = None
+        if tools:
+            self.process_tools(tools)
+
+    @override
+    def register_tool(self, tool: Any) -> None:
+        super().register_tool(tool)
+        self._tools_config = None
+
+    @override
+    def get_all_tools_config(self) -> Dict[str, Any]:
+        if self._tools_config is None:
+            self._tools_config = super().get_all_tools_config()
+        # shallow copy: callers may add or drop entries, the specs themselves are never mutated
+        return dict(self._tools_config)
@@ -0,0 +1,209 @@
+import hashlib
+import json
+import mmap
+import os
+import re
+import time
+from dataclasses import dataclass
+from typing import Any, List, Optional, override
+
+from strands import tool
+from strands.experimental.hooks import AfterToolInvocationEvent
+from strands.hooks import HookProvider, HookRegistry
+from strands.types.tools import ToolResultContent
+
+from utils.logger import logger
+
+
+# handles are the sha256 of the stored content; nothing else is accepted as a file name
+_HANDLE = re.compile(r"^[0-9a-f]{64}$")
+
+READ_TOOL_NAME = "read_tool_result"
+# upper bound for a single page, so paging cannot pull a whole result back into the context
+MAX_PAGE_BYTES = 16 * 1024
+
+
+def _is_continuation(byte: int) -> bool:
+    """True for the second to fourth byte of a multi-byte UTF-8 character"""
+    return byte & 0xC0 == 0x80
+
+
+class ToolResultNotFoundError(Exception):
+    """The handle is malformed or its blob has expired"""
+
+
+@dataclass
+class ToolResultPage:
+    text: str
+    offset: int
+    next_offset: Optional[int]
+    total_bytes: int
+
+
+class ToolResultBlobStore:
+    """
+    Content-addressed store of large tool results, one file per blob.
+
+    Identical results are stored once. Pages are read through a read-only memory map, so a read only
+    touches the pages it returns and nothing stays resident in the worker between reads.
+    Blobs not stored again for `ttl` seconds are removed by `prune`.
+    """
+
+    def __init__(self, path: str, ttl: Optional[float] = 7 * 24 * 60 * 60):
+        self.path = path
+        self.ttl = ttl
+        os.makedirs(path, exist_ok=True)
+
+    def put(self, data: bytes) -> str:
+        handle = hashlib.sha256(data).hexdigest()
+        path = self._blob_path(handle)
+        if os.path.exists(path):
+            os.utime(path)
+            return handle
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # write-then-rename so concurrent writers of the same content never expose a partial blob
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        return handle
+
+    def read(self, handle: str, offset: int = 0, length: int = MAX_PAGE_BYTES) -> ToolResultPage:
+        if not _HANDLE.match(handle):
+            raise ToolResultNotFoundError(f"invalid tool result handle: {handle}")
+        offset = max(offset, 0)
+        length = min(max(length, 1), MAX_PAGE_BYTES)
+        try:
+            with open(self._blob_path(handle), "rb") as f:
+                total = os.fstat(f.fileno()).st_size
+                if total == 0 or offset >= total:
+                    return ToolResultPage(text="", offset=offset, next_offset=None, total_bytes=total)
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                    # offsets are in bytes; one inside a multi-byte character reads from its first byte
+                    start = offset
+                    while start > 0 and _is_continuation(view[start]):
+                        start -= 1
+                    # end the page before a character it would split, the next page starts at it
+                    end = min(start + length, total)
+                    while end < total and end > start and _is_continuation(view[end]):
+                        end -= 1
+                    if end == start:
+                        # a page shorter than one character still returns that character
+                        end = start + 1
+                        while end < total and _is_continuation(view[end]):
+                            end += 1
+                    chunk = view[start:end]
+        except FileNotFoundError:
+            raise ToolResultNotFoundError(f"tool result not found or expired: {handle}")
+
+        return ToolResultPage(
+            text=chunk.decode("utf-8", errors="replace"),
+            offset=start,
+            next_offset=end if end < total else None,
+            total_bytes=total,
+        )
+
+    def prune(self) -> int:
+        """Remove expired blobs; returns how many were removed"""
+        if self.ttl is None:
+            return 0
+        cutoff = time.time() - self.ttl
+        removed = 0
+        for root, _, names in os.walk(self.path):
+            for name in names:
+                if not _HANDLE.match(name):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    if os.stat(path).st_mtime < cutoff:
+                        os.remove(path)
+                        removed += 1
+                except FileNotFoundError:
+                    pass
+        return removed
+
+    def _blob_path(self, handle: str) -> str:
+        return os.path.join(self.path, handle[:2], handle)
+
+
+class ToolResultOffloader(HookProvider):
+    """
+    Moves tool results larger than `threshold_bytes` out of the conversation.
+
+    The text of an oversized result is written to the blob store before it reaches the agent's
+    messages, so neither the pooled agent, the persisted session nor later prompts carry it.
+    The model gets a handle, the size and a preview, and pages through the rest with `read_tool_result`.
+    """
+
+    def __init__(self, store: ToolResultBlobStore, threshold_bytes: int = 16 * 1024, preview_chars: int = 1000):
+        self.store = store
+        self.threshold_bytes = threshold_bytes
+        self.preview_chars = preview_chars
+        self.offloaded = 0
+
+    @override
+    def register_hooks(self, registry: HookRegistry, **kwargs: Any) -> None:
+        registry.add_callback(AfterToolInvocationEvent, self._on_tool_result)
+
+    def _on_tool_result(self, event: AfterToolInvocationEvent) -> None:
+        if event.tool_use["name"] == READ_TOOL_NAME:
+            return
+        content = self.offload(event.result.get("content", []))
+        if content is not None:
+            # a copy: the original result may be shared, e.g. by the tool result cache
+            result = event.result.copy()
+            result["content"] = content
+            event.result = result
+
+    def offload(self, content: List[ToolResultContent]) -> Optional[List[ToolResultContent]]:
+        """Content with its text replaced by a stored-result notice, or None if it is small enough"""
+        texts = [
+            block["text"] if "text" in block else json.dumps(block["json"], ensure_ascii=False)
+            for block in content
+            if "text" in block or "json" in block
+        ]
+        data = "\n".join(texts).encode("utf-8")
+        if len(data) <= self.threshold_bytes:
+            return None
+
+        try:
+            handle = self.store.put(data)
+        except OSError:
+            logger.warning("⚠️ failed to offload tool result, keeping it inline", exc_info=True)
+            return None
+        self.offloaded += 1
+        logger.info("📦 tool result offloaded", handle=handle, size_bytes=len(data))
+
+        preview = data[:self.preview_chars * 4].decode("utf-8", errors="ignore")[:self.preview_chars]
+        notice = (
+            f"[Large tool result stored out of band: {len(data)} bytes, handle {handle}. "
+            f"Call {READ_TOOL_NAME}(handle, offset, length) to read it in pages.]\n"
+            f"Preview:\n{preview}"
+        )
+        offloaded: List[ToolResultContent] = [{"text": notice}]
+        return offloaded + [block for block in content if "text" not in block and "json" not in block]
+
+
+def read_tool_result_tool(store: ToolResultBlobStore) -> Any:
+    """Local tool the model uses to page through offloaded tool results"""
+
+    @tool(name=READ_TOOL_NAME)
+    def read_tool_result(handle: str, offset: int = 0, length: int = 4000) -> str:
+        """
+        Read part of a large tool result that was stored out of band.
+
+        Args:
+            handle: Handle given in the stored tool result notice.
+            offset: Byte offset to start reading from; use the next offset of the previous page.
+            length: Number of bytes to read, at most 16384.
+        """
+        try:
+            page = store.read(handle, offset, length)
+        except ToolResultNotFoundError as e:
+            return str(e)
+        end = page.next_offset if page.next_offset is not None else page.total_bytes
+        position = f"bytes {page.offset}-{end} of {page.total_bytes}"
+        more = f"next offset {page.next_offset}" if page.next_offset is not None else "end of result"
+        return f"[{position}, {more}]\n{page.text}"
+
+    return read_tool_result
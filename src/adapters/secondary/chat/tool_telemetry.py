@@ -0,0 +1,54 @@
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple, override
+
+from opentelemetry.trace import Span, StatusCode
+from strands.experimental.hooks import AfterToolInvocationEvent, BeforeToolInvocationEvent
+from strands.hooks import HookProvider, HookRegistry
+
+from utils.telemetry import telemetry
+
+# server label of tools that are not served by an MCP server
+LOCAL_SERVER = "local"
+
+
+class ToolCallTelemetry(HookProvider):
+    """
+    Traces every tool call as an `mcp.tool_call` span and records its duration, labelled by server and tool.
+
+    The span starts before the tool is invoked and ends once its result is known; concurrent calls
+    of one turn are told apart by their tool use id. `server_of` maps a tool name to its MCP server.
+    """
+
+    def __init__(self, server_of: Callable[[str], Optional[str]], clock: Callable[[], float] = time.monotonic):
+        self.server_of = server_of
+        self._clock = clock
+        # tool use id -> (span, start time, attributes)
+        self._calls: Dict[str, Tuple[Span, float, Dict[str, str]]] = {}
+        self._lock = threading.Lock()
+
+    @override
+    def register_hooks(self, registry: HookRegistry, **kwargs: Any) -> None:
+        registry.add_callback(BeforeToolInvocationEvent, self._on_tool_start)
+        registry.add_callback(AfterToolInvocationEvent, self._on_tool_end)
+
+    def _on_tool_start(self, event: BeforeToolInvocationEvent) -> None:
+        tool = event.tool_use["name"]
+        attributes = {"mcp.server": self.server_of(tool) or LOCAL_SERVER, "mcp.tool": tool}
+        span = telemetry.start_span("mcp.tool_call", **attributes)
+        with self._lock:
+            self._calls[event.tool_use["toolUseId"]] = (span, self._clock(), attributes)
+
+    def _on_tool_end(self, event: AfterToolInvocationEvent) -> None:
+        with self._lock:
+            call = self._calls.pop(event.tool_use["toolUseId"], None)
+        if call is None:
+            return
+        span, started, attributes = call
+        status = "error" if event.exception is not None or event.result.get("status") == "error" else "success"
+        telemetry.tool_call_duration.record(self._clock() - started, {**attributes, "mcp.status": status})
+        if event.exception is not None:
+            span.record_exception(event.exception)
+        if status == "error":
+            span.set_status(StatusCode.ERROR)
+        span.end()
@@ -1,4 +1,14 @@
+from .incremental_file_session_manager import IncrementalFileSessionManager
+from .in_memory_kv_store import InMemoryKeyValueStore
+from .sqlite_kv_store import SQLiteKeyValueStore
 from .strands_file_session_adapter import StrandsFileSessionAdapter
+from .strands_kv_session_adapter import StrandsKVSessionAdapter
 
 
-__all__ = ["StrandsFileSessionAdapter"]
+__all__ = [
+    "IncrementalFileSessionManager",
+    "InMemoryKeyValueStore",
+    "SQLiteKeyValueStore",
+    "StrandsFileSessionAdapter",
+    "StrandsKVSessionAdapter",
+]
@@ -0,0 +1,72 @@
+import bisect
+import threading
+from typing import Dict, List, Optional, Tuple, override
+
+from ports.session.kv_store import KeyValueStore
+
+
+class InMemoryKeyValueStore(KeyValueStore):
+    """
+    Process-local KeyValueStore.
+
+    Stands in for a network KV (Redis, DynamoDB, ...) in local development and tests;
+    it is NOT shared between workers.
+    """
+
+    def __init__(self):
+        self._data: Dict[str, str] = {}
+        self._keys: List[str] = []  # sorted, for prefix scans
+        self._lock = threading.Lock()
+
+    @override
+    def get(self, key: str) -> Optional[str]:
+        return self._data.get(key)
+
+    @override
+    def put(self, key: str, value: str) -> None:
+        with self._lock:
+            if key not in self._data:
+                bisect.insort(self._keys, key)
+            self._data[key] = value
+
+    @override
+    def compare_and_set(self, key: str, expected: Optional[str], value: str) -> bool:
+        with self._lock:
+            if self._data.get(key) != expected:
+                return False
+            if expected is None:
+                bisect.insort(self._keys, key)
+            self._data[key] = value
+            return True
+
+    @override
+    def delete(self, key: str) -> None:
+        with self._lock:
+            if self._data.pop(key, None) is not None:
+                self._keys.pop(bisect.bisect_left(self._keys, key))
+
+    @override
+    def scan(self, prefix: str) -> List[Tuple[str, str]]:
+        with self._lock:
+            return [(key, self._data[key]) for key in self._prefix_keys(prefix)]
+
+    @override
+    def delete_prefix(self, prefix: str) -> None:
+        with self._lock:
+            start = bisect.bisect_left(self._keys, prefix)
+            keys = self._prefix_keys(prefix)
+            for key in keys:
+                del self._data[key]
+            del self._keys[start:start + len(keys)]
+
+    @override
+    def close(self) -> None:
+        pass
+
+    def _prefix_keys(self, prefix: str) -> List[str]:
+        keys: List[str] = []
+        for key in self._keys[bisect.bisect_left(self._keys, prefix):]:
+            if not key.startswith(prefix):
+                break
+            keys.append(key)
+        return keys
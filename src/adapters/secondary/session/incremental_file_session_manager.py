@@ -0,0 +1,72 @@
+import json
+import os
+from typing import Any, Dict, override
+
+from strands import Agent
+from strands.session.file_session_manager import FileSessionManager
+from strands.types.session import SessionAgent
+
+
+# metadata fields refreshed on every serialization; ignored when detecting changes
+_VOLATILE_AGENT_FIELDS = ("created_at", "updated_at")
+
+
+class IncrementalFileSessionManager(FileSessionManager):
+    """
+    FileSessionManager that keeps per-turn persistence proportional to the new messages.
+
+    - each message is appended as its own file and never rewritten (except on guardrail redaction)
+    - agent metadata is only rewritten when its state or conversation manager state actually changed,
+      without the read-before-write of the base implementation
+    - an agent may be re-attached after it was evicted from the agent pool and rebuilt
+    """
+
+    def __init__(self, session_id: str, storage_dir: str, **kwargs: Any):
+        # agent_id -> (created_at, last persisted payload)
+        self._agent_snapshots: Dict[str, tuple[str, Dict[str, Any]]] = {}
+        super().__init__(session_id=session_id, storage_dir=storage_dir, **kwargs)
+
+    @override
+    def initialize(self, agent: Agent, **kwargs: Any) -> None:
+        # the previous agent instance of this session is gone (evicted); restore the new one from storage
+        self._latest_agent_message.pop(agent.agent_id, None)
+        super().initialize(agent, **kwargs)
+
+    @override
+    def create_agent(self, session_id: str, session_agent: SessionAgent, **kwargs: Any) -> None:
+        super().create_agent(session_id, session_agent, **kwargs)
+        self._remember(session_agent)
+
+    @override
+    def update_agent(self, session_id: str, session_agent: SessionAgent, **kwargs: Any) -> None:
+        snapshot = self._agent_snapshots.get(session_agent.agent_id)
+        if snapshot is None:
+            # not written by this process yet (e.g. restored after restart); fall back to read-modify-write
+            super().update_agent(session_id, session_agent, **kwargs)
+            self._remember(session_agent)
+            return
+
+        created_at, persisted = snapshot
+        if self._payload(session_agent) == persisted:
+            return
+
+        session_agent.created_at = created_at
+        agent_file = os.path.join(self._get_agent_path(session_id, session_agent.agent_id), "agent.json")
+        self._write_file(agent_file, session_agent.to_dict())
+        self._remember(session_agent)
+
+    @override
+    def _write_file(self, path: str, data: Dict[str, Any]) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+
+    def _remember(self, session_agent: SessionAgent) -> None:
+        self._agent_snapshots[session_agent.agent_id] = (session_agent.created_at, self._payload(session_agent))
+
+    @staticmethod
+    def _payload(session_agent: SessionAgent) -> Dict[str, Any]:
+        data = session_agent.to_dict()
+        for key in _VOLATILE_AGENT_FIELDS:
+            data.pop(key, None)
+        return data
@@ -0,0 +1,180 @@
+import json
+from typing import Any, Dict, List, Optional, override
+
+from strands import Agent
+from strands.session.repository_session_manager import RepositorySessionManager
+from strands.session.session_repository import SessionRepository
+from strands.types.exceptions import SessionException
+from strands.types.session import Session, SessionAgent, SessionMessage
+
+from ports.session.kv_store import KeyValueStore, SessionConflictError
+
+
+def session_prefix(session_id: str) -> str:
+    return f"session/{session_id}/"
+
+
+def _session_key(session_id: str) -> str:
+    return f"{session_prefix(session_id)}session"
+
+
+def _agent_key(session_id: str, agent_id: str) -> str:
+    return f"{session_prefix(session_id)}agent/{agent_id}/agent"
+
+
+def _messages_prefix(session_id: str, agent_id: str) -> str:
+    return f"{session_prefix(session_id)}agent/{agent_id}/message/"
+
+
+def _message_key(session_id: str, agent_id: str, message_id: int) -> str:
+    # zero padded so lexical key order is message order
+    return f"{_messages_prefix(session_id, agent_id)}{message_id:010d}"
+
+
+def _dumps(data: Dict[str, Any]) -> str:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+class KVSessionRepository(SessionRepository):
+    """
+    strands SessionRepository on top of a KeyValueStore.
+
+    Every message is its own key, so a turn writes only its new messages; agent metadata is
+    rewritten only when it changed since this process last wrote it.
+
+    Other workers may serve the same session, so every write is conditional: a message id is
+    written only if it is still free, and agent metadata only if it is still what this process
+    last read or wrote. A lost race raises SessionConflictError instead of overwriting history.
+    """
+
+    def __init__(self, store: KeyValueStore):
+        self.store = store
+        # (session_id, agent_id) -> (created_at, persisted state, raw stored payload)
+        self._agent_snapshots: Dict[tuple[str, str], tuple[str, str, str]] = {}
+
+    @override
+    def create_session(self, session: Session, **kwargs: Any) -> Session:
+        key = _session_key(session.session_id)
+        if self.store.get(key) is not None:
+            raise SessionException(f"Session {session.session_id} already exists")
+        self.store.put(key, _dumps(session.to_dict()))
+        return session
+
+    @override
+    def read_session(self, session_id: str, **kwargs: Any) -> Optional[Session]:
+        data = self.store.get(_session_key(session_id))
+        return Session.from_dict(json.loads(data)) if data is not None else None
+
+    @override
+    def create_agent(self, session_id: str, session_agent: SessionAgent, **kwargs: Any) -> None:
+        payload = _dumps(session_agent.to_dict())
+        if not self.store.compare_and_set(_agent_key(session_id, session_agent.agent_id), None, payload):
+            raise SessionConflictError(f"Agent {session_agent.agent_id} in session {session_id} already exists")
+        self._remember_agent(session_id, session_agent, payload)
+
+    @override
+    def read_agent(self, session_id: str, agent_id: str, **kwargs: Any) -> Optional[SessionAgent]:
+        data = self.store.get(_agent_key(session_id, agent_id))
+        if data is None:
+            return None
+        session_agent = SessionAgent.from_dict(json.loads(data))
+        # what this process has seen is what its next update must replace
+        self._remember_agent(session_id, session_agent, data)
+        return session_agent
+
+    @override
+    def update_agent(self, session_id: str, session_agent: SessionAgent, **kwargs: Any) -> None:
+        snapshot = self._agent_snapshots.get((session_id, session_agent.agent_id))
+        if snapshot is None:
+            if self.read_agent(session_id, session_agent.agent_id) is None:
+                raise SessionException(f"Agent {session_agent.agent_id} in session {session_id} does not exist")
+            snapshot = self._agent_snapshots[(session_id, session_agent.agent_id)]
+
+        created_at, persisted, expected = snapshot
+        if self._state(session_agent) == persisted:
+            return
+
+        session_agent.created_at = created_at
+        payload = _dumps(session_agent.to_dict())
+        if not self.store.compare_and_set(_agent_key(session_id, session_agent.agent_id), expected, payload):
+            self._agent_snapshots.pop((session_id, session_agent.agent_id), None)
+            raise SessionConflictError(f"Agent {session_agent.agent_id} in session {session_id} was updated elsewhere")
+        self._remember_agent(session_id, session_agent, payload)
+
+    @override
+    def create_message(self, session_id: str, agent_id: str, session_message: SessionMessage, **kwargs: Any) -> None:
+        key = _message_key(session_id, agent_id, session_message.message_id)
+        if not self.store.compare_and_set(key, None, _dumps(session_message.to_dict())):
+            raise SessionConflictError(
+                f"Message {session_message.message_id} in session {session_id} was written elsewhere"
+            )
+
+    @override
+    def read_message(self, session_id: str, agent_id: str, message_id: int, **kwargs: Any) -> Optional[SessionMessage]:
+        data = self.store.get(_message_key(session_id, agent_id, message_id))
+        return SessionMessage.from_dict(json.loads(data)) if data is not None else None
+
+    @override
+    def update_message(self, session_id: str, agent_id: str, session_message: SessionMessage, **kwargs: Any) -> None:
+        key = _message_key(session_id, agent_id, session_message.message_id)
+        expected = self.store.get(key)
+        if expected is None:
+            raise SessionException(f"Message {session_message.message_id} does not exist")
+
+        session_message.created_at = SessionMessage.from_dict(json.loads(expected)).created_at
+        if not self.store.compare_and_set(key, expected, _dumps(session_message.to_dict())):
+            raise SessionConflictError(
+                f"Message {session_message.message_id} in session {session_id} was updated elsewhere"
+            )
+
+    @override
+    def list_messages(
+        self, session_id: str, agent_id: str, limit: Optional[int] = None, offset: int = 0, **kwargs: Any
+    ) -> List[SessionMessage]:
+        rows = self.store.scan(_messages_prefix(session_id, agent_id))
+        rows = rows[offset:offset + limit] if limit is not None else rows[offset:]
+        return [SessionMessage.from_dict(json.loads(value)) for _, value in rows]
+
+    def is_behind(self, session_id: str, agent_id: str, next_message_id: int) -> bool:
+        """Whether another worker appended messages or changed agent metadata since this process saw them"""
+        if self.store.get(_message_key(session_id, agent_id, next_message_id)) is not None:
+            return True
+        snapshot = self._agent_snapshots.get((session_id, agent_id))
+        return snapshot is not None and self.store.get(_agent_key(session_id, agent_id)) != snapshot[2]
+
+    def forget(self, session_id: str) -> None:
+        for key in [key for key in self._agent_snapshots if key[0] == session_id]:
+            del self._agent_snapshots[key]
+
+    def _remember_agent(self, session_id: str, session_agent: SessionAgent, payload: str) -> None:
+        key = (session_id, session_agent.agent_id)
+        self._agent_snapshots[key] = (session_agent.created_at, self._state(session_agent), payload)
+
+    @staticmethod
+    def _state(session_agent: SessionAgent) -> str:
+        data = session_agent.to_dict()
+        data.pop("created_at", None)
+        data.pop("updated_at", None)
+        return _dumps(data)
+
+
+class KVSessionManager(RepositorySessionManager):
+    """RepositorySessionManager over a KVSessionRepository whose agent can be re-attached after eviction"""
+
+    def __init__(self, session_id: str, session_repository: KVSessionRepository, **kwargs: Any):
+        super().__init__(session_id=session_id, session_repository=session_repository, **kwargs)
+        self.repository = session_repository
+
+    def is_stale(self, agent: Agent) -> bool:
+        """Whether `agent` missed writes made by another worker and has to be rebuilt from storage"""
+        if agent.agent_id not in self._latest_agent_message:
+            return False
+        latest = self._latest_agent_message[agent.agent_id]
+        next_message_id = latest.message_id + 1 if latest is not None else 0
+        return self.repository.is_behind(self.session_id, agent.agent_id, next_message_id)
+
+    @override
+    def initialize(self, agent: Agent, **kwargs: Any) -> None:
+        # the previous agent instance of this session is gone (evicted); restore the new one from storage
+        self._latest_agent_message.pop(agent.agent_id, None)
+        super().initialize(agent, **kwargs)
@@ -0,0 +1,116 @@
+import os
+import queue
+import sqlite3
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Tuple, override
+
+from ports.session.kv_store import KeyValueStore
+
+
+# sorts after every character that can appear in a key
+_PREFIX_UPPER_BOUND = "\U0010ffff"
+
+
+class SQLiteKeyValueStore(KeyValueStore):
+    """
+    SQLite-backed key-value store shared by every worker on a host.
+
+    The database runs in WAL mode so readers never block the writer, and a fixed pool of
+    connections is reused across requests instead of opening one per call. A caller waits at most
+    `checkout_timeout` seconds for a free connection, so a stuck store cannot pile up blocked threads.
+    """
+
+    def __init__(self, path: str, pool_size: int = 4, busy_timeout_ms: int = 5000, checkout_timeout: float = 30.0):
+        assert pool_size > 0, "pool_size must be positive"
+        self.path = path
+        self.checkout_timeout = checkout_timeout
+        self._closed = False
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._pool: "queue.Queue[sqlite3.Connection]" = queue.Queue(maxsize=pool_size)
+        for _ in range(pool_size):
+            self._pool.put(self._connect(busy_timeout_ms))
+
+        with self._connection() as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS kv (key TEXT PRIMARY KEY, value TEXT NOT NULL) WITHOUT ROWID")
+
+    def _connect(self, busy_timeout_ms: int) -> sqlite3.Connection:
+        # autocommit: every statement is its own short transaction
+        conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA busy_timeout={int(busy_timeout_ms)}")
+        return conn
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        if self._closed:
+            raise sqlite3.ProgrammingError("Cannot operate on a closed store")
+        try:
+            conn = self._pool.get(timeout=self.checkout_timeout)
+        except queue.Empty:
+            raise TimeoutError(f"no free connection to {self.path} after {self.checkout_timeout} seconds") from None
+        try:
+            yield conn
+        finally:
+            if self._closed:
+                conn.close()
+            else:
+                self._pool.put(conn)
+
+    @override
+    def get(self, key: str) -> Optional[str]:
+        with self._connection() as conn:
+            row = conn.execute("SELECT value FROM kv WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    @override
+    def put(self, key: str, value: str) -> None:
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT INTO kv (key, value) VALUES (?, ?) ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                (key, value),
+            )
+
+    @override
+    def compare_and_set(self, key: str, expected: Optional[str], value: str) -> bool:
+        with self._connection() as conn:
+            if expected is None:
+                cursor = conn.execute(
+                    "INSERT INTO kv (key, value) VALUES (?, ?) ON CONFLICT(key) DO NOTHING", (key, value)
+                )
+            else:
+                cursor = conn.execute(
+                    "UPDATE kv SET value = ? WHERE key = ? AND value = ?", (value, key, expected)
+                )
+        return cursor.rowcount == 1
+
+    @override
+    def delete(self, key: str) -> None:
+        with self._connection() as conn:
+            conn.execute("DELETE FROM kv WHERE key = ?", (key,))
+
+    @override
+    def scan(self, prefix: str) -> List[Tuple[str, str]]:
+        with self._connection() as conn:
+            rows = conn.execute(
+                "SELECT key, value FROM kv WHERE key >= ? AND key < ? ORDER BY key",
+                (prefix, prefix + _PREFIX_UPPER_BOUND),
+            ).fetchall()
+        return [(key, value) for key, value in rows]
+
+    @override
+    def delete_prefix(self, prefix: str) -> None:
+        with self._connection() as conn:
+            conn.execute("DELETE FROM kv WHERE key >= ? AND key < ?", (prefix, prefix + _PREFIX_UPPER_BOUND))
+
+    @override
+    def close(self) -> None:
+        self._closed = True
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
@@ -1,45 +1,66 @@
+import asyncio
+import os
+import shutil
 from typing import Dict, override
 
 import ulid
-from strands.session.file_session_manager import FileSessionManager
 
+from adapters.secondary.session.incremental_file_session_manager import IncrementalFileSessionManager
 from ports.session.session_adapter import SessionAdapter
 from utils.logger import logger
 
 
+# directory prefix used by strands FileSessionManager for each session
+SESSION_DIR_PREFIX = "session_"
+
+
 class StrandsFileSessionAdapter(SessionAdapter):
     def __init__(self, base_path: str = "./.sessions"):
         self.base_path = base_path
-        self.sessions: Dict[str, FileSessionManager] = {}
+        self.sessions: Dict[str, IncrementalFileSessionManager] = {}
 
     # TODO: get involved with user_id
     @override
     async def create_session(self, user_id: str) -> str:
         session_id = ulid.ulid()
-        self.sessions[session_id] = FileSessionManager(
+        self.sessions[session_id] = IncrementalFileSessionManager(
             session_id=session_id,
             storage_dir=self.base_path,
         )
         return session_id
 
     @override
-    async def get_session(self, session_id: str) -> FileSessionManager:
+    async def get_session(self, session_id: str) -> IncrementalFileSessionManager:
         if session_id not in self.sessions:
-            logger.error(
-                "🚨 session not found",
+            if not os.path.isdir(self._session_path(session_id)):
+                logger.error(
+                    "🚨 session not found",
+                    session_id=session_id,
+                    exc_info=True,
+                    stack_info=True,
+                )
+                raise KeyError(f"🚨 session not found: {session_id}")
+
+            # persisted by a previous process; history is restored when the agent is attached
+            self.sessions[session_id] = IncrementalFileSessionManager(
                 session_id=session_id,
-                exc_info=True,
-                stack_info=True,
+                storage_dir=self.base_path,
             )
-            raise KeyError(f"🚨 session not found: {session_id}")
         return self.sessions[session_id]
 
     @override
     async def delete_session(self, session_id: str) -> None:
-        if session_id not in self.sessions:
-            return
+        self.sessions.pop(session_id, None)
+        shutil.rmtree(self._session_path(session_id), ignore_errors=True)
 
-        del self.sessions[session_id]
+    @override
+    async def check_health(self) -> None:
+        await asyncio.to_thread(self._check_writable)
+
+    def _check_writable(self) -> None:
+        os.makedirs(self.base_path, exist_ok=True)
+        if not os.access(self.base_path, os.W_OK):
+            raise PermissionError(f"session directory is not writable: {self.base_path}")
 
     @override
     def cleanup(self) -> None:
@@ -48,3 +69,9 @@ class StrandsFileSessionAdapter(SessionAdapter):
         self.sessions.clear()
 
         logger.info("🧹 session adapter cleaned up")
+
+    def _session_path(self, session_id: str) -> str:
+        # session ids are ulids; reject anything that could escape base_path
+        if not session_id or os.sep in session_id or session_id in (".", ".."):
+            raise KeyError(f"🚨 invalid session id: {session_id}")
+        return os.path.join(self.base_path, f"{SESSION_DIR_PREFIX}{session_id}")
@@ -0,0 +1,133 @@
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple, override
+
+import ulid
+
+from adapters.secondary.session.kv_session_manager import KVSessionManager, KVSessionRepository, session_prefix
+from ports.session.kv_store import KeyValueStore
+from ports.session.session_adapter import SessionAdapter
+from utils.logger import logger
+
+
+def _meta_key(session_id: str) -> str:
+    return f"meta/{session_id}"
+
+
+class StrandsKVSessionAdapter(SessionAdapter):
+    """
+    SessionAdapter backed by a shared KeyValueStore, so any worker or container can serve any session.
+
+    Sessions are looked up lazily: a session manager is only built on first use in this process.
+    Session metadata is kept in a small read-through cache so hot sessions don't hit the store on
+    every request; misses are never cached, so sessions created by another worker are visible at once.
+    Writes are conditional, so a worker whose cached agent missed turns served elsewhere gets it
+    rebuilt instead of overwriting them. Sticky routing is still preferable: it avoids the rebuilds,
+    and concurrent turns are only serialized within a process.
+    """
+
+    def __init__(
+        self,
+        store: KeyValueStore,
+        cache_size: int = 1024,
+        cache_ttl: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.store = store
+        self.repository = KVSessionRepository(store)
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self._clock = clock
+
+        # session_id -> (expires_at, metadata)
+        self._metadata: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self.sessions: "OrderedDict[str, KVSessionManager]" = OrderedDict()
+
+    # TODO: get involved with user_id
+    @override
+    async def create_session(self, user_id: str) -> str:
+        session_id = ulid.ulid()
+        metadata = {"user_id": user_id, "created_at": time.time()}
+
+        await asyncio.to_thread(self.store.put, _meta_key(session_id), json.dumps(metadata))
+        self._cache_metadata(session_id, metadata)
+        self._remember(session_id, await asyncio.to_thread(self._build_manager, session_id))
+        return session_id
+
+    @override
+    async def get_session(self, session_id: str) -> KVSessionManager:
+        if await self.get_metadata(session_id) is None:
+            self.sessions.pop(session_id, None)
+            logger.error(
+                "🚨 session not found",
+                session_id=session_id,
+                exc_info=True,
+                stack_info=True,
+            )
+            raise KeyError(f"🚨 session not found: {session_id}")
+
+        manager = self.sessions.get(session_id)
+        if manager is not None:
+            self.sessions.move_to_end(session_id)
+            return manager
+
+        manager = await asyncio.to_thread(self._build_manager, session_id)
+        self._remember(session_id, manager)
+        return manager
+
+    async def get_metadata(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Read-through cached session metadata; None if the session does not exist"""
+        cached = self._metadata.get(session_id)
+        if cached is not None and cached[0] > self._clock():
+            self._metadata.move_to_end(session_id)
+            return cached[1]
+
+        data = await asyncio.to_thread(self.store.get, _meta_key(session_id))
+        if data is None:
+            self._metadata.pop(session_id, None)
+            return None
+
+        metadata = json.loads(data)
+        self._cache_metadata(session_id, metadata)
+        return metadata
+
+    @override
+    async def delete_session(self, session_id: str) -> None:
+        self.sessions.pop(session_id, None)
+        self.repository.forget(session_id)
+        self._metadata.pop(session_id, None)
+
+        await asyncio.to_thread(self.store.delete, _meta_key(session_id))
+        await asyncio.to_thread(self.store.delete_prefix, session_prefix(session_id))
+
+    @override
+    async def check_health(self) -> None:
+        await asyncio.to_thread(self.store.get, _meta_key("health"))
+
+    @override
+    def cleanup(self) -> None:
+        logger.info("🧹 cleaning up session adapter")
+
+        self.sessions.clear()
+        self._metadata.clear()
+        self.store.close()
+
+        logger.info("🧹 session adapter cleaned up")
+
+    def _build_manager(self, session_id: str) -> KVSessionManager:
+        return KVSessionManager(session_id=session_id, session_repository=self.repository)
+
+    def _remember(self, session_id: str, manager: KVSessionManager) -> None:
+        self.sessions[session_id] = manager
+        self.sessions.move_to_end(session_id)
+        while len(self.sessions) > self.cache_size:
+            evicted_id, _ = self.sessions.popitem(last=False)
+            self.repository.forget(evicted_id)
+
+    def _cache_metadata(self, session_id: str, metadata: Dict[str, Any]) -> None:
+        self._metadata[session_id] = (self._clock() + self.cache_ttl, metadata)
+        self._metadata.move_to_end(session_id)
+        while len(self._metadata) > self.cache_size:
+            self._metadata.popitem(last=False)
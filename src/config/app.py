@@ -1,5 +1,6 @@
+import json
 import os
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from dataclasses import dataclass
 
 from dotenv import load_dotenv
@@ -13,6 +14,123 @@ AWS_PROFILE_NAME = os.getenv("AWS_PROFILE_NAME")
 MODEL_TEMPERATURE = float(os.getenv("MODEL_TEMPERATURE", 0.3))
 MODEL_MAX_TOKENS = int(os.getenv("MODEL_MAX_TOKENS", 1024 * 2))
 
+# Model routing
+# more models by name, e.g. {"fast": {"model_id": "...", "input_cost": 0.0008, "output_cost": 0.004}};
+# costs are USD per 1000 tokens. "default" is MODEL_ID unless listed here
+MODEL_REGISTRY = json.loads(os.getenv("MODEL_REGISTRY") or "{}")
+MODEL_ROUTING = os.getenv("MODEL_ROUTING", "fixed")  # fixed | cascade
+MODEL_CASCADE_FAST = os.getenv("MODEL_CASCADE_FAST", "fast")  # registered model tried first by the cascade
+MODEL_CASCADE_MAX_PROMPT_CHARS = int(os.getenv("MODEL_CASCADE_MAX_PROMPT_CHARS", 400))
+
+# bedrock | fake: a local model answering without AWS, for load tests; FAKE_MODEL holds its settings, e.g.
+# {"latency": 0.3, "tokens_per_second": 50, "tool_calls_per_turn": 1}
+MODEL_PROVIDER = os.getenv("MODEL_PROVIDER", "bedrock")
+FAKE_MODEL = json.loads(os.getenv("FAKE_MODEL") or "{}")
+
+# Outbound model calls: queued beyond these limits; throttling lowers the global limit until calls succeed again
+MODEL_MAX_CONCURRENCY = int(os.getenv("MODEL_MAX_CONCURRENCY", 32))
+MODEL_USER_MAX_CONCURRENCY = int(os.getenv("MODEL_USER_MAX_CONCURRENCY", 4))
+MODEL_THROTTLE_RETRIES = int(os.getenv("MODEL_THROTTLE_RETRIES", 3))
+
+# Agent pool
+AGENT_POOL_MAX_SIZE = int(os.getenv("AGENT_POOL_MAX_SIZE", 256))
+AGENT_POOL_IDLE_TTL = float(os.getenv("AGENT_POOL_IDLE_TTL", 60 * 30))
+AGENT_POOL_MAX_BYTES = int(os.getenv("AGENT_POOL_MAX_BYTES", 256 * 1024 * 1024))
+
+# Conversation management
+# sliding | summarizing | token_budget | compacting
+CONVERSATION_STRATEGY = os.getenv("CONVERSATION_STRATEGY", "sliding")
+CONVERSATION_WINDOW_SIZE = int(os.getenv("CONVERSATION_WINDOW_SIZE", 20))
+CONVERSATION_TOKEN_BUDGET = int(os.getenv("CONVERSATION_TOKEN_BUDGET", 32_000))
+# tokens at which the compacting strategy summarizes the oldest messages; unset means 3/4 of the budget
+CONVERSATION_COMPACTION_THRESHOLD = os.getenv("CONVERSATION_COMPACTION_THRESHOLD")
+
+# Chat turn concurrency
+CHAT_CONCURRENCY_POLICY = os.getenv("CHAT_CONCURRENCY_POLICY", "queue")  # queue | reject | cancel
+CHAT_COALESCE_RETRIES = os.getenv("CHAT_COALESCE_RETRIES", "true").lower() == "true"
+
+# Admission control: interactive turns beyond these limits are answered 503 with Retry-After; 0 disables a limit
+ADMISSION_MAX_IN_FLIGHT_TURNS = int(os.getenv("ADMISSION_MAX_IN_FLIGHT_TURNS", 256))  # running or queued turns
+ADMISSION_MAX_QUEUED_MODEL_CALLS = int(os.getenv("ADMISSION_MAX_QUEUED_MODEL_CALLS", 128))
+ADMISSION_RETRY_AFTER = float(os.getenv("ADMISSION_RETRY_AFTER", 1))
+
+# Health checks (/health/ready): the session store and the model are probed at most once per interval
+HEALTH_SESSION_PROBE_INTERVAL = float(os.getenv("HEALTH_SESSION_PROBE_INTERVAL", 10))
+HEALTH_MODEL_PROBE_INTERVAL = float(os.getenv("HEALTH_MODEL_PROBE_INTERVAL", 60))  # 0 disables the model probe
+HEALTH_PROBE_TIMEOUT = float(os.getenv("HEALTH_PROBE_TIMEOUT", 10))
+
+# SSE streaming
+STREAM_FLUSH_INTERVAL = float(os.getenv("STREAM_FLUSH_INTERVAL", 0.02))
+STREAM_FLUSH_BYTES = int(os.getenv("STREAM_FLUSH_BYTES", 512))
+STREAM_HEARTBEAT_INTERVAL = float(os.getenv("STREAM_HEARTBEAT_INTERVAL", 15))
+STREAM_REPLAY_LOG_MAX_BYTES = int(os.getenv("STREAM_REPLAY_LOG_MAX_BYTES", 1024 * 1024))
+STREAM_REPLAY_MEMORY_BYTES = int(os.getenv("STREAM_REPLAY_MEMORY_BYTES", 64 * 1024 * 1024))
+STREAM_REPLAY_TTL = float(os.getenv("STREAM_REPLAY_TTL", 300))
+STREAM_REPLAY_SPILL_PATH = os.getenv("STREAM_REPLAY_SPILL_PATH", "./.cache/stream_replay")  # "" disables
+STREAM_RESUME_GRACE = float(os.getenv("STREAM_RESUME_GRACE", 30))
+
+# Response cache for first-turn prompts
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", 1024))  # 0 disables
+RESPONSE_CACHE_TTL = float(os.getenv("RESPONSE_CACHE_TTL", 60 * 60))
+# cosine similarity for near-identical prompts (requires numpy); unset disables the similarity tier
+RESPONSE_CACHE_SIMILARITY_THRESHOLD = os.getenv("RESPONSE_CACHE_SIMILARITY_THRESHOLD")
+
+# Bedrock prompt caching: checkpoint after the conversation history so the next turn reuses it
+PROMPT_CACHE_CHECKPOINTS = os.getenv("PROMPT_CACHE_CHECKPOINTS", "true").lower() == "true"
+
+# Batch invocations
+BATCH_CONCURRENCY = int(os.getenv("BATCH_CONCURRENCY", 4))  # items of one batch run at once
+# completed results per batch id, for resuming; "" disables checkpointing
+BATCH_CHECKPOINT_PATH = os.getenv("BATCH_CHECKPOINT_PATH", "./.sessions/batches")
+
+# Session store
+SESSION_STORE = os.getenv("SESSION_STORE", "file")  # file | sqlite | memory
+SESSION_BASE_PATH = os.getenv("SESSION_BASE_PATH", "./.sessions")
+SESSION_SQLITE_PATH = os.getenv("SESSION_SQLITE_PATH", "./.sessions/sessions.db")
+SESSION_STORE_POOL_SIZE = int(os.getenv("SESSION_STORE_POOL_SIZE", 4))
+SESSION_CACHE_SIZE = int(os.getenv("SESSION_CACHE_SIZE", 1024))
+SESSION_CACHE_TTL = float(os.getenv("SESSION_CACHE_TTL", 60))
+
+# MCP startup
+MCP_STARTUP_TIMEOUT = float(os.getenv("MCP_STARTUP_TIMEOUT", 30))
+# servers that must be ready before serving traffic; unset means all of them
+MCP_STARTUP_QUORUM = os.getenv("MCP_STARTUP_QUORUM")
+# cached tool schemas for fast cold starts; set to an empty string to disable
+MCP_TOOL_CATALOG_PATH = os.getenv("MCP_TOOL_CATALOG_PATH", "./.cache/mcp_tools")
+
+# MCP tool result cache (tools opt in with "toolCache" in mcp_config.json)
+TOOL_RESULT_CACHE_MAX_BYTES = int(os.getenv("TOOL_RESULT_CACHE_MAX_BYTES", 64 * 1024 * 1024))
+# directory for results evicted from memory; unset disables disk spill
+TOOL_RESULT_CACHE_SPILL_PATH = os.getenv("TOOL_RESULT_CACHE_SPILL_PATH")
+
+# MCP tool calls: the tool uses of one model response run concurrently, at most this many at once across
+# all turns (0: no limit); servers can set lower caps and per-tool timeouts with "toolExecution" in mcp_config.json
+TOOL_MAX_CONCURRENCY = int(os.getenv("TOOL_MAX_CONCURRENCY", 32))
+TOOL_TIMEOUT = float(os.getenv("TOOL_TIMEOUT", 120))  # seconds per call unless the server sets one; 0: no limit
+
+# Tool selection: with more MCP tools than this, each turn gets the ones matching its prompt (BM25 over tool names
+# and descriptions), the tools its conversation used and TOOL_SELECTION_ALWAYS (comma-separated names); 0 sends all
+TOOL_SELECTION_TOP_K = int(os.getenv("TOOL_SELECTION_TOP_K", 16))
+TOOL_SELECTION_ALWAYS = [name.strip() for name in os.getenv("TOOL_SELECTION_ALWAYS", "").split(",") if name.strip()]
+
+# Large tool results are stored out of band and paged in with the read_tool_result tool
+TOOL_RESULT_OFFLOAD_BYTES = int(os.getenv("TOOL_RESULT_OFFLOAD_BYTES", 16 * 1024))  # 0 disables
+TOOL_RESULT_BLOB_PATH = os.getenv("TOOL_RESULT_BLOB_PATH", "./.sessions/tool_results")
+TOOL_RESULT_PREVIEW_CHARS = int(os.getenv("TOOL_RESULT_PREVIEW_CHARS", 1000))
+
+# Logging
+# write logs from a background thread; when its queue is full, entries are dropped and counted instead of waited for
+LOG_ASYNC = os.getenv("LOG_ASYNC", "false").lower() == "true"
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", 10_000))
+# per event name (the log message): max events per second, and the share of events kept
+LOG_RATE_LIMITS = json.loads(os.getenv("LOG_RATE_LIMITS") or "{}")
+LOG_SAMPLE_RATES = json.loads(os.getenv("LOG_SAMPLE_RATES") or "{}")
+
+# Telemetry
+# spans of requests, session lookups, model and tool calls: none | console | memory | file | otlp (OTEL_EXPORTER_OTLP_*)
+TELEMETRY_EXPORTER = os.getenv("TELEMETRY_EXPORTER", "none")
+TELEMETRY_FILE_PATH = os.getenv("TELEMETRY_FILE_PATH", "./.telemetry/spans.jsonl")
+
 # Environment
 ENVIRONMENT = os.getenv("ENVIRONMENT", "local")
 assert ENVIRONMENT, "ENVIRONMENT environment variable not set"
@@ -25,6 +143,68 @@ class AppConfig:
     max_tokens: int
     aws_profile_name: Optional[str]
     environment: str
+    model_registry: Dict[str, Dict[str, Any]]
+    model_routing: str
+    model_cascade_fast: Optional[str]
+    model_cascade_max_prompt_chars: int
+    model_max_concurrency: int
+    model_user_max_concurrency: int
+    model_throttle_retries: int
+    model_provider: str
+    fake_model: Dict[str, Any]
+    agent_pool_max_size: int
+    agent_pool_idle_ttl: float
+    agent_pool_max_bytes: int
+    conversation_strategy: str
+    conversation_window_size: int
+    conversation_token_budget: int
+    conversation_compaction_threshold: Optional[int]
+    chat_concurrency_policy: str
+    chat_coalesce_retries: bool
+    admission_max_in_flight_turns: Optional[int]
+    admission_max_queued_model_calls: Optional[int]
+    admission_retry_after: float
+    health_session_probe_interval: float
+    health_model_probe_interval: float
+    health_probe_timeout: float
+    stream_flush_interval: float
+    stream_flush_bytes: int
+    stream_heartbeat_interval: float
+    stream_replay_log_max_bytes: int
+    stream_replay_memory_bytes: int
+    stream_replay_ttl: float
+    stream_replay_spill_path: Optional[str]
+    stream_resume_grace: float
+    response_cache_max_entries: int
+    response_cache_ttl: float
+    response_cache_similarity_threshold: Optional[float]
+    prompt_cache_checkpoints: bool
+    batch_concurrency: int
+    batch_checkpoint_path: Optional[str]
+    session_store: str
+    session_base_path: str
+    session_sqlite_path: str
+    session_store_pool_size: int
+    session_cache_size: int
+    session_cache_ttl: float
+    mcp_startup_timeout: float
+    mcp_startup_quorum: Optional[int]
+    mcp_tool_catalog_path: Optional[str]
+    tool_result_cache_max_bytes: int
+    tool_result_cache_spill_path: Optional[str]
+    tool_max_concurrency: Optional[int]
+    tool_timeout: Optional[float]
+    tool_selection_top_k: int
+    tool_selection_always: List[str]
+    tool_result_offload_bytes: int
+    tool_result_blob_path: str
+    tool_result_preview_chars: int
+    log_async: bool
+    log_queue_size: int
+    log_rate_limits: Dict[str, float]
+    log_sample_rates: Dict[str, float]
+    telemetry_exporter: str
+    telemetry_file_path: str
 
 
 app_config = AppConfig(
@@ -33,4 +213,70 @@ app_config = AppConfig(
     max_tokens=MODEL_MAX_TOKENS,
     aws_profile_name=AWS_PROFILE_NAME,
     environment=ENVIRONMENT,
+    model_registry=MODEL_REGISTRY,
+    model_routing=MODEL_ROUTING,
+    model_cascade_fast=MODEL_CASCADE_FAST if MODEL_ROUTING == "cascade" else None,
+    model_cascade_max_prompt_chars=MODEL_CASCADE_MAX_PROMPT_CHARS,
+    model_max_concurrency=MODEL_MAX_CONCURRENCY,
+    model_user_max_concurrency=MODEL_USER_MAX_CONCURRENCY,
+    model_throttle_retries=MODEL_THROTTLE_RETRIES,
+    model_provider=MODEL_PROVIDER,
+    fake_model=FAKE_MODEL,
+    agent_pool_max_size=AGENT_POOL_MAX_SIZE,
+    agent_pool_idle_ttl=AGENT_POOL_IDLE_TTL,
+    agent_pool_max_bytes=AGENT_POOL_MAX_BYTES,
+    conversation_strategy=CONVERSATION_STRATEGY,
+    conversation_window_size=CONVERSATION_WINDOW_SIZE,
+    conversation_token_budget=CONVERSATION_TOKEN_BUDGET,
+    conversation_compaction_threshold=(
+        int(CONVERSATION_COMPACTION_THRESHOLD) if CONVERSATION_COMPACTION_THRESHOLD else None
+    ),
+    chat_concurrency_policy=CHAT_CONCURRENCY_POLICY,
+    chat_coalesce_retries=CHAT_COALESCE_RETRIES,
+    admission_max_in_flight_turns=ADMISSION_MAX_IN_FLIGHT_TURNS or None,
+    admission_max_queued_model_calls=ADMISSION_MAX_QUEUED_MODEL_CALLS or None,
+    admission_retry_after=ADMISSION_RETRY_AFTER,
+    health_session_probe_interval=HEALTH_SESSION_PROBE_INTERVAL,
+    health_model_probe_interval=HEALTH_MODEL_PROBE_INTERVAL,
+    health_probe_timeout=HEALTH_PROBE_TIMEOUT,
+    stream_flush_interval=STREAM_FLUSH_INTERVAL,
+    stream_flush_bytes=STREAM_FLUSH_BYTES,
+    stream_heartbeat_interval=STREAM_HEARTBEAT_INTERVAL,
+    stream_replay_log_max_bytes=STREAM_REPLAY_LOG_MAX_BYTES,
+    stream_replay_memory_bytes=STREAM_REPLAY_MEMORY_BYTES,
+    stream_replay_ttl=STREAM_REPLAY_TTL,
+    stream_replay_spill_path=STREAM_REPLAY_SPILL_PATH or None,
+    stream_resume_grace=STREAM_RESUME_GRACE,
+    response_cache_max_entries=RESPONSE_CACHE_MAX_ENTRIES,
+    response_cache_ttl=RESPONSE_CACHE_TTL,
+    response_cache_similarity_threshold=(
+        float(RESPONSE_CACHE_SIMILARITY_THRESHOLD) if RESPONSE_CACHE_SIMILARITY_THRESHOLD else None
+    ),
+    prompt_cache_checkpoints=PROMPT_CACHE_CHECKPOINTS,
+    batch_concurrency=BATCH_CONCURRENCY,
+    batch_checkpoint_path=BATCH_CHECKPOINT_PATH or None,
+    session_store=SESSION_STORE,
+    session_base_path=SESSION_BASE_PATH,
+    session_sqlite_path=SESSION_SQLITE_PATH,
+    session_store_pool_size=SESSION_STORE_POOL_SIZE,
+    session_cache_size=SESSION_CACHE_SIZE,
+    session_cache_ttl=SESSION_CACHE_TTL,
+    mcp_startup_timeout=MCP_STARTUP_TIMEOUT,
+    mcp_startup_quorum=int(MCP_STARTUP_QUORUM) if MCP_STARTUP_QUORUM else None,
+    mcp_tool_catalog_path=MCP_TOOL_CATALOG_PATH or None,
+    tool_result_cache_max_bytes=TOOL_RESULT_CACHE_MAX_BYTES,
+    tool_result_cache_spill_path=TOOL_RESULT_CACHE_SPILL_PATH,
+    tool_max_concurrency=TOOL_MAX_CONCURRENCY or None,
+    tool_timeout=TOOL_TIMEOUT or None,
+    tool_selection_top_k=TOOL_SELECTION_TOP_K,
+    tool_selection_always=TOOL_SELECTION_ALWAYS,
+    tool_result_offload_bytes=TOOL_RESULT_OFFLOAD_BYTES,
+    tool_result_blob_path=TOOL_RESULT_BLOB_PATH,
+    tool_result_preview_chars=TOOL_RESULT_PREVIEW_CHARS,
+    log_async=LOG_ASYNC,
+    log_queue_size=LOG_QUEUE_SIZE,
+    log_rate_limits=LOG_RATE_LIMITS,
+    log_sample_rates=LOG_SAMPLE_RATES,
+    telemetry_exporter=TELEMETRY_EXPORTER,
+    telemetry_file_path=TELEMETRY_FILE_PATH,
 )
@@ -1,8 +1,27 @@
-from services import ChatService, SessionService
-from adapters.secondary.chat import StrandsMCPAgentAdapter
-from adapters.secondary.session import StrandsFileSessionAdapter
+from typing import Any, Callable, Optional
+
+from services import BatchService, ChatService, HealthService, SessionService
+from adapters.primary.chat.stream_replay import StreamReplayStore
+from services.chat.admission import AdmissionControl
+from services.chat.turn_coordinator import ConcurrencyPolicy
+from adapters.secondary.chat import (
+    ConversationManagerFactory,
+    ConversationStrategy,
+    FakeModel,
+    FileBatchCheckpointStore,
+    InMemoryResponseCache,
+    ModelSpec,
+    RoutingStrategy,
+    StrandsMCPAgentAdapter,
+)
+from adapters.secondary.session import (
+    InMemoryKeyValueStore,
+    SQLiteKeyValueStore,
+    StrandsFileSessionAdapter,
+    StrandsKVSessionAdapter,
+)
 from ports.session import SessionAdapter
-from ports.chat import MCPAgentAdapter
+from ports.chat import BatchCheckpointStore, MCPAgentAdapter, ResponseCache
 from config import app_config
 
 
@@ -10,14 +29,43 @@ from config import app_config
 class DIContainer:
     def __init__(self):
         # secondary adapters
-        self._session_adapter: SessionAdapter = StrandsFileSessionAdapter()
+        self._session_adapter: SessionAdapter = self._create_session_adapter()
         self._agent_adapter: MCPAgentAdapter = StrandsMCPAgentAdapter(
             model_id=app_config.model_id,
             max_tokens=app_config.max_tokens,
             temperature=app_config.temperature,
             aws_profile_name=app_config.aws_profile_name,
+            agent_pool_max_size=app_config.agent_pool_max_size,
+            agent_pool_idle_ttl=app_config.agent_pool_idle_ttl,
+            agent_pool_max_bytes=app_config.agent_pool_max_bytes,
+            conversation_manager_factory=ConversationManagerFactory(
+                strategy=ConversationStrategy(app_config.conversation_strategy),
+                window_size=app_config.conversation_window_size,
+                token_budget=app_config.conversation_token_budget,
+                compaction_threshold=app_config.conversation_compaction_threshold,
+            ),
+            mcp_startup_timeout=app_config.mcp_startup_timeout,
+            mcp_startup_quorum=app_config.mcp_startup_quorum,
+            mcp_tool_catalog_path=app_config.mcp_tool_catalog_path,
+            tool_result_cache_max_bytes=app_config.tool_result_cache_max_bytes,
+            tool_result_cache_spill_path=app_config.tool_result_cache_spill_path,
+            tool_max_concurrency=app_config.tool_max_concurrency,
+            tool_timeout=app_config.tool_timeout,
+            tool_selection_top_k=app_config.tool_selection_top_k,
+            tool_selection_always=app_config.tool_selection_always,
+            tool_result_offload_bytes=app_config.tool_result_offload_bytes,
+            tool_result_blob_path=app_config.tool_result_blob_path,
+            tool_result_preview_chars=app_config.tool_result_preview_chars,
+            prompt_cache_checkpoints=app_config.prompt_cache_checkpoints,
+            models={name: ModelSpec(**spec) for name, spec in app_config.model_registry.items()},
+            routing_strategy=RoutingStrategy(app_config.model_routing),
+            cascade_model=app_config.model_cascade_fast,
+            cascade_max_prompt_chars=app_config.model_cascade_max_prompt_chars,
+            model_max_concurrency=app_config.model_max_concurrency,
+            model_user_max_concurrency=app_config.model_user_max_concurrency,
+            model_throttle_retries=app_config.model_throttle_retries,
+            model_factory=self._create_model_factory(),
         )
-        self._agent_adapter.configure_mcp()
 
         # services
         self._session_service = SessionService(
@@ -27,6 +75,89 @@ class DIContainer:
         self._chat_service = ChatService(
             self._agent_adapter,
             self._session_adapter,
+            concurrency_policy=ConcurrencyPolicy(app_config.chat_concurrency_policy),
+            coalesce_retries=app_config.chat_coalesce_retries,
+            response_cache=self._create_response_cache(),
+            admission=AdmissionControl(
+                max_in_flight_turns=app_config.admission_max_in_flight_turns,
+                max_queued_model_calls=app_config.admission_max_queued_model_calls,
+                retry_after=app_config.admission_retry_after,
+            ),
+        )
+
+        self._batch_service = BatchService(
+            self._chat_service,
+            self._session_service,
+            checkpoints=self._create_batch_checkpoints(),
+            concurrency=app_config.batch_concurrency,
+        )
+
+        self._health_service = HealthService(
+            self._chat_service,
+            self._session_adapter,
+            self._agent_adapter,
+            session_probe_interval=app_config.health_session_probe_interval,
+            model_probe_interval=app_config.health_model_probe_interval,
+            probe_timeout=app_config.health_probe_timeout,
+        )
+
+        # replay logs of streamed turns; owned here so their producer tasks and spill files are cleaned up
+        self._stream_replays = StreamReplayStore(
+            log_max_bytes=app_config.stream_replay_log_max_bytes,
+            max_memory_bytes=app_config.stream_replay_memory_bytes,
+            ttl=app_config.stream_replay_ttl,
+            resume_grace=app_config.stream_resume_grace,
+            spill_path=app_config.stream_replay_spill_path,
+            flush_interval=app_config.stream_flush_interval,
+            flush_bytes=app_config.stream_flush_bytes,
+        )
+
+    async def startup(self) -> None:
+        """Connect external resources; called from the application lifespan, not at import time"""
+        await self._agent_adapter.configure_mcp()
+
+    @staticmethod
+    def _create_model_factory() -> Optional[Callable[[ModelSpec], Any]]:
+        if app_config.model_provider == "fake":
+            return lambda spec: FakeModel(**app_config.fake_model)
+        if app_config.model_provider != "bedrock":
+            raise ValueError(f"unknown model provider: {app_config.model_provider}")
+        return None
+
+    @staticmethod
+    def _create_response_cache() -> Optional[ResponseCache]:
+        if app_config.response_cache_max_entries <= 0:
+            return None
+        return InMemoryResponseCache(
+            max_entries=app_config.response_cache_max_entries,
+            ttl=app_config.response_cache_ttl,
+            similarity_threshold=app_config.response_cache_similarity_threshold,
+        )
+
+    @staticmethod
+    def _create_batch_checkpoints() -> Optional[BatchCheckpointStore]:
+        if not app_config.batch_checkpoint_path:
+            return None
+        checkpoints = FileBatchCheckpointStore(app_config.batch_checkpoint_path)
+        checkpoints.prune()
+        return checkpoints
+
+    @staticmethod
+    def _create_session_adapter() -> SessionAdapter:
+        if app_config.session_store == "sqlite":
+            store = SQLiteKeyValueStore(
+                app_config.session_sqlite_path,
+                pool_size=app_config.session_store_pool_size,
+            )
+        elif app_config.session_store == "memory":
+            store = InMemoryKeyValueStore()
+        else:
+            return StrandsFileSessionAdapter(base_path=app_config.session_base_path)
+
+        return StrandsKVSessionAdapter(
+            store,
+            cache_size=app_config.session_cache_size,
+            cache_ttl=app_config.session_cache_ttl,
         )
 
     @property
@@ -37,8 +168,22 @@ class DIContainer:
     def session_service(self) -> SessionService:
         return self._session_service
 
+    @property
+    def batch_service(self) -> BatchService:
+        return self._batch_service
+
+    @property
+    def health_service(self) -> HealthService:
+        return self._health_service
+
+    @property
+    def stream_replays(self) -> StreamReplayStore:
+        return self._stream_replays
+
     def cleanup(self) -> None:
         """Cleanup all resources managed by the container"""
+        self._stream_replays.cleanup()
+
         if hasattr(self._agent_adapter, 'cleanup'):
             self._agent_adapter.cleanup()
 
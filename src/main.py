@@ -1,27 +1,102 @@
+import asyncio
 import os
-from contextlib import asynccontextmanager
+import time
+from contextlib import asynccontextmanager, suppress
+from typing import TYPE_CHECKING, Optional, Tuple
+
 from dotenv import load_dotenv
 
 load_dotenv()  # noqa: E402
 
-from fastapi import FastAPI
-from di.container import DIContainer
+from fastapi import APIRouter, FastAPI
+from config import app_config
+from utils.logger import logger
+from utils.readiness import Readiness, SubsystemState
+
+from adapters.primary.ping.ping_controller import PingController
+from adapters.primary.ping.startup_gate import StartupGate
+
+if TYPE_CHECKING:
+    from di.container import DIContainer
+
+
+# Startup state of the subsystems, reported by /health/ready
+readiness = Readiness(["telemetry", "container", "mcp"])
+
+# Global DI container instance; built in the lifespan, once the port is bound
+di_container: Optional["DIContainer"] = None
+
+
+def _setup_telemetry() -> None:
+    from utils.telemetry import setup_telemetry
 
-from adapters.primary import create_api_router
+    # Tracing and metrics providers, installed before anything creates spans or instruments
+    setup_telemetry(app_config.telemetry_exporter, app_config.telemetry_file_path)
 
 
-# Global DI container instance
-di_container: DIContainer = DIContainer()
+def _build_container() -> Tuple["DIContainer", APIRouter]:
+    # strands, boto3 and mcp are first imported here, so importing this module stays cheap
+    from di.container import DIContainer
+    from adapters.primary import create_api_router
+
+    container = DIContainer()
+    return container, create_api_router(container)
+
+
+async def startup(app: FastAPI) -> None:
+    """Build the container and connect the MCP servers, reporting each step to `readiness`"""
+    global di_container
+    subsystem = "telemetry"
+    try:
+        started = time.perf_counter()
+        # blocking imports and construction run in a thread, so health checks are answered meanwhile
+        await asyncio.to_thread(_setup_telemetry)
+        readiness.set(subsystem, SubsystemState.UP, exporter=app_config.telemetry_exporter)
+
+        subsystem = "container"
+        container, router = await asyncio.to_thread(_build_container)
+        di_container = container
+        app.include_router(router)
+        # routes were added after start; the OpenAPI schema must not be the one cached without them
+        app.openapi_schema = None
+        readiness.set(
+            subsystem,
+            SubsystemState.UP,
+            model_provider=app_config.model_provider,
+            session_store=app_config.session_store,
+        )
+
+        subsystem = "mcp"
+        # returns once the startup quorum of MCP servers is ready; the rest keep starting
+        await container.startup()
+        # from here on, the subsystems report their current health instead of their startup step
+        for name, check in container.health_service.checks().items():
+            readiness.watch(name, check)
+        readiness.mark_started()
+        logger.info("🚀 Application started", startup_seconds=round(time.perf_counter() - started, 3))
+    except Exception as e:
+        readiness.set(subsystem, SubsystemState.FAILED, error=f"{type(e).__name__}: {e}")
+        logger.error("🚨 application startup failed", subsystem=subsystem, exc_info=True)
 
 
 @asynccontextmanager
-async def lifespan(_: FastAPI):
-    print("🚀 Application started - DI container initialized")
+async def lifespan(app: FastAPI):
+    # uvicorn binds the port once this yields; the startup goes on in the background and
+    # requests other than the health checks are answered 503 until it is done
+    startup_task = asyncio.create_task(startup(app))
 
     yield
 
     # Shutdown
-    di_container.cleanup()
+    startup_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await startup_task
+    if di_container is not None:
+        di_container.cleanup()
+
+    from utils.telemetry import shutdown_telemetry
+
+    shutdown_telemetry()
     print("🧹 Application shutdown - resources cleaned up")
 
 
@@ -33,7 +108,9 @@ def create_app() -> FastAPI:
         lifespan=lifespan,
     )
 
-    app.include_router(create_api_router(di_container))
+    # the rest of the API is added by `startup`, once the container is built
+    app.include_router(PingController(readiness).router, tags=["health"])
+    app.add_middleware(StartupGate, readiness=readiness)
 
     return app
 
@@ -1,4 +1,6 @@
-from .mcp_agent_adapter import MCPAgentAdapter
+from .batch_checkpoint import BatchCheckpointStore
+from .mcp_agent_adapter import MCPAgentAdapter, ModelThrottledError, UnknownModelError
+from .response_cache import ResponseCache
 
 
-__all__ = ["MCPAgentAdapter"]
+__all__ = ["BatchCheckpointStore", "MCPAgentAdapter", "ModelThrottledError", "ResponseCache", "UnknownModelError"]
@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+from typing import Dict
+
+from ports.chat.dto import BatchResult
+
+
+class BatchCheckpointStore(ABC):
+    """Results of the completed items of a batch, so a failed or interrupted batch can resume"""
+
+    @abstractmethod
+    def load(self, batch_id: str) -> Dict[str, BatchResult]:
+        """Completed results by item id; empty for an unknown batch"""
+        pass
+
+    @abstractmethod
+    def append(self, batch_id: str, result: BatchResult) -> None:
+        pass
@@ -1,20 +1,114 @@
+from enum import StrEnum
+
 from pydantic import BaseModel
-from typing import Optional
+from typing import Any, Dict, Optional
+
+
+class TurnPriority(StrEnum):
+    # a user is waiting for the answer
+    INTERACTIVE = "interactive"
+    # offline work, e.g. batch requests and background summaries; admitted after interactive turns
+    BATCH = "batch"
 
 
 class ChatRequest(BaseModel):
     message: str
     session_id: str
     stream: Optional[bool] = False
+    # client-generated id reused on retries, so a retry attaches to the turn it already started
+    request_id: Optional[str] = None
+    # name of a registered model to answer with; unset leaves the choice to the model router
+    model: Optional[str] = None
+    # caps concurrent model calls per user; unset counts the session as the user
+    user_id: Optional[str] = None
 
 
 class ChatResponse(BaseModel):
     data: str
 
 
+class BatchItem(BaseModel):
+    # identifies the item in results and checkpoints; defaults to its line number
+    id: str
+    message: str
+    # unset runs the item in a new session that is deleted afterwards
+    session_id: Optional[str] = None
+    model: Optional[str] = None
+    user_id: Optional[str] = None
+
+
+class BatchResult(BaseModel):
+    id: str
+    session_id: Optional[str] = None
+    data: Optional[str] = None
+    error: Optional[str] = None
+
+
 class ChatStreamChunk(BaseModel):
     chunk: str
 
 
+class ChatStreamToolUse(BaseModel):
+    tool_use_id: str
+    name: str
+    input: Dict[str, Any] = {}
+
+
+class ChatStreamUsage(BaseModel):
+    input_tokens: int = 0
+    output_tokens: int = 0
+    total_tokens: int = 0
+    cache_read_input_tokens: int = 0
+    cache_write_input_tokens: int = 0
+
+
+class ChatStreamError(BaseModel):
+    error: str
+
+
 class ChatStreamEnd(BaseModel):
     done: bool = True
+    stop_reason: Optional[str] = None
+
+
+class ModelUsageStats(BaseModel):
+    model_calls: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_input_tokens: int = 0
+    cache_write_input_tokens: int = 0
+    # share of prompt tokens read from the prompt cache
+    cache_hit_rate: float = 0.0
+
+
+class ModelRouteStats(BaseModel):
+    calls: int = 0
+    escalations: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_input_tokens: int = 0
+    avg_latency: float = 0.0
+    # USD, from the configured per-model token prices
+    cost: float = 0.0
+
+
+class LoadStats(BaseModel):
+    # turns running, and turns waiting for an earlier turn of their session
+    in_flight_turns: int = 0
+    waiting_turns: int = 0
+    # model calls running, and waiting for a concurrency slot
+    model_calls_in_flight: int = 0
+    queued_model_calls: int = 0
+    # turns turned away by admission control so far
+    rejected_turns: int = 0
+
+
+class ModelSchedulerStats(BaseModel):
+    # adaptive limit on concurrent model calls, lowered on throttling
+    limit: float = 0.0
+    in_flight: int = 0
+    queued: int = 0
+    admitted: int = 0
+    throttled: int = 0
+    avg_queue_time: float = 0.0
+    max_queue_time: float = 0.0
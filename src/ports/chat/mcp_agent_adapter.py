@@ -1,27 +1,90 @@
 from abc import ABC, abstractmethod
-from typing import AsyncIterator, Any, Optional
+from typing import AsyncIterator, Any, Dict, Optional
 
 from strands.session.repository_session_manager import RepositorySessionManager
 
+from ports.chat.dto import ModelRouteStats, ModelSchedulerStats, ModelUsageStats, TurnPriority
 from ports.mcp import MCPConfig
 
 
+class UnknownModelError(ValueError):
+    """The request names a model that is not in the model registry"""
+
+
+class ModelThrottledError(Exception):
+    """The model is reachable but throttles calls for now"""
+
+
 class MCPAgentAdapter(ABC):
     @abstractmethod
-    async def generate_response(self, session_manager: RepositorySessionManager, content: str) -> str:
+    async def generate_response(
+        self,
+        session_manager: RepositorySessionManager,
+        content: str,
+        model: Optional[str] = None,
+        user_id: Optional[str] = None,
+        priority: TurnPriority = TurnPriority.INTERACTIVE,
+    ) -> str:
+        """
+        `model` names a registered model for this turn; None leaves the choice to the model router.
+        `user_id` and `priority` decide where the turn's model calls queue when the model is busy.
+        """
         pass
 
     @abstractmethod
     async def generate_response_stream(
-        self, session_manager: RepositorySessionManager, content: str
+        self,
+        session_manager: RepositorySessionManager,
+        content: str,
+        model: Optional[str] = None,
+        user_id: Optional[str] = None,
+        priority: TurnPriority = TurnPriority.INTERACTIVE,
     ) -> AsyncIterator[Any]:
         pass
 
     @abstractmethod
-    def configure_mcp(self, mcp_config: Optional[MCPConfig] = None) -> None:
-        """Configure MCP clients and tools"""
+    async def configure_mcp(self, mcp_config: Optional[MCPConfig] = None) -> None:
+        """Configure MCP clients and tools; returns once enough servers are ready to serve traffic"""
+        pass
+
+    def response_cache_scope(self, session_manager: RepositorySessionManager) -> Optional[str]:
+        """
+        Fingerprint of the model, system prompt and tool set, if the next turn's answer depends on
+        nothing but its prompt (i.e. the session has no history yet); None disables response caching.
+        """
+        return None
+
+    async def record_response(self, session_manager: RepositorySessionManager, content: str, response: str) -> None:
+        """Add a turn answered without the model (e.g. from the response cache) to the session history"""
+        raise NotImplementedError
+
+    def usage_stats(self) -> ModelUsageStats:
+        """Token usage of the model calls made so far, including prompt cache reads and writes"""
+        return ModelUsageStats()
+
+    def release_session(self, session_id: str) -> None:
+        """Drop per-session state kept for later turns, e.g. once a temporary session is deleted"""
         pass
 
+    def model_stats(self) -> Dict[str, ModelRouteStats]:
+        """Calls, escalations, latency and estimated cost per registered model"""
+        return {}
+
+    def scheduler_stats(self) -> ModelSchedulerStats:
+        """Concurrency limit, queue length and queue times of outbound model calls"""
+        return ModelSchedulerStats()
+
+    async def probe_model(self) -> None:
+        """
+        Cheapest call that shows the default model is reachable; raises ModelThrottledError when it
+        throttles and any other error when it cannot be reached.
+        """
+        pass
+
+    def mcp_server_status(self) -> Dict[str, str]:
+        """State of each configured MCP server: ready, starting, recovering, circuit_open or failed"""
+        return {}
+
     @abstractmethod
     def cleanup(self) -> None:
         pass
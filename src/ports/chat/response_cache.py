@@ -0,0 +1,23 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class ResponseCache(ABC):
+    """
+    Answers to context-free prompts, reusable across sessions.
+
+    `scope` identifies everything besides the prompt that shapes an answer (model, system prompt,
+    tool set); entries are never shared between scopes.
+    """
+
+    @abstractmethod
+    def get(self, scope: str, prompt: str) -> Optional[str]:
+        pass
+
+    @abstractmethod
+    def put(self, scope: str, prompt: str, response: str) -> None:
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
@@ -1,3 +1,21 @@
-from .config import MCPConfig, StreamableHttpMCPConfig, StdioMCPConfig
+from .client import MCPToolClient
+from .config import (
+    MCPCircuitBreakerConfig,
+    MCPConfig,
+    MCPPoolConfig,
+    MCPToolCacheConfig,
+    MCPToolExecutionConfig,
+    StdioMCPConfig,
+    StreamableHttpMCPConfig,
+)
 
-__all__ = ["MCPConfig", "StreamableHttpMCPConfig", "StdioMCPConfig"]
+__all__ = [
+    "MCPCircuitBreakerConfig",
+    "MCPConfig",
+    "MCPPoolConfig",
+    "MCPToolCacheConfig",
+    "MCPToolClient",
+    "MCPToolExecutionConfig",
+    "StdioMCPConfig",
+    "StreamableHttpMCPConfig",
+]
@@ -0,0 +1,27 @@
+from typing import Any, Dict, Optional, Protocol
+
+
+class MCPToolClient(Protocol):
+    """
+    The part of the strands MCPClient interface that agent tools and the agent adapter rely on.
+
+    Implemented by MCPClient itself and by wrappers standing in for it, such as a connection pool.
+    """
+
+    def start(self) -> Any:
+        ...
+
+    def stop(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        ...
+
+    def list_tools_sync(self, pagination_token: Optional[str] = None) -> Any:
+        ...
+
+    async def call_tool_async(
+        self,
+        tool_use_id: str,
+        name: str,
+        arguments: Optional[Dict[str, Any]] = None,
+        read_timeout_seconds: Any = None,
+    ) -> Any:
+        ...
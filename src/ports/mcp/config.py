@@ -1,16 +1,60 @@
 from pydantic import BaseModel
-from typing import Union, List, Dict
+from typing import Union, List, Dict, Optional
+
+
+class MCPToolCacheConfig(BaseModel):
+    """Result caching for a single MCP tool; only tools listed here are cached"""
+
+    enabled: bool = True
+    ttl: float = 300
+    maxBytes: int = 64 * 1024
+
+
+class MCPPoolConfig(BaseModel):
+    """Connections kept per server and how they are health-checked and reconnected"""
+
+    size: int = 1
+    healthCheckInterval: float = 30
+    probeTimeout: float = 10
+    reconnectBackoff: float = 1
+    maxReconnectBackoff: float = 60
+    callTimeout: Optional[float] = None
+
+
+class MCPCircuitBreakerConfig(BaseModel):
+    """Consecutive failures that open the breaker, and how long it stays open"""
+
+    failureThreshold: int = 5
+    resetTimeout: float = 30
+
+
+class MCPToolExecutionConfig(BaseModel):
+    """Concurrent calls to one server's tools, and seconds a call may take (per tool or for all); None: no limit"""
+
+    maxConcurrency: Optional[int] = None
+    timeout: Optional[float] = None
+    toolTimeouts: Dict[str, float] = {}
 
 
 class StreamableHttpMCPConfig(BaseModel):
     transportType: str = "streamable-http"
     disabled: bool = False
+    startupTimeout: Optional[float] = None
+    toolCache: Dict[str, MCPToolCacheConfig] = {}
+    pool: MCPPoolConfig = MCPPoolConfig()
+    circuitBreaker: MCPCircuitBreakerConfig = MCPCircuitBreakerConfig()
+    toolExecution: MCPToolExecutionConfig = MCPToolExecutionConfig()
     url: str
 
 
 class StdioMCPConfig(BaseModel):
     transportType: str = "stdio"
     disabled: bool = False
+    startupTimeout: Optional[float] = None
+    toolCache: Dict[str, MCPToolCacheConfig] = {}
+    pool: MCPPoolConfig = MCPPoolConfig()
+    circuitBreaker: MCPCircuitBreakerConfig = MCPCircuitBreakerConfig()
+    toolExecution: MCPToolExecutionConfig = MCPToolExecutionConfig()
     command: str
     args: List[str]
     env: Dict[str, str] = {
@@ -1,5 +1,18 @@
+from typing import Any, Dict
+
 from pydantic import BaseModel
 
 
 class HealthResponse(BaseModel):
     status: str
+
+
+class SubsystemResponse(BaseModel):
+    state: str
+    detail: Dict[str, Any] = {}
+
+
+class ReadinessResponse(BaseModel):
+    # "ready" or "not_ready"
+    status: str
+    subsystems: Dict[str, SubsystemResponse]
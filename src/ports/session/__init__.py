@@ -1,4 +1,5 @@
+from .kv_store import KeyValueStore, SessionConflictError
 from .session_adapter import SessionAdapter
 
 
-__all__ = ["SessionAdapter"]
+__all__ = ["KeyValueStore", "SessionAdapter", "SessionConflictError"]
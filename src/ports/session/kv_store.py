@@ -0,0 +1,50 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple
+
+from strands.types.exceptions import SessionException
+
+
+class KeyValueStore(ABC):
+    """
+    Minimal ordered key-value contract for shared session storage.
+
+    Implementations must be safe to call from multiple threads and, for shared deployments,
+    visible to every worker/container (e.g. SQLite in WAL mode on a single host, or a network KV).
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        pass
+
+    @abstractmethod
+    def put(self, key: str, value: str) -> None:
+        pass
+
+    @abstractmethod
+    def compare_and_set(self, key: str, expected: Optional[str], value: str) -> bool:
+        """
+        Atomically write `value` if the current value is `expected` (None: the key must not exist).
+        Returns False, without writing, when another writer got there first.
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        pass
+
+    @abstractmethod
+    def scan(self, prefix: str) -> List[Tuple[str, str]]:
+        """Return all (key, value) pairs whose key starts with `prefix`, ordered by key"""
+        pass
+
+    @abstractmethod
+    def delete_prefix(self, prefix: str) -> None:
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        pass
+
+
+class SessionConflictError(SessionException):
+    """Another worker wrote to the session since this process last read it; the local agent is stale"""
@@ -16,6 +16,10 @@ class SessionAdapter(ABC):
     async def delete_session(self, session_id: str) -> None:
         pass
 
+    async def check_health(self) -> None:
+        """Round trip to the session store; raises if it cannot be read (or written, for files)"""
+        pass
+
     @abstractmethod
     def cleanup(self) -> None:
-        pass
\ No newline at end of file
+        pass
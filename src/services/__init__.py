@@ -1,5 +1,7 @@
+from .chat.batch_service import BatchService
 from .chat.chat_service import ChatService
+from .health.health_service import HealthService
 from .session.session_service import SessionService
 
 
-__all__ = ["ChatService", "SessionService"]
+__all__ = ["BatchService", "ChatService", "HealthService", "SessionService"]
@@ -0,0 +1,44 @@
+from typing import Optional
+
+
+class OverloadedError(Exception):
+    """The service is at capacity and turned the turn away; it can be retried after `retry_after` seconds"""
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class AdmissionControl:
+    """
+    Turns away new turns once the service is at capacity, so overload is answered at once with a
+    retryable error instead of turning into timeouts for every request queued behind it.
+
+    Limits are on turns in flight (running, or waiting for an earlier turn of their session) and on
+    model calls waiting for a concurrency slot; None disables a limit.
+    """
+
+    def __init__(
+        self,
+        max_in_flight_turns: Optional[int] = None,
+        max_queued_model_calls: Optional[int] = None,
+        retry_after: float = 1.0,
+    ):
+        self.max_in_flight_turns = max_in_flight_turns
+        self.max_queued_model_calls = max_queued_model_calls
+        self.retry_after = retry_after
+        self.rejected = 0
+
+    def overloaded(self, in_flight_turns: int, queued_model_calls: int) -> Optional[str]:
+        """Why a new turn would be turned away now, or None if it would be admitted"""
+        if self.max_in_flight_turns is not None and in_flight_turns >= self.max_in_flight_turns:
+            return f"too many turns in flight: {in_flight_turns} (limit {self.max_in_flight_turns})"
+        if self.max_queued_model_calls is not None and queued_model_calls >= self.max_queued_model_calls:
+            return f"too many queued model calls: {queued_model_calls} (limit {self.max_queued_model_calls})"
+        return None
+
+    def admit(self, in_flight_turns: int, queued_model_calls: int) -> None:
+        reason = self.overloaded(in_flight_turns, queued_model_calls)
+        if reason is not None:
+            self.rejected += 1
+            raise OverloadedError(reason, self.retry_after)
@@ -0,0 +1,96 @@
+import asyncio
+from typing import AsyncIterator, Dict, List, Optional
+
+from ports.chat import BatchCheckpointStore
+from ports.chat.dto import BatchItem, BatchResult, TurnPriority
+from services.chat.chat_service import ChatService
+from services.session.session_service import SessionService
+from utils.logger import logger
+
+
+class BatchService:
+    """
+    Runs bulk invocations through the chat service on the batch priority lane.
+
+    At most `concurrency` items run at once and results are yielded in completion order. With a
+    batch id, each successful result is checkpointed; running the same batch id again yields the
+    checkpointed results first and only runs the items that have none (failed or never reached).
+    """
+
+    def __init__(
+        self,
+        chat_service: ChatService,
+        session_service: SessionService,
+        checkpoints: Optional[BatchCheckpointStore] = None,
+        concurrency: int = 4,
+    ):
+        self.chat_service = chat_service
+        self.session_service = session_service
+        self.checkpoints = checkpoints
+        self.concurrency = concurrency
+
+    def run(self, items: List[BatchItem], batch_id: Optional[str] = None) -> AsyncIterator[BatchResult]:
+        """Raises ValueError for a batch id the checkpoint store does not accept"""
+        completed: Dict[str, BatchResult] = {}
+        if batch_id is not None and self.checkpoints is not None:
+            completed = self.checkpoints.load(batch_id)
+        if completed:
+            logger.info("⏩ resuming batch", batch_id=batch_id, completed=len(completed), total=len(items))
+        return self._run(items, batch_id, completed)
+
+    async def _run(
+        self, items: List[BatchItem], batch_id: Optional[str], completed: Dict[str, BatchResult]
+    ) -> AsyncIterator[BatchResult]:
+        pending: List[BatchItem] = []
+        for item in items:
+            if item.id in completed:
+                yield completed[item.id]
+            else:
+                pending.append(item)
+
+        remaining = iter(pending)
+        # bounded, so workers pause while the client is slow to read results
+        results: asyncio.Queue[Optional[BatchResult]] = asyncio.Queue(maxsize=self.concurrency)
+
+        async def worker() -> None:
+            for item in remaining:
+                await results.put(await self._invoke(item, batch_id))
+            await results.put(None)
+
+        workers = [asyncio.create_task(worker()) for _ in range(min(self.concurrency, len(pending)))]
+        try:
+            finished = 0
+            while finished < len(workers):
+                result = await results.get()
+                if result is None:
+                    finished += 1
+                else:
+                    yield result
+        finally:
+            # the client went away; completed items are checkpointed, the rest run on resume
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def _invoke(self, item: BatchItem, batch_id: Optional[str]) -> BatchResult:
+        session_id = item.session_id or await self.session_service.create_session(item.user_id or "batch")
+        try:
+            response = await self.chat_service.generate_response(
+                session_id,
+                item.message,
+                model=item.model,
+                user_id=item.user_id,
+                priority=TurnPriority.BATCH,
+            )
+            result = BatchResult(id=item.id, session_id=item.session_id, data=str(response))
+        except Exception as e:
+            logger.warning("⚠️ batch item failed", batch_id=batch_id, item_id=item.id, error=str(e))
+            return BatchResult(id=item.id, session_id=item.session_id, error=str(e))
+        finally:
+            if item.session_id is None:
+                await self.session_service.delete_session(session_id)
+                self.chat_service.release_session(session_id)
+
+        if batch_id is not None and self.checkpoints is not None:
+            self.checkpoints.append(batch_id, result)
+        return result
@@ -1,7 +1,14 @@
-from typing import AsyncIterator, Any, Union
+from typing import AsyncIterator, Any, Dict, Optional, Union
 
-from ports.chat import MCPAgentAdapter
+from strands.session.repository_session_manager import RepositorySessionManager
+
+from ports.chat import MCPAgentAdapter, ResponseCache
+from ports.chat.dto import LoadStats, ModelRouteStats, ModelSchedulerStats, ModelUsageStats, TurnPriority
 from ports.session import SessionAdapter
+from services.chat.admission import AdmissionControl
+from services.chat.turn_coordinator import ConcurrencyPolicy, SessionTurnCoordinator
+from utils.logger import logger
+from utils.telemetry import telemetry
 
 
 class ChatService:
@@ -9,14 +16,162 @@ class ChatService:
         self,
         agent_adapter: MCPAgentAdapter,
         session_adapter: SessionAdapter,
+        concurrency_policy: ConcurrencyPolicy = ConcurrencyPolicy.QUEUE,
+        coalesce_retries: bool = True,
+        response_cache: Optional[ResponseCache] = None,
+        admission: Optional[AdmissionControl] = None,
     ):
         self.agent_adapter = agent_adapter
         self.session_adapter = session_adapter
+        self.turns = SessionTurnCoordinator(policy=concurrency_policy, coalesce=coalesce_retries)
+        # answers to first-turn prompts, shared across sessions; None disables caching
+        self.response_cache = response_cache
+        # sheds interactive turns beyond capacity; None admits every turn
+        self.admission = admission
+
+    async def generate_response(
+        self,
+        session_id: str,
+        content: str,
+        stream: bool = False,
+        request_id: Optional[str] = None,
+        model: Optional[str] = None,
+        user_id: Optional[str] = None,
+        priority: TurnPriority = TurnPriority.INTERACTIVE,
+    ) -> Union[str, AsyncIterator[Any]]:
+        # batch turns are not shed: the batch concurrency bounds them, and they queue behind interactive ones
+        if self.admission is not None and priority == TurnPriority.INTERACTIVE:
+            self.admission.admit(
+                self.turns.in_flight() + self.turns.waiting(), self.agent_adapter.scheduler_stats().queued
+            )
 
-    async def generate_response(self, session_id: str, content: str, stream: bool = False) -> Union[str, AsyncIterator[Any]]:
-        session_manager = await self.session_adapter.get_session(session_id)
+        with telemetry.span("session.lookup", **{"session.id": session_id}):
+            session_manager = await self.session_adapter.get_session(session_id)
 
+        # one turn at a time per session: an agent's message list must not be mutated concurrently
         if stream:
-            return await self.agent_adapter.generate_response_stream(session_manager, content)
+            return await self.turns.run_stream(
+                session_id,
+                lambda: self._generate_stream(session_manager, content, model, user_id, priority),
+                request_id=request_id,
+            )
         else:
-            return await self.agent_adapter.generate_response(session_manager, content)
+            return await self.turns.run(
+                session_id,
+                lambda: self._generate(session_manager, content, model, user_id, priority),
+                request_id=request_id,
+            )
+
+    def release_session(self, session_id: str) -> None:
+        self.agent_adapter.release_session(session_id)
+
+    def usage_stats(self) -> ModelUsageStats:
+        return self.agent_adapter.usage_stats()
+
+    def model_stats(self) -> Dict[str, ModelRouteStats]:
+        return self.agent_adapter.model_stats()
+
+    def scheduler_stats(self) -> ModelSchedulerStats:
+        return self.agent_adapter.scheduler_stats()
+
+    def load_stats(self) -> LoadStats:
+        scheduler = self.agent_adapter.scheduler_stats()
+        return LoadStats(
+            in_flight_turns=self.turns.in_flight(),
+            waiting_turns=self.turns.waiting(),
+            model_calls_in_flight=scheduler.in_flight,
+            queued_model_calls=scheduler.queued,
+            rejected_turns=self.admission.rejected if self.admission is not None else 0,
+        )
+
+    async def _generate(
+        self,
+        session_manager: RepositorySessionManager,
+        content: str,
+        model: Optional[str],
+        user_id: Optional[str],
+        priority: TurnPriority,
+    ) -> str:
+        scope = self._cache_scope(session_manager, model)
+        if scope is not None:
+            cached = await self._cached_response(session_manager, scope, content)
+            if cached is not None:
+                return cached
+
+        response = await self.agent_adapter.generate_response(
+            session_manager, content, model=model, user_id=user_id, priority=priority
+        )
+        if scope is not None and self.response_cache is not None:
+            self.response_cache.put(scope, content, response)
+        return response
+
+    async def _generate_stream(
+        self,
+        session_manager: RepositorySessionManager,
+        content: str,
+        model: Optional[str],
+        user_id: Optional[str],
+        priority: TurnPriority,
+    ) -> AsyncIterator[Any]:
+        scope = self._cache_scope(session_manager, model)
+        if scope is not None:
+            cached = await self._cached_response(session_manager, scope, content)
+            if cached is not None:
+                return self._replay(cached)
+
+        stream = await self.agent_adapter.generate_response_stream(
+            session_manager, content, model=model, user_id=user_id, priority=priority
+        )
+        if scope is None:
+            return stream
+        return self._cache_stream(scope, content, stream)
+
+    def _cache_scope(self, session_manager: RepositorySessionManager, model: Optional[str]) -> Optional[str]:
+        # a request for a specific model is answered by that model
+        if self.response_cache is None or model is not None:
+            return None
+        return self.agent_adapter.response_cache_scope(session_manager)
+
+    async def _cached_response(
+        self, session_manager: RepositorySessionManager, scope: str, content: str
+    ) -> Optional[str]:
+        assert self.response_cache is not None
+        cached = self.response_cache.get(scope, content)
+        if cached is None:
+            return None
+        logger.info("🎯 serving cached response", session_id=session_manager.session_id)
+        # the session continues from the cached answer as if the model had given it
+        await self.agent_adapter.record_response(session_manager, content, cached)
+        return cached
+
+    @staticmethod
+    async def _replay(response: str) -> AsyncIterator[Any]:
+        yield {"data": response}
+
+    async def _cache_stream(self, scope: str, content: str, stream: AsyncIterator[Any]) -> AsyncIterator[Any]:
+        """Relay a first-turn stream and cache its final answer once the turn completes"""
+        answer: Optional[str] = None
+        try:
+            async for event in stream:
+                if isinstance(event, dict) and "result" in event:
+                    answer = self._answer_text(event["result"])
+                yield event
+        finally:
+            aclose = getattr(stream, "aclose", None)
+            if aclose is not None:
+                await aclose()
+        # not reached when the turn failed or was cancelled
+        if answer is not None:
+            assert self.response_cache is not None
+            self.response_cache.put(scope, content, answer)
+
+    @staticmethod
+    def _answer_text(result: Any) -> Optional[str]:
+        """
+        Text of the turn's final message, as the non-streaming response returns it; streamed text
+        also holds what the model said before its tool calls
+        """
+        message = getattr(result, "message", None)
+        if not isinstance(message, dict) or not message.get("content"):
+            return None
+        return message["content"][0].get("text", "")
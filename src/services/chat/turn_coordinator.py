@@ -0,0 +1,210 @@
+import asyncio
+from enum import StrEnum
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+from utils.logger import logger
+
+
+class ConcurrencyPolicy(StrEnum):
+    QUEUE = "queue"  # wait for the running turn to finish
+    REJECT = "reject"  # fail fast with SessionBusyError
+    CANCEL = "cancel"  # cancel the running turn and take over
+
+
+class SessionBusyError(Exception):
+    """Another turn is running for the session and the policy rejects concurrent turns"""
+
+
+class TurnCancelledError(Exception):
+    """The turn was cancelled because a newer turn for the same session superseded it"""
+
+
+class _Turn:
+    """A single in-flight generation that one or more requests can attach to"""
+
+    def __init__(self, request_id: Optional[str], stream: bool):
+        self.request_id = request_id
+        self.stream = stream
+        self.task: Optional[asyncio.Task] = None
+        self.events: List[Any] = []
+        self.error: Optional[BaseException] = None
+        self.finished = False
+        self.subscribers = 0
+        self._changed = asyncio.Event()
+
+    def matches(self, request_id: Optional[str], stream: bool) -> bool:
+        # the message text is no key: a user may well send "yes" twice on purpose
+        return (
+            request_id is not None
+            and not self.finished
+            and self.stream == stream
+            and self.request_id == request_id
+        )
+
+    def publish(self, event: Any) -> None:
+        self.events.append(event)
+        self._notify()
+
+    def finish(self) -> None:
+        self.finished = True
+        self._notify()
+
+    async def subscribe(self) -> AsyncIterator[Any]:
+        """Replay the events produced so far, then follow the live generation"""
+        self.subscribers += 1
+        index = 0
+        try:
+            while True:
+                changed = self._changed
+                while index < len(self.events):
+                    yield self.events[index]
+                    index += 1
+                if self.finished:
+                    if self.error is not None:
+                        raise self.error
+                    return
+                await changed.wait()
+        finally:
+            self.subscribers -= 1
+            if self.subscribers == 0 and not self.finished and self.task is not None:
+                # nobody is listening anymore; stop paying for tokens
+                self.task.cancel()
+
+    def _notify(self) -> None:
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+
+class _SessionSlot:
+    def __init__(self):
+        self.lock = asyncio.Lock()
+        self.current: Optional[_Turn] = None
+        self.waiters = 0
+
+
+class SessionTurnCoordinator:
+    """
+    Serializes turns per session so an agent is never driven by two requests at once.
+
+    Concurrent turns for the same session are handled according to the configured policy.
+    When coalescing is enabled, a request carrying the same client-supplied request id as the
+    in-flight turn (i.e. a client retry) attaches to the running generation instead of starting a new one.
+    """
+
+    def __init__(self, policy: ConcurrencyPolicy = ConcurrencyPolicy.QUEUE, coalesce: bool = True):
+        self.policy = ConcurrencyPolicy(policy)
+        self.coalesce = coalesce
+        self.coalesced = 0
+        self._slots: Dict[str, _SessionSlot] = {}
+        # counted as turns come and go, for admission control on every request
+        self._running = 0
+        self._waiting = 0
+
+    def in_flight(self) -> int:
+        """Turns running now"""
+        return self._running
+
+    def waiting(self) -> int:
+        """Turns waiting for an earlier turn of their session to finish"""
+        return self._waiting
+
+    async def run(
+        self,
+        session_id: str,
+        generate: Callable[[], Awaitable[Any]],
+        request_id: Optional[str] = None,
+    ) -> Any:
+        slot = self._slots.setdefault(session_id, _SessionSlot())
+        turn = slot.current
+        if turn is None or not (self.coalesce and turn.matches(request_id, stream=False)):
+            turn = _Turn(request_id, stream=False)
+            await self._admit(session_id, slot, turn)
+            self._start(session_id, slot, turn, generate)
+        else:
+            self.coalesced += 1
+            logger.info("🔗 coalescing retry into in-flight turn", session_id=session_id)
+
+        task = turn.task
+        assert task is not None
+        try:
+            # shield: a disconnecting requester must not abort a turn other requests are attached to
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if task.cancelled():
+                raise TurnCancelledError(f"turn superseded for session: {session_id}")
+            raise
+
+    async def run_stream(
+        self,
+        session_id: str,
+        generate: Callable[[], Awaitable[AsyncIterator[Any]]],
+        request_id: Optional[str] = None,
+    ) -> AsyncIterator[Any]:
+        slot = self._slots.setdefault(session_id, _SessionSlot())
+        turn = slot.current
+        if turn is not None and self.coalesce and turn.matches(request_id, stream=True):
+            self.coalesced += 1
+            logger.info("🔗 coalescing retry into in-flight stream", session_id=session_id)
+            return turn.subscribe()
+
+        turn = _Turn(request_id, stream=True)
+        await self._admit(session_id, slot, turn)
+        self._start(session_id, slot, turn, lambda: self._pump(turn, generate))
+        return turn.subscribe()
+
+    async def _admit(self, session_id: str, slot: _SessionSlot, turn: _Turn) -> None:
+        """Apply the concurrency policy, then take the session lock on behalf of `turn`"""
+        if slot.lock.locked():
+            if self.policy == ConcurrencyPolicy.REJECT:
+                raise SessionBusyError(f"session is busy: {session_id}")
+            if self.policy == ConcurrencyPolicy.CANCEL and slot.current is not None and slot.current.task:
+                logger.info("✂️ cancelling in-flight turn", session_id=session_id)
+                slot.current.task.cancel()
+
+        slot.waiters += 1
+        self._waiting += 1
+        try:
+            await slot.lock.acquire()
+        finally:
+            slot.waiters -= 1
+            self._waiting -= 1
+        slot.current = turn
+        self._running += 1
+
+    def _start(
+        self, session_id: str, slot: _SessionSlot, turn: _Turn, generate: Callable[[], Awaitable[Any]]
+    ) -> None:
+        turn.task = asyncio.create_task(self._execute(generate))
+        # released from a done callback, not a `finally` in the task: a turn cancelled by the next
+        # request before its first step never runs its body and would hold the lock forever
+        turn.task.add_done_callback(lambda _: self._release(session_id, slot, turn))
+
+    @staticmethod
+    async def _execute(generate: Callable[[], Awaitable[Any]]) -> Any:
+        return await generate()
+
+    def _release(self, session_id: str, slot: _SessionSlot, turn: _Turn) -> None:
+        turn.finish()
+        slot.current = None
+        self._running -= 1
+        slot.lock.release()
+        if slot.waiters == 0 and not slot.lock.locked():
+            self._slots.pop(session_id, None)
+
+    @staticmethod
+    async def _pump(turn: _Turn, generate: Callable[[], Awaitable[AsyncIterator[Any]]]) -> None:
+        """Drive the agent stream, fanning events out to every attached subscriber"""
+        try:
+            stream = await generate()
+            try:
+                async for event in stream:
+                    turn.publish(event)
+            finally:
+                aclose = getattr(stream, "aclose", None)
+                if aclose is not None:
+                    await aclose()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # surfaced to subscribers instead of the (unawaited) producer task
+            turn.error = e
@@ -0,0 +1,72 @@
+from typing import Callable, Dict
+
+from ports.chat import MCPAgentAdapter, ModelThrottledError
+from ports.session import SessionAdapter
+from services.chat.chat_service import ChatService
+from utils.readiness import CachedProbe, SubsystemState, SubsystemStatus
+
+
+def _model_probe_state(error: Exception) -> SubsystemState:
+    # a throttling model still answers some calls; once its backlog reaches the admission limits
+    # the load check turns the instance not ready
+    return SubsystemState.DEGRADED if isinstance(error, ModelThrottledError) else SubsystemState.FAILED
+
+
+class HealthService:
+    """
+    Health of the subsystems behind the chat API, as checks for the readiness endpoint.
+
+    The session store and the model are probed in the background, at most once per probe interval,
+    so a readiness request never waits on them; MCP servers and load come from in-process state.
+    """
+
+    def __init__(
+        self,
+        chat_service: ChatService,
+        session_adapter: SessionAdapter,
+        agent_adapter: MCPAgentAdapter,
+        session_probe_interval: float = 10.0,
+        model_probe_interval: float = 60.0,
+        probe_timeout: float = 10.0,
+    ):
+        self.chat_service = chat_service
+        self.agent_adapter = agent_adapter
+        self.session_probe = CachedProbe(session_adapter.check_health, session_probe_interval, probe_timeout)
+        # every probe is a (tiny) model call, so it can be turned off
+        self.model_probe = (
+            CachedProbe(agent_adapter.probe_model, model_probe_interval, probe_timeout, classify=_model_probe_state)
+            if model_probe_interval > 0
+            else None
+        )
+
+    def checks(self) -> Dict[str, Callable[[], SubsystemStatus]]:
+        checks = {
+            "sessions": self.session_probe.status,
+            "mcp": self.mcp_status,
+            "load": self.load_status,
+        }
+        if self.model_probe is not None:
+            checks["model"] = self.model_probe.status
+        return checks
+
+    def mcp_status(self) -> SubsystemStatus:
+        servers = self.agent_adapter.mcp_server_status()
+        ready = sum(1 for state in servers.values() if state == "ready")
+        if servers and ready == 0:
+            # answers would come without any of the tools
+            starting = any(state == "starting" for state in servers.values())
+            state = SubsystemState.STARTING if starting else SubsystemState.FAILED
+        elif ready < len(servers):
+            state = SubsystemState.DEGRADED
+        else:
+            state = SubsystemState.UP
+        return SubsystemStatus(state, {"servers": servers})
+
+    def load_status(self) -> SubsystemStatus:
+        """In-flight counts; overloaded, and so not ready, while admission control turns new turns away"""
+        stats = self.chat_service.load_stats()
+        admission = self.chat_service.admission
+        shedding = admission is not None and admission.overloaded(
+            stats.in_flight_turns + stats.waiting_turns, stats.queued_model_calls
+        )
+        return SubsystemStatus(SubsystemState.OVERLOADED if shedding else SubsystemState.UP, stats.model_dump())
@@ -0,0 +1,182 @@
+import json
+import queue
+import random
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, TextIO, Union
+
+try:
+    import orjson
+except ImportError:  # fast-logging extra not installed
+    orjson = None
+
+
+LogEntry = Union[str, Dict[str, Any]]
+
+
+def dumps(event: Dict[str, Any]) -> str:
+    """JSON line for an event; orjson when installed, values it cannot encode fall back to str"""
+    if orjson is not None:
+        return orjson.dumps(event, default=str).decode("utf-8")
+    return json.dumps(event, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+class EventSampler:
+    """
+    Per-event-name sampling and rate limits, applied before an event is rendered.
+
+    `sample_rates` keeps the given share of an event (0.01 keeps one in a hundred); `rate_limits`
+    allows at most that many events per second, in bursts of up to one second's worth.
+    """
+
+    def __init__(
+        self,
+        rate_limits: Optional[Dict[str, float]] = None,
+        sample_rates: Optional[Dict[str, float]] = None,
+        clock: Callable[[], float] = time.monotonic,
+        rng: Callable[[], float] = random.random,
+    ):
+        self.rate_limits = rate_limits or {}
+        self.sample_rates = sample_rates or {}
+        self._clock = clock
+        self._rng = rng
+        # event -> (tokens, last refill)
+        self._buckets: Dict[str, List[float]] = {}
+        self._suppressed: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def allow(self, event: str) -> Optional[int]:
+        """None to drop the event, otherwise how many of its kind were dropped since the last one kept"""
+        if event not in self.rate_limits and event not in self.sample_rates:
+            return 0
+        with self._lock:
+            if self._keep(event):
+                return self._suppressed.pop(event, 0)
+            self._suppressed[event] = self._suppressed.get(event, 0) + 1
+            return None
+
+    def _keep(self, event: str) -> bool:
+        rate = self.sample_rates.get(event)
+        if rate is not None and self._rng() >= rate:
+            return False
+        limit = self.rate_limits.get(event)
+        if limit is None:
+            return True
+        now = self._clock()
+        bucket = self._buckets.setdefault(event, [limit, now])
+        bucket[0] = min(limit, bucket[0] + (now - bucket[1]) * limit)
+        bucket[1] = now
+        if bucket[0] < 1:
+            return False
+        bucket[0] -= 1
+        return True
+
+
+_STOP = object()
+
+
+class AsyncLogWriter:
+    """
+    Writes log entries from a background thread, so logging never blocks the event loop on stdout.
+
+    Entries are event dicts, rendered to JSON lines on the writer thread, or already rendered strings.
+    They are written in batches of up to `batch_size` lines. When the queue is full, entries are
+    dropped rather than waited for, and the number dropped is logged once the writer catches up.
+    """
+
+    def __init__(
+        self,
+        stream: Optional[TextIO] = None,
+        max_queue: int = 10_000,
+        batch_size: int = 512,
+        flush_interval: float = 0.1,
+    ):
+        self.stream = stream or sys.stdout
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=max_queue)
+        self._dropped = 0
+        self._dropped_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+
+    @property
+    def dropped(self) -> int:
+        return self._dropped
+
+    def write(self, entry: LogEntry) -> None:
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            with self._dropped_lock:
+                self._dropped += 1
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Write what is queued and stop the writer thread"""
+        if not self._thread.is_alive():
+            return
+        # blocking put: the stop marker must not be dropped
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        reported = 0
+        while True:
+            batch = self._next_batch()
+            stop = any(entry is _STOP for entry in batch)
+            lines = [self._render(entry) for entry in batch if entry is not _STOP]
+            dropped = self._dropped
+            if dropped > reported:
+                lines.append(dumps({"event": "log entries dropped", "level": "warning", "dropped": dropped - reported}))
+                reported = dropped
+            if lines:
+                try:
+                    self.stream.write("\n".join(lines) + "\n")
+                    self.stream.flush()
+                except Exception:
+                    # nowhere left to report it; keep the thread alive for the next batch
+                    pass
+            if stop:
+                return
+
+    def _next_batch(self) -> List[Any]:
+        try:
+            batch = [self._queue.get(timeout=self.flush_interval)]
+        except queue.Empty:
+            return []
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    @staticmethod
+    def _render(entry: LogEntry) -> str:
+        if isinstance(entry, str):
+            return entry
+        try:
+            return dumps(entry)
+        except Exception:
+            return repr(entry)
+
+
+class QueueLogger:
+    """structlog logger that hands entries to an `AsyncLogWriter` instead of printing them"""
+
+    def __init__(self, writer: AsyncLogWriter):
+        self._writer = writer
+
+    def msg(self, message: Optional[str] = None, **event_dict: Any) -> None:
+        self._writer.write(message if message is not None else event_dict)
+
+    log = debug = info = warn = warning = err = error = critical = exception = fatal = failure = msg
+
+
+class QueueLoggerFactory:
+    def __init__(self, writer: AsyncLogWriter):
+        self._logger = QueueLogger(writer)
+
+    def __call__(self, *args: Any) -> QueueLogger:
+        return self._logger
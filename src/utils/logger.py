@@ -1,6 +1,24 @@
+import atexit
+from typing import Any, Dict
+
 import structlog
 
 from config import app_config
+from utils.log_pipeline import AsyncLogWriter, EventSampler, QueueLoggerFactory
+
+
+def _sampling(sampler: EventSampler) -> Any:
+    """Processor dropping sampled-out and rate-limited events before any other work is done on them"""
+
+    def sample(_: Any, __: str, event_dict: Dict[str, Any]) -> Dict[str, Any]:
+        suppressed = sampler.allow(str(event_dict.get("event")))
+        if suppressed is None:
+            raise structlog.DropEvent
+        if suppressed:
+            event_dict["suppressed"] = suppressed
+        return event_dict
+
+    return sample
 
 
 def setup_logger(name: str = "chatbot") -> structlog.BoundLogger:
@@ -15,6 +33,7 @@ def setup_logger(name: str = "chatbot") -> structlog.BoundLogger:
     """
     # Configure processors
     processors = [
+        _sampling(EventSampler(app_config.log_rate_limits, app_config.log_sample_rates)),
         structlog.processors.add_log_level,
         structlog.processors.TimeStamper(fmt="iso"),
         structlog.processors.StackInfoRenderer(),
@@ -33,17 +52,21 @@ def setup_logger(name: str = "chatbot") -> structlog.BoundLogger:
         )
     else:
         # Production: JSON format
-        processors.extend(
-            [
-                structlog.processors.dict_tracebacks,
-                structlog.processors.JSONRenderer(),
-            ]
-        )
+        processors.append(structlog.processors.dict_tracebacks)
+        if not app_config.log_async:
+            processors.append(structlog.processors.JSONRenderer())
+        # in async mode the event dict is rendered to JSON on the writer thread
+
+    logger_factory: Any = structlog.PrintLoggerFactory()
+    if app_config.log_async:
+        writer = AsyncLogWriter(max_queue=app_config.log_queue_size)
+        atexit.register(writer.close)
+        logger_factory = QueueLoggerFactory(writer)
 
     structlog.configure(
         processors=processors,
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(),
+        logger_factory=logger_factory,
         wrapper_class=structlog.BoundLogger,
         cache_logger_on_first_use=True,
     )
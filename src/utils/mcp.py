@@ -1,12 +1,12 @@
 import os
 import json
-from typing import Optional, Dict, List, Callable
+from typing import Optional, Dict, List, Callable, Mapping, Union
 
 from strands.tools.mcp import MCPClient
 from mcp.client.stdio import stdio_client, StdioServerParameters
 from mcp.client.streamable_http import streamablehttp_client
 
-from ports.mcp import MCPConfig, StreamableHttpMCPConfig, StdioMCPConfig
+from ports.mcp import MCPConfig, MCPToolClient, StreamableHttpMCPConfig, StdioMCPConfig
 from utils.logger import logger
 
 
@@ -34,6 +34,26 @@ def load_mcp_config() -> MCPConfig:
         return MCPConfig()
 
 
+def create_mcp_client(server_config: Union[StreamableHttpMCPConfig, StdioMCPConfig]) -> Optional[MCPClient]:
+    """Create a (not yet started) MCP client for a server config"""
+    if server_config.transportType == "streamable-http":
+        if isinstance(server_config, StreamableHttpMCPConfig):
+            return MCPClient(
+                lambda config=server_config: streamablehttp_client(config.url))
+    elif server_config.transportType == "stdio":
+        if isinstance(server_config, StdioMCPConfig):
+            return MCPClient(
+                lambda config=server_config: stdio_client(
+                    StdioServerParameters(
+                        command=config.command,
+                        args=config.args,
+                        env=config.env,
+                    )
+                )
+            )
+    return None
+
+
 def initialize_mcp_clients(mcp_config: MCPConfig) -> Dict[str, MCPClient]:
     mcp_clients: Dict[str, MCPClient] = {}
     for server_name, server_config in mcp_config.mcpServers.items():
@@ -43,22 +63,7 @@ def initialize_mcp_clients(mcp_config: MCPConfig) -> Dict[str, MCPClient]:
             continue
 
         try:
-            client: Optional[MCPClient] = None
-            if server_config.transportType == "streamable-http":
-                if isinstance(server_config, StreamableHttpMCPConfig):
-                    client = MCPClient(
-                        lambda config=server_config: streamablehttp_client(config.url))
-            elif server_config.transportType == "stdio":
-                if isinstance(server_config, StdioMCPConfig):
-                    client = MCPClient(
-                        lambda config=server_config: stdio_client(
-                            StdioServerParameters(
-                                command=config.command,
-                                args=config.args,
-                                env=config.env,
-                            )
-                        )
-                    )
+            client = create_mcp_client(server_config)
             if client:
                 logger.info("🔄 MCP client created", server_name=server_name)
                 mcp_clients[server_name] = client
@@ -70,7 +75,7 @@ def initialize_mcp_clients(mcp_config: MCPConfig) -> Dict[str, MCPClient]:
     return mcp_clients
 
 
-def load_mcp_tools(mcp_clients: Dict[str, MCPClient]) -> List[Callable]:
+def load_mcp_tools(mcp_clients: Mapping[str, MCPToolClient]) -> List[Callable]:
     """Load tools from MCP clients"""
     mcp_tools: List[Callable] = []
     for server_name, mcp_client in mcp_clients.items():
@@ -0,0 +1,125 @@
+import asyncio
+import threading
+import time
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional
+
+
+class SubsystemState(StrEnum):
+    STARTING = "starting"
+    UP = "up"
+    # serving, with part of it missing (e.g. an MCP server that is down)
+    DEGRADED = "degraded"
+    # working, but turning requests away: not ready, so traffic goes to other instances until it drains
+    OVERLOADED = "overloaded"
+    FAILED = "failed"
+
+
+@dataclass
+class SubsystemStatus:
+    state: SubsystemState
+    detail: Dict[str, Any] = field(default_factory=dict)
+
+
+class Readiness:
+    """
+    State of the application's subsystems, for the readiness endpoint.
+
+    The startup sets each subsystem as it comes up and calls `mark_started` at the end; `watch`
+    replaces a set state by a check run on every report, for subsystems whose health changes after
+    startup. The application is ready once it has started and every subsystem is up or degraded,
+    and live as long as no startup step failed.
+    """
+
+    def __init__(self, subsystems: Iterable[str]):
+        self._states: Dict[str, SubsystemStatus] = {
+            name: SubsystemStatus(SubsystemState.STARTING) for name in subsystems
+        }
+        self._checks: Dict[str, Callable[[], SubsystemStatus]] = {}
+        self._lock = threading.Lock()
+        self.started = False
+
+    def mark_started(self) -> None:
+        self.started = True
+
+    def set(self, name: str, state: SubsystemState, **detail: Any) -> None:
+        with self._lock:
+            self._checks.pop(name, None)
+            self._states[name] = SubsystemStatus(state, detail)
+
+    def watch(self, name: str, check: Callable[[], SubsystemStatus]) -> None:
+        with self._lock:
+            self._checks[name] = check
+
+    def status(self) -> Dict[str, SubsystemStatus]:
+        with self._lock:
+            states = dict(self._states)
+            checks = dict(self._checks)
+        for name, check in checks.items():
+            try:
+                states[name] = check()
+            except Exception as e:
+                states[name] = SubsystemStatus(SubsystemState.FAILED, {"error": str(e)})
+        return states
+
+    @property
+    def ready(self) -> bool:
+        return self.started and all_ready(self.status())
+
+    @property
+    def live(self) -> bool:
+        """False once a startup step failed: the process will not recover by itself"""
+        with self._lock:
+            return all(status.state != SubsystemState.FAILED for status in self._states.values())
+
+
+def all_ready(states: Dict[str, SubsystemStatus]) -> bool:
+    return all(status.state in (SubsystemState.UP, SubsystemState.DEGRADED) for status in states.values())
+
+
+class CachedProbe:
+    """
+    Subsystem check backed by an async probe that runs in the background, at most every `interval` seconds.
+
+    `status` never waits for the probe: it returns the last result and starts a new probe once that
+    is stale, so readiness requests stay fast however slow the probed dependency is. The probe fails
+    when it raises or takes longer than `timeout`; `classify` picks the state for its exception.
+    Until the first probe has finished the subsystem is starting.
+    """
+
+    def __init__(
+        self,
+        probe: Callable[[], Awaitable[Any]],
+        interval: float,
+        timeout: float,
+        classify: Callable[[Exception], SubsystemState] = lambda e: SubsystemState.FAILED,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._probe = probe
+        self.interval = interval
+        self.timeout = timeout
+        self._classify = classify
+        self._clock = clock
+        self._last = SubsystemStatus(SubsystemState.STARTING)
+        self._checked_at: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def status(self) -> SubsystemStatus:
+        stale = self._checked_at is None or self._clock() - self._checked_at >= self.interval
+        if stale and self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        return self._last
+
+    async def _run(self) -> None:
+        started = self._clock()
+        try:
+            await asyncio.wait_for(self._probe(), self.timeout)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}" if str(e) else type(e).__name__
+            self._last = SubsystemStatus(self._classify(e), {"error": error})
+        else:
+            self._last = SubsystemStatus(SubsystemState.UP, {"latency": round(self._clock() - started, 3)})
+        finally:
+            self._checked_at = self._clock()
+            self._task = None
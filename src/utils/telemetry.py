@@ -0,0 +1,251 @@
+import os
+import re
+import threading
+from contextlib import AbstractContextManager
+from typing import Any, Dict, List, Optional, Sequence, override
+
+from opentelemetry import metrics, trace
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import (
+    Gauge,
+    Histogram,
+    InMemoryMetricReader,
+    MetricReader,
+    PeriodicExportingMetricReader,
+    Sum,
+)
+from opentelemetry.sdk.trace import ReadableSpan
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, SimpleSpanProcessor, SpanExporter, SpanExportResult
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.trace import Span
+
+_SCOPE = "chatbot"
+
+# seconds; model calls and tool calls run from milliseconds to minutes
+_LATENCY_BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300]
+_TOKEN_BUCKETS = [16, 64, 256, 1024, 4096, 16384, 65536, 262144]
+
+
+class Telemetry:
+    """
+    Tracer and metric instruments of the application.
+
+    Until `configure` is given providers, everything goes to the global OpenTelemetry providers:
+    no-ops unless `setup_telemetry` installed SDK ones, so instrumented code never checks whether
+    telemetry is enabled. `render_prometheus` needs the metric reader `setup_telemetry` attaches.
+    """
+
+    def __init__(self):
+        self.configure()
+
+    def configure(
+        self,
+        tracer_provider: Optional[trace.TracerProvider] = None,
+        meter_provider: Optional[metrics.MeterProvider] = None,
+        metric_reader: Optional[InMemoryMetricReader] = None,
+    ) -> None:
+        self.tracer = trace.get_tracer(_SCOPE, tracer_provider=tracer_provider)
+        meter = metrics.get_meter(_SCOPE, meter_provider=meter_provider)
+        self.metric_reader = metric_reader
+
+        self.invoke_duration = meter.create_histogram(
+            "chat.invoke.duration",
+            unit="s",
+            description="Time to answer an invocation; for streams, until the stream starts",
+            explicit_bucket_boundaries_advisory=_LATENCY_BUCKETS,
+        )
+        self.model_call_duration = meter.create_histogram(
+            "model.call.duration",
+            unit="s",
+            description="Duration of a model call, from the request to its last event",
+            explicit_bucket_boundaries_advisory=_LATENCY_BUCKETS,
+        )
+        self.model_time_to_first_token = meter.create_histogram(
+            "model.time_to_first_token",
+            unit="s",
+            description="Time from the model request to its first text or tool use delta",
+            explicit_bucket_boundaries_advisory=_LATENCY_BUCKETS,
+        )
+        self.model_tokens = meter.create_histogram(
+            "model.tokens",
+            unit="{token}",
+            description="Tokens per model call, by token type",
+            explicit_bucket_boundaries_advisory=_TOKEN_BUCKETS,
+        )
+        self.model_queue_wait = meter.create_histogram(
+            "model.queue_wait",
+            unit="s",
+            description="Time a model call waited for a concurrency slot",
+            explicit_bucket_boundaries_advisory=_LATENCY_BUCKETS,
+        )
+        self.tool_call_duration = meter.create_histogram(
+            "mcp.tool.duration",
+            unit="s",
+            description="Duration of a tool call, by server and tool",
+            explicit_bucket_boundaries_advisory=_LATENCY_BUCKETS,
+        )
+
+    def span(self, name: str, **attributes: Any) -> AbstractContextManager[Span]:
+        """Span around a block, made current so spans started inside it are its children"""
+        return self.tracer.start_as_current_span(name, attributes=_attributes(attributes))
+
+    def start_span(self, name: str, **attributes: Any) -> Span:
+        """
+        Span the caller ends; not made current.
+
+        For work spread over the yields of an async generator or over hook callbacks, where a
+        current span could not be detached in the context it was attached in.
+        """
+        return self.tracer.start_span(name, attributes=_attributes(attributes))
+
+    def render_prometheus(self) -> str:
+        """Metrics in the Prometheus text exposition format; empty without a metric reader"""
+        if self.metric_reader is None:
+            return ""
+        data = self.metric_reader.get_metrics_data()
+        if data is None:
+            return ""
+        lines: List[str] = []
+        for resource_metrics in data.resource_metrics:
+            for scope_metrics in resource_metrics.scope_metrics:
+                for metric in scope_metrics.metrics:
+                    lines.extend(_render_metric(metric))
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+def _attributes(attributes: Dict[str, Any]) -> Dict[str, Any]:
+    # None is not a valid attribute value
+    return {key: value for key, value in attributes.items() if value is not None}
+
+
+_INVALID_NAME_CHARS = re.compile(r"[^a-zA-Z0-9_:]")
+_UNIT_SUFFIXES = {"s": "seconds", "ms": "milliseconds", "By": "bytes"}
+
+
+def _prometheus_name(name: str, unit: str) -> str:
+    name = _INVALID_NAME_CHARS.sub("_", name)
+    suffix = _UNIT_SUFFIXES.get(unit)
+    if suffix and not name.endswith(f"_{suffix}"):
+        name = f"{name}_{suffix}"
+    return name
+
+
+def _labels(attributes: Any, **extra: str) -> str:
+    labels = {**{_INVALID_NAME_CHARS.sub("_", str(k)): str(v) for k, v in (attributes or {}).items()}, **extra}
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+def _render_metric(metric: Any) -> List[str]:
+    name = _prometheus_name(metric.name, metric.unit or "")
+    data = metric.data
+    if isinstance(data, Histogram):
+        lines = [f"# HELP {name} {metric.description}", f"# TYPE {name} histogram"]
+        for point in data.data_points:
+            cumulative = 0
+            bounds: Sequence[float] = [*point.explicit_bounds, float("inf")]
+            for bound, count in zip(bounds, point.bucket_counts):
+                cumulative += count
+                lines.append(f"{name}_bucket{_labels(point.attributes, le=_number(bound))} {cumulative}")
+            lines.append(f"{name}_sum{_labels(point.attributes)} {_number(point.sum)}")
+            lines.append(f"{name}_count{_labels(point.attributes)} {point.count}")
+        return lines
+    if isinstance(data, Sum) and data.is_monotonic:
+        lines = [f"# HELP {name}_total {metric.description}", f"# TYPE {name}_total counter"]
+        lines.extend(f"{name}_total{_labels(p.attributes)} {_number(p.value)}" for p in data.data_points)
+        return lines
+    if isinstance(data, (Sum, Gauge)):
+        lines = [f"# HELP {name} {metric.description}", f"# TYPE {name} gauge"]
+        lines.extend(f"{name}{_labels(p.attributes)} {_number(p.value)}" for p in data.data_points)
+        return lines
+    return []
+
+
+class FileSpanExporter(SpanExporter):
+    """Span exporter appending finished spans to a JSON lines file, for tracing without a collector"""
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+
+    @override
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        lines = "".join(span.to_json(indent=None) + "\n" for span in spans)
+        try:
+            with self._lock, open(self.path, "a", encoding="utf-8") as f:
+                f.write(lines)
+        except OSError:
+            return SpanExportResult.FAILURE
+        return SpanExportResult.SUCCESS
+
+    @override
+    def shutdown(self) -> None:
+        pass
+
+
+# Shared instance, used like the logger
+telemetry = Telemetry()
+
+
+def setup_telemetry(exporter: str = "none", file_path: Optional[str] = None) -> Optional[InMemorySpanExporter]:
+    """
+    Install SDK tracer and meter providers as the global ones, so spans of strands itself are recorded too.
+
+    Metrics are always collected in process for `/metrics`. Spans go to `exporter`: "none", "console",
+    "memory" (kept in the returned span exporter), "file" (JSON lines at `file_path`) or "otlp"
+    (configured with the standard OTEL_EXPORTER_OTLP_* variables, which then receives metrics too).
+    Returns the in-memory span exporter, if any.
+    """
+    from strands.telemetry import StrandsTelemetry
+    from strands.telemetry.config import get_otel_resource
+
+    # sets the global tracer provider and the W3C trace context propagators
+    strands_telemetry = StrandsTelemetry()
+    tracer_provider = strands_telemetry.tracer_provider
+    span_exporter = None
+    if exporter == "console":
+        strands_telemetry.setup_console_exporter()
+    elif exporter == "memory":
+        span_exporter = InMemorySpanExporter()
+        tracer_provider.add_span_processor(SimpleSpanProcessor(span_exporter))
+    elif exporter == "file":
+        span_processor = BatchSpanProcessor(FileSpanExporter(file_path or "./.telemetry/spans.jsonl"))
+        tracer_provider.add_span_processor(span_processor)
+    elif exporter == "otlp":
+        strands_telemetry.setup_otlp_exporter()
+    elif exporter != "none":
+        raise ValueError(f"unknown telemetry exporter: {exporter}")
+
+    metric_reader = InMemoryMetricReader()
+    readers: List[MetricReader] = [metric_reader]
+    if exporter == "otlp":
+        from opentelemetry.exporter.otlp.proto.http.metric_exporter import OTLPMetricExporter
+
+        readers.append(PeriodicExportingMetricReader(OTLPMetricExporter()))
+    meter_provider = MeterProvider(resource=get_otel_resource(), metric_readers=readers)
+    metrics.set_meter_provider(meter_provider)
+
+    telemetry.configure(tracer_provider, meter_provider, metric_reader)
+    return span_exporter
+
+
+def shutdown_telemetry() -> None:
+    """Flush and stop the SDK providers installed by `setup_telemetry`"""
+    for provider in (trace.get_tracer_provider(), metrics.get_meter_provider()):
+        shutdown = getattr(provider, "shutdown", None)
+        if shutdown is not None:
+            shutdown()
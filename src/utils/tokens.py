@@ -0,0 +1,39 @@
+import json
+import math
+from typing import Any, Dict, Iterable, Mapping
+
+
+# rough average for English text on Claude tokenizers
+CHARS_PER_TOKEN = 4
+# role/framing overhead added per message
+MESSAGE_OVERHEAD_TOKENS = 4
+
+
+def estimate_text_tokens(text: str) -> int:
+    """Cheap token estimate for a string without a tokenizer round trip"""
+    if not text:
+        return 0
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def _content_block_chars(block: Dict[str, Any]) -> int:
+    if "text" in block:
+        return len(block["text"])
+    if "toolUse" in block:
+        tool_use = block["toolUse"]
+        return len(tool_use.get("name", "")) + len(json.dumps(tool_use.get("input", {}), default=str))
+    if "toolResult" in block:
+        return sum(_content_block_chars(item) for item in block["toolResult"].get("content", []))
+    if "json" in block:
+        return len(json.dumps(block["json"], default=str))
+    return len(json.dumps(block, default=str))
+
+
+def estimate_message_tokens(message: Mapping[str, Any]) -> int:
+    """Estimate the input tokens a single Bedrock converse message contributes"""
+    chars = sum(_content_block_chars(block) for block in message.get("content", []))
+    return MESSAGE_OVERHEAD_TOKENS + math.ceil(chars / CHARS_PER_TOKEN)
+
+
+def estimate_messages_tokens(messages: Iterable[Mapping[str, Any]]) -> int:
+    return sum(estimate_message_tokens(message) for message in messages)
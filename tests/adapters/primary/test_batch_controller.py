@@ -0,0 +1,58 @@
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from adapters.primary.batch.batch_controller import BatchController, parse_batch_items
+from ports.chat.dto import BatchResult
+
+
+class DummyBatchService:
+    def __init__(self):
+        self.runs = []
+
+    def run(self, items, batch_id=None):
+        if batch_id == "../x":
+            raise ValueError("invalid batch id")
+        self.runs.append((items, batch_id))
+
+        async def results():
+            for item in reversed(items):
+                yield BatchResult(id=item.id, data=item.message.upper())
+        return results()
+
+
+def test_parse_accepts_messages_and_backlog_entries():
+    data = (
+        b'{"message": "hi", "session_id": "s1"}\n'
+        b"\n"
+        b'{"request_id": "user-001", "title": "Title", "body": "Body"}\n'
+    )
+    items = parse_batch_items(data)
+    assert [(i.id, i.message, i.session_id) for i in items] == [("1", "hi", "s1"), ("user-001", "Title\n\nBody", None)]
+
+    with pytest.raises(ValueError, match="line 2"):
+        parse_batch_items(b'{"message": "hi"}\n{"nope": 1}\n')
+    with pytest.raises(ValueError, match="duplicate"):
+        parse_batch_items(b'{"id": "a", "message": "x"}\n{"id": "a", "message": "y"}\n')
+
+
+def test_batch_invocations_stream_jsonl_results():
+    service = DummyBatchService()
+    app = FastAPI()
+    app.include_router(BatchController(service).router)
+    client = TestClient(app)
+
+    body = b'{"message": "a"}\n{"message": "b"}\n'
+    resp = client.post("/v1/batch/invocations?batch_id=nightly", content=body)
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    assert [json.loads(line) for line in resp.text.splitlines()] == [
+        {"id": "2", "data": "B"},
+        {"id": "1", "data": "A"},
+    ]
+    assert service.runs[0][1] == "nightly"
+
+    assert client.post("/v1/batch/invocations", content=b"not json\n").status_code == 400
+    assert client.post("/v1/batch/invocations?batch_id=../x", content=body).status_code == 400
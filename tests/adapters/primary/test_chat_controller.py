@@ -3,8 +3,10 @@ from fastapi.testclient import TestClient
 import pytest
 
 from adapters.primary.chat.chat_controller import ChatController
+from services.chat.admission import AdmissionControl
 from services.chat.chat_service import ChatService
 from ports.session.session_adapter import SessionAdapter
+from ports.chat.dto import ModelSchedulerStats
 from ports.chat.mcp_agent_adapter import MCPAgentAdapter
 
 
@@ -24,15 +26,15 @@ class DummySessionAdapter(SessionAdapter):
 
 
 class DummyAgentAdapter(MCPAgentAdapter):
-    async def generate_response(self, session_manager, content: str) -> str:
+    async def generate_response(self, session_manager, content: str, model=None, **kwargs) -> str:
         return "response"
 
-    async def generate_response_stream(self, session_manager, content: str):
+    async def generate_response_stream(self, session_manager, content: str, model=None, **kwargs):
         async def iterator():
             yield {"data": "chunk"}
         return iterator()
 
-    def configure_mcp(self, mcp_config=None) -> None:
+    async def configure_mcp(self, mcp_config=None) -> None:
         pass
 
     def cleanup(self) -> None:
@@ -40,7 +42,7 @@ class DummyAgentAdapter(MCPAgentAdapter):
 
 
 class FailingAgentAdapter(DummyAgentAdapter):
-    async def generate_response(self, session_manager, content: str) -> str:
+    async def generate_response(self, session_manager, content: str, model=None, **kwargs) -> str:
         raise RuntimeError("boom")
 
 
@@ -66,7 +68,8 @@ def test_invoke_streaming(app):
         assert resp.status_code == 200
         assert resp.headers["content-type"].startswith("text/event-stream")
         body = b"".join(resp.iter_bytes())
-        assert b"chunk" in body
+        assert b'event: chunk\ndata: {"chunk":"chunk"}' in body
+        assert body.endswith(b'event: end\ndata: {"done":true,"stop_reason":null}\n\n')
 
 
 def test_invoke_requires_fields(app):
@@ -83,3 +86,63 @@ def test_invoke_service_error():
     client = TestClient(fastapi_app, raise_server_exceptions=False)
     resp = client.post("/v1/invocations", json={"message": "hi", "session_id": "1"})
     assert resp.status_code == 500
+
+
+class BusyAgentAdapter(DummyAgentAdapter):
+    async def generate_response(self, session_manager, content: str, model=None, **kwargs) -> str:
+        from services.chat.turn_coordinator import SessionBusyError
+        raise SessionBusyError("busy")
+
+
+def test_invoke_session_busy_returns_conflict():
+    service = ChatService(BusyAgentAdapter(), DummySessionAdapter())
+    controller = ChatController(service)
+    fastapi_app = FastAPI()
+    fastapi_app.include_router(controller.router)
+    client = TestClient(fastapi_app)
+    resp = client.post("/v1/invocations", json={"message": "hi", "session_id": "1"})
+    assert resp.status_code == 409
+
+
+def test_invoke_streaming_resumes_after_last_event_id(app):
+    request = {"message": "hi", "session_id": "1", "stream": True}
+    with TestClient(app) as client:
+        body = client.post("/v1/invocations", json=request).content
+        event_ids = [line[len("id: "):] for line in body.decode().split("\n") if line.startswith("id: ")]
+
+        resumed = client.post("/v1/invocations", json=request, headers={"Last-Event-ID": event_ids[0]})
+        assert resumed.status_code == 200
+        assert resumed.content == body[body.index(f"id: {event_ids[1]}".encode()):]
+
+        turn_id = event_ids[0].rpartition(":")[0]
+        assert client.post("/v1/invocations", json=request, headers={"Last-Event-ID": "bogus"}).status_code == 400
+        unknown = client.post("/v1/invocations", json=request, headers={"Last-Event-ID": f"{turn_id}x:1"})
+        assert unknown.status_code == 410
+
+
+def test_invoke_with_unknown_model_is_bad_request():
+    class RoutingAgentAdapter(DummyAgentAdapter):
+        async def generate_response(self, session_manager, content: str, model=None, **kwargs) -> str:
+            from ports.chat import UnknownModelError
+            raise UnknownModelError(f"unknown model: {model}")
+
+    app = FastAPI()
+    app.include_router(ChatController(ChatService(RoutingAgentAdapter(), DummySessionAdapter())).router)
+    resp = TestClient(app).post("/v1/invocations", json={"message": "hi", "session_id": "1", "model": "huge"})
+    assert resp.status_code == 400
+    assert resp.json() == {"detail": "unknown model: huge"}
+
+
+def test_invoke_when_overloaded_is_service_unavailable_with_retry_after():
+    class QueuedAgentAdapter(DummyAgentAdapter):
+        def scheduler_stats(self) -> ModelSchedulerStats:
+            return ModelSchedulerStats(queued=10)
+
+    admission = AdmissionControl(max_queued_model_calls=10, retry_after=0.5)
+    service = ChatService(QueuedAgentAdapter(), DummySessionAdapter(), admission=admission)
+    app = FastAPI()
+    app.include_router(ChatController(service).router)
+    resp = TestClient(app).post("/v1/invocations", json={"message": "hi", "session_id": "1"})
+    assert resp.status_code == 503
+    assert resp.headers["retry-after"] == "1"
+    assert resp.json() == {"detail": "too many queued model calls: 10 (limit 10)"}
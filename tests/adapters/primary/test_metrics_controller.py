@@ -0,0 +1,38 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from adapters.primary.metrics.metrics_controller import MetricsController
+from adapters.primary.metrics.prometheus_controller import PrometheusController
+from ports.chat.dto import ModelUsageStats
+
+
+class DummyChatService:
+    def usage_stats(self):
+        return ModelUsageStats(model_calls=2, input_tokens=20, cache_read_input_tokens=60, cache_hit_rate=0.75)
+
+
+def test_usage_reports_prompt_cache_tokens():
+    app = FastAPI()
+    app.include_router(MetricsController(DummyChatService()).router)
+
+    response = TestClient(app).get("/v1/metrics/usage")
+    assert response.status_code == 200
+    assert response.json() == {
+        "model_calls": 2,
+        "input_tokens": 20,
+        "output_tokens": 0,
+        "cache_read_input_tokens": 60,
+        "cache_write_input_tokens": 0,
+        "cache_hit_rate": 0.75,
+    }
+
+
+def test_prometheus_endpoint_serves_recorded_histograms(recorded_telemetry):
+    recorded_telemetry.telemetry.model_queue_wait.record(0.02, {"priority": "interactive"})
+    app = FastAPI()
+    app.include_router(PrometheusController(recorded_telemetry.telemetry).router)
+
+    response = TestClient(app).get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'model_queue_wait_seconds_count{priority="interactive"} 1' in response.text
@@ -2,6 +2,7 @@ from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from adapters.primary.ping.ping_controller import PingController
+from utils.readiness import Readiness, SubsystemState
 
 
 def create_app():
@@ -22,3 +23,50 @@ def test_ping_controller_disallows_post():
     client = TestClient(create_app())
     response = client.post("/ping")
     assert response.status_code == 405
+
+
+def test_ready_reports_subsystems_and_503_while_starting():
+    readiness = Readiness(["container", "mcp"])
+    readiness.set("container", SubsystemState.UP, model_provider="fake")
+    readiness.mark_started()
+    app = FastAPI()
+    app.include_router(PingController(readiness).router)
+    client = TestClient(app)
+
+    response = client.get("/health/ready")
+    assert response.status_code == 503
+    assert response.json() == {
+        "status": "not_ready",
+        "subsystems": {
+            "container": {"state": "up", "detail": {"model_provider": "fake"}},
+            "mcp": {"state": "starting", "detail": {}},
+        },
+    }
+
+    readiness.set("mcp", SubsystemState.DEGRADED, servers={"search": "failed"})
+    response = client.get("/health/ready")
+    assert response.status_code == 200
+    assert response.json()["status"] == "ready"
+    assert response.json()["subsystems"]["mcp"]["detail"] == {"servers": {"search": "failed"}}
+
+
+def test_ready_without_readiness_tracker_is_always_ready():
+    response = TestClient(create_app()).get("/health/ready")
+    assert response.status_code == 200
+    assert response.json() == {"status": "ready", "subsystems": {}}
+
+
+def test_live_fails_once_a_startup_step_failed():
+    readiness = Readiness(["container"])
+    app = FastAPI()
+    app.include_router(PingController(readiness).router)
+    client = TestClient(app)
+
+    response = client.get("/health/live")
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
+
+    readiness.set("container", SubsystemState.FAILED, error="bad config")
+    response = client.get("/health/live")
+    assert response.status_code == 503
+    assert response.json() == {"status": "failed"}
@@ -0,0 +1,117 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from adapters.primary.chat.sse import HEARTBEAT, SSEEncoder, batch_frames, with_heartbeats
+from adapters.primary.chat.stream_replay import StreamReplayStore
+
+
+def parse(frames: bytes):
+    events = []
+    for frame in frames.decode().split("\n\n"):
+        if not frame or frame.startswith(":"):
+            continue
+        fields = dict(line.split(": ", 1) for line in frame.split("\n"))
+        events.append((int(fields["id"]), fields["event"], json.loads(fields["data"])))
+    return events
+
+
+async def encode(events, **kwargs):
+    return b"".join([frame async for frames in batch_frames(events, SSEEncoder(), **kwargs) for _, frame in frames])
+
+
+@pytest.mark.asyncio
+async def test_tokens_are_batched_and_stream_ends_with_terminal_event():
+    async def events():
+        for token in ["Hel", "lo", " world"]:
+            yield {"data": token}
+        yield {
+            "message": {
+                "role": "assistant",
+                "content": [{"toolUse": {"toolUseId": "t1", "name": "search", "input": {"q": "x"}}}],
+            }
+        }
+        yield {
+            "event": {
+                "metadata": {
+                    "usage": {"inputTokens": 5, "outputTokens": 3, "totalTokens": 8, "cacheReadInputTokens": 120}
+                }
+            }
+        }
+        yield {"data": "!"}
+        yield {"result": SimpleNamespace(stop_reason="end_turn")}
+
+    body = await encode(events(), flush_interval=10, flush_bytes=512)
+
+    assert parse(body) == [
+        (1, "chunk", {"chunk": "Hello world"}),
+        (2, "tool_use", {"tool_use_id": "t1", "name": "search", "input": {"q": "x"}}),
+        (3, "chunk", {"chunk": "!"}),
+        (
+            4,
+            "usage",
+            {
+                "input_tokens": 5,
+                "output_tokens": 3,
+                "total_tokens": 8,
+                "cache_read_input_tokens": 120,
+                "cache_write_input_tokens": 0,
+            },
+        ),
+        (5, "end", {"done": True, "stop_reason": "end_turn"}),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_size_threshold_flushes_early():
+    async def events():
+        for _ in range(4):
+            yield {"data": "x" * 4}
+
+    body = await encode(events(), flush_interval=10, flush_bytes=8)
+
+    assert [data for _, event, data in parse(body) if event == "chunk"] == [{"chunk": "x" * 8}, {"chunk": "x" * 8}]
+
+
+@pytest.mark.asyncio
+async def test_stream_error_is_reported_before_end():
+    async def events():
+        yield {"data": "partial"}
+        raise RuntimeError("model failed")
+
+    body = await encode(events())
+
+    assert [event for _, event, _ in parse(body)] == ["chunk", "error", "end"]
+    assert parse(body)[-1][2]["stop_reason"] == "error"
+
+
+@pytest.mark.asyncio
+async def test_heartbeats_and_disconnect_cancel_the_agent_stream():
+    cancelled = asyncio.Event()
+    disconnected = [False]
+
+    async def events():
+        try:
+            await asyncio.sleep(10)
+            yield {"data": "never"}
+        finally:
+            cancelled.set()
+
+    async def is_disconnected():
+        return disconnected[0]
+
+    # the controller's path: a replay log encodes the turn, each client follows it with heartbeats
+    store = StreamReplayStore(resume_grace=0)
+    log = store.start("s1", events())
+    stream = with_heartbeats(store.follow(log), is_disconnected, heartbeat_interval=0.01)
+    assert await stream.__anext__() == HEARTBEAT
+
+    disconnected[0] = True
+    with pytest.raises(StopAsyncIteration):
+        await stream.__anext__()
+    # nobody is left to resume the turn, so its agent stream is cancelled
+    await asyncio.wait([log.task], timeout=1)
+    assert log.task.cancelled() and cancelled.is_set()
+    store.cleanup()
@@ -0,0 +1,43 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from adapters.primary.ping.ping_controller import PingController
+from adapters.primary.ping.startup_gate import StartupGate
+from utils.readiness import Readiness, SubsystemState
+
+
+def create_app(readiness: Readiness) -> FastAPI:
+    app = FastAPI()
+    app.include_router(PingController(readiness).router)
+    app.add_api_route("/v1/sessions", lambda: {"sessions": []}, methods=["GET"])
+    app.add_middleware(StartupGate, readiness=readiness, retry_after=2)
+    return app
+
+
+def test_requests_get_503_with_retry_after_until_started():
+    readiness = Readiness(["container"])
+    client = TestClient(create_app(readiness))
+
+    response = client.get("/v1/sessions")
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "2"
+
+    # health checks are answered while starting
+    assert client.get("/ping").status_code == 200
+    assert client.get("/health/ready").status_code == 503
+
+    readiness.set("container", SubsystemState.UP)
+    readiness.mark_started()
+    assert client.get("/v1/sessions").status_code == 200
+
+
+def test_gate_stays_open_once_started():
+    readiness = Readiness(["container"])
+    client = TestClient(create_app(readiness))
+    readiness.set("container", SubsystemState.UP)
+    readiness.mark_started()
+    assert client.get("/v1/sessions").status_code == 200
+
+    readiness.set("container", SubsystemState.FAILED)
+    assert client.get("/v1/sessions").status_code == 200
+    assert client.get("/health/ready").status_code == 503
@@ -0,0 +1,129 @@
+import asyncio
+
+import pytest
+
+from adapters.primary.chat.stream_replay import ReplayUnavailableError, StreamReplayStore, parse_last_event_id
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def ids(chunks: bytes):
+    return [line[len("id: "):] for line in chunks.decode().split("\n") if line.startswith("id: ")]
+
+
+async def collect(stream):
+    return b"".join([chunk async for chunk in stream])
+
+
+async def tokens(*parts, gate: asyncio.Event = None):
+    for i, part in enumerate(parts):
+        if gate is not None and i == 1:
+            await gate.wait()
+        yield {"data": part}
+
+
+def test_parse_last_event_id():
+    assert parse_last_event_id("01ABC:7") == ("01ABC", 7)
+    with pytest.raises(ValueError):
+        parse_last_event_id("7")
+    with pytest.raises(ValueError):
+        parse_last_event_id("01ABC:x")
+
+
+@pytest.mark.asyncio
+async def test_resume_replays_tail_of_finished_turn():
+    store = StreamReplayStore(flush_interval=0, flush_bytes=1)
+    log = store.start("s1", tokens("a", "b", "c"))
+    first = await collect(store.follow(log, 0))
+    first_ids = ids(first)
+    assert first_ids[-1].startswith(f"{log.turn_id}:")
+
+    turn_id, seq = parse_last_event_id(first_ids[1])
+    resumed = await collect(store.follow(store.get("s1", turn_id), seq))
+
+    assert ids(resumed) == first_ids[2:]
+    assert resumed.endswith(b'event: end\ndata: {"done":true,"stop_reason":null}\n\n')
+    store.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_reconnect_reattaches_to_live_turn():
+    gate = asyncio.Event()
+    store = StreamReplayStore(flush_interval=0, flush_bytes=1, resume_grace=10)
+    log = store.start("s1", tokens("a", "b", gate=gate))
+
+    # first connection reads one event, then drops
+    first = store.follow(log, 0)
+    chunk = await anext(first)
+    await first.aclose()
+    assert not log.task.done()
+
+    _, seq = parse_last_event_id(ids(chunk)[-1])
+    resumed = asyncio.create_task(collect(store.follow(store.get("s1", log.turn_id), seq)))
+    await asyncio.sleep(0)
+    gate.set()
+    body = await resumed
+
+    assert b'"chunk":"b"' in body
+    assert b'"chunk":"a"' not in body
+    assert log.finished
+    store.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_abandoned_turn_is_cancelled():
+    cancelled = asyncio.Event()
+
+    async def events():
+        try:
+            yield {"data": "a"}
+            await asyncio.Event().wait()
+        finally:
+            cancelled.set()
+
+    store = StreamReplayStore(flush_interval=0, flush_bytes=1, resume_grace=0)
+    log = store.start("s1", events())
+    stream = store.follow(log, 0)
+    await anext(stream)
+    await stream.aclose()
+
+    await asyncio.wait_for(cancelled.wait(), 1)
+    store.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_overwritten_events_are_unavailable():
+    store = StreamReplayStore(log_max_bytes=1, flush_interval=0, flush_bytes=1)
+    log = store.start("s1", tokens("a", "b", "c"))
+    await log.task
+
+    assert len(log.frames) == 1
+    assert not log.can_resume(0)
+    with pytest.raises(ReplayUnavailableError):
+        await collect(store.follow(log, 0))
+    store.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_finished_logs_spill_to_disk_and_expire(tmp_path):
+    clock = FakeClock()
+    store = StreamReplayStore(
+        max_memory_bytes=1, ttl=60, spill_path=str(tmp_path), flush_interval=0, flush_bytes=1, clock=clock
+    )
+    log = store.start("s1", tokens("a", "b"))
+    expected = await collect(store.follow(log, 0))
+
+    assert ("s1", log.turn_id) not in store.logs
+    assert await collect(store.follow(store.get("s1", log.turn_id), 0)) == expected
+
+    clock.now = 61
+    with pytest.raises(ReplayUnavailableError):
+        store.get("s1", log.turn_id)
+    assert list(tmp_path.iterdir()) == []
+    store.cleanup()
@@ -0,0 +1,89 @@
+from types import SimpleNamespace
+
+from adapters.secondary.chat.agent_pool import AgentPool
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_agent(messages=None):
+    return SimpleNamespace(messages=messages or [])
+
+
+def test_pool_hit_miss_and_lru_capacity_eviction():
+    evicted = []
+    pool = AgentPool(max_size=2, idle_ttl=None)
+    pool.add_eviction_callback(lambda sid, agent, reason: evicted.append((sid, reason)))
+
+    pool.put("a", make_agent())
+    pool.put("b", make_agent())
+    assert pool.get("a") is not None  # "b" becomes least recently used
+    assert pool.get("missing") is None
+
+    pool.put("c", make_agent())
+
+    assert "b" not in pool
+    assert "a" in pool and "c" in pool
+    assert evicted == [("b", "capacity")]
+
+    stats = pool.stats()
+    assert stats.size == 2
+    assert stats.hits == 1
+    assert stats.misses == 1
+    assert stats.evictions == {"capacity": 1}
+
+
+def test_pool_evicts_idle_agents():
+    clock = FakeClock()
+    pool = AgentPool(max_size=10, idle_ttl=10, clock=clock)
+
+    pool.put("old", make_agent())
+    clock.now = 5
+    pool.put("new", make_agent())
+    clock.now = 12
+
+    assert pool.get("old") is None
+    assert pool.get("new") is not None
+    assert pool.stats().evictions == {"idle": 1}
+
+
+def test_pool_tracks_bytes_incrementally_and_evicts_on_memory():
+    pool = AgentPool(max_size=10, idle_ttl=None, max_bytes=200)
+
+    agent = make_agent([{"role": "user", "content": [{"text": "hi"}]}])
+    pool.put("a", agent)
+    initial = pool.stats().bytes
+    assert initial > 0
+
+    agent.messages.append({"role": "assistant", "content": [{"text": "hello"}]})
+    pool.touch("a")
+    assert pool.stats().bytes > initial
+
+    agent.messages[:] = agent.messages[1:]
+    pool.touch("a")
+    assert pool.stats().bytes < initial + 50
+
+    pool.put("b", make_agent([{"role": "user", "content": [{"text": "x" * 300}]}]))
+
+    assert "a" not in pool
+    assert "b" in pool  # the entry being touched is never evicted
+    assert pool.stats().evictions == {"memory": 1}
+
+
+def test_pool_remove_and_clear_do_not_count_evictions():
+    pool = AgentPool(max_size=10)
+    pool.put("a", make_agent([{"text": "hi"}]))
+    pool.put("b", make_agent())
+
+    assert pool.remove("a") is not None
+    pool.clear()
+
+    stats = pool.stats()
+    assert stats.size == 0
+    assert stats.bytes == 0
+    assert stats.evictions == {}
@@ -0,0 +1,19 @@
+import pytest
+
+from adapters.secondary.chat.batch_checkpoint_store import FileBatchCheckpointStore
+from ports.chat.dto import BatchResult
+
+
+def test_checkpoints_survive_a_torn_last_line(tmp_path):
+    store = FileBatchCheckpointStore(str(tmp_path))
+    store.append("nightly", BatchResult(id="1", data="one"))
+    store.append("nightly", BatchResult(id="2", session_id="s", data="two"))
+    with open(tmp_path / "nightly.jsonl", "a") as f:
+        f.write('{"id": "3", "da')
+
+    results = FileBatchCheckpointStore(str(tmp_path)).load("nightly")
+    assert results == {"1": BatchResult(id="1", data="one"), "2": BatchResult(id="2", session_id="s", data="two")}
+    assert store.load("other") == {}
+
+    with pytest.raises(ValueError):
+        store.load("../etc/passwd")
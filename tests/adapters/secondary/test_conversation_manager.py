@@ -0,0 +1,160 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+
+from adapters.secondary.chat.conversation_manager import (
+    CompactingConversationManager,
+    ConversationManagerFactory,
+    ConversationStrategy,
+    MessageTokenTracker,
+    TokenBudgetConversationManager,
+)
+
+
+def text_message(role: str, text: str):
+    return {"role": role, "content": [{"text": text}]}
+
+
+def test_factory_builds_independent_managers_per_strategy():
+    factory = ConversationManagerFactory(strategy="token_budget", window_size=6, token_budget=100)
+
+    first, second = factory.create(), factory.create()
+
+    assert first is not second
+    assert isinstance(first, TokenBudgetConversationManager)
+    assert first.window_size == 6
+
+    summarizing = ConversationManagerFactory(strategy=ConversationStrategy.SUMMARIZING).create()
+    assert summarizing.preserve_recent_messages == 10
+
+    compacting = ConversationManagerFactory(
+        strategy="compacting", window_size=8, preserve_recent_messages=2, token_budget=100
+    ).create(summarizer=lambda messages: "summary")
+    assert isinstance(compacting, CompactingConversationManager)
+    assert (compacting.window_size, compacting.preserve_recent_messages) == (8, 2)
+
+
+def test_factory_rejects_unknown_strategy():
+    with pytest.raises(ValueError):
+        ConversationManagerFactory(strategy="nope")
+
+
+def test_token_tracker_counts_each_message_once():
+    calls = []
+
+    def counter(message):
+        calls.append(message)
+        return 10
+
+    tracker = MessageTokenTracker(counter)
+    messages = [text_message("user", "a"), text_message("assistant", "b")]
+    assert tracker.sync(messages) == 20
+
+    messages.append(text_message("user", "c"))
+    assert tracker.sync(messages) == 30
+    assert len(calls) == 3
+
+    tracker.drop_front(1)
+    del messages[0]
+    assert tracker.sync(messages) == 20
+    assert len(calls) == 3
+
+    # a rewritten history is detected and recounted
+    messages[0] = text_message("assistant", "summary")
+    assert tracker.sync(messages) == 20
+    assert len(calls) == 5
+
+
+def test_token_budget_trims_oldest_messages():
+    manager = TokenBudgetConversationManager(token_budget=25, window_size=100, token_counter=lambda m: 10)
+    agent = SimpleNamespace(messages=[text_message("user" if i % 2 == 0 else "assistant", str(i)) for i in range(5)])
+
+    manager.apply_management(agent)
+
+    assert [m["content"][0]["text"] for m in agent.messages] == ["3", "4"]
+    assert manager.removed_message_count == 3
+    assert manager.tracker.total == 20
+
+
+def test_token_budget_never_starts_with_tool_result():
+    manager = TokenBudgetConversationManager(token_budget=10, window_size=100, token_counter=lambda m: 10)
+    agent = SimpleNamespace(
+        messages=[
+            text_message("user", "question"),
+            {"role": "assistant", "content": [{"toolUse": {"toolUseId": "1", "name": "t", "input": {}}}]},
+            {"role": "user", "content": [{"toolResult": {"toolUseId": "1", "content": [], "status": "success"}}]},
+            text_message("assistant", "answer"),
+        ]
+    )
+
+    manager.apply_management(agent)
+
+    assert agent.messages[0]["content"][0]["text"] == "answer"
+    assert manager.removed_message_count == 3
+
+
+def conversation(count: int):
+    return [text_message("user" if i % 2 == 0 else "assistant", str(i)) for i in range(count)]
+
+
+@pytest.mark.asyncio
+async def test_compaction_summarizes_oldest_span_in_background_and_persists_it():
+    summarized = []
+
+    async def summarizer(messages):
+        summarized.append([m["content"][0]["text"] for m in messages])
+        return f"summary {len(summarized)}"
+
+    manager = CompactingConversationManager(
+        token_budget=1000, summarizer=summarizer, compaction_threshold=80, preserve_recent_messages=2,
+        token_counter=lambda m: 10,
+    )
+    agent = SimpleNamespace(messages=conversation(10))
+
+    manager.apply_management(agent)
+    # nothing is trimmed while the summary is being written
+    assert len(agent.messages) == 10
+    await asyncio.sleep(0)
+
+    assert manager.apply_summary(agent)
+    assert summarized == [["0", "1", "2", "3", "4", "5", "6"]]
+    assert agent.messages[0]["content"][0]["text"].endswith("summary 1")
+    assert [m["content"][0]["text"] for m in agent.messages[1:]] == ["7", "8", "9"]
+    assert manager.removed_message_count == 7
+
+    # the next compaction folds the previous summary in instead of re-reading its messages
+    agent.messages.extend(conversation(16)[10:])
+    manager.apply_management(agent)
+    await asyncio.sleep(0)
+    manager.apply_summary(agent)
+    assert summarized[1][0].endswith("summary 1")
+    assert manager.removed_message_count == 7 + len(summarized[1]) - 1
+
+    restored = CompactingConversationManager(token_budget=1000, summarizer=summarizer)
+    assert restored.restore_from_session(manager.get_state()) == [agent.messages[0]]
+    assert restored.removed_message_count == manager.removed_message_count
+
+
+@pytest.mark.asyncio
+async def test_compaction_is_dropped_when_the_span_was_trimmed_meanwhile():
+    release = asyncio.Event()
+
+    async def summarizer(messages):
+        await release.wait()
+        return "late summary"
+
+    manager = CompactingConversationManager(
+        token_budget=1000, summarizer=summarizer, compaction_threshold=80, preserve_recent_messages=2,
+        token_counter=lambda m: 10,
+    )
+    agent = SimpleNamespace(messages=conversation(10))
+    manager.apply_management(agent)
+
+    del agent.messages[:8]
+    release.set()
+    await asyncio.sleep(0)
+
+    assert not manager.apply_summary(agent)
+    assert manager.get_state()["summary_message"] is None
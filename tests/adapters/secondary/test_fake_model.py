@@ -0,0 +1,71 @@
+import json
+
+import pytest
+
+from adapters.secondary.chat.fake_model import FakeModel
+
+TOOLS = [{"name": "search"}, {"name": "fetch"}]
+
+
+def prompt(text):
+    return {"role": "user", "content": [{"text": text}]}
+
+
+def tool_round(name):
+    return [
+        {"role": "assistant", "content": [{"toolUse": {"toolUseId": "t", "name": name, "input": {}}}]},
+        {"role": "user", "content": [{"toolResult": {"toolUseId": "t", "content": []}}]},
+    ]
+
+
+async def collect(model, messages, tool_specs=None):
+    return [event async for event in model.stream(messages, tool_specs)]
+
+
+@pytest.mark.asyncio
+async def test_streams_the_answer_token_by_token():
+    model = FakeModel(text="one two three", latency=0, tokens_per_second=1000)
+
+    events = await collect(model, [prompt("hi")])
+
+    texts = [e["contentBlockDelta"]["delta"]["text"] for e in events if "contentBlockDelta" in e]
+    assert texts == ["one ", "two ", "three"]
+    assert events[-1]["metadata"]["usage"]["outputTokens"] == 3
+    assert model.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_asks_for_the_offered_tools_in_turn_before_answering():
+    model = FakeModel(text="done", latency=0, tool_calls_per_turn=2, tool_input={"q": "x"})
+    history = [prompt("earlier"), *tool_round("search"), {"role": "assistant", "content": [{"text": "ok"}]}]
+
+    first = await collect(model, [*history, prompt("now")], TOOLS)
+    second = await collect(model, [*history, prompt("now"), *tool_round("search")], TOOLS)
+    third = await collect(model, [*history, prompt("now"), *tool_round("search"), *tool_round("fetch")], TOOLS)
+
+    assert first[1]["contentBlockStart"]["start"]["toolUse"]["name"] == "search"
+    assert json.loads(first[2]["contentBlockDelta"]["delta"]["toolUse"]["input"]) == {"q": "x"}
+    assert first[4]["messageStop"]["stopReason"] == "tool_use"
+    # tool calls of earlier turns do not count
+    assert second[1]["contentBlockStart"]["start"]["toolUse"]["name"] == "fetch"
+    assert third[-2]["messageStop"]["stopReason"] == "end_turn"
+
+
+@pytest.mark.asyncio
+async def test_asks_for_several_tools_at_once():
+    model = FakeModel(text="done", latency=0, tool_calls_per_turn=1, parallel_tool_calls=3)
+
+    events = await collect(model, [prompt("now")], TOOLS)
+
+    names = [e["contentBlockStart"]["start"]["toolUse"]["name"] for e in events if "contentBlockStart" in e]
+    assert names == ["search", "fetch", "search"]
+    assert events[-2]["messageStop"]["stopReason"] == "tool_use"
+
+
+@pytest.mark.asyncio
+async def test_answers_directly_without_tools():
+    model = FakeModel(text="done", latency=0, tool_calls_per_turn=1)
+
+    events = await collect(model, [prompt("hi")])
+
+    assert events[-2]["messageStop"]["stopReason"] == "end_turn"
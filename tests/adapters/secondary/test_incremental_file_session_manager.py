@@ -0,0 +1,55 @@
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from types import SimpleNamespace
+from typing import Any, Dict
+
+from adapters.secondary.session.incremental_file_session_manager import IncrementalFileSessionManager
+
+
+@dataclass
+class FakeSessionAgent:
+    agent_id: str
+    state: Dict[str, Any] = field(default_factory=dict)
+    created_at: str = "2025-01-01T00:00:00"
+    updated_at: str = "2025-01-01T00:00:00"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def read_agent_file(manager: IncrementalFileSessionManager, agent_id: str) -> Dict[str, Any]:
+    path = os.path.join(manager._get_agent_path(manager.session_id, agent_id), "agent.json")
+    with open(path) as f:
+        return json.load(f)
+
+
+def test_update_agent_skips_unchanged_state(tmp_path):
+    manager = IncrementalFileSessionManager(session_id="s1", storage_dir=str(tmp_path))
+    manager.create_agent("s1", FakeSessionAgent(agent_id="default"))
+
+    manager.update_agent("s1", FakeSessionAgent(agent_id="default", updated_at="2025-01-02T00:00:00"))
+    assert not os.path.exists(os.path.join(manager._get_agent_path("s1", "default"), "agent.json"))
+
+    manager.update_agent(
+        "s1", FakeSessionAgent(agent_id="default", state={"k": "v"}, created_at="ignored")
+    )
+    persisted = read_agent_file(manager, "default")
+    assert persisted["state"] == {"k": "v"}
+    assert persisted["created_at"] == "2025-01-01T00:00:00"
+
+
+def test_update_agent_falls_back_when_agent_unknown(tmp_path):
+    manager = IncrementalFileSessionManager(session_id="s1", storage_dir=str(tmp_path))
+
+    manager.update_agent("s1", FakeSessionAgent(agent_id="restored", state={"a": 1}))
+    manager.update_agent("s1", FakeSessionAgent(agent_id="restored", state={"a": 1}))
+
+    # the first update goes through the base read-modify-write, the identical second one is skipped
+    assert len(manager.agent_updates) == 1
+
+
+def test_agent_can_be_reattached_after_eviction(tmp_path):
+    manager = IncrementalFileSessionManager(session_id="s1", storage_dir=str(tmp_path))
+    manager.initialize(SimpleNamespace(agent_id="default"))
+    manager.initialize(SimpleNamespace(agent_id="default"))
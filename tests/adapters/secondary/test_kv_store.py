@@ -0,0 +1,72 @@
+import sqlite3
+
+import pytest
+
+from adapters.secondary.session.in_memory_kv_store import InMemoryKeyValueStore
+from adapters.secondary.session.sqlite_kv_store import SQLiteKeyValueStore
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "sqlite":
+        kv = SQLiteKeyValueStore(str(tmp_path / "kv.db"), pool_size=2)
+    else:
+        kv = InMemoryKeyValueStore()
+    yield kv
+    kv.close()
+
+
+def test_put_get_delete(store):
+    assert store.get("a") is None
+
+    store.put("a", "1")
+    store.put("a", "2")
+    assert store.get("a") == "2"
+
+    store.delete("a")
+    store.delete("a")
+    assert store.get("a") is None
+
+
+def test_compare_and_set(store):
+    assert store.compare_and_set("a", None, "1")
+    assert not store.compare_and_set("a", None, "2")
+    assert not store.compare_and_set("a", "0", "2")
+    assert store.compare_and_set("a", "1", "2")
+    assert store.get("a") == "2"
+    assert [key for key, _ in store.scan("")] == ["a"]
+
+
+def test_scan_and_delete_prefix_are_ordered_and_scoped(store):
+    for key in ["s/1/m/0002", "s/1/m/0001", "s/10/m/0001", "s/2/m/0001"]:
+        store.put(key, key)
+
+    assert [key for key, _ in store.scan("s/1/")] == ["s/1/m/0001", "s/1/m/0002"]
+
+    store.delete_prefix("s/1/")
+    assert store.scan("s/1/") == []
+    assert store.get("s/10/m/0001") == "s/10/m/0001"
+
+
+def test_sqlite_store_is_shared_between_instances(tmp_path):
+    path = str(tmp_path / "kv.db")
+    writer = SQLiteKeyValueStore(path)
+    reader = SQLiteKeyValueStore(path)
+
+    writer.put("k", "v")
+    assert reader.get("k") == "v"
+
+    writer.close()
+    reader.close()
+
+
+def test_sqlite_checkout_times_out_when_the_pool_is_exhausted(tmp_path):
+    store = SQLiteKeyValueStore(str(tmp_path / "kv.db"), pool_size=1, checkout_timeout=0.01)
+    with store._connection():
+        with pytest.raises(TimeoutError):
+            store.get("a")
+    assert store.get("a") is None
+
+    store.close()
+    with pytest.raises(sqlite3.ProgrammingError):
+        store.get("a")
@@ -0,0 +1,196 @@
+import asyncio
+import threading
+
+import pytest
+
+import adapters.secondary.chat.strands_mcp_agent_adapter as adapter_module
+
+from adapters.secondary.chat.mcp_client_pool import CircuitBreaker, CircuitState, MCPClientPool
+from ports.mcp import MCPCircuitBreakerConfig, MCPConfig, MCPPoolConfig, StdioMCPConfig
+from conftest import DummyMCPAgentTool, DummyMCPClient, DummyMCPTool
+
+
+class FakeClient(DummyMCPClient):
+    def __init__(self, fail_start: bool = False, delay: float = 0):
+        super().__init__()
+        self.fail_start = fail_start
+        self.delay = delay
+        self.calls = 0
+        self.broken = False
+
+    def start(self):
+        if self.fail_start:
+            raise RuntimeError("connection refused")
+        super().start()
+
+    def list_tools_sync(self, pagination_token=None):
+        if self.broken:
+            raise RuntimeError("session closed")
+        return []
+
+    async def call_tool_async(self, tool_use_id, name, arguments=None, read_timeout_seconds=None):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.broken:
+            return {"status": "error", "toolUseId": tool_use_id, "content": [{"text": "Tool execution failed: eof"}]}
+        return {"status": "success", "toolUseId": tool_use_id, "content": [{"text": "ok"}]}
+
+
+def test_circuit_breaker_opens_half_opens_and_closes():
+    now = [0.0]
+    changes = []
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, on_change=changes.append, clock=lambda: now[0])
+
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert not breaker.allow()
+
+    now[0] = 10
+    assert breaker.state == CircuitState.HALF_OPEN
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+
+    now[0] = 20
+    assert breaker.allow()
+    breaker.record_success()
+    assert changes == [
+        CircuitState.OPEN,
+        CircuitState.HALF_OPEN,
+        CircuitState.OPEN,
+        CircuitState.HALF_OPEN,
+        CircuitState.CLOSED,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_calls_are_spread_over_connections():
+    clients = [FakeClient(delay=0.02) for _ in range(3)]
+    factory = iter(clients[1:])
+    pool = MCPClientPool("srv", clients[0], factory=lambda: next(factory), pool_config=MCPPoolConfig(size=3))
+    pool.start()
+
+    await asyncio.gather(*(pool.call_tool_async(f"t{i}", "search") for i in range(6)))
+
+    assert [client.calls for client in clients] == [2, 2, 2]
+
+
+@pytest.mark.asyncio
+async def test_broken_connection_is_replaced_and_breaker_trips():
+    now = [0.0]
+    first, replacement = FakeClient(), FakeClient()
+    changes = []
+    pool = MCPClientPool(
+        "srv",
+        first,
+        factory=lambda: replacement,
+        breaker_config=MCPCircuitBreakerConfig(failureThreshold=2, resetTimeout=5),
+        on_circuit_change=lambda name, state: changes.append((name, state)),
+        clock=lambda: now[0],
+    )
+    pool.start()
+
+    first.broken = True
+    await pool.call_tool_async("t1", "search")
+    result = await pool.call_tool_async("t2", "search")
+    assert "no healthy connection" in result["content"][0]["text"]
+    assert not pool.available
+    assert changes == [("srv", CircuitState.OPEN)]
+
+    # reconnect happens in the background; the breaker closes once the reset timeout has passed
+    now[0] = 5
+    await pool.check_health()
+    assert pool.members[0].client is replacement
+    assert first.stopped is True
+    assert pool.available
+    assert changes[-1] == ("srv", CircuitState.CLOSED)
+    assert (await pool.call_tool_async("t3", "search"))["status"] == "success"
+
+
+@pytest.mark.asyncio
+async def test_failed_reconnects_back_off_exponentially():
+    now = [0.0]
+    pool = MCPClientPool(
+        "srv",
+        FakeClient(fail_start=True),
+        pool_config=MCPPoolConfig(reconnectBackoff=1, maxReconnectBackoff=4),
+        clock=lambda: now[0],
+    )
+    with pytest.raises(RuntimeError):
+        pool.start()
+
+    member = pool.members[0]
+    backoffs = [member.backoff]
+    for _ in range(3):
+        now[0] = member.retry_at
+        await pool.check_health()
+        backoffs.append(member.backoff)
+    assert backoffs == [1, 2, 4, 4]
+
+
+@pytest.mark.asyncio
+async def test_pool_that_failed_to_start_keeps_reconnecting():
+    now = [0.0]
+    client = FakeClient(fail_start=True)
+    connected = []
+    pool = MCPClientPool("srv", client, on_connected=connected.append, clock=lambda: now[0])
+    with pytest.raises(RuntimeError):
+        pool.start()
+
+    client.fail_start = False
+    now[0] = pool.members[0].retry_at
+    await pool.check_health()
+    assert pool.members[0].healthy
+    assert connected == ["srv"]
+
+    # already connected: no second notification
+    await pool.check_health()
+    assert connected == ["srv"]
+
+
+@pytest.mark.asyncio
+async def test_hung_probes_do_not_pile_up():
+    release = threading.Event()
+
+    class HangingClient(FakeClient):
+        probes = 0
+
+        def list_tools_sync(self, pagination_token=None):
+            HangingClient.probes += 1
+            release.wait()
+            return []
+
+    pool = MCPClientPool("srv", HangingClient(), pool_config=MCPPoolConfig(probeTimeout=0.01))
+    pool.start()
+    for _ in range(4):
+        await pool.check_health()
+
+    assert HangingClient.probes == 1
+    release.set()
+    pool.stop()
+
+
+@pytest.mark.asyncio
+async def test_server_down_at_boot_is_attached_once_it_connects(monkeypatch):
+    client = FakeClient(fail_start=True)
+    config = MCPConfig(mcpServers={"srv": StdioMCPConfig(command="server", args=[])})
+    monkeypatch.setattr(adapter_module, "initialize_mcp_clients", lambda cfg: {"srv": client})
+    monkeypatch.setattr(
+        adapter_module, "load_mcp_tools", lambda clients: [DummyMCPAgentTool(DummyMCPTool("search"), client)]
+    )
+
+    adapter = adapter_module.StrandsMCPAgentAdapter(model_id="m")
+    await adapter.configure_mcp(config)
+    await adapter.mcp_startup._tasks["srv"]
+    assert adapter.mcp_tools == []
+    assert "srv" in adapter.mcp_pool_stats()
+
+    pool = adapter._recovering_clients["srv"]
+    client.fail_start = False
+    pool.members[0].retry_at = 0
+    await pool.check_health()
+    await asyncio.gather(*adapter._recovery_tasks)
+
+    assert [tool.tool_name for tool in adapter.mcp_tools] == ["search"]
+    assert adapter.mcp_clients["srv"] is pool
+    adapter.cleanup()
@@ -0,0 +1,69 @@
+import asyncio
+import threading
+
+import pytest
+
+from adapters.secondary.chat.mcp_startup import MCPStartup
+from conftest import DummyMCPClient
+
+
+class GatedClient(DummyMCPClient):
+    def __init__(self, name: str, fail: bool = False):
+        super().__init__()
+        self.name = name
+        self.fail = fail
+        self.gate = threading.Event()
+
+
+def connect(server_name, client):
+    client.gate.wait(timeout=5)
+    if client.fail:
+        raise RuntimeError("boom")
+    client.start()
+    return [f"{server_name}-tool"]
+
+
+@pytest.mark.asyncio
+async def test_quorum_returns_before_slow_servers_and_late_tools_attach():
+    ready = {}
+    fast, slow = GatedClient("fast"), GatedClient("slow")
+    startup = MCPStartup(connect=connect, on_ready=lambda name, client, tools: ready.update({name: tools}))
+
+    startup.start({"fast": fast, "slow": slow}, {"fast": 5, "slow": 5}, quorum=1)
+    fast.gate.set()
+    await asyncio.wait_for(startup.wait_for_quorum(), 1)
+
+    assert ready == {"fast": ["fast-tool"]}
+    assert startup.pending() == ["slow"]
+
+    slow.gate.set()
+    for _ in range(100):
+        if not startup.pending():
+            break
+        await asyncio.sleep(0.01)
+    assert ready["slow"] == ["slow-tool"]
+
+
+@pytest.mark.asyncio
+async def test_failed_and_timed_out_servers_do_not_block_startup():
+    failed = []
+    broken, hanging = GatedClient("broken", fail=True), GatedClient("hanging")
+    startup = MCPStartup(
+        connect=connect,
+        on_ready=lambda name, client, tools: None,
+        on_failed=failed.append,
+    )
+
+    broken.gate.set()
+    startup.start({"broken": broken, "hanging": hanging}, {"broken": 5, "hanging": 0.05})
+    await asyncio.wait_for(startup.wait_for_quorum(), 1)
+
+    assert sorted(failed) == ["broken", "hanging"]
+
+    # the abandoned client is closed once it finally connects
+    hanging.gate.set()
+    for _ in range(100):
+        if hanging.stopped:
+            break
+        await asyncio.sleep(0.01)
+    assert hanging.started and hanging.stopped
@@ -0,0 +1,107 @@
+import json
+
+import pytest
+
+import adapters.secondary.chat.strands_mcp_agent_adapter as adapter_module
+from adapters.secondary.chat.mcp_tool_catalog import MCPToolCatalog, build_tools, tool_definitions
+from adapters.secondary.chat.tool_registry import SharedToolRegistry
+from ports.mcp import MCPConfig, StdioMCPConfig
+from conftest import DummyMCPAgentTool, DummyMCPClient, DummyMCPTool, DummyRepositorySessionManager
+
+
+def make_tool(name: str, client=None):
+    return DummyMCPAgentTool(DummyMCPTool(name, f"{name} tool", {"type": "object"}), client)
+
+
+def server_config(command: str = "server"):
+    return StdioMCPConfig(command=command, args=[])
+
+
+def test_catalog_round_trip_is_invalidated_by_config_change(tmp_path):
+    catalog = MCPToolCatalog(str(tmp_path))
+    definitions = tool_definitions([make_tool("search")])
+
+    assert catalog.load("srv", server_config()) is None
+    catalog.store("srv", server_config(), definitions)
+
+    assert catalog.load("srv", server_config()) == definitions
+    assert catalog.load("srv", server_config("other-server")) is None
+
+    client = DummyMCPClient()
+    [tool] = build_tools(definitions, client)
+    assert tool.tool_name == "search"
+    assert tool.mcp_client is client
+
+
+
+def test_malformed_catalog_entry_is_ignored(tmp_path):
+    catalog = MCPToolCatalog(str(tmp_path))
+    catalog.store("srv", server_config(), tool_definitions([make_tool("search")]))
+    [entry_path] = tmp_path.iterdir()
+
+    entry = json.loads(entry_path.read_text())
+    del entry["tools"]
+    entry_path.write_text(json.dumps(entry))
+    assert catalog.load("srv", server_config()) is None
+
+    entry["tools"] = [{"description": "no name"}]
+    entry_path.write_text(json.dumps(entry))
+    assert catalog.load("srv", server_config()) is None
+
+def test_shared_registry_builds_tool_config_once():
+    registry = SharedToolRegistry([make_tool("a")])
+
+    registry.get_all_tools_config()
+    registry.get_all_tools_config()
+    assert registry.config_builds == 1
+
+    registry.register_tool(make_tool("b"))
+    assert set(registry.get_all_tools_config()) == {"a", "b"}
+    assert registry.config_builds == 2
+
+
+@pytest.mark.asyncio
+async def test_cached_tools_are_served_before_connect_and_refreshed_on_change(tmp_path, monkeypatch):
+    config = MCPConfig(mcpServers={"srv": server_config()})
+    MCPToolCatalog(str(tmp_path)).store("srv", config.mcpServers["srv"], tool_definitions([make_tool("old")]))
+
+    client = DummyMCPClient()
+    monkeypatch.setattr(adapter_module, "initialize_mcp_clients", lambda cfg: {"srv": client})
+    monkeypatch.setattr(adapter_module, "load_mcp_tools", lambda clients: [make_tool("new", client)])
+
+    adapter = adapter_module.StrandsMCPAgentAdapter(
+        model_id="m", mcp_startup_quorum=1, mcp_tool_catalog_path=str(tmp_path)
+    )
+    await adapter.configure_mcp(config)
+
+    # the cached server satisfies the quorum, so tools are available before it connects
+    assert [tool.tool_name for tool in adapter.mcp_tools] == ["old"]
+
+    await adapter.mcp_startup._tasks["srv"]
+    assert [tool.tool_name for tool in adapter.mcp_tools] == ["new"]
+    assert [d["name"] for d in MCPToolCatalog(str(tmp_path)).load("srv", config.mcpServers["srv"])] == ["new"]
+
+    first = adapter._get_or_create_agent(DummyRepositorySessionManager("s1"))
+    second = adapter._get_or_create_agent(DummyRepositorySessionManager("s2"))
+    assert first.tool_registry is second.tool_registry
+    adapter.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_unchanged_tool_list_keeps_cached_tools(tmp_path, monkeypatch):
+    config = MCPConfig(mcpServers={"srv": server_config()})
+    catalog = MCPToolCatalog(str(tmp_path))
+    catalog.store("srv", config.mcpServers["srv"], tool_definitions([make_tool("search")]))
+
+    client = DummyMCPClient()
+    monkeypatch.setattr(adapter_module, "initialize_mcp_clients", lambda cfg: {"srv": client})
+    monkeypatch.setattr(adapter_module, "load_mcp_tools", lambda clients: [make_tool("search", client)])
+
+    adapter = adapter_module.StrandsMCPAgentAdapter(model_id="m", mcp_tool_catalog_path=str(tmp_path))
+    await adapter.configure_mcp(config)
+    cached_tools = list(adapter.mcp_tools)
+
+    await adapter.mcp_startup._tasks["srv"]
+    assert adapter.mcp_tools == cached_tools
+    assert client.started is True
+    adapter.cleanup()
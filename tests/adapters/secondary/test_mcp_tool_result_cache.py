@@ -0,0 +1,125 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from adapters.secondary.chat.mcp_tool_result_cache import (
+    CachedMCPAgentTool,
+    ToolResultCache,
+    canonical_arguments,
+    wrap_cached_tools,
+)
+from ports.mcp import MCPToolCacheConfig
+from conftest import DummyMCPAgentTool, DummyMCPTool
+
+
+class CountingClient:
+    def __init__(self, status: str = "success", delay: float = 0):
+        self.calls = 0
+        self.status = status
+        self.delay = delay
+
+    async def call_tool_async(self, tool_use_id, name, arguments=None):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return {"status": self.status, "toolUseId": tool_use_id, "content": [{"text": f"{name}:{arguments}"}]}
+
+
+def make_tool(client, cache, **config):
+    tool = DummyMCPAgentTool(DummyMCPTool("search", inputSchema={"type": "object"}), client)
+    [wrapped] = wrap_cached_tools("docs", [tool], cache, {"search": MCPToolCacheConfig(**config)})
+    return wrapped
+
+
+async def call(tool, tool_use_id, arguments):
+    return [event async for event in tool.stream({"toolUseId": tool_use_id, "input": arguments}, {})][-1]
+
+
+def test_canonical_arguments_ignore_key_order_and_nulls():
+    assert canonical_arguments({"b": 1.0, "a": {"y": None, "x": [1, 2]}}) == canonical_arguments(
+        {"a": {"x": [1, 2]}, "b": 1}
+    )
+
+
+@pytest.mark.asyncio
+async def test_cached_result_is_reused_with_callers_tool_use_id():
+    client, cache = CountingClient(), ToolResultCache()
+    tool = make_tool(client, cache)
+    assert isinstance(tool, CachedMCPAgentTool)
+
+    first = await call(tool, "t1", {"q": "s3", "limit": None})
+    second = await call(tool, "t2", {"q": "s3"})
+
+    assert client.calls == 1
+    assert second["toolUseId"] == "t2"
+    assert second["content"] == first["content"]
+    stats = cache.stats()["docs/search"]
+    assert (stats.hits, stats.misses, stats.hit_rate) == (1, 1, 0.5)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_calls_share_one_request():
+    client, cache = CountingClient(delay=0.05), ToolResultCache()
+    tool = make_tool(client, cache)
+
+    results = await asyncio.gather(*(call(tool, f"t{i}", {"q": "lambda"}) for i in range(5)))
+
+    assert client.calls == 1
+    assert [r["toolUseId"] for r in results] == [f"t{i}" for i in range(5)]
+    assert cache.stats()["docs/search"].coalesced == 4
+
+
+@pytest.mark.asyncio
+async def test_errors_and_oversized_results_are_not_cached():
+    client, cache = CountingClient(status="error"), ToolResultCache()
+    tool = make_tool(client, cache)
+    await call(tool, "t1", {"q": "x"})
+    await call(tool, "t2", {"q": "x"})
+    assert client.calls == 2
+
+    client, cache = CountingClient(), ToolResultCache()
+    tool = make_tool(client, cache, maxBytes=10)
+    await call(tool, "t1", {"q": "x"})
+    await call(tool, "t2", {"q": "x"})
+    assert client.calls == 2
+    assert cache.stats()["docs/search"].uncacheable == 2
+
+
+def test_entries_expire_and_spill_to_disk(tmp_path):
+    now = [0.0]
+    cache = ToolResultCache(max_bytes=10, spill_path=str(tmp_path), clock=lambda: now[0])
+
+    cache.put("a", "aaaaaaaa", ttl=5)
+    cache.put("b", "bbbbbbbb", ttl=5)
+
+    # "a" no longer fits in memory but is promoted back from disk
+    assert len(list(Path(cache.spill_path).iterdir())) == 1
+    assert cache.get("a") == "aaaaaaaa"
+    assert cache.get("b") == "bbbbbbbb"
+
+    now[0] = 6
+    assert cache.get("b") is None
+    assert cache.get("a") is None
+
+
+def test_spill_directory_is_private_to_the_process(tmp_path):
+    unrelated = tmp_path / "notes.txt"
+    unrelated.write_text("keep")
+    other_worker = tmp_path / "worker-0"
+    other_worker.mkdir()
+    (other_worker / ("0" * 64)).write_text("{}")
+
+    cache = ToolResultCache(max_bytes=10, spill_path=str(tmp_path))
+    cache.put("a", "aaaaaaaa", ttl=5)
+    cache.put("b", "bbbbbbbb", ttl=5)
+    assert Path(cache.spill_path).parent == tmp_path
+
+    cache.clear()
+    assert not Path(cache.spill_path).exists()
+    assert unrelated.read_text() == "keep"
+    assert (other_worker / ("0" * 64)).exists()
+
+
+def test_tools_without_cache_config_are_left_alone():
+    tool = DummyMCPAgentTool(DummyMCPTool("write"), CountingClient())
+    assert wrap_cached_tools("docs", [tool], ToolResultCache(), {"search": MCPToolCacheConfig()}) == [tool]
@@ -0,0 +1,102 @@
+import pytest
+
+from adapters.secondary.chat.model_router import ModelRouter, ModelSpec, RoutingStrategy
+from ports.chat import UnknownModelError
+
+
+class FakeModel:
+    def __init__(self, text, stop_reason="end_turn"):
+        self.text = text
+        self.stop_reason = stop_reason
+        self.calls = 0
+
+    async def stream(self, messages, tool_specs=None, system_prompt=None, **kwargs):
+        self.calls += 1
+        yield {"contentBlockDelta": {"delta": {"text": self.text}}}
+        yield {"messageStop": {"stopReason": self.stop_reason}}
+        yield {"metadata": {"usage": {"inputTokens": 1000, "outputTokens": 100, "totalTokens": 1100}}}
+
+
+def prompt(text):
+    return [{"role": "user", "content": [{"text": text}]}]
+
+
+def create_router(fast, default, **kwargs):
+    return ModelRouter(
+        {"default": default, "fast": fast},
+        {"default": ModelSpec("big", input_cost=0.003), "fast": ModelSpec("small", input_cost=0.001)},
+        strategy=RoutingStrategy.CASCADE,
+        fast_model="fast",
+        simple_prompt_chars=20,
+        **kwargs,
+    )
+
+
+async def texts(router, messages):
+    return [e["contentBlockDelta"]["delta"]["text"] async for e in router.stream(messages) if "contentBlockDelta" in e]
+
+
+@pytest.mark.asyncio
+async def test_cascade_keeps_the_fast_answer_for_simple_prompts():
+    fast, default = FakeModel("quick"), FakeModel("thorough")
+    router = create_router(fast, default)
+
+    assert await texts(router, prompt("hi")) == ["quick"]
+    assert await texts(router, prompt("a much longer question than the limit")) == ["thorough"]
+
+    stats = router.stats()
+    assert stats["fast"].calls == 1
+    assert stats["default"].calls == 1
+    assert stats["fast"].cost == pytest.approx(0.001)
+    assert stats["default"].cost == pytest.approx(0.003)
+
+
+@pytest.mark.asyncio
+async def test_cascade_escalates_when_the_fast_model_needs_tools():
+    fast, default = FakeModel("", stop_reason="tool_use"), FakeModel("thorough")
+    router = create_router(fast, default)
+
+    assert await texts(router, prompt("hi")) == ["thorough"]
+    assert fast.calls == 1
+    assert router.stats()["fast"].escalations == 1
+
+
+@pytest.mark.asyncio
+async def test_requested_model_is_used_for_the_whole_turn():
+    fast, default = FakeModel("quick"), FakeModel("thorough")
+    router = create_router(fast, default)
+
+    router.start_turn("default")
+    assert await texts(router, prompt("hi")) == ["thorough"]
+    router.end_turn()
+    assert fast.calls == 0
+
+    with pytest.raises(UnknownModelError):
+        router.start_turn("missing")
+
+
+@pytest.mark.asyncio
+async def test_model_calls_are_traced_with_time_to_first_token(recorded_telemetry):
+    now = [0.0]
+
+    class SlowModel(FakeModel):
+        async def stream(self, messages, tool_specs=None, system_prompt=None, **kwargs):
+            now[0] += 0.4
+            async for event in super().stream(messages, tool_specs, system_prompt, **kwargs):
+                yield event
+                now[0] += 0.1
+
+    router = create_router(FakeModel("quick"), SlowModel("thorough"), clock=lambda: now[0])
+    router.start_turn("default")
+    assert await texts(router, prompt("hi")) == ["thorough"]
+
+    (span,) = recorded_telemetry.spans.get_finished_spans()
+    assert span.name == "model.call"
+    assert span.attributes["model.name"] == "default"
+    assert span.attributes["model.id"] == "big"
+    assert span.attributes["model.time_to_first_token"] == pytest.approx(0.4)
+    assert span.attributes["model.tokens.output"] == 100
+
+    text = recorded_telemetry.telemetry.render_prometheus()
+    assert 'model_time_to_first_token_seconds_count{model_name="default"} 1' in text
+    assert 'model_tokens_sum{model_name="default",token_type="input"} 1000' in text
@@ -0,0 +1,79 @@
+import asyncio
+
+import pytest
+
+from adapters.secondary.chat.fake_model import FakeModel
+from adapters.secondary.chat.model_scheduler import ModelCallScheduler, ScheduledModel
+from ports.chat.dto import TurnPriority
+
+
+@pytest.mark.asyncio
+async def test_interactive_calls_are_admitted_before_batch():
+    scheduler = ModelCallScheduler(max_concurrency=1)
+    await scheduler.acquire("a")
+    admitted = []
+
+    async def call(user, priority):
+        await scheduler.acquire(user, priority)
+        admitted.append(user)
+
+    batch = asyncio.create_task(call("batch", TurnPriority.BATCH))
+    interactive = asyncio.create_task(call("interactive", TurnPriority.INTERACTIVE))
+    await asyncio.sleep(0)
+    assert scheduler.stats().queued == 2
+
+    scheduler.release("a")
+    await interactive
+    assert admitted == ["interactive"]
+    scheduler.release("interactive")
+    await batch
+    assert admitted == ["interactive", "batch"]
+
+
+@pytest.mark.asyncio
+async def test_a_user_at_its_cap_does_not_block_others():
+    scheduler = ModelCallScheduler(max_concurrency=4, per_user_concurrency=1)
+    await scheduler.acquire("a")
+
+    second = asyncio.create_task(scheduler.acquire("a"))
+    await scheduler.acquire("b")
+    await asyncio.sleep(0)
+    assert not second.done()
+
+    scheduler.release("a")
+    await second
+    assert scheduler.stats().in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_gives_up_its_place():
+    scheduler = ModelCallScheduler(max_concurrency=1)
+    await scheduler.acquire("a")
+    waiter = asyncio.create_task(scheduler.acquire("b"))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    scheduler.release("a")
+    assert scheduler.stats().in_flight == 0
+    assert scheduler.stats().queued == 0
+
+
+@pytest.mark.asyncio
+async def test_throttling_lowers_the_limit_and_calls_are_retried():
+    fake = FakeModel(text="hello", latency=0.01, capacity=2)
+    scheduler = ModelCallScheduler(max_concurrency=8)
+    model = ScheduledModel(fake, scheduler, max_retries=5, retry_delay=0)
+
+    async def call():
+        return [event async for event in model.stream([{"role": "user", "content": [{"text": "hi"}]}])]
+
+    results = await asyncio.gather(*(call() for _ in range(8)))
+
+    assert all(events[1] == {"contentBlockDelta": {"delta": {"text": "hello"}}} for events in results)
+    stats = scheduler.stats()
+    assert fake.throttled > 0
+    assert stats.throttled == fake.throttled
+    assert stats.limit < 8
+    assert stats.in_flight == 0
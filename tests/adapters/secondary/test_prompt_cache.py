@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+
+from adapters.secondary.chat.prompt_cache import (
+    TokenUsageMetrics,
+    UsageTrackingBedrockModel,
+    place_cache_checkpoint,
+    prefix_fingerprint,
+)
+from conftest import DummyBedrockModel
+
+
+class DummyTool:
+    def __init__(self, name):
+        self.tool_name = name
+        self.tool_spec = {"name": name, "description": name, "inputSchema": {"json": {}}}
+
+
+def test_cache_checkpoint_moves_to_the_end_of_the_history():
+    messages = [
+        {"role": "user", "content": [{"text": "hi"}]},
+        {"role": "assistant", "content": [{"text": "hello"}]},
+    ]
+    place_cache_checkpoint(messages)
+    assert messages[1]["content"] == [{"text": "hello"}, {"cachePoint": {"type": "default"}}]
+
+    messages.append({"role": "user", "content": [{"text": "more"}]})
+    messages.append({"role": "assistant", "content": [{"text": "sure"}]})
+    place_cache_checkpoint(messages)
+
+    checkpoints = [i for i, m in enumerate(messages) for block in m["content"] if "cachePoint" in block]
+    assert checkpoints == [3]
+    assert messages[1]["content"] == [{"text": "hello"}]
+
+
+def test_prefix_fingerprint_depends_on_tool_specs():
+    tools = [DummyTool("a"), DummyTool("b")]
+    assert prefix_fingerprint("m", "prompt", tools) == prefix_fingerprint("m", "prompt", list(tools))
+    assert prefix_fingerprint("m", "prompt", tools) != prefix_fingerprint("m", "prompt", tools[::-1])
+    assert prefix_fingerprint("m", "prompt", tools) != prefix_fingerprint("m", "other", tools)
+
+
+@pytest.mark.asyncio
+async def test_usage_is_recorded_per_turn_and_in_total(monkeypatch):
+    async def stream(self, messages, tool_specs=None, system_prompt=None, **kwargs):
+        yield {"contentBlockDelta": {"delta": {"text": "hi"}}}
+        yield {
+            "metadata": {
+                "usage": {
+                    "inputTokens": 10,
+                    "outputTokens": 5,
+                    "totalTokens": 15,
+                    "cacheReadInputTokens": 30,
+                    "cacheWriteInputTokens": 0 if messages else 60,
+                }
+            }
+        }
+
+    monkeypatch.setattr(DummyBedrockModel, "stream", stream, raising=False)
+    usage = TokenUsageMetrics()
+    model = UsageTrackingBedrockModel(usage, model_id="m")
+
+    async def turn(messages):
+        current = usage.start_turn()
+        events = [event async for event in model.stream(messages)]
+        usage.end_turn()
+        return current, events
+
+    (first, events), (second, _) = await asyncio.gather(turn([]), turn([{"role": "user"}]))
+
+    assert len(events) == 2
+    assert first.cache_write_input_tokens == 60
+    assert second.cache_write_input_tokens == 0
+    assert second.cache_read_input_tokens == 30
+
+    total = usage.stats()
+    assert total.model_calls == 2
+    assert total.input_tokens == 20
+    assert total.cache_read_input_tokens == 60
+    assert total.cache_hit_rate == 60 / (20 + 60 + 60)
+
+
+def test_untracked_usage_is_not_recorded():
+    usage = TokenUsageMetrics()
+    with usage.untracked():
+        usage.record({"inputTokens": 10, "outputTokens": 1})
+    usage.record({"inputTokens": 3})
+
+    total = usage.stats()
+    assert (total.model_calls, total.input_tokens, total.output_tokens) == (1, 3, 0)
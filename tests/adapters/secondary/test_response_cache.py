@@ -0,0 +1,57 @@
+import pytest
+
+from adapters.secondary.chat.response_cache import InMemoryResponseCache, normalize_prompt
+
+
+def test_exact_tier_matches_normalized_prompt_within_scope():
+    cache = InMemoryResponseCache()
+    cache.put("scope", "What is  Amazon S3?", "object storage")
+
+    assert normalize_prompt("  what is amazon s3 ") == "what is amazon s3"
+    assert cache.get("scope", "what is amazon s3") == "object storage"
+    assert cache.get("other-scope", "What is Amazon S3?") is None
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.similar_hits) == (1, 1, 0)
+
+
+def test_entries_expire_and_least_recently_used_is_evicted():
+    now = [0.0]
+    cache = InMemoryResponseCache(max_entries=2, ttl=10, clock=lambda: now[0])
+    cache.put("s", "a", "A")
+    cache.put("s", "b", "B")
+    cache.get("s", "a")
+    cache.put("s", "c", "C")
+
+    assert cache.get("s", "b") is None
+    assert cache.get("s", "a") == "A"
+
+    now[0] = 11
+    assert cache.get("s", "a") is None
+    assert cache.get("s", "c") is None
+
+
+def test_similarity_tier_serves_near_identical_prompts():
+    pytest.importorskip("numpy")
+    cache = InMemoryResponseCache(similarity_threshold=0.85)
+    cache.put("s", "How do I create an S3 bucket with versioning enabled?", "use put-bucket-versioning")
+
+    assert cache.get("s", "how do i create a S3 bucket with versioning enabled") == "use put-bucket-versioning"
+    assert cache.get("s", "What is the capital of France?") is None
+    assert cache.get("other", "How do I create an S3 bucket with versioning enabled") is None
+    assert cache.stats().similar_hits == 1
+
+
+def test_similarity_index_swap_removes_rows():
+    np = pytest.importorskip("numpy")
+    from adapters.secondary.chat.similarity_index import SimilarityIndex
+
+    index = SimilarityIndex(dimensions=2, capacity=1)
+    index.add("x", np.array([1.0, 0.0]))
+    index.add("y", np.array([0.0, 1.0]))
+    index.remove("x")
+
+    assert len(index) == 1
+    key, score = index.nearest(np.array([0.0, 2.0]))
+    assert key == "y"
+    assert score == pytest.approx(1.0)
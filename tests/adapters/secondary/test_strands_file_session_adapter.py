@@ -14,3 +14,30 @@ async def test_create_get_delete_session(tmp_path):
     await adapter.delete_session(session_id)
     with pytest.raises(KeyError):
         await adapter.get_session(session_id)
+
+
+@pytest.mark.asyncio
+async def test_get_session_restores_persisted_session(tmp_path):
+    adapter = StrandsFileSessionAdapter(base_path=str(tmp_path))
+    session_id = await adapter.create_session("user1")
+    (tmp_path / f"session_{session_id}").mkdir()
+
+    # a new process (or worker) only has the session on disk
+    restarted = StrandsFileSessionAdapter(base_path=str(tmp_path))
+    session = await restarted.get_session(session_id)
+    assert session.session_id == session_id
+
+    await restarted.delete_session(session_id)
+    assert not (tmp_path / f"session_{session_id}").exists()
+    with pytest.raises(KeyError):
+        await restarted.get_session(session_id)
+
+
+@pytest.mark.asyncio
+async def test_check_health_fails_when_sessions_cannot_be_written(tmp_path):
+    await StrandsFileSessionAdapter(base_path=str(tmp_path / "sessions")).check_health()
+    assert (tmp_path / "sessions").is_dir()
+
+    (tmp_path / "file").write_text("")
+    with pytest.raises(OSError):
+        await StrandsFileSessionAdapter(base_path=str(tmp_path / "file" / "sessions")).check_health()
@@ -0,0 +1,110 @@
+from types import SimpleNamespace
+
+import pytest
+
+from adapters.secondary.session.in_memory_kv_store import InMemoryKeyValueStore
+from adapters.secondary.session.kv_session_manager import KVSessionManager, KVSessionRepository
+from adapters.secondary.session.sqlite_kv_store import SQLiteKeyValueStore
+from adapters.secondary.session.strands_kv_session_adapter import StrandsKVSessionAdapter
+from ports.session import SessionConflictError
+from strands.types.session import SessionAgent, SessionMessage
+
+
+@pytest.mark.asyncio
+async def test_session_is_visible_from_another_worker(tmp_path):
+    path = str(tmp_path / "sessions.db")
+    worker_a = StrandsKVSessionAdapter(SQLiteKeyValueStore(path))
+    worker_b = StrandsKVSessionAdapter(SQLiteKeyValueStore(path))
+
+    session_id = await worker_a.create_session("user1")
+    session = await worker_b.get_session(session_id)
+    assert session.session_id == session_id
+    assert (await worker_b.get_metadata(session_id))["user_id"] == "user1"
+
+    await worker_a.delete_session(session_id)
+    with pytest.raises(KeyError):
+        await worker_a.get_session(session_id)
+
+    worker_a.cleanup()
+    worker_b.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_metadata_is_cached_until_ttl(tmp_path):
+    now = [0.0]
+    store = SQLiteKeyValueStore(str(tmp_path / "sessions.db"))
+    adapter = StrandsKVSessionAdapter(store, cache_ttl=10, clock=lambda: now[0])
+    session_id = await adapter.create_session("user1")
+
+    store.delete(f"meta/{session_id}")
+    assert await adapter.get_metadata(session_id) is not None
+
+    now[0] = 11
+    assert await adapter.get_metadata(session_id) is None
+    adapter.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_check_health_reads_from_the_store():
+    class BrokenStore(InMemoryKeyValueStore):
+        def get(self, key):
+            raise OSError("store unreachable")
+
+    await StrandsKVSessionAdapter(InMemoryKeyValueStore()).check_health()
+    with pytest.raises(OSError):
+        await StrandsKVSessionAdapter(BrokenStore()).check_health()
+
+
+def test_repository_appends_messages_and_skips_unchanged_agent(tmp_path):
+    store = SQLiteKeyValueStore(str(tmp_path / "sessions.db"))
+    repository = KVSessionRepository(store)
+
+    agent = SessionAgent(agent_id="default", state={}, created_at="t0", updated_at="t0")
+    repository.create_agent("s1", agent)
+    for i in range(3):
+        repository.create_message("s1", "default", SessionMessage(message_id=i, message={"role": "user"}))
+
+    assert [m.message_id for m in repository.list_messages("s1", "default", offset=1)] == [1, 2]
+
+    repository.update_agent("s1", SessionAgent(agent_id="default", state={}, created_at="t1", updated_at="t1"))
+    assert repository.read_agent("s1", "default").updated_at == "t0"  # unchanged: no write
+
+    repository.update_agent("s1", SessionAgent(agent_id="default", state={"k": 1}, created_at="t1", updated_at="t1"))
+    persisted = repository.read_agent("s1", "default")
+    assert persisted.state == {"k": 1}
+    assert persisted.created_at == "t0"
+    store.close()
+
+
+def test_stale_worker_cannot_overwrite_history_written_elsewhere(tmp_path):
+    path = str(tmp_path / "sessions.db")
+    worker_a = KVSessionRepository(SQLiteKeyValueStore(path))
+    worker_b = KVSessionRepository(SQLiteKeyValueStore(path))
+
+    worker_a.create_agent("s1", SessionAgent(agent_id="default", state={}, created_at="t0", updated_at="t0"))
+    for i in range(4):
+        worker_a.create_message("s1", "default", SessionMessage(message_id=i, message={"role": "user"}))
+
+    # worker B serves the next turn of the session
+    worker_b.read_agent("s1", "default")
+    worker_b.create_message("s1", "default", SessionMessage(message_id=4, message={"role": "user", "by": "b"}))
+    worker_b.update_agent("s1", SessionAgent(agent_id="default", state={"by": "b"}, created_at="t1", updated_at="t1"))
+
+    manager = KVSessionManager("s1", worker_a)
+    manager._latest_agent_message["default"] = SessionMessage(message_id=3, message={})
+    assert manager.is_stale(SimpleNamespace(agent_id="default"))
+
+    with pytest.raises(SessionConflictError):
+        worker_a.create_message("s1", "default", SessionMessage(message_id=4, message={"role": "user", "by": "a"}))
+    with pytest.raises(SessionConflictError):
+        worker_a.update_agent(
+            "s1", SessionAgent(agent_id="default", state={"by": "a"}, created_at="t1", updated_at="t1")
+        )
+
+    assert worker_b.read_message("s1", "default", 4).message["by"] == "b"
+    assert worker_b.read_agent("s1", "default").state == {"by": "b"}
+
+    # once rebuilt from storage, worker A is current again
+    worker_a.read_agent("s1", "default")
+    manager._latest_agent_message["default"] = SessionMessage(message_id=4, message={})
+    assert not manager.is_stale(SimpleNamespace(agent_id="default"))
@@ -1,7 +1,18 @@
+from types import SimpleNamespace
+
 import pytest
 
 import adapters.secondary.chat.strands_mcp_agent_adapter as adapter_module
-from conftest import DummyRepositorySessionManager, DummyMCPClient
+from adapters.secondary.chat.tool_executor import BoundedMCPAgentTool
+from ports.chat import ModelThrottledError
+from ports.mcp import MCPConfig
+from conftest import (
+    DummyMCPAgentTool,
+    DummyMCPClient,
+    DummyMCPTool,
+    DummyModelThrottledException,
+    DummyRepositorySessionManager,
+)
 
 
 class DummyClient(DummyMCPClient):
@@ -20,10 +31,10 @@ async def test_mcp_agent_adapter_lifecycle(monkeypatch):
     monkeypatch.setattr(
         adapter_module, "load_mcp_tools", lambda clients: [lambda: None]
     )
-    monkeypatch.setattr(adapter_module, "load_mcp_config", lambda: {})
+    monkeypatch.setattr(adapter_module, "load_mcp_config", lambda: MCPConfig())
 
     adapter = adapter_module.StrandsMCPAgentAdapter(model_id="m")
-    adapter.configure_mcp()
+    await adapter.configure_mcp()
 
     assert "dummy" in adapter.mcp_clients
     assert client.started is True
@@ -40,4 +51,181 @@ async def test_mcp_agent_adapter_lifecycle(monkeypatch):
     adapter.cleanup()
     assert client.stopped is True
     assert adapter.mcp_clients == {}
-    assert adapter.agents == {}
+    assert len(adapter.agents) == 0
+
+
+@pytest.mark.asyncio
+async def test_agent_is_attached_to_session_manager_and_pooled():
+    adapter = adapter_module.StrandsMCPAgentAdapter(model_id="m")
+    session = DummyRepositorySessionManager("s1")
+
+    await adapter.generate_response(session, "hi")
+    await adapter.generate_response(session, "again")
+
+    agent = adapter.agents.get("s1")
+    assert agent.kwargs["session_manager"] is session
+
+    stats = adapter.pool_stats()
+    assert stats.size == 1
+    assert stats.misses == 1
+    assert stats.hits == 2
+
+
+@pytest.mark.asyncio
+async def test_stale_pooled_agent_is_rebuilt():
+    adapter = adapter_module.StrandsMCPAgentAdapter(model_id="m")
+    session = DummyRepositorySessionManager("s1")
+    session.stale = False
+    session.is_stale = lambda agent: session.stale
+
+    await adapter.generate_response(session, "hi")
+    first = adapter.agents.get("s1")
+
+    session.stale = True
+    await adapter.generate_response(session, "again")
+    assert adapter.agents.get("s1") is not first
+
+
+@pytest.mark.asyncio
+async def test_response_cache_scope_only_for_sessions_without_history():
+    adapter = adapter_module.StrandsMCPAgentAdapter(model_id="m")
+    session = DummyRepositorySessionManager("s1")
+
+    scope = adapter.response_cache_scope(session)
+    assert scope is not None
+    assert adapter.response_cache_scope(DummyRepositorySessionManager("s2")) == scope
+
+    await adapter.record_response(session, "hi", "cached hello")
+    assert adapter.response_cache_scope(session) is None
+    assert [m["role"] for m in session.appended_messages] == ["user", "assistant"]
+    assert adapter.agents.get("s1").messages == session.appended_messages
+
+    other = adapter_module.StrandsMCPAgentAdapter(model_id="other")
+    assert other.response_cache_scope(DummyRepositorySessionManager("s3")) != scope
+
+
+@pytest.mark.asyncio
+async def test_tools_are_sorted_and_history_gets_a_cache_checkpoint():
+    class Tool:
+        def __init__(self, name):
+            self.tool_name = name
+            self.tool_spec = {"name": name, "inputSchema": {"json": {}}}
+
+    adapter = adapter_module.StrandsMCPAgentAdapter(model_id="m")
+    adapter.server_tools = {"b": [Tool("zeta"), Tool("beta")], "a": [Tool("alpha")]}
+    adapter._rebuild_tools()
+    assert [tool.tool_name for tool in adapter.mcp_tools] == ["alpha", "beta", "zeta"]
+
+    session = DummyRepositorySessionManager("s1")
+    await adapter.record_response(session, "hi", "hello")
+    await adapter.generate_response(session, "again")
+
+    messages = adapter.agents.get("s1").messages
+    assert messages[-1]["content"][-1] == {"cachePoint": {"type": "default"}}
+    assert adapter.usage_stats().model_calls == 0
+
+
+@pytest.mark.asyncio
+async def test_each_turn_gets_the_tools_its_prompt_needs():
+    class Tool:
+        def __init__(self, name, description):
+            self.tool_name = name
+            self.tool_spec = {"name": name, "description": description, "inputSchema": {"json": {}}}
+
+    adapter = adapter_module.StrandsMCPAgentAdapter(
+        model_id="m", tool_selection_top_k=1, tool_selection_always=["fetch_page"]
+    )
+    adapter.server_tools = {
+        "docs": [Tool("search_docs", "Search the documentation"), Tool("fetch_page", "Fetch a web page")],
+        "weather": [Tool("forecast", "Weather forecast for a city")],
+    }
+    adapter._rebuild_tools()
+    adapter.local_tools.append(Tool("read_tool_result", "Read a stored tool result"))
+
+    session = DummyRepositorySessionManager("s1")
+    await adapter.generate_response(session, "will it rain in Oslo? check the weather")
+    agent = adapter.agents.get("s1")
+    assert list(agent.tool_registry.registry) == ["fetch_page", "forecast", "read_tool_result"]
+    registry = agent.tool_registry
+
+    # tools the conversation already called stay available
+    agent.messages.append({"role": "assistant", "content": [{"toolUse": {"toolUseId": "1", "name": "forecast"}}]})
+    await adapter.generate_response(session, "search the docs")
+    assert list(agent.tool_registry.registry) == ["fetch_page", "forecast", "search_docs", "read_tool_result"]
+
+    # the same subset reuses its registry
+    agent.messages.clear()
+    await adapter.generate_response(session, "and in Bergen? weather please")
+    assert agent.tool_registry is registry
+
+    # a tool set within the limit is sent whole
+    adapter.tool_selection_top_k = 3
+    await adapter.generate_response(session, "hello")
+    assert agent.tool_registry is adapter._shared_tool_registry()
+
+def test_mcp_server_status_covers_every_configured_server():
+    adapter = adapter_module.StrandsMCPAgentAdapter(model_id="m")
+    adapter.mcp_config = MCPConfig.model_validate(
+        {"mcpServers": {name: {"url": f"http://{name}"} for name in ("search", "docs", "slow", "gone")}}
+    )
+    adapter.mcp_clients["search"] = DummyClient()
+    adapter.mcp_startup = SimpleNamespace(pending=lambda: ["slow"])
+    adapter._recovering_clients["docs"] = DummyClient()
+
+    assert adapter.mcp_server_status() == {
+        "search": "ready",
+        "docs": "recovering",
+        "slow": "starting",
+        "gone": "failed",
+    }
+
+
+@pytest.mark.asyncio
+async def test_mcp_tools_run_through_the_tool_executor(monkeypatch):
+    client = DummyClient()
+    monkeypatch.setattr(adapter_module, "initialize_mcp_clients", lambda cfg: {"search": client})
+    monkeypatch.setattr(
+        adapter_module, "load_mcp_tools", lambda clients: [DummyMCPAgentTool(DummyMCPTool("lookup"), client)]
+    )
+    config = MCPConfig.model_validate(
+        {"mcpServers": {"search": {"url": "http://search", "toolExecution": {"toolTimeouts": {"lookup": 5}}}}}
+    )
+
+    adapter = adapter_module.StrandsMCPAgentAdapter(model_id="m", tool_max_concurrency=4, tool_timeout=30)
+    await adapter.configure_mcp(config)
+
+    [tool] = adapter.mcp_tools
+    assert isinstance(tool, BoundedMCPAgentTool)
+    assert adapter.tool_executor.max_concurrency == 4
+    assert adapter.tool_executor.timeout("search", "lookup") == 5
+    assert adapter.tool_executor.timeout("search", "other") == 30
+    adapter.cleanup()
+
+@pytest.mark.asyncio
+async def test_probe_model_reports_throttling():
+    class ProbedModel:
+        def __init__(self, error=None):
+            self.error = error
+            self.closed = False
+
+        def stream(self, messages, tool_specs=None, system_prompt=None, **kwargs):
+            return self._events()
+
+        async def _events(self):
+            try:
+                if self.error is not None:
+                    raise self.error
+                yield {"messageStart": {"role": "assistant"}}
+                yield {"messageStop": {"stopReason": "end_turn"}}
+            finally:
+                self.closed = True
+
+    adapter = adapter_module.StrandsMCPAgentAdapter(model_id="m")
+    model = ProbedModel()
+    adapter.model_router.models[adapter_module.DEFAULT_MODEL] = model
+    await adapter.probe_model()
+    assert model.closed
+
+    adapter.model_router.models[adapter_module.DEFAULT_MODEL] = ProbedModel(DummyModelThrottledException("slow down"))
+    with pytest.raises(ModelThrottledError):
+        await adapter.probe_model()
@@ -0,0 +1,129 @@
+import asyncio
+import time
+
+import pytest
+
+from adapters.secondary.chat.tool_executor import BoundedMCPAgentTool, ToolExecutor, bound_tools
+from conftest import DummyMCPAgentTool, DummyMCPTool
+from ports.mcp import MCPToolExecutionConfig
+
+
+class SlowClient:
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+        self.cancelled = 0
+
+    async def call_tool_async(self, tool_use_id, name, arguments=None, read_timeout_seconds=None):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(arguments.get("delay", self.delay))
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.active -= 1
+        return {"toolUseId": tool_use_id, "status": "success", "content": [{"text": name}]}
+
+
+def make_tool(name: str, client: SlowClient, executor: ToolExecutor, server_name: str = "search"):
+    return BoundedMCPAgentTool(DummyMCPAgentTool(DummyMCPTool(name), client), server_name, executor)
+
+
+async def run(tool, tool_use_id: str, **arguments):
+    return [event async for event in tool.stream({"toolUseId": tool_use_id, "input": arguments}, {})][-1]
+
+
+@pytest.mark.asyncio
+async def test_tool_uses_of_a_turn_take_as_long_as_the_slowest():
+    client = SlowClient(delay=0.1)
+    tool = make_tool("lookup", client, ToolExecutor())
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(run(tool, f"t{i}") for i in range(3)))
+    elapsed = time.perf_counter() - started
+
+    assert [result["toolUseId"] for result in results] == ["t0", "t1", "t2"]
+    assert client.max_active == 3
+    assert elapsed < 0.25
+
+
+@pytest.mark.asyncio
+async def test_calls_wait_for_the_global_and_server_caps():
+    executor = ToolExecutor(max_concurrency=2)
+    executor.configure_server("docs", MCPToolExecutionConfig(maxConcurrency=1))
+    search_client, docs_client = SlowClient(), SlowClient()
+    search = make_tool("lookup", search_client, executor)
+    docs = make_tool("read", docs_client, executor, server_name="docs")
+
+    await asyncio.gather(*(run(search, f"s{i}") for i in range(4)))
+    assert search_client.max_active == 2
+
+    await asyncio.gather(*(run(docs, f"d{i}") for i in range(3)))
+    assert docs_client.max_active == 1
+    stats = executor.stats()
+    assert (stats.completed, stats.in_flight, stats.queued) == (7, 0, 0)
+
+
+@pytest.mark.asyncio
+async def test_slow_call_times_out_with_an_error_result():
+    executor = ToolExecutor(default_timeout=0.05)
+    executor.configure_server("search", MCPToolExecutionConfig(timeout=1, toolTimeouts={"lookup": 0.01}))
+    client = SlowClient()
+
+    result = await run(make_tool("lookup", client, executor), "t1", delay=0.5)
+    assert result == {
+        "toolUseId": "t1",
+        "status": "error",
+        "content": [{"text": "Tool lookup timed out after 0.01 seconds"}],
+    }
+    assert client.cancelled == 1
+
+    # the server timeout applies to its other tools, the default to servers without one
+    assert (await run(make_tool("read", client, executor), "t2", delay=0.1))["status"] == "success"
+    assert executor.timeout("docs", "read") == 0.05
+    assert executor.stats().timed_out == 1
+
+
+@pytest.mark.asyncio
+async def test_end_turn_cancels_the_calls_an_aborted_turn_left_running():
+    executor = ToolExecutor()
+    client = SlowClient(delay=10)
+    tool = make_tool("lookup", client, executor)
+    aborted = asyncio.Event()
+
+    async def turn(abort: bool):
+        # each turn runs in the task of its request
+        executor.start_turn()
+        # strands runs every tool use of a response in its own task
+        calls = [asyncio.create_task(run(tool, f"t{i}")) for i in range(2)]
+        if abort:
+            await asyncio.sleep(0.01)
+            assert executor.end_turn() == 2
+            aborted.set()
+        return calls
+
+    running = await asyncio.create_task(turn(abort=False))
+    cancelled = await asyncio.create_task(turn(abort=True))
+    assert aborted.is_set()
+
+    await asyncio.gather(*cancelled, return_exceptions=True)
+    assert all(call.cancelled() for call in cancelled)
+    assert client.cancelled == 2
+    assert not any(call.done() for call in running)
+    assert executor.stats().cancelled == 2
+    for call in running:
+        call.cancel()
+    await asyncio.gather(*running, return_exceptions=True)
+
+
+def test_only_mcp_tools_are_bound():
+    executor = ToolExecutor()
+    mcp_tool = DummyMCPAgentTool(DummyMCPTool("lookup"), SlowClient())
+    local_tool = object()
+
+    bound, local = bound_tools("search", [mcp_tool, local_tool], executor)
+    assert isinstance(bound, BoundedMCPAgentTool) and bound.tool_name == "lookup"
+    assert local is local_tool
@@ -0,0 +1,53 @@
+from types import SimpleNamespace
+
+from adapters.secondary.chat.tool_index import ToolIndex, tokenize, used_tools
+
+
+def tool(name, description):
+    return SimpleNamespace(tool_name=name, tool_spec={"name": name, "description": description})
+
+
+TOOLS = [
+    tool("aws___search_documentation", "Search the AWS documentation for a query"),
+    tool("aws___read_documentation", "Read an AWS documentation page as markdown"),
+    tool("getWeatherForecast", "Weather forecast for a city"),
+    tool("resolve_library_id", "Resolve a package name to a library id"),
+]
+
+
+def test_tokenize_splits_tool_names():
+    assert tokenize("aws___search_documentation") == ["aws", "search", "documentation"]
+    assert tokenize("getWeatherForecast, Berlin!") == ["get", "weather", "forecast", "berlin"]
+
+
+def test_select_ranks_by_relevance():
+    index = ToolIndex(TOOLS)
+
+    assert index.select("what's the weather in Berlin tomorrow?", top_k=1) == {"getWeatherForecast"}
+    assert index.select("search the docs for S3 lifecycle rules", top_k=1) == {"aws___search_documentation"}
+    assert index.select("read the lambda documentation page", top_k=2) == {
+        "aws___read_documentation",
+        "aws___search_documentation",
+    }
+
+
+def test_unrelated_prompt_only_gets_the_allowlist():
+    index = ToolIndex(TOOLS)
+
+    assert index.select("hello there", top_k=3) == set()
+    assert index.select("hello there", top_k=3, always={"resolve_library_id", "gone"}) == {"resolve_library_id"}
+
+
+def test_ties_are_broken_by_name():
+    index = ToolIndex([tool("b_lookup", "lookup"), tool("a_lookup", "lookup"), tool("c_lookup", "lookup")])
+
+    assert index.select("lookup", top_k=2) == {"a_lookup", "b_lookup"}
+
+
+def test_used_tools_are_the_tools_called_in_the_conversation():
+    messages = [
+        {"role": "user", "content": [{"text": "hi"}]},
+        {"role": "assistant", "content": [{"text": "let me look"}, {"toolUse": {"toolUseId": "1", "name": "search"}}]},
+        {"role": "user", "content": [{"toolResult": {"toolUseId": "1", "content": []}}]},
+    ]
+    assert used_tools(messages) == {"search"}
@@ -0,0 +1,91 @@
+import os
+import time
+
+import pytest
+
+from adapters.secondary.chat.tool_result_store import (
+    ToolResultBlobStore,
+    ToolResultNotFoundError,
+    ToolResultOffloader,
+    read_tool_result_tool,
+)
+from conftest import DummyAfterToolInvocationEvent
+
+
+def test_blobs_are_content_addressed_and_paged(tmp_path):
+    store = ToolResultBlobStore(str(tmp_path))
+    data = ("é" * 10 + "x" * 10).encode("utf-8")
+
+    handle = store.put(data)
+    assert store.put(data) == handle
+
+    first = store.read(handle, 0, 5)
+    # the split "é" is left for the next page
+    assert first.text == "éé"
+    assert first.next_offset == 4
+    rest = store.read(handle, first.next_offset, 100)
+    assert first.text + rest.text == data.decode("utf-8")
+    assert rest.next_offset is None
+
+    with pytest.raises(ToolResultNotFoundError):
+        store.read("../../etc/passwd")
+
+
+@pytest.mark.parametrize("length", [1, 2, 5, 7])
+def test_non_ascii_results_page_without_losing_or_repeating_text(tmp_path, length):
+    store = ToolResultBlobStore(str(tmp_path))
+    text = "naïve 東京 🚀 " * 3
+    handle = store.put(text.encode("utf-8"))
+
+    pages, offset = [], 0
+    while offset is not None:
+        page = store.read(handle, offset, length)
+        pages.append(page.text)
+        offset = page.next_offset
+    assert "".join(pages) == text
+
+    # an offset inside a character reads from its first byte
+    middle = store.read(handle, len("naïve ".encode("utf-8")) + 1, 3)
+    assert (middle.text, middle.offset) == ("東", len("naïve ".encode("utf-8")))
+
+
+def test_expired_blobs_are_pruned(tmp_path):
+    store = ToolResultBlobStore(str(tmp_path), ttl=60)
+    handle = store.put(b"old")
+    path = os.path.join(str(tmp_path), handle[:2], handle)
+    os.utime(path, (time.time() - 120, time.time() - 120))
+    store.put(b"new")
+
+    assert store.prune() == 1
+    with pytest.raises(ToolResultNotFoundError):
+        store.read(handle)
+
+
+def test_large_results_are_replaced_by_a_handle_and_preview(tmp_path):
+    store = ToolResultBlobStore(str(tmp_path))
+    offloader = ToolResultOffloader(store, threshold_bytes=100, preview_chars=10)
+    image = {"image": {"format": "png", "source": {"bytes": b""}}}
+    event = DummyAfterToolInvocationEvent(
+        tool_use={"toolUseId": "t1", "name": "search", "input": {}},
+        result={"toolUseId": "t1", "status": "success", "content": [{"text": "a" * 300}, image]},
+    )
+
+    offloader._on_tool_result(event)
+
+    [notice, kept] = event.result["content"]
+    assert kept == image
+    assert "300 bytes" in notice["text"]
+    assert notice["text"].endswith("a" * 10)
+    handle = notice["text"].split("handle ")[1][:64]
+
+    read_tool_result = read_tool_result_tool(store)
+    page = read_tool_result(handle, offset=290, length=50)
+    assert page == "[bytes 290-300 of 300, end of result]\n" + "a" * 10
+
+    small = DummyAfterToolInvocationEvent(
+        tool_use={"toolUseId": "t2", "name": "search", "input": {}},
+        result={"toolUseId": "t2", "status": "success", "content": [{"text": "short"}]},
+    )
+    offloader._on_tool_result(small)
+    assert small.result["content"] == [{"text": "short"}]
+    assert offloader.offloaded == 1
@@ -0,0 +1,52 @@
+from opentelemetry.trace import StatusCode
+from strands.experimental.hooks import AfterToolInvocationEvent, BeforeToolInvocationEvent
+
+from adapters.secondary.chat.tool_telemetry import ToolCallTelemetry
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def tool_use(tool_use_id, name):
+    return {"toolUseId": tool_use_id, "name": name, "input": {}}
+
+
+def test_tool_calls_are_traced_by_server_and_tool(recorded_telemetry):
+    clock = Clock()
+    hook = ToolCallTelemetry({"search": "docs"}.get, clock=clock)
+
+    # two calls of one turn overlap
+    hook._on_tool_start(BeforeToolInvocationEvent(tool_use=tool_use("t1", "search")))
+    hook._on_tool_start(BeforeToolInvocationEvent(tool_use=tool_use("t2", "read_tool_result")))
+    clock.now = 0.2
+    hook._on_tool_end(
+        AfterToolInvocationEvent(tool_use=tool_use("t2", "read_tool_result"), result={"status": "success"})
+    )
+    clock.now = 1.5
+    hook._on_tool_end(AfterToolInvocationEvent(tool_use=tool_use("t1", "search"), result={"status": "error"}))
+
+    spans = {span.attributes["mcp.tool"]: span for span in recorded_telemetry.spans.get_finished_spans()}
+    assert spans["search"].name == "mcp.tool_call"
+    assert spans["search"].attributes["mcp.server"] == "docs"
+    assert spans["search"].status.status_code == StatusCode.ERROR
+    assert spans["read_tool_result"].attributes["mcp.server"] == "local"
+
+    text = recorded_telemetry.telemetry.render_prometheus()
+    assert 'mcp_tool_duration_seconds_sum{mcp_server="docs",mcp_tool="search",mcp_status="error"} 1.5' in text
+    assert (
+        'mcp_tool_duration_seconds_sum{mcp_server="local",mcp_tool="read_tool_result",mcp_status="success"} 0.2'
+        in text
+    )
+
+
+def test_results_without_a_started_call_are_ignored(recorded_telemetry):
+    hook = ToolCallTelemetry(lambda name: None)
+
+    hook._on_tool_end(AfterToolInvocationEvent(tool_use=tool_use("t1", "search"), result={"status": "success"}))
+
+    assert recorded_telemetry.spans.get_finished_spans() == ()
@@ -1,6 +1,9 @@
 import os
 import sys
 from types import SimpleNamespace
+from typing import AsyncIterator
+
+import pytest
 
 os.environ.setdefault("MODEL_ID", "test-model")
 os.environ.setdefault("ENVIRONMENT", "test")
@@ -9,6 +12,23 @@ os.environ.setdefault("ENVIRONMENT", "test")
 class DummyRepositorySessionManager:
     def __init__(self, session_id: str, **kwargs):
         self.session_id = session_id
+        self._latest_agent_message = {}
+        self.agent_updates = []
+        self.appended_messages = []
+
+    def initialize(self, agent, **kwargs):
+        if agent.agent_id in self._latest_agent_message:
+            raise RuntimeError("The `agent_id` of an agent must be unique in a session.")
+        self._latest_agent_message[agent.agent_id] = None
+
+    def create_agent(self, session_id: str, session_agent, **kwargs):
+        self.agent_updates.append(session_agent.to_dict())
+
+    def update_agent(self, session_id: str, session_agent, **kwargs):
+        self.agent_updates.append(session_agent.to_dict())
+
+    def append_message(self, message, agent, **kwargs):
+        self.appended_messages.append(message)
 
 
 class DummyFileSessionManager(DummyRepositorySessionManager):
@@ -16,6 +36,9 @@ class DummyFileSessionManager(DummyRepositorySessionManager):
         super().__init__(session_id, **kwargs)
         self.storage_dir = storage_dir
 
+    def _get_agent_path(self, session_id: str, agent_id: str) -> str:
+        return os.path.join(self.storage_dir, f"session_{session_id}", "agents", f"agent_{agent_id}")
+
 
 class DummySession:
     def __init__(self, profile_name=None, region_name=None):
@@ -28,9 +51,63 @@ class DummyBedrockModel:
         self.kwargs = kwargs
 
 
-class DummySlidingWindowConversationManager:
+class DummyConversationManager:
     def __init__(self, *args, **kwargs):
-        pass
+        self.removed_message_count = 0
+
+    def restore_from_session(self, state):
+        if state.get("__name__") != self.__class__.__name__:
+            raise ValueError("Invalid conversation manager state.")
+        self.removed_message_count = state["removed_message_count"]
+        return None
+
+    def get_state(self):
+        return {"__name__": self.__class__.__name__, "removed_message_count": self.removed_message_count}
+
+
+class DummySlidingWindowConversationManager(DummyConversationManager):
+    def __init__(self, window_size: int = 40, should_truncate_results: bool = True):
+        super().__init__()
+        self.window_size = window_size
+        self.should_truncate_results = should_truncate_results
+
+    def reduce_context(self, agent, e=None, **kwargs):
+        trim_index = max(len(agent.messages) - self.window_size, 2)
+        self.removed_message_count += trim_index
+        agent.messages[:] = agent.messages[trim_index:]
+
+
+class DummySummarizingConversationManager(DummyConversationManager):
+    def __init__(self, summary_ratio: float = 0.3, preserve_recent_messages: int = 10, **kwargs):
+        super().__init__()
+        self.summary_ratio = summary_ratio
+        self.preserve_recent_messages = preserve_recent_messages
+
+
+class DummyContextWindowOverflowException(Exception):
+    pass
+
+
+class DummyModelThrottledException(Exception):
+    pass
+
+
+class DummySessionException(Exception):
+    pass
+
+
+class DummySessionRecord:
+    """Stands in for strands Session/SessionAgent/SessionMessage dataclasses"""
+
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**data)
+
+    def to_dict(self):
+        return dict(self.__dict__)
 
 
 class DummyMCPClient:
@@ -45,9 +122,61 @@ class DummyMCPClient:
         self.stopped = True
 
 
+class DummyMCPTool:
+    """Stands in for mcp.types.Tool"""
+
+    def __init__(self, name: str, description=None, inputSchema=None, **kwargs):
+        self.name = name
+        self.description = description
+        self.inputSchema = inputSchema or {}
+
+
+class DummyMCPAgentTool:
+    def __init__(self, mcp_tool, mcp_client):
+        self.mcp_tool = mcp_tool
+        self.mcp_client = mcp_client
+
+    @property
+    def tool_name(self):
+        return self.mcp_tool.name
+
+    @property
+    def tool_spec(self):
+        return {
+            "name": self.mcp_tool.name,
+            "description": self.mcp_tool.description or f"Tool which performs {self.mcp_tool.name}",
+            "inputSchema": {"json": self.mcp_tool.inputSchema},
+        }
+
+    async def stream(self, tool_use, invocation_state, **kwargs):
+        yield await self.mcp_client.call_tool_async(
+            tool_use_id=tool_use["toolUseId"], name=self.tool_name, arguments=tool_use["input"]
+        )
+
+
+class DummyToolRegistry:
+    def __init__(self):
+        self.registry = {}
+        self.config_builds = 0
+
+    def process_tools(self, tools):
+        for tool in tools:
+            self.register_tool(tool)
+
+    def register_tool(self, tool):
+        self.registry[getattr(tool, "tool_name", repr(tool))] = tool
+
+    def get_all_tools_config(self):
+        self.config_builds += 1
+        return {name: tool.tool_spec for name, tool in self.registry.items() if hasattr(tool, "tool_spec")}
+
+
 class DummyAgent:
-    def __init__(self, *args, **kwargs):
-        pass
+    def __init__(self, *args, agent_id: str = "default", **kwargs):
+        self.agent_id = agent_id
+        self.kwargs = kwargs
+        self.conversation_manager = kwargs.get("conversation_manager")
+        self.messages = []
 
     async def invoke_async(self, prompt: str):
         return SimpleNamespace(message={"content": [{"text": "dummy"}]})
@@ -61,6 +190,18 @@ sys.modules.setdefault(
     "strands.session.repository_session_manager",
     SimpleNamespace(RepositorySessionManager=DummyRepositorySessionManager),
 )
+sys.modules.setdefault(
+    "strands.types.session",
+    SimpleNamespace(
+        Session=type("Session", (DummySessionRecord,), {}),
+        SessionAgent=type("SessionAgent", (DummySessionRecord,), {}),
+        SessionMessage=type("SessionMessage", (DummySessionRecord,), {}),
+    ),
+)
+sys.modules.setdefault(
+    "strands.session.session_repository",
+    SimpleNamespace(SessionRepository=object),
+)
 sys.modules.setdefault(
     "strands.session.file_session_manager",
     SimpleNamespace(FileSessionManager=DummyFileSessionManager),
@@ -71,16 +212,39 @@ sys.modules.setdefault(
     "boto3",
     SimpleNamespace(Session=DummySession, client=lambda *args, **kwargs: None),
 )
+sys.modules.setdefault("strands.models", SimpleNamespace(Model=object))
 sys.modules.setdefault(
     "strands.models.bedrock", SimpleNamespace(BedrockModel=DummyBedrockModel)
 )
 sys.modules.setdefault(
     "strands.agent.conversation_manager",
-    SimpleNamespace(SlidingWindowConversationManager=DummySlidingWindowConversationManager),
+    SimpleNamespace(
+        ConversationManager=DummyConversationManager,
+        SlidingWindowConversationManager=DummySlidingWindowConversationManager,
+        SummarizingConversationManager=DummySummarizingConversationManager,
+    ),
+)
+sys.modules.setdefault(
+    "strands.types.content", SimpleNamespace(ContentBlock=dict, Message=dict, Messages=list)
+)
+sys.modules.setdefault("strands.types.streaming", SimpleNamespace(StreamEvent=dict))
+sys.modules.setdefault(
+    "strands.types.exceptions",
+    SimpleNamespace(
+        ContextWindowOverflowException=DummyContextWindowOverflowException,
+        ModelThrottledException=DummyModelThrottledException,
+        SessionException=DummySessionException,
+    ),
 )
 sys.modules.setdefault(
-    "strands.tools.mcp", SimpleNamespace(MCPClient=DummyMCPClient)
+    "strands.tools.mcp", SimpleNamespace(MCPClient=DummyMCPClient, MCPAgentTool=DummyMCPAgentTool)
 )
+sys.modules.setdefault(
+    "strands.types.tools",
+    SimpleNamespace(ToolGenerator=AsyncIterator, ToolUse=dict, ToolResultContent=dict, ToolSpec=dict),
+)
+sys.modules.setdefault("strands.tools.registry", SimpleNamespace(ToolRegistry=DummyToolRegistry))
+sys.modules.setdefault("mcp.types", SimpleNamespace(Tool=DummyMCPTool))
 
 class _DummyStructlog(SimpleNamespace):
     def __init__(self):
@@ -111,8 +275,37 @@ class _DummyStructlog(SimpleNamespace):
 sys.modules.setdefault("structlog", _DummyStructlog())
 
 # Additional stubs for optional dependencies
-sys.modules.setdefault("strands", SimpleNamespace(Agent=DummyAgent))
-sys.modules.setdefault("strands.hooks", SimpleNamespace(HookProvider=object))
+
+
+def dummy_tool(name=None, **kwargs):
+    def decorate(func):
+        func.tool_name = name or func.__name__
+        return func
+
+    return decorate
+
+
+class DummyBeforeToolInvocationEvent:
+    def __init__(self, tool_use, **kwargs):
+        self.tool_use = tool_use
+
+
+class DummyAfterToolInvocationEvent:
+    def __init__(self, tool_use, result, exception=None, **kwargs):
+        self.tool_use = tool_use
+        self.result = result
+        self.exception = exception
+
+
+sys.modules.setdefault("strands", SimpleNamespace(Agent=DummyAgent, tool=dummy_tool))
+sys.modules.setdefault("strands.hooks", SimpleNamespace(HookProvider=object, HookRegistry=object))
+sys.modules.setdefault(
+    "strands.experimental.hooks",
+    SimpleNamespace(
+        AfterToolInvocationEvent=DummyAfterToolInvocationEvent,
+        BeforeToolInvocationEvent=DummyBeforeToolInvocationEvent,
+    ),
+)
 sys.modules.setdefault("dotenv", SimpleNamespace(load_dotenv=lambda *args, **kwargs: None))
 sys.modules.setdefault(
     "utils.logger",
@@ -131,6 +324,7 @@ sys.modules.setdefault(
         load_mcp_config=lambda: {},
         initialize_mcp_clients=lambda config: {},
         load_mcp_tools=lambda clients: [],
+        create_mcp_client=lambda config: None,
     ),
 )
 
@@ -144,3 +338,23 @@ try:
         _ulid.ulid = _ulid.new  # type: ignore[attr-defined]
 except Exception:
     pass
+
+
+@pytest.fixture
+def recorded_telemetry():
+    """Records spans and metrics of the shared telemetry instance in memory for one test"""
+    from opentelemetry.sdk.metrics import MeterProvider
+    from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+    from utils.telemetry import telemetry
+
+    spans = InMemorySpanExporter()
+    tracer_provider = TracerProvider()
+    tracer_provider.add_span_processor(SimpleSpanProcessor(spans))
+    reader = InMemoryMetricReader()
+    telemetry.configure(tracer_provider, MeterProvider(metric_readers=[reader]), reader)
+    yield SimpleNamespace(spans=spans, telemetry=telemetry)
+    telemetry.configure()
@@ -0,0 +1,116 @@
+import asyncio
+
+import pytest
+
+from ports.chat import BatchCheckpointStore, MCPAgentAdapter
+from ports.chat.dto import BatchItem, TurnPriority
+from services.chat.batch_service import BatchService
+from services.chat.chat_service import ChatService
+
+
+class DummySession:
+    def __init__(self, session_id):
+        self.session_id = session_id
+
+
+class SlowAgentAdapter(MCPAgentAdapter):
+    def __init__(self):
+        self.running = 0
+        self.max_running = 0
+        self.priorities = []
+        self.released = []
+
+    async def generate_response(self, session_manager, content: str, model=None, user_id=None, priority=None) -> str:
+        if content == "fail":
+            raise RuntimeError("boom")
+        self.priorities.append(priority)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        # longer messages take longer, so completion order differs from input order
+        await asyncio.sleep(len(content) * 0.01)
+        self.running -= 1
+        return f"echo: {content}"
+
+    async def generate_response_stream(self, session_manager, content: str, **kwargs):
+        raise NotImplementedError
+
+    async def configure_mcp(self, mcp_config=None) -> None:
+        pass
+
+    def release_session(self, session_id: str) -> None:
+        self.released.append(session_id)
+
+    def cleanup(self) -> None:
+        pass
+
+
+class DummySessionAdapter:
+    async def get_session(self, session_id):
+        return DummySession(session_id)
+
+
+class DummySessionService:
+    def __init__(self):
+        self.created = []
+        self.deleted = []
+
+    async def create_session(self, user_id):
+        session_id = f"tmp-{len(self.created)}"
+        self.created.append(session_id)
+        return session_id
+
+    async def delete_session(self, session_id):
+        self.deleted.append(session_id)
+
+
+class InMemoryCheckpoints(BatchCheckpointStore):
+    def __init__(self):
+        self.results = {}
+
+    def load(self, batch_id):
+        return dict(self.results.get(batch_id, {}))
+
+    def append(self, batch_id, result):
+        self.results.setdefault(batch_id, {})[result.id] = result
+
+
+def create_service(checkpoints=None, concurrency=2):
+    adapter = SlowAgentAdapter()
+    sessions = DummySessionService()
+    chat_service = ChatService(adapter, DummySessionAdapter())
+    return BatchService(chat_service, sessions, checkpoints, concurrency=concurrency), adapter, sessions
+
+
+@pytest.mark.asyncio
+async def test_batch_runs_bounded_on_the_batch_lane_in_completion_order():
+    service, adapter, sessions = create_service(concurrency=2)
+    items = [
+        BatchItem(id="1", message="xxxxxxxx"),
+        BatchItem(id="2", message="x"),
+        BatchItem(id="3", message="xx", session_id="s"),
+    ]
+
+    results = [result async for result in service.run(items)]
+
+    assert [r.id for r in results] == ["2", "3", "1"]
+    assert results[1].session_id == "s"
+    assert adapter.max_running == 2
+    assert set(adapter.priorities) == {TurnPriority.BATCH}
+    # items without a session ran in temporary ones, which are gone afterwards
+    assert sorted(sessions.deleted) == sorted(sessions.created) == ["tmp-0", "tmp-1"]
+    assert sorted(adapter.released) == ["tmp-0", "tmp-1"]
+
+
+@pytest.mark.asyncio
+async def test_resumed_batch_only_runs_items_without_a_checkpoint():
+    checkpoints = InMemoryCheckpoints()
+    service, adapter, _ = create_service(checkpoints)
+    items = [BatchItem(id="1", message="a"), BatchItem(id="2", message="fail")]
+
+    results = [result async for result in service.run(items, batch_id="nightly")]
+    assert {r.id: r.error for r in results} == {"1": None, "2": "boom"}
+
+    items[1] = BatchItem(id="2", message="b")
+    results = [result async for result in service.run(items, batch_id="nightly")]
+    assert [(r.id, r.data) for r in results] == [("1", "echo: a"), ("2", "echo: b")]
+    assert len(adapter.priorities) == 2
@@ -1,22 +1,26 @@
 import pytest
+from types import SimpleNamespace
 from typing import AsyncIterator, Any
 
+from adapters.secondary.chat.response_cache import InMemoryResponseCache
+from services.chat.admission import AdmissionControl, OverloadedError
 from services.chat.chat_service import ChatService
+from ports.chat.dto import ModelSchedulerStats, TurnPriority
 from ports.chat.mcp_agent_adapter import MCPAgentAdapter
 from ports.session.session_adapter import SessionAdapter
 
 
 class DummyAgentAdapter(MCPAgentAdapter):
-    async def generate_response(self, session_manager, content: str) -> str:
+    async def generate_response(self, session_manager, content: str, model=None, **kwargs) -> str:
         return f"echo: {content}"
 
-    async def generate_response_stream(self, session_manager, content: str) -> AsyncIterator[Any]:
+    async def generate_response_stream(self, session_manager, content: str, model=None, **kwargs) -> AsyncIterator[Any]:
         async def iterator():
             yield {"data": "first"}
             yield {"data": "second"}
         return iterator()
 
-    def configure_mcp(self, mcp_config=None) -> None:
+    async def configure_mcp(self, mcp_config=None) -> None:
         pass
 
     def cleanup(self) -> None:
@@ -53,3 +57,101 @@ async def test_generate_response_stream():
     stream = await service.generate_response("session", "hello", stream=True)
     chunks = [chunk async for chunk in stream]
     assert chunks == [{"data": "first"}, {"data": "second"}]
+
+
+class CachingAgentAdapter(DummyAgentAdapter):
+    def __init__(self):
+        self.calls = 0
+        self.recorded = []
+
+    async def generate_response(self, session_manager, content: str, model=None, **kwargs) -> str:
+        self.calls += 1
+        return await super().generate_response(session_manager, content)
+
+    async def generate_response_stream(self, session_manager, content: str, model=None, **kwargs) -> AsyncIterator[Any]:
+        self.calls += 1
+
+        async def iterator():
+            yield {"data": "Let me look that up."}
+            yield {"data": "echo: "}
+            yield {"data": content}
+            # the final message holds only the answer given after the tool call
+            yield {"result": SimpleNamespace(message={"role": "assistant", "content": [{"text": f"echo: {content}"}]})}
+        return iterator()
+
+    def response_cache_scope(self, session_manager):
+        # sessions named "new-*" have no history yet
+        return "scope" if session_manager.session_id.startswith("new") else None
+
+    async def record_response(self, session_manager, content: str, response: str) -> None:
+        self.recorded.append((session_manager.session_id, content, response))
+
+
+@pytest.mark.asyncio
+async def test_first_turn_answers_are_cached_across_sessions():
+    adapter = CachingAgentAdapter()
+    service = ChatService(adapter, DummySessionAdapter(), response_cache=InMemoryResponseCache())
+
+    assert await service.generate_response("new-1", "hello") == "echo: hello"
+    assert await service.generate_response("new-2", "Hello?") == "echo: hello"
+    assert adapter.calls == 1
+    assert adapter.recorded == [("new-2", "Hello?", "echo: hello")]
+
+    # sessions with history are never answered from the cache
+    await service.generate_response("old", "hello")
+    assert adapter.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_streamed_first_turn_is_cached_and_replayed():
+    adapter = CachingAgentAdapter()
+    service = ChatService(adapter, DummySessionAdapter(), response_cache=InMemoryResponseCache())
+
+    stream = await service.generate_response("new-1", "hello", stream=True)
+    assert [chunk async for chunk in stream if "data" in chunk] == [
+        {"data": "Let me look that up."},
+        {"data": "echo: "},
+        {"data": "hello"},
+    ]
+
+    # the same answer the non-streaming path caches and returns
+    stream = await service.generate_response("new-2", "hello", stream=True)
+    assert [chunk async for chunk in stream] == [{"data": "echo: hello"}]
+    assert await service.generate_response("new-3", "hello") == "echo: hello"
+    assert adapter.calls == 1
+
+
+class BusyAgentAdapter(DummyAgentAdapter):
+    def __init__(self, queued: int):
+        self.queued = queued
+
+    def scheduler_stats(self) -> ModelSchedulerStats:
+        return ModelSchedulerStats(in_flight=8, queued=self.queued)
+
+
+@pytest.mark.asyncio
+async def test_admission_sheds_interactive_turns_beyond_the_queue_limit():
+    adapter = BusyAgentAdapter(queued=4)
+    admission = AdmissionControl(max_queued_model_calls=4, retry_after=2)
+    service = ChatService(adapter, DummySessionAdapter(), admission=admission)
+
+    with pytest.raises(OverloadedError) as e:
+        await service.generate_response("session", "hello")
+    assert e.value.retry_after == 2
+
+    # batch turns are bounded by the batch concurrency instead
+    assert await service.generate_response("session", "hello", priority=TurnPriority.BATCH) == "echo: hello"
+
+    adapter.queued = 3
+    assert await service.generate_response("session", "hello") == "echo: hello"
+    stats = service.load_stats()
+    assert (stats.rejected_turns, stats.model_calls_in_flight, stats.queued_model_calls) == (1, 8, 3)
+
+
+def test_admission_limits_turns_in_flight():
+    admission = AdmissionControl(max_in_flight_turns=2)
+    admission.admit(in_flight_turns=1, queued_model_calls=100)
+    assert admission.overloaded(2, 0) == "too many turns in flight: 2 (limit 2)"
+    with pytest.raises(OverloadedError):
+        admission.admit(in_flight_turns=2, queued_model_calls=0)
+    assert admission.rejected == 1
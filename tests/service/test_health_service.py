@@ -0,0 +1,161 @@
+import asyncio
+from typing import Any, AsyncIterator, Dict, Optional
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from strands.session.repository_session_manager import RepositorySessionManager
+
+from adapters.primary.ping.ping_controller import PingController
+from ports.chat import ModelThrottledError
+from ports.chat.dto import ModelSchedulerStats, TurnPriority
+from ports.chat.mcp_agent_adapter import MCPAgentAdapter
+from ports.mcp import MCPConfig
+from ports.session.session_adapter import SessionAdapter
+from services.chat.admission import AdmissionControl
+from services.chat.chat_service import ChatService
+from services.health.health_service import HealthService
+from utils.readiness import Readiness, SubsystemState
+
+
+class DummyAgentAdapter(MCPAgentAdapter):
+    def __init__(self):
+        self.servers: Dict[str, str] = {}
+        self.queued = 0
+        self.probe_error: Optional[Exception] = None
+
+    async def generate_response(
+        self,
+        session_manager: RepositorySessionManager,
+        content: str,
+        model: Optional[str] = None,
+        user_id: Optional[str] = None,
+        priority: TurnPriority = TurnPriority.INTERACTIVE,
+    ) -> str:
+        return "response"
+
+    async def generate_response_stream(
+        self,
+        session_manager: RepositorySessionManager,
+        content: str,
+        model: Optional[str] = None,
+        user_id: Optional[str] = None,
+        priority: TurnPriority = TurnPriority.INTERACTIVE,
+    ) -> AsyncIterator[Any]:
+        raise NotImplementedError
+
+    async def configure_mcp(self, mcp_config: Optional[MCPConfig] = None) -> None:
+        pass
+
+    async def probe_model(self) -> None:
+        if self.probe_error is not None:
+            raise self.probe_error
+
+    def mcp_server_status(self) -> Dict[str, str]:
+        return self.servers
+
+    def scheduler_stats(self) -> ModelSchedulerStats:
+        return ModelSchedulerStats(queued=self.queued)
+
+    def cleanup(self) -> None:
+        pass
+
+
+class DummySessionAdapter(SessionAdapter):
+    def __init__(self):
+        self.healthy = True
+
+    async def create_session(self, user_id: str) -> str:
+        return "1"
+
+    async def get_session(self, session_id: str) -> RepositorySessionManager:
+        raise NotImplementedError
+
+    async def delete_session(self, session_id: str) -> None:
+        pass
+
+    async def check_health(self) -> None:
+        if not self.healthy:
+            raise OSError("disk gone")
+
+    def cleanup(self) -> None:
+        pass
+
+
+def create_service(model_probe_interval: float = 60.0):
+    agent_adapter = DummyAgentAdapter()
+    session_adapter = DummySessionAdapter()
+    chat_service = ChatService(
+        agent_adapter, session_adapter, admission=AdmissionControl(max_queued_model_calls=5)
+    )
+    service = HealthService(chat_service, session_adapter, agent_adapter, model_probe_interval=model_probe_interval)
+    return service, agent_adapter, session_adapter
+
+
+def test_mcp_is_failed_only_when_no_server_is_ready():
+    service, agent_adapter, _ = create_service()
+    assert service.mcp_status().state == SubsystemState.UP
+
+    agent_adapter.servers = {"search": "ready", "docs": "circuit_open"}
+    assert service.mcp_status().state == SubsystemState.DEGRADED
+
+    agent_adapter.servers = {"search": "starting", "docs": "failed"}
+    assert service.mcp_status().state == SubsystemState.STARTING
+
+    agent_adapter.servers = {"search": "recovering", "docs": "failed"}
+    status = service.mcp_status()
+    assert status.state == SubsystemState.FAILED
+    assert status.detail == {"servers": {"search": "recovering", "docs": "failed"}}
+
+
+def test_load_is_overloaded_while_admission_sheds_turns():
+    service, agent_adapter, _ = create_service()
+    status = service.load_status()
+    assert status.state == SubsystemState.UP
+    assert status.detail["queued_model_calls"] == 0
+
+    agent_adapter.queued = 5
+    assert service.load_status().state == SubsystemState.OVERLOADED
+
+
+def test_ready_fails_while_admission_sheds_turns():
+    service, agent_adapter, _ = create_service()
+    readiness = Readiness([])
+    readiness.watch("load", service.load_status)
+    readiness.mark_started()
+    app = FastAPI()
+    app.include_router(PingController(readiness).router)
+    client = TestClient(app)
+    assert client.get("/health/ready").status_code == 200
+
+    # an instance that sheds turns takes itself out of the load balancer until it drains
+    agent_adapter.queued = 5
+    response = client.get("/health/ready")
+    assert response.status_code == 503
+    assert response.json()["subsystems"]["load"]["state"] == "overloaded"
+
+    agent_adapter.queued = 4
+    assert client.get("/health/ready").status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_probes_report_session_store_and_model_health():
+    service, agent_adapter, session_adapter = create_service()
+    checks = service.checks()
+    assert set(checks) == {"sessions", "mcp", "load", "model"}
+
+    session_adapter.healthy = False
+    agent_adapter.probe_error = ModelThrottledError("ThrottlingException")
+    checks["sessions"]()
+    checks["model"]()
+    await asyncio.sleep(0.01)
+
+    assert checks["sessions"]().state == SubsystemState.FAILED
+    assert checks["sessions"]().detail == {"error": "OSError: disk gone"}
+    # a throttling model is still reachable
+    assert checks["model"]().state == SubsystemState.DEGRADED
+
+
+def test_model_probe_can_be_disabled():
+    service, _, _ = create_service(model_probe_interval=0)
+    assert "model" not in service.checks()
@@ -0,0 +1,151 @@
+import asyncio
+
+import pytest
+
+from services.chat.turn_coordinator import (
+    ConcurrencyPolicy,
+    SessionBusyError,
+    SessionTurnCoordinator,
+    TurnCancelledError,
+)
+
+
+class SlowGenerator:
+    def __init__(self):
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self, content: str) -> str:
+        self.calls += 1
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await self.release.wait()
+            return f"echo: {content}"
+        finally:
+            self.active -= 1
+
+
+@pytest.mark.asyncio
+async def test_queue_policy_serializes_turns_per_session():
+    generator = SlowGenerator()
+    coordinator = SessionTurnCoordinator(ConcurrencyPolicy.QUEUE)
+
+    first = asyncio.create_task(coordinator.run("s1", lambda: generator("a")))
+    second = asyncio.create_task(coordinator.run("s1", lambda: generator("b")))
+    await asyncio.sleep(0)
+    assert (coordinator.in_flight(), coordinator.waiting()) == (1, 1)
+    generator.release.set()
+
+    assert await first == "echo: a"
+    assert await second == "echo: b"
+    assert generator.max_active == 1
+    assert (coordinator.in_flight(), coordinator.waiting()) == (0, 0)
+
+
+@pytest.mark.asyncio
+async def test_reject_policy_raises_when_busy():
+    generator = SlowGenerator()
+    coordinator = SessionTurnCoordinator(ConcurrencyPolicy.REJECT)
+
+    first = asyncio.create_task(coordinator.run("s1", lambda: generator("a")))
+    await asyncio.sleep(0)
+    with pytest.raises(SessionBusyError):
+        await coordinator.run("s1", lambda: generator("b"))
+
+    # other sessions are unaffected
+    other = asyncio.create_task(coordinator.run("s2", lambda: generator("b")))
+    generator.release.set()
+    assert await first == "echo: a"
+    assert await other == "echo: b"
+
+
+@pytest.mark.asyncio
+async def test_cancel_policy_supersedes_in_flight_turn():
+    generator = SlowGenerator()
+    coordinator = SessionTurnCoordinator(ConcurrencyPolicy.CANCEL)
+
+    first = asyncio.create_task(coordinator.run("s1", lambda: generator("a")))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(coordinator.run("s1", lambda: generator("b")))
+    await asyncio.sleep(0)
+    generator.release.set()
+
+    with pytest.raises(TurnCancelledError):
+        await first
+    assert await second == "echo: b"
+
+
+@pytest.mark.asyncio
+async def test_cancel_policy_releases_session_when_superseded_before_start():
+    generator = SlowGenerator()
+    coordinator = SessionTurnCoordinator(ConcurrencyPolicy.CANCEL)
+
+    # back to back: the second request cancels the first turn before its task has run
+    first = asyncio.create_task(coordinator.run("s1", lambda: generator("a")))
+    second = asyncio.create_task(coordinator.run("s1", lambda: generator("b")))
+    await asyncio.sleep(0)
+    generator.release.set()
+
+    with pytest.raises(TurnCancelledError):
+        await first
+    assert await asyncio.wait_for(second, 1) == "echo: b"
+    assert coordinator.in_flight() == 0
+
+
+@pytest.mark.asyncio
+async def test_same_message_without_request_id_starts_a_new_turn():
+    generator = SlowGenerator()
+    coordinator = SessionTurnCoordinator(ConcurrencyPolicy.QUEUE)
+
+    first = asyncio.create_task(coordinator.run("s1", lambda: generator("yes")))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(coordinator.run("s1", lambda: generator("yes")))
+    await asyncio.sleep(0)
+    generator.release.set()
+
+    assert await first == await second == "echo: yes"
+    assert generator.calls == 2
+    assert coordinator.coalesced == 0
+
+
+@pytest.mark.asyncio
+async def test_identical_retry_is_coalesced():
+    generator = SlowGenerator()
+    coordinator = SessionTurnCoordinator(ConcurrencyPolicy.REJECT)
+
+    first = asyncio.create_task(coordinator.run("s1", lambda: generator("a"), request_id="r1"))
+    await asyncio.sleep(0)
+    retry = asyncio.create_task(coordinator.run("s1", lambda: generator("a"), request_id="r1"))
+    await asyncio.sleep(0)
+    generator.release.set()
+
+    assert await first == await retry == "echo: a"
+    assert generator.calls == 1
+    assert coordinator.coalesced == 1
+
+
+@pytest.mark.asyncio
+async def test_stream_retry_replays_and_follows_live_generation():
+    release = asyncio.Event()
+
+    async def generate():
+        async def iterator():
+            yield {"data": "first"}
+            await release.wait()
+            yield {"data": "second"}
+        return iterator()
+
+    coordinator = SessionTurnCoordinator()
+    stream = await coordinator.run_stream("s1", generate, request_id="r1")
+    first_event = await anext(stream)
+
+    retry = await coordinator.run_stream("s1", generate, request_id="r1")
+    release.set()
+
+    assert first_event == {"data": "first"}
+    assert [e async for e in stream] == [{"data": "second"}]
+    assert [e async for e in retry] == [{"data": "first"}, {"data": "second"}]
+    assert coordinator.coalesced == 1
@@ -0,0 +1,34 @@
+import importlib
+import sys
+
+from fastapi.testclient import TestClient
+
+# modules that must not be loaded before the app listens
+HEAVY = ("strands", "boto3", "botocore", "mcp")
+
+
+class BlockHeavyImports:
+    def find_spec(self, name, path=None, target=None):
+        if name.split(".")[0] in HEAVY:
+            raise ImportError(f"{name} imported with main")
+        return None
+
+
+def test_importing_main_defers_the_container_and_heavy_imports(monkeypatch):
+    # forget the app's modules (and the stubs of heavy ones), so `import main` loads what it needs afresh
+    for name in list(sys.modules):
+        if name == "main" or name.split(".")[0] in (*HEAVY, "adapters", "di", "services", "ports"):
+            monkeypatch.delitem(sys.modules, name)
+    monkeypatch.setattr(sys, "meta_path", [BlockHeavyImports(), *sys.meta_path])
+
+    main = importlib.import_module("main")
+
+    assert main.di_container is None
+    assert not main.readiness.ready
+    assert "di.container" not in sys.modules
+
+    # without the lifespan (not entered here) only the health checks are served
+    client = TestClient(main.app)
+    assert client.get("/ping").status_code == 200
+    assert client.get("/health/ready").status_code == 503
+    assert client.post("/v1/sessions", json={}).status_code == 503
@@ -0,0 +1,57 @@
+import io
+import json
+import threading
+
+from utils.log_pipeline import AsyncLogWriter, EventSampler, QueueLogger
+
+
+class BlockingStream(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.unblocked = threading.Event()
+
+    def write(self, s):
+        self.unblocked.wait(5)
+        return super().write(s)
+
+
+def test_writer_renders_batches_on_its_own_thread():
+    stream = io.StringIO()
+    writer = AsyncLogWriter(stream, flush_interval=0.01)
+    logger = QueueLogger(writer)
+
+    logger.info(event="🔄 reusing existing agent for session", session_id="s1")
+    logger.info("already rendered")
+    writer.close()
+
+    lines = stream.getvalue().splitlines()
+    assert json.loads(lines[0]) == {"event": "🔄 reusing existing agent for session", "session_id": "s1"}
+    assert lines[1] == "already rendered"
+
+
+def test_full_queue_drops_and_reports_the_count():
+    stream = BlockingStream()
+    writer = AsyncLogWriter(stream, max_queue=2, batch_size=1, flush_interval=0.01)
+
+    for i in range(20):
+        writer.write({"event": "spam", "i": i})
+    assert writer.dropped > 0
+    dropped = writer.dropped
+
+    stream.unblocked.set()
+    writer.close()
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert {"event": "log entries dropped", "level": "warning", "dropped": dropped} in lines
+    assert len(lines) == 20 - dropped + 1
+
+
+def test_sampler_rate_limits_and_counts_suppressed_events():
+    now = [0.0]
+    sampler = EventSampler(rate_limits={"hot": 2}, sample_rates={"noisy": 0.5}, clock=lambda: now[0], rng=lambda: 0.7)
+
+    assert [sampler.allow("hot") for _ in range(4)] == [0, 0, None, None]
+    now[0] = 1.0
+    assert sampler.allow("hot") == 2
+
+    assert sampler.allow("noisy") is None
+    assert sampler.allow("other") == 0
@@ -0,0 +1,112 @@
+import asyncio
+
+import pytest
+
+from utils.readiness import CachedProbe, Readiness, SubsystemState, SubsystemStatus
+
+
+def test_ready_once_started_and_no_subsystem_is_starting_or_failed():
+    readiness = Readiness(["container", "mcp"])
+    assert not readiness.ready
+
+    readiness.set("container", SubsystemState.UP, session_store="memory")
+    readiness.set("mcp", SubsystemState.DEGRADED)
+    assert not readiness.ready
+    readiness.mark_started()
+    assert readiness.ready
+    assert readiness.status()["container"].detail == {"session_store": "memory"}
+
+    readiness.set("mcp", SubsystemState.FAILED, error="boom")
+    assert not readiness.ready
+
+
+def test_live_until_a_startup_step_fails():
+    readiness = Readiness(["container"])
+    assert readiness.live
+
+    # a failing health check is a readiness matter; only a failed startup step is fatal
+    readiness.watch("model", lambda: SubsystemStatus(SubsystemState.FAILED))
+    assert readiness.live
+
+    readiness.set("container", SubsystemState.FAILED, error="bad config")
+    assert not readiness.live
+
+
+def test_watched_subsystems_are_checked_on_every_report():
+    readiness = Readiness(["mcp"])
+    readiness.mark_started()
+    servers = {"search": "starting"}
+    readiness.watch(
+        "mcp",
+        lambda: SubsystemStatus(
+            SubsystemState.UP if servers["search"] == "ready" else SubsystemState.STARTING, {"servers": dict(servers)}
+        ),
+    )
+    assert not readiness.ready
+
+    servers["search"] = "ready"
+    assert readiness.ready
+    assert readiness.status()["mcp"].detail == {"servers": {"search": "ready"}}
+
+
+def test_failing_check_reports_the_subsystem_as_failed():
+    readiness = Readiness(["mcp"])
+
+    def check():
+        raise RuntimeError("adapter gone")
+
+    readiness.watch("mcp", check)
+    status = readiness.status()["mcp"]
+    assert status.state == SubsystemState.FAILED
+    assert status.detail == {"error": "adapter gone"}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_cached_probe_runs_in_the_background_at_most_once_per_interval():
+    calls = []
+    clock = FakeClock()
+
+    async def probe():
+        calls.append(clock.now)
+
+    cached = CachedProbe(probe, interval=10, timeout=1, clock=clock)
+    assert cached.status().state == SubsystemState.STARTING
+    await asyncio.sleep(0.01)
+    assert cached.status().state == SubsystemState.UP
+
+    clock.now = 5
+    cached.status()
+    await asyncio.sleep(0.01)
+    assert calls == [0.0]
+
+    clock.now = 10
+    cached.status()
+    await asyncio.sleep(0.01)
+    assert calls == [0.0, 10]
+
+
+@pytest.mark.asyncio
+async def test_cached_probe_classifies_errors_and_times_out():
+    async def throttled():
+        raise ValueError("slow down")
+
+    cached = CachedProbe(throttled, interval=10, timeout=1, classify=lambda e: SubsystemState.DEGRADED)
+    cached.status()
+    await asyncio.sleep(0.01)
+    assert cached.status() == SubsystemStatus(SubsystemState.DEGRADED, {"error": "ValueError: slow down"})
+
+    async def hangs():
+        await asyncio.sleep(10)
+
+    cached = CachedProbe(hangs, interval=10, timeout=0.01)
+    cached.status()
+    await asyncio.sleep(0.05)
+    assert cached.status() == SubsystemStatus(SubsystemState.FAILED, {"error": "TimeoutError"})
@@ -0,0 +1,60 @@
+import json
+
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+
+from utils.telemetry import FileSpanExporter, Telemetry
+
+
+def test_histograms_render_in_prometheus_format(recorded_telemetry):
+    telemetry = recorded_telemetry.telemetry
+    telemetry.model_call_duration.record(0.3, {"model.name": "default"})
+    telemetry.model_call_duration.record(7.0, {"model.name": "default"})
+    telemetry.model_tokens.record(100, {"model.name": "default", "token.type": "output"})
+
+    text = telemetry.render_prometheus()
+
+    assert "# TYPE model_call_duration_seconds histogram" in text
+    assert 'model_call_duration_seconds_bucket{model_name="default",le="0.25"} 0' in text
+    assert 'model_call_duration_seconds_bucket{model_name="default",le="0.5"} 1' in text
+    assert 'model_call_duration_seconds_bucket{model_name="default",le="+Inf"} 2' in text
+    assert 'model_call_duration_seconds_sum{model_name="default"} 7.3' in text
+    assert 'model_call_duration_seconds_count{model_name="default"} 2' in text
+    # no unit suffix for token counts
+    assert 'model_tokens_count{model_name="default",token_type="output"} 1' in text
+
+
+def test_label_values_are_escaped(recorded_telemetry):
+    recorded_telemetry.telemetry.tool_call_duration.record(0.1, {"mcp.tool": 'say "hi"\n'})
+
+    assert 'mcp_tool="say \\"hi\\"\\n"' in recorded_telemetry.telemetry.render_prometheus()
+
+
+def test_nothing_is_rendered_without_a_metric_reader():
+    telemetry = Telemetry()
+    telemetry.invoke_duration.record(1.0)
+
+    assert telemetry.render_prometheus() == ""
+
+
+def test_spans_drop_missing_attributes(recorded_telemetry):
+    with recorded_telemetry.telemetry.span("chat.invoke", **{"session.id": "s1", "chat.model": None}):
+        pass
+
+    (span,) = recorded_telemetry.spans.get_finished_spans()
+    assert span.name == "chat.invoke"
+    assert dict(span.attributes or {}) == {"session.id": "s1"}
+
+
+def test_file_exporter_appends_json_lines(tmp_path):
+    path = tmp_path / "traces" / "spans.jsonl"
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(FileSpanExporter(str(path))))
+    tracer = provider.get_tracer("test")
+
+    for name in ("first", "second"):
+        with tracer.start_as_current_span(name):
+            pass
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["name"] for line in lines] == ["first", "second"]